@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+"""
+Benchmark of loading a large definition.yaml with many stages and permissions.
+
+It compares the previous implementation, which rendered the template and parsed the whole YAML by FullLoader for
+every load, with DefinitionLoader on a cold cache and on a warm cache.
+
+Usage: PYTHONPATH=src python benchmarks/bench_definition_loader.py [--stages 200] [--number 20]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+import django
+import yaml
+from django.conf import settings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+def make_definition(stages):
+    lines = [
+        "spec_version: 2",
+        "release:",
+        '  version: "{{ data.version }}"',
+        "  title: release",
+        "apigateway:",
+        "  description: a large gateway",
+        "  is_public: true",
+        "  maintainers:",
+        '    - "{{ settings.BK_APIGW_MAINTAINER }}"',
+        "stages:",
+    ]
+    for index in range(stages):
+        lines.extend(
+            [
+                f"  - name: stage{index}",
+                f"    description: stage {index}",
+                "    vars:",
+                f"      prefix: /api/{index}/",
+                "    backends:",
+                "      - name: default",
+                "        config:",
+                "          timeout: 60",
+                "          loadbalance: roundrobin",
+                "          hosts:",
+                f'            - host: "{{{{ environ.BACKEND_HOST }}}}:{8000 + index}"',
+                "              weight: 100",
+                "    plugin_configs:",
+                "      - type: bk-rate-limit",
+                "        yaml: |-",
+                "          rates:",
+                "            __default:",
+                "            - period: 1",
+                "              tokens: 100",
+            ]
+        )
+    lines.append("grant_permissions:")
+    for index in range(stages * 5):
+        lines.extend([f"  - bk_app_code: app{index}", "    grant_dimension: gateway"])
+
+    return "\n".join(lines) + "\n"
+
+
+def measure(func, number):
+    func()
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stages", type=int, default=200)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    settings.configure(
+        BK_APIGW_MAINTAINER="admin",
+        INSTALLED_APPS=["django.contrib.contenttypes", "django.contrib.auth", "apigw_manager.apigw"],
+        TEMPLATES=[{"BACKEND": "django.template.backends.django.DjangoTemplates"}],
+    )
+    django.setup()
+    os.environ.setdefault("BACKEND_HOST", "backend.example.com")
+
+    from django.template import Context, Template
+
+    from apigw_manager.apigw.helper import DefinitionLoader
+
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as fp:
+        fp.write(make_definition(args.stages))
+        path = fp.name
+
+    context = {"data": {"version": "1.0.0"}, "settings": settings, "environ": os.environ}
+    print("definition: %s stages, %.1f KB, libyaml: %s" % (args.stages, os.path.getsize(path) / 1024, yaml.__with_libyaml__))
+
+    def legacy():
+        with open(path) as fp:
+            rendered = Template(fp.read()).render(Context(context, autoescape=False))
+        return yaml.load(rendered, Loader=yaml.FullLoader)["stages"]
+
+    def cold():
+        return DefinitionLoader().load_from(path, context).get("stages")
+
+    def cold_section():
+        return DefinitionLoader().load_from(path, context).get("release")
+
+    loader = DefinitionLoader()
+
+    def warm():
+        return loader.load_from(path, context).get("stages")
+
+    def warm_section():
+        return loader.load_from(path, context).get("release")
+
+    print("  %-34s %12s" % ("impl", "load ms"))
+    for name, func in [
+        ("legacy, stages", legacy),
+        ("loader cold cache, stages", cold),
+        ("loader cold cache, release only", cold_section),
+        ("loader warm cache, stages", warm),
+        ("loader warm cache, release only", warm_section),
+    ]:
+        print("  %-34s %12.2f" % (name, measure(func, args.number)))
+
+    os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
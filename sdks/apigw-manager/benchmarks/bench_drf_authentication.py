@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+"""
+Microbenchmark of a DRF view protected by ApiGatewayJWTAuthentication and ApiGatewayPermission.
+
+DRF instantiates the authentication classes for every request, it compares the previous implementation,
+which resolved the configuration and created the providers in the constructor, with the shared provider.
+
+Usage: PYTHONPATH=src python benchmarks/bench_drf_authentication.py [--number 2000]
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+
+import django
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.conf import settings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+def make_keys():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return private_pem.decode(), public_pem.decode()
+
+
+def measure(func, number):
+    func()
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    private_key, public_key = make_keys()
+    settings.configure(
+        APIGW_PUBLIC_KEY=public_key,
+        BK_APIGW_NAME="demo",
+        BK_APP_CODE="demo",
+        SECRET_KEY="benchmark",
+        INSTALLED_APPS=["django.contrib.contenttypes", "django.contrib.auth", "apigw_manager.apigw"],
+        AUTHENTICATION_BACKENDS=["apigw_manager.apigw.authentication.UserModelBackend"],
+        DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    )
+    django.setup()
+
+    from rest_framework.response import Response
+    from rest_framework.test import APIRequestFactory
+    from rest_framework.views import APIView
+
+    from apigw_manager.apigw.providers import SettingsPublicKeyProvider
+    from apigw_manager.drf.authentication import ApiGatewayJWTAuthentication
+    from apigw_manager.drf.permission import ApiGatewayPermission
+
+    class CurrentAuthentication(ApiGatewayJWTAuthentication):
+        PUBLIC_KEY_PROVIDER_CLS = SettingsPublicKeyProvider
+
+    class LegacyAuthentication(CurrentAuthentication):
+        def __init__(self):
+            # the previous implementation: resolve the configuration and create the providers for every request
+            self.provider = self.make_provider()
+
+    def make_view(authentication_cls):
+        class View(APIView):
+            authentication_classes = [authentication_cls]
+            permission_classes = [ApiGatewayPermission]
+
+            def get(self, request):
+                return Response({"result": True})
+
+        return View.as_view()
+
+    token = jwt.encode(
+        {
+            "app": {"app_code": "demo", "verified": True},
+            "user": {"username": "admin", "verified": True},
+            "exp": int(time.time()) + 3600,
+        },
+        private_key,
+        algorithm="RS512",
+        headers={"kid": "demo", "iss": "APIGW"},
+    )
+    factory = APIRequestFactory()
+
+    print("DRF view protected by ApiGatewayPermission, the same token for every request")
+    print("  %-10s %18s %18s" % ("impl", "constructor us", "request us"))
+    for name, authentication_cls in [("legacy", LegacyAuthentication), ("current", CurrentAuthentication)]:
+        view = make_view(authentication_cls)
+
+        def request(view=view):
+            response = view(factory.get("/", HTTP_X_BKAPI_JWT=token))
+            assert response.status_code == 200, response.data
+
+        print(
+            "  %-10s %18.1f %18.1f"
+            % (name, measure(authentication_cls, args.number * 10), measure(request, args.number))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+"""
+Microbenchmark of ApiGatewayJWTMiddleware for the repeated tokens.
+
+It compares the middleware without caches, which parses the PEM public key and verifies the signature
+on every request, with the middleware caching the parsed public key and the verified tokens.
+
+Usage: PYTHONPATH=src python benchmarks/bench_jwt_middleware.py [--tokens 10] [--number 2000]
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+
+import django
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.conf import settings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+def make_keys():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return private_pem.decode(), public_pem.decode()
+
+
+def make_tokens(private_key, count):
+    return [
+        jwt.encode(
+            {
+                "app": {"app_code": "demo", "verified": True},
+                "user": {"username": "user-%s" % i, "verified": True},
+                "exp": int(time.time()) + 3600,
+            },
+            private_key,
+            algorithm="RS512",
+            headers={"kid": "demo", "iss": "APIGW"},
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tokens", type=int, default=10, help="the number of distinct tokens")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    private_key, public_key = make_keys()
+    settings.configure(
+        APIGW_PUBLIC_KEY=public_key,
+        BK_APIGW_NAME="demo",
+        BK_APP_CODE="demo",
+        SECRET_KEY="benchmark",
+        INSTALLED_APPS=["django.contrib.contenttypes", "django.contrib.auth", "apigw_manager.apigw"],
+    )
+    django.setup()
+
+    from django.test import RequestFactory
+
+    from apigw_manager.apigw.authentication import ApiGatewayJWTMiddleware
+    from apigw_manager.apigw.providers import DefaultJWTProvider
+
+    class LegacyJWTProvider(DefaultJWTProvider):
+        TOKEN_CACHE_SIZE = 0
+
+        def _get_verifying_key(self, gateway_name, public_key, algorithm):
+            return public_key
+
+    factory = RequestFactory()
+    requests = [factory.get("/", HTTP_X_BKAPI_JWT=token) for token in make_tokens(private_key, args.tokens)]
+
+    def run(provider_cls):
+        middleware = ApiGatewayJWTMiddleware(lambda request: None)
+        provider = middleware.provider
+        middleware.provider = provider_cls(
+            jwt_key_name=provider.jwt_key_name,
+            default_gateway_name=provider.default_gateway_name,
+            algorithm=provider.algorithm,
+            allow_invalid_jwt_token=provider.allow_invalid_jwt_token,
+            public_key_provider=provider.public_key_provider,
+        )
+
+        def _run():
+            for request in requests:
+                middleware(request)
+
+        number = max(args.number // len(requests), 1)
+        _run()
+        seconds = min(timeit.repeat(_run, number=number, repeat=3))
+        return seconds / (number * len(requests)) * 1e6
+
+    print("ApiGatewayJWTMiddleware with %s distinct tokens" % args.tokens)
+    print("  %-10s %14s" % ("impl", "us/request"))
+    for name, provider_cls in [("legacy", LegacyJWTProvider), ("current", DefaultJWTProvider)]:
+        print("  %-10s %14.1f" % (name, run(provider_cls)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+"""
+Microbenchmark of the gateway middleware stack:
+ApiGatewayJWTMiddleware -> ApiGatewayJWTAppMiddleware -> ApiGatewayJWTUserMiddleware.
+
+It compares the user resolution by `auth.authenticate`, which loads the backends for every request,
+with the pre-bound backend chain, and the cached users for a backend querying the database.
+
+Usage: PYTHONPATH=src python benchmarks/bench_jwt_user_middleware.py [--users 50] [--number 5000]
+"""
+import argparse
+import os
+import sys
+import time
+import timeit
+
+import django
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.conf import settings
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+class DatabaseUserBackend:
+    """A backend which queries the users from the database, it is used by many projects"""
+
+    def authenticate(self, request, gateway_name, bk_username, verified, **credentials):
+        from django.contrib.auth import get_user_model
+
+        if not verified:
+            return None
+
+        user_model = get_user_model()
+        return user_model.objects.filter(username=bk_username).first() or user_model(username=bk_username)
+
+
+def make_keys():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return private_pem.decode(), public_pem.decode()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=50, help="the number of distinct users")
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    private_key, public_key = make_keys()
+    settings.configure(
+        APIGW_PUBLIC_KEY=public_key,
+        BK_APIGW_NAME="demo",
+        BK_APP_CODE="demo",
+        SECRET_KEY="benchmark",
+        INSTALLED_APPS=["django.contrib.contenttypes", "django.contrib.auth", "apigw_manager.apigw"],
+        DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+    )
+    django.setup()
+
+    from django.contrib import auth
+    from django.core.management import call_command
+    from django.test import RequestFactory
+
+    from apigw_manager.apigw import authentication
+
+    call_command("migrate", verbosity=0)
+
+    class LegacyJWTUserMiddleware(authentication.ApiGatewayJWTUserMiddleware):
+        def get_user(self, request, gateway_name=None, bk_username=None, tenant_id=None, verified=False, **credentials):
+            return auth.authenticate(
+                request,
+                gateway_name=gateway_name,
+                bk_username=bk_username,
+                tenant_id=tenant_id,
+                verified=verified,
+                **credentials,
+            )
+
+    factory = RequestFactory()
+    tokens = [
+        jwt.encode(
+            {
+                "app": {"app_code": "demo", "verified": True},
+                "user": {"username": "user-%s" % i, "verified": True},
+                "exp": int(time.time()) + 3600,
+            },
+            private_key,
+            algorithm="RS512",
+            headers={"kid": "demo", "iss": "APIGW"},
+        )
+        for i in range(args.users)
+    ]
+
+    def make_stack(user_middleware_cls):
+        handler = user_middleware_cls(lambda request: request.user)
+        handler = authentication.ApiGatewayJWTAppMiddleware(handler)
+        return authentication.ApiGatewayJWTMiddleware(handler)
+
+    def run(user_middleware_cls):
+        stack = make_stack(user_middleware_cls)
+        requests = [factory.get("/", HTTP_X_BKAPI_JWT=token) for token in tokens]
+
+        def _run():
+            for request in requests:
+                request.__dict__.pop("user", None)
+                assert stack(request) is not None
+
+        number = max(args.number // len(requests), 1)
+        _run()
+        seconds = min(timeit.repeat(_run, number=number, repeat=3)) / (number * len(requests))
+        return seconds * 1e6, 1 / seconds
+
+    cases = [
+        ("ModelBackend, UserModelBackend", "apigw_manager.apigw.authentication.UserModelBackend"),
+        ("ModelBackend, DatabaseUserBackend", "__main__.DatabaseUserBackend"),
+    ]
+    resolvers = [
+        ("authenticate", None),
+        ("chain", "apigw_manager.apigw.authentication.BackendUserResolver"),
+        ("cached", "apigw_manager.apigw.authentication.CachedUserResolver"),
+    ]
+    for title, backend in cases:
+        print("middleware stack with %s distinct users, backends: %s" % (args.users, title))
+        print("  %-14s %14s %14s" % ("resolver", "us/request", "requests/s"))
+        for name, resolver_cls in resolvers:
+            settings.AUTHENTICATION_BACKENDS = ["django.contrib.auth.backends.ModelBackend", backend]
+            settings.APIGW_JWT_USER_RESOLVER_CLS = resolver_cls or resolvers[1][1]
+            authentication.reset_user_resolver()
+
+            middleware_cls = LegacyJWTUserMiddleware if resolver_cls is None else authentication.ApiGatewayJWTUserMiddleware
+            us, rps = run(middleware_cls)
+            print("  %-14s %14.1f %14.0f" % (name, us, rps))
+
+        stats = authentication.get_user_resolver().stats.as_dict()
+        print("  cached resolver: %(resolved)s resolved, %(cache_hits)s cache hits" % stats)
+
+
+if __name__ == "__main__":
+    main()
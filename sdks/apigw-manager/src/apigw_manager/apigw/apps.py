@@ -13,3 +13,14 @@ from django.apps import AppConfig as BaseAppConfig
 
 class AppConfig(BaseAppConfig):
     name = "apigw_manager.apigw"
+
+    def ready(self):
+        from django.core.signals import setting_changed
+        from django.db.models.signals import post_delete, post_save
+
+        from apigw_manager.apigw import helper
+        from apigw_manager.apigw.models import Context
+
+        post_save.connect(helper.on_context_changed, sender=Context, dispatch_uid="apigw_manager.public_key_saved")
+        post_delete.connect(helper.on_context_changed, sender=Context, dispatch_uid="apigw_manager.public_key_deleted")
+        setting_changed.connect(helper.on_setting_changed, dispatch_uid="apigw_manager.setting_changed")
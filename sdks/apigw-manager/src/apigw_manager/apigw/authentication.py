@@ -9,18 +9,25 @@
 * specific language governing permissions and limitations under the License.
 """
 
+import copy
 import logging
-from collections import namedtuple
-from typing import ClassVar, Type
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from inspect import signature
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Type
 
 from django.conf import settings
 from django.contrib import auth
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth.models import AnonymousUser
+from django.contrib.auth.signals import user_login_failed
+from django.core.exceptions import PermissionDenied
+from django.core.signals import setting_changed
 from django.utils.module_loading import import_string
 
-from apigw_manager.apigw.providers import CachePublicKeyProvider, PublicKeyProvider, SettingsPublicKeyProvider
+from apigw_manager.apigw.providers import LocalCachePublicKeyProvider, PublicKeyProvider, SettingsPublicKeyProvider
 from apigw_manager.apigw.utils import get_configuration
 
 logger = logging.getLogger(__name__)
@@ -78,7 +85,7 @@ class ApiGatewayJWTGenericMiddleware(ApiGatewayJWTMiddleware):
     but gets the API gateway public key from Context Model.
     """
 
-    PUBLIC_KEY_PROVIDER_CLS = CachePublicKeyProvider
+    PUBLIC_KEY_PROVIDER_CLS = LocalCachePublicKeyProvider
 
 
 class ApiGatewayJWTAppMiddleware:
@@ -110,6 +117,200 @@ class ApiGatewayJWTAppMiddleware:
         return self.get_response(request)
 
 
+class UserResolverStats:
+    """The counters of the user resolution, the time is in seconds"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.resolved = 0
+        self.cache_hits = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def observe(self, seconds: float, cache_hit: bool = False):
+        with self._lock:
+            self.resolved += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            if cache_hit:
+                self.cache_hits += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "resolved": self.resolved,
+                "cache_hits": self.cache_hits,
+                "total_seconds": self.total_seconds,
+                "max_seconds": self.max_seconds,
+                "avg_seconds": self.total_seconds / self.resolved if self.resolved else 0.0,
+            }
+
+
+class BackendUserResolver:
+    """
+    Resolve the user verified by the gateway through the authentication backends, like `auth.authenticate`,
+    but the backends are loaded once, and the backends accepting the credentials are computed once.
+    """
+
+    def __init__(self):
+        self.backends: List[Tuple[Any, str]] = [
+            (auth.load_backend(backend_path), backend_path) for backend_path in settings.AUTHENTICATION_BACKENDS
+        ]
+        # names of the credentials -> the backends accepting them
+        self._compatible_backends: Dict[FrozenSet[str], List[Tuple[Any, str]]] = {}
+        self.stats = UserResolverStats()
+
+    def resolve(self, request, **credentials):
+        started_at = time.perf_counter()
+        user = self.authenticate(request, **credentials)
+        self.stats.observe(time.perf_counter() - started_at)
+        return user
+
+    def authenticate(self, request, **credentials):
+        for backend, backend_path in self._get_compatible_backends(request, credentials):
+            try:
+                user = backend.authenticate(request, **credentials)
+            except PermissionDenied:
+                break
+
+            if user is None:
+                continue
+
+            user.backend = backend_path
+            return user
+
+        user_login_failed.send(
+            sender=auth.__name__,
+            credentials=auth._clean_credentials(credentials),  # type: ignore
+            request=request,
+        )
+        return None
+
+    def _get_compatible_backends(self, request, credentials: Dict[str, Any]) -> List[Tuple[Any, str]]:
+        names = frozenset(credentials)
+        backends = self._compatible_backends.get(names)
+        if backends is not None:
+            return backends
+
+        backends = []
+        for backend, backend_path in self.backends:
+            try:
+                signature(backend.authenticate).bind(request, **credentials)
+            except TypeError:
+                continue
+
+            backends.append((backend, backend_path))
+
+        self._compatible_backends[names] = backends
+        return backends
+
+
+class CachedUserResolver(BackendUserResolver):
+    """
+    Cache the resolved users in the process for a short time, for the projects whose backends query the database.
+
+    settings.APIGW_JWT_USER_CACHE_SECONDS is the seconds to cache a user.
+
+    settings.APIGW_JWT_USER_CACHE_SIZE is the max number of the users to cache.
+    """
+
+    CACHE_SECONDS = 10
+    CACHE_SIZE = 1024
+
+    def __init__(self):
+        super().__init__()
+
+        self.cache_seconds = getattr(settings, "APIGW_JWT_USER_CACHE_SECONDS", self.CACHE_SECONDS)
+        self.cache_size = getattr(settings, "APIGW_JWT_USER_CACHE_SIZE", self.CACHE_SIZE)
+        self._lock = threading.Lock()
+        # credentials -> (user, expires_at)
+        self._users: "OrderedDict[Any, Tuple[Any, float]]" = OrderedDict()
+
+    def resolve(self, request, **credentials):
+        started_at = time.perf_counter()
+        try:
+            # the users are distinguished by the username and tenant, and the other credentials from the gateway
+            key: Optional[Tuple] = tuple(sorted(credentials.items()))
+            hash(key)
+        except TypeError:
+            key = None
+
+        user = self._get_cached(key) if key is not None else None
+        if user is not None:
+            self.stats.observe(time.perf_counter() - started_at, cache_hit=True)
+            return user
+
+        user = self.authenticate(request, **credentials)
+        if user is not None and key is not None:
+            with self._lock:
+                self._users[key] = (copy.copy(user), time.time() + self.cache_seconds)
+                self._users.move_to_end(key)
+                while len(self._users) > self.cache_size:
+                    self._users.popitem(last=False)
+
+        self.stats.observe(time.perf_counter() - started_at)
+        return user
+
+    def clear(self):
+        with self._lock:
+            self._users.clear()
+
+    def _get_cached(self, key):
+        with self._lock:
+            cached = self._users.get(key)
+            if cached is None or cached[1] <= time.time():
+                return None
+
+            self._users.move_to_end(key)
+
+        # the user object may be modified by the request, so a copy is returned
+        return copy.copy(cached[0])
+
+
+_user_resolver: Optional[BackendUserResolver] = None
+_user_resolver_lock = threading.Lock()
+
+
+def get_user_resolver() -> BackendUserResolver:
+    """
+    Return the process-level user resolver,
+    which can be specified by settings.APIGW_JWT_USER_RESOLVER_CLS, default to BackendUserResolver.
+    """
+    global _user_resolver
+
+    user_resolver = _user_resolver
+    if user_resolver is not None:
+        return user_resolver
+
+    with _user_resolver_lock:
+        if _user_resolver is None:
+            user_resolver_cls = import_string(
+                getattr(
+                    settings,
+                    "APIGW_JWT_USER_RESOLVER_CLS",
+                    "apigw_manager.apigw.authentication.BackendUserResolver",
+                )
+            )
+            _user_resolver = user_resolver_cls()
+
+        return _user_resolver
+
+
+def reset_user_resolver():
+    global _user_resolver
+
+    with _user_resolver_lock:
+        _user_resolver = None
+
+
+def _reset_user_resolver_on_setting_changed(sender, setting, **kwargs):
+    if setting == "AUTHENTICATION_BACKENDS" or setting.startswith("APIGW_JWT_USER_"):
+        reset_user_resolver()
+
+
+setting_changed.connect(_reset_user_resolver_on_setting_changed, dispatch_uid="apigw_manager.reset_user_resolver")
+
+
 class ApiGatewayJWTUserMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -119,7 +320,8 @@ class ApiGatewayJWTUserMiddleware:
         # 1. 来明确标识这个请求来自于网关
         # 2. 用户已经过认证，后端无需再认证
         # 3. 避免非预期调用激活对应后端使得用户认证被绕过
-        return auth.authenticate(
+        # 用户通过进程内预加载的认证后端获取，与 auth.authenticate 的规则一致
+        return get_user_resolver().resolve(
             request,
             gateway_name=gateway_name,
             bk_username=bk_username,
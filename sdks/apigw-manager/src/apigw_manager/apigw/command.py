@@ -16,7 +16,7 @@ from django.conf import settings
 from django.core.management.base import BaseCommand
 
 from apigw_manager.apigw.helper import Definition
-from apigw_manager.apigw.utils import get_configuration, parse_value_list
+from apigw_manager.apigw.utils import get_api_cache, get_configuration, parse_value_list
 from apigw_manager.core.exceptions import ApiResponseError
 from apigw_manager.core.fetch import Fetcher
 from apigw_manager.core.permission import Manager as PermissionManager
@@ -33,6 +33,24 @@ class ApiCommand(BaseCommand):
     def get_configuration(self, **kwargs):
         return get_configuration(**{k: v for k, v in kwargs.items() if v is not None})
 
+    def execute(self, *args, **options):
+        api_cache = get_api_cache()
+        if api_cache is None:
+            return super().execute(*args, **options)
+
+        self.warmup_api_cache(api_cache, **options)
+        with api_cache.track() as stats:
+            try:
+                return super().execute(*args, **options)
+            finally:
+                api_cache.save()
+                if stats.hits or stats.misses:
+                    self.stdout.write("api cache: %s" % stats)
+
+    def warmup_api_cache(self, api_cache, **options):
+        """Prepare the api cache before handling, the persisted responses are loaded by default"""
+        api_cache.load()
+
     def handle(self, *args, **kwargs):
         configuration = self.get_configuration(**kwargs)
         manager = self.manager_class(configuration)
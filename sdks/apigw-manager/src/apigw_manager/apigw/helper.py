@@ -8,9 +8,18 @@
  * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
  * specific language governing permissions and limitations under the License.
 """
+import copy
+import hashlib
 import json
 import logging
+import os
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable, Dict, List, Optional, Tuple
 
 from django.conf import settings
 from django.db.transaction import atomic
@@ -24,6 +33,73 @@ from apigw_manager.core.utils import get_item
 logger = logging.getLogger(__name__)
 
 
+class DefinitionDocument:
+    """A rendered definition, the top level sections are parsed on demand and shared by the loaded definitions"""
+
+    # a top level key in block style, the sections can not be split if there is any other top level construct
+    section_key_pattern = re.compile(r"^([A-Za-z_][\w-]*)[ \t]*:(?:[ \t]|$)")
+    # anchors, aliases and tags may refer to the other sections
+    unsplittable_pattern = re.compile(r"(?:^|[\s\[{,:-])[&*!][^\s,\]}]")
+    full = object()
+
+    def __init__(self, rendered: str):
+        self.rendered = rendered
+        self.sections = self._split(rendered)
+        self._parsed: Dict = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _split(cls, rendered: str) -> Optional[Dict[str, str]]:
+        """Split the text of the top level sections, None will be returned if it is not a simple mapping"""
+        if cls.unsplittable_pattern.search(rendered):
+            return None
+
+        sections: Dict[str, List[str]] = {}
+        lines: Optional[List[str]] = None
+        for line in rendered.splitlines(keepends=True):
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#") or line[0] in " \t" or line.startswith("- "):
+                if lines is None and stripped and not stripped.startswith("#"):
+                    return None
+                if lines is not None:
+                    lines.append(line)
+                continue
+
+            match = cls.section_key_pattern.match(line)
+            if not match or match.group(1) in sections:
+                return None
+
+            lines = sections[match.group(1)] = [line]
+
+        return {name: "".join(lines) for name, lines in sections.items()}
+
+    def get(self, name, default=None):
+        """Get the parsed section, the returned value is shared and should not be modified"""
+        if self.sections is None:
+            loaded = self.get_all()
+            return loaded.get(name, default) if isinstance(loaded, dict) else default
+
+        if name not in self.sections:
+            return default
+
+        return self._parse(name, lambda: (yaml_load(self.sections[name]) or {}).get(name))
+
+    def get_all(self):
+        """Get the whole parsed definition, the returned value is shared and should not be modified"""
+        if self.sections is None:
+            return self._parse(self.full, lambda: yaml_load(self.rendered))
+
+        return {name: self.get(name) for name in self.sections}
+
+    def _parse(self, key, parse):
+        if key not in self._parsed:
+            with self._lock:
+                if key not in self._parsed:
+                    self._parsed[key] = parse()
+
+        return self._parsed[key]
+
+
 class Definition:
     """Gateway model definitions"""
 
@@ -32,23 +108,36 @@ class Definition:
 
     @classmethod
     def load_from(cls, path, dictionary):
-        with open(path) as fp:
-            return cls.load(fp.read(), dictionary)
+        return definition_loader.load_from(path, dictionary)
 
     @classmethod
     def load(cls, definition, dictionary):
-        template = Template(definition)
-        rendered = template.render(Context(dictionary, autoescape=False))
-        logger.debug("rendered definition: %s", rendered)
-
-        return cls(rendered)
+        return definition_loader.load(definition, dictionary)
 
     def __init__(self, definition):
-        loaded = yaml_load(definition)
-
-        self._check_spec_version(loaded)
-        self.spec_version = loaded.get("spec_version")
-        self.loaded = loaded
+        if not isinstance(definition, DefinitionDocument):
+            definition = DefinitionDocument(definition)
+
+        self._document = definition
+        # the sections copied from the document, it can be modified by the caller
+        self._sections: Dict = {}
+        self._loaded = None
+
+        spec_version = self._document.get("spec_version")
+        self._check_spec_version({"spec_version": spec_version})
+        self.spec_version = spec_version
+
+    @property
+    def loaded(self):
+        """The whole definition, only the sections which are required will be parsed if using `get`"""
+        if self._loaded is None:
+            loaded = self._document.get_all()
+            if not isinstance(loaded, dict):
+                self._loaded = copy.deepcopy(loaded)
+            else:
+                self._loaded = {name: self._get_section(name) for name in loaded}
+
+        return self._loaded
 
     def _check_spec_version(self, definition):
         spec_version = definition.get("spec_version")
@@ -64,14 +153,143 @@ class Definition:
 
         return namespace.split(".")
 
+    def _get_section(self, name):
+        if name not in self._sections:
+            missing = object()
+            value = self._document.get(name, missing)
+            if value is missing:
+                raise KeyError(name)
+
+            self._sections[name] = copy.deepcopy(value)
+
+        return self._sections[name]
+
     def get(self, namespace, default=None):
         """Get the definition according to the namespace"""
+        namespaces = self._get_namespace_list(namespace)
         try:
-            return get_item(self.loaded, self._get_namespace_list(namespace))
+            if not namespaces or self._loaded is not None:
+                return get_item(self.loaded, namespaces)
+
+            return get_item(self._get_section(namespaces[0]), namespaces[1:])
         except (KeyError, IndexError):
             return default
 
 
+class DefinitionLoader:
+    """
+    Loads the definitions, which are shared in process.
+
+    - the compiled templates are cached by the file path and modification time, or by the content;
+    - the rendered definitions are cached by the template and the digest of the context, only the settings and the
+      environment variables referred by the template are used to compute the digest;
+    - the sections of a rendered definition are parsed on demand, see `DefinitionDocument`.
+    """
+
+    def __init__(self, max_size: int = 32):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # template key -> (template, source, the referred attributes of the variables)
+        self._templates: "OrderedDict[Tuple, Tuple[Template, str, Dict]]" = OrderedDict()
+        # (template key, context digest) -> document
+        self._documents: "OrderedDict[Tuple, DefinitionDocument]" = OrderedDict()
+
+    def load_from(self, path, dictionary) -> Definition:
+        stat = os.stat(path)
+        key = ("file", os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+        def read():
+            with open(path) as fp:
+                return fp.read()
+
+        return self._load(key, read, dictionary)
+
+    def load(self, definition: str, dictionary) -> Definition:
+        key = ("content", hashlib.sha256(definition.encode("utf-8")).hexdigest())
+        return self._load(key, lambda: definition, dictionary)
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+            self._documents.clear()
+
+    def _load(self, template_key, read, dictionary) -> Definition:
+        template, source, referred = self._get_template(template_key, read)
+        key = (template_key, self._get_context_digest(source, referred, dictionary))
+
+        document = self._get_cached(self._documents, key)
+        if document is None:
+            rendered = template.render(Context(dictionary, autoescape=False))
+            logger.debug("rendered definition: %s", rendered)
+            document = self._set_cached(self._documents, key, DefinitionDocument(rendered))
+
+        return Definition(document)
+
+    def _get_template(self, key, read) -> Tuple[Template, str, Dict]:
+        cached = self._get_cached(self._templates, key)
+        if cached is None:
+            source = read()
+            cached = self._set_cached(self._templates, key, (Template(source), source, {}))
+
+        return cached
+
+    def _get_cached(self, entries: OrderedDict, key):
+        with self._lock:
+            value = entries.get(key)
+            if value is not None:
+                entries.move_to_end(key)
+
+            return value
+
+    def _set_cached(self, entries: OrderedDict, key, value):
+        with self._lock:
+            # keep the first one if loaded concurrently
+            value = entries.setdefault(key, value)
+            entries.move_to_end(key)
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+
+            return value
+
+    def _get_context_digest(self, source: str, referred: Dict, dictionary) -> str:
+        values = {}
+        for name, value in dictionary.items():
+            if value is None or isinstance(value, (str, int, float, bool, list, tuple, dict)):
+                values[name] = value
+                continue
+
+            # the objects like settings and os.environ, only the attributes referred by the template are used
+            if name not in referred:
+                referred[name] = self._get_referred_attributes(source, name)
+
+            attributes = referred[name]
+            if attributes is None:
+                attributes = value.keys() if isinstance(value, Mapping) else [i for i in dir(value) if i.isupper()]
+
+            values[name] = {attribute: self._lookup(value, attribute) for attribute in sorted(attributes)}
+
+        return hashlib.sha256(json.dumps(values, sort_keys=True, default=repr).encode("utf-8")).hexdigest()
+
+    def _get_referred_attributes(self, source: str, name: str) -> Optional[List[str]]:
+        """Returns the attributes of the variable referred by the template, None means the variable is used directly"""
+        attributes = set()
+        for match in re.finditer(r"(?<![\w.])%s\b(\.\w+)?" % re.escape(name), source):
+            if not match.group(1):
+                return None
+            attributes.add(match.group(1)[1:])
+
+        return sorted(attributes)
+
+    def _lookup(self, value, attribute):
+        try:
+            return value[attribute]
+        except (TypeError, KeyError, AttributeError):
+            return getattr(value, attribute, None)
+
+
+definition_loader = DefinitionLoader()
+
+
 class ContextManager:
     scope: str
 
@@ -149,6 +367,142 @@ class PublicKeyManager(ContextManager, BasePublicKeyManager):
         return gateway_name
 
 
+class LocalPublicKeyCache:
+    """
+    Process-local cache of the public keys, keyed by (issuer, gateway_name).
+
+    - when the cache is cold, only one thread loads the public key, the others wait for it;
+    - when an entry expires, one thread refreshes it, the others keep using the stale value;
+    - a missing public key is cached too, but for a shorter time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (issuer, gateway_name) -> (public_key, expires_at)
+        self._entries: Dict[Tuple[str, str], Tuple[Optional[str], float]] = {}
+        self._load_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        # (issuer, gateway_name) -> the time of the last forced reload
+        self._reloaded_at: Dict[Tuple[str, str], float] = {}
+        # increased on invalidation, so that a load started before will not be saved
+        self._generation = 0
+
+    def get_or_load(
+        self,
+        key: Tuple[str, str],
+        load: Callable[[], Optional[str]],
+        ttl: float,
+        negative_ttl: float,
+    ) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.time():
+            return entry[0]
+
+        load_lock = self._get_load_lock(key)
+        if entry is None:
+            load_lock.acquire()
+        elif not load_lock.acquire(blocking=False):
+            # another thread is refreshing it
+            return entry[0]
+
+        try:
+            current = self._entries.get(key)
+            if current is not None and current[1] > time.time():
+                return current[0]
+
+            generation = self._generation
+            try:
+                public_key = load()
+            except Exception:
+                if current is None:
+                    raise
+
+                logger.exception("refresh public key failed, use the stale one, key=%s", key)
+                public_key = current[0]
+
+            expires_at = time.time() + (ttl if public_key else negative_ttl)
+            with self._lock:
+                if generation == self._generation:
+                    self._entries[key] = (public_key, expires_at)
+
+            return public_key
+        finally:
+            load_lock.release()
+
+    def reload(
+        self,
+        key: Tuple[str, str],
+        load: Callable[[], Optional[str]],
+        ttl: float,
+        negative_ttl: float,
+        min_interval: float,
+    ) -> Optional[str]:
+        """
+        Load the public key again before it expires, such as when it fails to verify a signature,
+        a key is reloaded at most once in `min_interval` seconds, return None if it is not reloaded.
+        """
+        now = time.time()
+        with self._lock:
+            if now - self._reloaded_at.get(key, 0) < min_interval:
+                return None
+
+            self._reloaded_at[key] = now
+
+        with self._get_load_lock(key):
+            generation = self._generation
+            public_key = load()
+
+            expires_at = time.time() + (ttl if public_key else negative_ttl)
+            with self._lock:
+                if generation == self._generation:
+                    self._entries[key] = (public_key, expires_at)
+
+            return public_key
+
+    def invalidate(self, gateway_name: Optional[str] = None):
+        """Drop the cached public keys of the gateway, or all of them if gateway_name is not specified"""
+        with self._lock:
+            self._generation += 1
+            if gateway_name is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if key[1] == gateway_name]:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        self.invalidate()
+        with self._lock:
+            self._reloaded_at.clear()
+
+    def _get_load_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        load_lock = self._load_locks.get(key)
+        if load_lock is None:
+            with self._lock:
+                load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        return load_lock
+
+
+public_key_cache = LocalPublicKeyCache()
+
+
+def on_context_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached public key when it is updated in this process,
+    the other processes reload it when it expires or fails to verify a token.
+    """
+    if instance.scope != PublicKeyManager.scope:
+        return
+
+    # the key is `gateway_name` or `issuer:gateway_name`
+    public_key_cache.invalidate(instance.key.rpartition(":")[2])
+
+
+def on_setting_changed(sender, setting, **kwargs):
+    if setting.startswith(("APIGW_", "BK_APIGW_")):
+        public_key_cache.clear()
+
+
 class ReleaseVersionManager(ContextManager):
     scope = "release_version"
 
@@ -205,6 +559,142 @@ class ResourceSignatureManager(ContextManager):
         self.set(gateway_name, saved.get("is_dirty") or last_signature != signature, signature)
 
 
+class ResourceDiff:
+    """The difference between the resources of the definition and the synced ones"""
+
+    def __init__(self, added, changed, removed, unchanged, shared_changed):
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+        self.unchanged = unchanged
+        # the sections except the paths are changed, they may be referred by any resource
+        self.shared_changed = shared_changed
+
+    @property
+    def has_changes(self):
+        return bool(self.shared_changed or self.added or self.changed or self.removed)
+
+
+class ResourceFingerprints:
+    """The fingerprints of each resource in a resources definition (swagger or openapi)"""
+
+    http_methods = {"get", "put", "post", "delete", "options", "head", "patch", "trace", "any"}
+
+    def __init__(self, shared, resources):
+        self.shared = shared
+        self.resources = resources
+
+    @classmethod
+    def from_definition(cls, definition, **options):
+        """Compute the fingerprints, the options which affect the syncing are treated as shared sections"""
+        shared = cls._digest(
+            {
+                "definition": {key: value for key, value in definition.items() if key != "paths"},
+                "options": options,
+            }
+        )
+
+        resources = {}
+        for path, method, path_item, operation in cls._iter_operations(definition):
+            resources[cls.get_resource_name(path, method, operation)] = cls._digest(
+                {"path": path, "method": method, "path_item": path_item, "operation": operation}
+            )
+
+        return cls(shared, resources)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("shared", ""), data.get("resources", {}))
+
+    @classmethod
+    def get_resource_name(cls, path, method, operation):
+        return (operation or {}).get("operationId") or "%s %s" % (method.upper(), path)
+
+    @classmethod
+    def select(cls, definition, names):
+        """Returns a copy of the definition which only contains the specified resources"""
+        names = set(names)
+        paths = {}
+        for path, method, path_item, operation in cls._iter_operations(definition):
+            if cls.get_resource_name(path, method, operation) not in names:
+                continue
+
+            paths.setdefault(path, dict(path_item))[method] = operation
+
+        selected = dict(definition)
+        selected["paths"] = paths
+        return selected
+
+    def to_dict(self):
+        return {"shared": self.shared, "resources": self.resources}
+
+    def diff(self, synced: Optional["ResourceFingerprints"]) -> ResourceDiff:
+        if synced is None:
+            return ResourceDiff(sorted(self.resources), [], [], 0, True)
+
+        added, changed, unchanged = [], [], 0
+        for name, fingerprint in self.resources.items():
+            if name not in synced.resources:
+                added.append(name)
+            elif synced.resources[name] != fingerprint:
+                changed.append(name)
+            else:
+                unchanged += 1
+
+        removed = [name for name in synced.resources if name not in self.resources]
+        return ResourceDiff(sorted(added), sorted(changed), sorted(removed), unchanged, self.shared != synced.shared)
+
+    @classmethod
+    def _iter_operations(cls, definition):
+        for path, raw_path_item in (definition.get("paths") or {}).items():
+            path_item = raw_path_item or {}
+            # the path level fields, such as parameters, are shared by the operations of the path
+            shared = {key: value for key, value in path_item.items() if key.lower() not in cls.http_methods}
+
+            for method, operation in path_item.items():
+                if method.lower() in cls.http_methods:
+                    yield path, method, shared, operation
+
+    @staticmethod
+    def _digest(value):
+        return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class ResourceFingerprintManager(ContextManager):
+    """The resource fingerprints which have been synced to the gateway"""
+
+    scope = "resource_fingerprint"
+
+    def get(self, gateway_name) -> Optional[ResourceFingerprints]:
+        value = self.get_value(gateway_name)
+        if not value:
+            return None
+
+        return ResourceFingerprints.from_dict(json.loads(value))
+
+    def set(self, gateway_name, fingerprints: ResourceFingerprints):
+        self.set_value(gateway_name, json.dumps(fingerprints.to_dict()))
+
+
+class SyncSignatureManager(ContextManager):
+    """The signatures of the inputs of the sync steps which have been applied to the gateway successfully"""
+
+    scope = "sync_signature"
+
+    def _get_key(self, gateway_name, step_name):
+        return "%s:%s" % (gateway_name, step_name)
+
+    def get_signatures(self, gateway_name, step_names):
+        keys = {self._get_key(gateway_name, name): name for name in step_names}
+        return {keys[key]: value for key, value in self.get_values(list(keys)).items()}
+
+    def set_signature(self, gateway_name, step_name, signature):
+        self.set_value(self._get_key(gateway_name, step_name), signature)
+
+    def reset(self, gateway_name):
+        ContextModel.objects.filter(scope=self.scope, key__startswith=self._get_key(gateway_name, "")).delete()
+
+
 def make_default_public_key_manager() -> BasePublicKeyManager:
     public_key_manager_location = getattr(
         settings,
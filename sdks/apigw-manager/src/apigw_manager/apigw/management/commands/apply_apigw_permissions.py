@@ -9,6 +9,7 @@
  * specific language governing permissions and limitations under the License.
 """
 from apigw_manager.apigw.command import PermissionCommand
+from apigw_manager.apigw.utils import map_concurrently
 
 
 class Command(PermissionCommand):
@@ -30,7 +31,10 @@ class Command(PermissionCommand):
             if permission.get("grant_dimension") in [None, "gateway"]:
                 permission["grant_dimension"] = "api"
 
-            result = manager.apply_permission(**permission)
+        # the permissions are independent of each other, apply them concurrently
+        results = map_concurrently(lambda permission: manager.apply_permission(**permission), definition)
+
+        for permission, result in zip(definition, results):
             print(
                 "Applied permissions for gateway %s, record %s, dimension %s"
                 % (
@@ -37,3 +37,5 @@ class Command(FetchCommand):
 
         public_key_manager = helper.make_default_public_key_manager()
         public_key_manager.set(configuration.gateway_name, result["public_key"], result.get("issuer"))
+        # the public key may be stored out of the Context model, such as in a k8s secret
+        helper.public_key_cache.invalidate(configuration.gateway_name)
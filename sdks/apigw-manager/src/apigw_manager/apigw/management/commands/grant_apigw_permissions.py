@@ -9,6 +9,7 @@
  * specific language governing permissions and limitations under the License.
 """
 from apigw_manager.apigw.command import PermissionCommand
+from apigw_manager.apigw.utils import map_concurrently
 
 
 class Command(PermissionCommand):
@@ -27,8 +28,10 @@ class Command(PermissionCommand):
             if permission.get("grant_dimension") in [None, "gateway"]:
                 permission["grant_dimension"] = "api"
 
-            manager.grant_permission(**permission)
+        # the permissions are independent of each other, grant them concurrently
+        map_concurrently(lambda permission: manager.grant_permission(**permission), definition)
 
+        for permission in definition:
             print(
                 "Granted gateway %s permission for app code %s, dimension %s"
                 % (
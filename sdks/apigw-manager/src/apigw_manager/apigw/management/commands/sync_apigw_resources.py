@@ -10,15 +10,17 @@
 """
 import hashlib
 import json
+import time
 
 from apigw_manager.apigw.command import SyncCommand
-from apigw_manager.apigw.helper import ResourceSignatureManager
+from apigw_manager.apigw.helper import ResourceFingerprintManager, ResourceFingerprints, ResourceSignatureManager
 
 
 class Command(SyncCommand):
     """Synchronous API Gateway resources"""
 
     ResourceSignatureManager = ResourceSignatureManager
+    ResourceFingerprintManager = ResourceFingerprintManager
 
     def add_arguments(self, parser):
         super(Command, self).add_arguments(parser)
@@ -37,6 +39,22 @@ class Command(SyncCommand):
             help="language for gen api doc: en/zh",
         )
 
+        parser.add_argument(
+            "--delta",
+            default=False,
+            action="store_true",
+            help="only submit the resources changed since the last synchronization, "
+            "the resources changed on the gateway side will not be restored if they are unchanged locally",
+        )
+
+        parser.add_argument(
+            "--dry-run",
+            dest="dry_run",
+            default=False,
+            action="store_true",
+            help="only print the difference between the resources and the synchronized ones",
+        )
+
     def _update_signature(self, gateway_name, definition, added, deleted):
         signature = hashlib.md5(json.dumps(definition, sort_keys=True).encode("utf-8")).hexdigest()
 
@@ -47,14 +65,68 @@ class Command(SyncCommand):
         if added > 0 or deleted > 0:
             manager.mark_dirty(gateway_name)
 
+    def _get_content(self, definition, fingerprints, diff, delete):
+        """Returns the resources to be submitted, None means a full synchronization is required"""
+        # 公共部分（如 definitions）可能被任意资源引用；删除资源只能通过全量同步完成
+        if diff.shared_changed or (delete and diff.removed):
+            return None
+
+        return ResourceFingerprints.select(definition, diff.added + diff.changed)
+
+    def _print_diff(self, gateway_name, diff, elapsed):
+        print(
+            "API gateway %s resources diff, added %s, changed %s, removed %s, unchanged %s, computed in %.3fs"
+            % (gateway_name, len(diff.added), len(diff.changed), len(diff.removed), diff.unchanged, elapsed)
+        )
+
+        if diff.shared_changed:
+            print("the shared definitions are changed or never synchronized, all resources will be submitted")
+
+        for sign, names in (("+", diff.added), ("~", diff.changed), ("-", diff.removed)):
+            for name in names:
+                print("  %s %s" % (sign, name))
+
     def do(self, manager, definition, configuration, *args, **kwargs):
+        gateway_name = configuration.gateway_name
+        started_at = time.perf_counter()
+
+        fingerprints = ResourceFingerprints.from_definition(
+            definition, delete=kwargs["delete"], doc_language=kwargs["doc_language"]
+        )
+        fingerprint_manager = self.ResourceFingerprintManager()
+        # the fingerprints only track the local changes, so all resources are submitted by default,
+        # which restores the resources changed on the gateway side
+        delta = kwargs.get("delta") or kwargs.get("dry_run")
+        synced = fingerprint_manager.get(gateway_name) if delta else None
+        diff = fingerprints.diff(synced)
+        diff_elapsed = time.perf_counter() - started_at
+
+        if kwargs.get("dry_run"):
+            self._print_diff(gateway_name, diff, diff_elapsed)
+            return
+
+        if not diff.has_changes:
+            print(
+                "API gateway resources are unchanged since the last synchronization, skip, computed in %.3fs"
+                % diff_elapsed
+            )
+            return
+
+        content = self._get_content(definition, fingerprints, diff, kwargs["delete"])
+        if content is not None and not content["paths"]:
+            # the removed resources are kept on the gateway without `--delete`, the fingerprints are not updated,
+            # so that they will be deleted by a later synchronization with `--delete`
+            print("only resources removed, which are kept without --delete, skip, computed in %.3fs" % diff_elapsed)
+            return
+
         sync_args = {
-            'content': definition,
-            'delete': kwargs["delete"],
+            "content": definition if content is None else content,
+            # 增量同步时，提交的资源只是部分资源，不能删除其它资源
+            "delete": kwargs["delete"] if content is None else False,
         }
 
-        if kwargs['doc_language']:
-            sync_args['doc_language'] = kwargs['doc_language']
+        if kwargs["doc_language"]:
+            sync_args["doc_language"] = kwargs["doc_language"]
 
         result = manager.sync_resources_config(**sync_args)
 
@@ -63,8 +135,15 @@ class Command(SyncCommand):
         updated_count = len(result["updated"])
 
         print(
-            "API gateway resources synchronization completed, added %s, updated %s, deleted %s"
-            % (added_count, updated_count, deleted_count)
+            "API gateway resources synchronization completed, added %s, updated %s, deleted %s, %s in %.3fs"
+            % (
+                added_count,
+                updated_count,
+                deleted_count,
+                "full" if content is None else "delta of %s resources" % len(diff.added + diff.changed),
+                time.perf_counter() - started_at,
+            )
         )
 
-        self._update_signature(configuration.gateway_name, definition, added_count, deleted_count)
+        self._update_signature(gateway_name, definition, added_count, deleted_count)
+        fingerprint_manager.set(gateway_name, fingerprints)
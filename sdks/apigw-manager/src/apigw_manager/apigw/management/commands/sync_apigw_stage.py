@@ -9,6 +9,7 @@
  * specific language governing permissions and limitations under the License.
 """
 from apigw_manager.apigw.command import SyncCommand
+from apigw_manager.apigw.utils import map_concurrently
 
 
 class Command(SyncCommand):
@@ -27,8 +28,9 @@ class Command(SyncCommand):
 
     def do(self, manager, definition, *args, **kwargs):
         if self.default_namespace == "stages":
-            for stage_definition in definition:
-                result = manager.sync_stage_config(**stage_definition)
+            # the stages are independent of each other, sync them concurrently
+            results = map_concurrently(lambda stage: manager.sync_stage_config(**stage), definition)
+            for result in results:
                 print("API gateway stage synchronization completed, id %s, name %s" % (result["id"], result["name"]))
         else:
             result = manager.sync_stage_config(**definition)
@@ -10,6 +10,7 @@
 """
 
 from apigw_manager.apigw.command import SyncCommand
+from apigw_manager.apigw.utils import map_concurrently
 
 
 class Command(SyncCommand):
@@ -26,8 +27,8 @@ class Command(SyncCommand):
         return super().get_definition(define, file, namespace, **kwargs)
 
     def do(self, manager, definition, *args, **kwargs):
-        for stage_definition in definition:
-            result = manager.sync_stage_mcp_servers(**stage_definition)
+        results = map_concurrently(lambda stage: manager.sync_stage_mcp_servers(**stage), definition)
+        for result in results:
             for mcp_sync_result in result.get("data", []):
                 print("API gateway stage mcp servers synchronization completed [ id:%s,name:%s,action:%s ]" % (
                     mcp_sync_result["id"], mcp_sync_result["name"], mcp_sync_result["action"]))
\ No newline at end of file
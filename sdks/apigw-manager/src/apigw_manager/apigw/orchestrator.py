@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connections
+
+from apigw_manager.apigw.helper import Definition, SyncSignatureManager
+from apigw_manager.apigw.utils import get_configuration, get_sync_max_workers, parse_value_list
+
+logger = logging.getLogger(__name__)
+
+
+class DefinitionInput:
+    """The rendered sections of a definition file, the whole definition will be used if no namespace specified"""
+
+    def __init__(self, file, namespaces=(), define=()):
+        self.file = file
+        self.namespaces = list(namespaces)
+        self.define = list(define)
+
+    def load(self, loaded: Dict) -> Definition:
+        """Load the definition, the rendered definitions are shared by the inputs via `loaded`"""
+        key = (self.file, tuple(self.define))
+        if key not in loaded:
+            # the same context as `DefinitionCommand.get_context`
+            context = {"data": parse_value_list(*self.define), "settings": settings, "environ": os.environ}
+            loaded[key] = Definition.load_from(self.file, context)
+
+        return loaded[key]
+
+    def get_value(self, definition):
+        if not self.namespaces:
+            return definition.loaded
+
+        return {namespace: definition.get(namespace) for namespace in self.namespaces}
+
+    def digest(self, loaded: Dict) -> str:
+        return _hash_value(self.get_value(self.load(loaded)))
+
+
+class ResourceDocsInput(DefinitionInput):
+    """The resource docs section of a definition file, and the content of the docs archive file or directory"""
+
+    def __init__(self, file, define=()):
+        super().__init__(file, ["resource_docs"], define)
+
+    def digest(self, loaded: Dict) -> str:
+        definition = self.load(loaded)
+        docs = definition.get("resource_docs") or {}
+
+        return _hash_value(
+            {
+                "definition": self.get_value(definition),
+                "archivefile": _hash_path(docs.get("archivefile")),
+                "basedir": _hash_path(docs.get("basedir")),
+            }
+        )
+
+
+class SyncStep:
+    """A sync step, which calls a management command.
+
+    :param name: The unique name of the step.
+    :param command: The management command to call.
+    :param args: The arguments of the command.
+    :param depends_on: The names of the steps which should be succeeded before this step.
+    :param inputs: The inputs of the command, which are used to detect changes.
+    :param always_run: Run the step even if nothing has changed, it is for the steps which depend on the gateway state.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        command: str,
+        args: Sequence[str] = (),
+        depends_on: Sequence[str] = (),
+        inputs: Sequence[DefinitionInput] = (),
+        always_run: bool = False,
+    ):
+        self.name = name
+        self.command = command
+        self.args = list(args)
+        self.depends_on = list(depends_on)
+        self.inputs = list(inputs)
+        self.always_run = always_run
+
+    def __repr__(self):
+        return "<SyncStep %s>" % self.name
+
+
+class SyncStepResult:
+    SUCCEEDED = "succeeded"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, name: str, status: str, elapsed: float = 0.0, error: Optional[BaseException] = None):
+        self.name = name
+        self.status = status
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.status in (self.SUCCEEDED, self.SKIPPED)
+
+    def __repr__(self):
+        return "<SyncStepResult %s: %s>" % (self.name, self.status)
+
+
+class SyncOrchestrator:
+    """Run the sync steps in the order of their dependencies.
+
+    The independent steps run concurrently. The signatures of the inputs of the succeeded steps are saved,
+    with `skip_unchanged`, a step is skipped when the signature is the same as the one synced last time.
+    The signature of a step covers its command, arguments, inputs and the signatures of its dependencies,
+    so that a change is propagated to all the steps which depend on it.
+
+    The signatures only track the local inputs, the changes made on the gateway side, such as by the web UI,
+    are not detected, so all the steps run by default to converge the gateway to the definitions.
+
+    :param gateway_name: The gateway to sync, the signatures of the steps are stored for each gateway.
+    :param steps: The steps to run.
+    :param max_workers: The max number of the steps running concurrently, 1 means running in the current thread.
+    :param skip_unchanged: Skip the steps whose inputs are unchanged since the last successful sync.
+    """
+
+    SyncSignatureManager = SyncSignatureManager
+
+    def __init__(
+        self,
+        gateway_name: str,
+        steps: Sequence[SyncStep],
+        max_workers: Optional[int] = None,
+        skip_unchanged: bool = False,
+    ):
+        self.gateway_name = gateway_name
+        self.steps = list(steps)
+        self.max_workers = get_sync_max_workers() if max_workers is None else max_workers
+        self.skip_unchanged = skip_unchanged
+        self.signature_manager = self.SyncSignatureManager()
+
+        self._check_steps()
+
+    def run(self) -> List[SyncStepResult]:
+        """Run the steps, returns the results in the order of the steps"""
+        signatures = self._make_signatures()
+        saved_signatures = (
+            self.signature_manager.get_signatures(self.gateway_name, signatures) if self.skip_unchanged else {}
+        )
+
+        results: Dict[str, SyncStepResult] = {}
+        pending = list(self.steps)
+        running: Dict[Future, SyncStep] = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers) if self.max_workers > 1 else None
+
+        try:
+            while pending or running:
+                ready = self._pop_ready_steps(pending, results)
+                while ready:
+                    for step in ready:
+                        result = self._check_step(step, results, signatures, saved_signatures)
+                        if result:
+                            results[step.name] = result
+                        else:
+                            running[self._submit(executor, step)] = step
+
+                    # the skipped and cancelled steps are finished immediately, so more steps may be ready
+                    ready = self._pop_ready_steps(pending, results)
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    result = results[step.name] = future.result()
+
+                    # the signatures are saved in current thread, so that they will never be saved partially
+                    if result.status == SyncStepResult.SUCCEEDED and step.name in signatures:
+                        self.signature_manager.set_signature(self.gateway_name, step.name, signatures[step.name])
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+
+        return [results[step.name] for step in self.steps]
+
+    def _check_steps(self):
+        names = set()
+        for step in self.steps:
+            if step.name in names:
+                raise ValueError("duplicated sync step %s" % step.name)
+
+            # the dependencies should be declared in front, so there is no cycle
+            for name in step.depends_on:
+                if name not in names:
+                    raise ValueError("sync step %s depends on %s, which is not declared before it" % (step.name, name))
+
+            names.add(step.name)
+
+    def _make_signatures(self) -> Dict[str, str]:
+        """Returns the signatures of the steps, the steps which should always run have no signature"""
+        host = get_configuration().host
+        loaded: Dict = {}
+        chained: Dict[str, str] = {}
+        signatures = {}
+
+        for step in self.steps:
+            chained[step.name] = _hash_value(
+                {
+                    "host": host,
+                    "command": step.command,
+                    "args": step.args,
+                    "inputs": [i.digest(loaded) for i in step.inputs],
+                    "depends_on": [chained[name] for name in step.depends_on],
+                }
+            )
+
+            if not step.always_run:
+                signatures[step.name] = chained[step.name]
+
+        return signatures
+
+    def _pop_ready_steps(self, pending, results):
+        ready = [step for step in pending if all(name in results for name in step.depends_on)]
+        for step in ready:
+            pending.remove(step)
+
+        return ready
+
+    def _check_step(self, step, results, signatures, saved_signatures) -> Optional[SyncStepResult]:
+        """Returns the result if the step need not run"""
+        failed = [name for name in step.depends_on if not results[name].ok]
+        if failed:
+            logger.warning("sync step %s is cancelled, because the steps it depends on failed: %s", step.name, failed)
+            return SyncStepResult(step.name, SyncStepResult.CANCELLED)
+
+        signature = signatures.get(step.name)
+        if signature and saved_signatures.get(step.name) == signature:
+            logger.info("sync step %s is skipped, nothing has changed", step.name)
+            return SyncStepResult(step.name, SyncStepResult.SKIPPED)
+
+        return None
+
+    def _submit(self, executor, step) -> Future:
+        if executor:
+            return executor.submit(self._run_step, step, True)
+
+        future: Future = Future()
+        future.set_result(self._run_step(step, False))
+        return future
+
+    def _run_step(self, step, threaded) -> SyncStepResult:
+        started_at = time.perf_counter()
+        try:
+            call_command(step.command, *step.args)
+        # the commands exit by `sys.exit(1)` when the gateway responds an error
+        except (Exception, SystemExit) as err:
+            logger.exception("sync step %s failed", step.name)
+            return SyncStepResult(step.name, SyncStepResult.FAILED, time.perf_counter() - started_at, err)
+        finally:
+            # the database connections are per thread, release them before the thread is reused
+            if threaded:
+                connections.close_all()
+
+        return SyncStepResult(step.name, SyncStepResult.SUCCEEDED, time.perf_counter() - started_at)
+
+
+def make_sync_steps(
+    gateway_name: str,
+    definition_file: str,
+    resources_file: Optional[str] = None,
+    stages: Sequence[str] = (),
+    doc_language: Optional[str] = None,
+    sync_resource_docs: bool = False,
+    grant_permissions: bool = True,
+    sync_mcp_servers: bool = False,
+) -> List[SyncStep]:
+    """Returns the steps to sync a gateway by the definition file and the resources file.
+
+    config ─┬─ stage ───────────────────────────────┬─ release ── mcp servers
+            ├─ resources ─┬─ resource docs ─────────┘
+            │             └─ grant permissions
+            └─ public key
+    """
+    gateway_args = ["--gateway-name=%s" % gateway_name]
+    definition_args = gateway_args + ["--file=%s" % definition_file]
+
+    steps = [
+        SyncStep(
+            "config",
+            "sync_apigw_config",
+            definition_args,
+            inputs=[DefinitionInput(definition_file, ["apigateway"])],
+        ),
+        SyncStep(
+            "stage",
+            "sync_apigw_stage",
+            definition_args,
+            depends_on=["config"],
+            inputs=[DefinitionInput(definition_file, ["stage", "stages"])],
+        ),
+    ]
+    release_depends_on = ["stage"]
+
+    if resources_file:
+        resources_args = gateway_args + ["--delete", "--file=%s" % resources_file]
+        if doc_language:
+            resources_args.append("--doc_language=%s" % doc_language)
+
+        steps.append(
+            SyncStep(
+                "resources",
+                "sync_apigw_resources",
+                resources_args,
+                depends_on=["config"],
+                inputs=[DefinitionInput(resources_file)],
+            )
+        )
+        release_depends_on.append("resources")
+
+    if sync_resource_docs:
+        steps.append(
+            SyncStep(
+                "resource_docs",
+                "sync_resource_docs_by_archive",
+                definition_args + ["--safe-mode"],
+                depends_on=["resources"] if resources_file else ["config"],
+                inputs=[ResourceDocsInput(definition_file)],
+            )
+        )
+        release_depends_on.append("resource_docs")
+
+    if grant_permissions:
+        steps.append(
+            SyncStep(
+                "grant_permissions",
+                "grant_apigw_permissions",
+                definition_args,
+                # the permissions may be granted by resources
+                depends_on=["resources"] if resources_file else ["config"],
+                inputs=[DefinitionInput(definition_file, ["grant_permissions"])],
+            )
+        )
+
+    release_args = list(definition_args)
+    if stages:
+        release_args.append("--stage")
+        release_args.extend(stages)
+
+    steps.extend(
+        [
+            # whether to create a version depends on the gateway state, so it always runs
+            SyncStep(
+                "release", "create_version_and_release_apigw", release_args, release_depends_on, always_run=True
+            ),
+            SyncStep("public_key", "fetch_apigw_public_key", gateway_args, depends_on=["config"], always_run=True),
+        ]
+    )
+
+    if sync_mcp_servers:
+        steps.append(
+            SyncStep(
+                "mcp_servers",
+                "sync_apigw_stage_mcp_servers",
+                definition_args,
+                # the tools of the mcp servers should be released
+                depends_on=["release"],
+                inputs=[DefinitionInput(definition_file, ["stages"])],
+            )
+        )
+
+    return steps
+
+
+def _hash_value(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _hash_path(path) -> str:
+    """Returns the digest of the file, or all the files in the directory"""
+    if not path or not os.path.exists(path):
+        return ""
+
+    hasher = hashlib.sha256()
+    if os.path.isfile(path):
+        files = [(os.path.basename(path), path)]
+    else:
+        files = sorted(
+            (os.path.relpath(os.path.join(root, name), path), os.path.join(root, name))
+            for root, _, names in os.walk(path)
+            for name in names
+        )
+
+    for name, file_path in files:
+        hasher.update(name.encode("utf-8"))
+        with open(file_path, "rb") as fp:
+            for chunk in iter(lambda: fp.read(65536), b""):
+                hasher.update(chunk)
+
+    return hasher.hexdigest()
@@ -10,17 +10,23 @@
 """
 
 import abc
+import copy
+import hashlib
 import logging
 import os
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 
 import jwt
 from django.conf import settings
 from django.core.cache import caches
 from django.core.cache.backends.dummy import DummyCache
 from django.http.request import HttpRequest
+from jwt.algorithms import get_default_algorithms
 
-from apigw_manager.apigw.helper import make_default_public_key_manager
+from apigw_manager.apigw.helper import make_default_public_key_manager, public_key_cache
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +49,13 @@ class PublicKeyProvider(metaclass=abc.ABCMeta):
         return None when process error
         """
 
+    def reload(self, gateway_name: str, jwt_issuer: Optional[str] = None) -> Optional[str]:
+        """
+        reload should load the public key again when the provided one fails to verify a token,
+        and return None when the public key is not reloaded
+        """
+        return None
+
 
 class SettingsPublicKeyProvider(PublicKeyProvider):
     def provide(self, gateway_name: str, jwt_issuer: Optional[str] = None) -> Optional[str]:
@@ -101,6 +114,61 @@ class CachePublicKeyProvider(SettingsPublicKeyProvider):
         return public_key
 
 
+class LocalCachePublicKeyProvider(CachePublicKeyProvider):
+    """
+    Keep the public keys in the process, so that the database or the k8s secret is not read on every request.
+    The cache is only invalidated in the process which updates the public key, such as by the command
+    fetch_apigw_public_key, the other processes reload it when it fails to verify a token, or when it expires.
+
+    settings.APIGW_JWT_PUBLIC_KEY_REFRESH_SECONDS is the interval to refresh the cached public key,
+    if the value is 0, it does not need to cache in the process.
+
+    settings.APIGW_JWT_PUBLIC_KEY_NEGATIVE_CACHE_SECONDS is the seconds to cache a missing public key.
+
+    settings.APIGW_JWT_PUBLIC_KEY_RELOAD_SECONDS is the min interval to reload a public key which fails to
+    verify a token, so that the invalid tokens will not make the public key loaded on every request.
+    """
+
+    REFRESH_SECONDS = 300
+    NEGATIVE_CACHE_SECONDS = 30
+    RELOAD_SECONDS = 10
+
+    def __init__(self, default_gateway_name: str):
+        super().__init__(default_gateway_name)
+
+        self.refresh_seconds = getattr(settings, "APIGW_JWT_PUBLIC_KEY_REFRESH_SECONDS", self.REFRESH_SECONDS)
+        self.negative_cache_seconds = getattr(
+            settings, "APIGW_JWT_PUBLIC_KEY_NEGATIVE_CACHE_SECONDS", self.NEGATIVE_CACHE_SECONDS
+        )
+        self.reload_seconds = getattr(settings, "APIGW_JWT_PUBLIC_KEY_RELOAD_SECONDS", self.RELOAD_SECONDS)
+
+    def provide(self, gateway_name: str, jwt_issuer: Optional[str] = None) -> Optional[str]:
+        load = super(LocalCachePublicKeyProvider, self).provide
+        if not self.refresh_seconds:
+            return load(gateway_name, jwt_issuer)
+
+        return public_key_cache.get_or_load(
+            (jwt_issuer or "", gateway_name),
+            lambda: load(gateway_name, jwt_issuer),
+            self.refresh_seconds,
+            self.negative_cache_seconds,
+        )
+
+    def reload(self, gateway_name: str, jwt_issuer: Optional[str] = None) -> Optional[str]:
+        if not self.refresh_seconds:
+            # the public key is loaded on every request
+            return None
+
+        load = super(LocalCachePublicKeyProvider, self).provide
+        return public_key_cache.reload(
+            (jwt_issuer or "", gateway_name),
+            lambda: load(gateway_name, jwt_issuer),
+            self.refresh_seconds,
+            self.negative_cache_seconds,
+            self.reload_seconds,
+        )
+
+
 # jwt key provider
 
 
@@ -136,7 +204,117 @@ class JWTProvider(metaclass=abc.ABCMeta):
         """
 
 
+class VerifiedTokenCache:
+    """
+    A bounded LRU cache of the verified tokens, keyed by the digest of the token.
+    An entry expires after `ttl` seconds, or when the token expires, whichever comes first.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # digest -> (expires_at, gateway_name, issuer, public_key, payload)
+        self._entries: "OrderedDict[bytes, Tuple[float, str, str, str, dict]]" = OrderedDict()
+
+    def make_key(self, token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, key: bytes) -> Optional[Tuple[str, str, str, dict]]:
+        """Return the (gateway_name, issuer, public_key, payload) of the verified token"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, gateway_name, issuer, public_key, payload = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        # the payload may be modified by the views, such as the nested user and app
+        return gateway_name, issuer, public_key, copy.deepcopy(payload)
+
+    def set(self, key: bytes, gateway_name: str, issuer: str, public_key: str, payload: dict):
+        expires_at = time.time() + self.ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+
+        with self._lock:
+            self._entries[key] = (expires_at, gateway_name, issuer, public_key, copy.deepcopy(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
 class DefaultJWTProvider(JWTProvider):
+    """
+    settings.APIGW_JWT_TOKEN_CACHE_SIZE is the max number of the verified tokens to cache,
+    if the value is 0, the tokens will be verified on every request.
+
+    settings.APIGW_JWT_TOKEN_CACHE_SECONDS is the max seconds to cache a verified token,
+    the token is never cached beyond its `exp`.
+    """
+
+    TOKEN_CACHE_SIZE = 1024
+    TOKEN_CACHE_SECONDS = 60
+    # the max number of the parsed public keys, a key is kept for each gateway and algorithm
+    VERIFYING_KEY_CACHE_SIZE = 128
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.token_cache: Optional[VerifiedTokenCache] = None
+        cache_size = getattr(settings, "APIGW_JWT_TOKEN_CACHE_SIZE", self.TOKEN_CACHE_SIZE)
+        cache_seconds = getattr(settings, "APIGW_JWT_TOKEN_CACHE_SECONDS", self.TOKEN_CACHE_SECONDS)
+        if cache_size and cache_seconds:
+            self.token_cache = VerifiedTokenCache(cache_size, cache_seconds)
+
+        # (gateway_name, algorithm) -> (public_key, parsed key), the least recently used ones are dropped
+        self._verifying_keys: "OrderedDict[Tuple[str, str], Tuple[str, Any]]" = OrderedDict()
+        self._verifying_keys_lock = threading.Lock()
+
+    def _get_verifying_key(self, gateway_name, public_key, algorithm):
+        """Return the parsed public key, parsing the PEM string is much slower than verifying the signature"""
+        cache_key = (gateway_name, algorithm)
+        with self._verifying_keys_lock:
+            cached = self._verifying_keys.get(cache_key)
+            if cached is not None and cached[0] == public_key:
+                self._verifying_keys.move_to_end(cache_key)
+                return cached[1]
+
+        alg_obj = get_default_algorithms().get(algorithm)
+        if alg_obj is None:
+            # let jwt.decode report the unsupported algorithm
+            return public_key
+
+        verifying_key = alg_obj.prepare_key(public_key)
+        with self._verifying_keys_lock:
+            self._verifying_keys[cache_key] = (public_key, verifying_key)
+            self._verifying_keys.move_to_end(cache_key)
+            while len(self._verifying_keys) > self.VERIFYING_KEY_CACHE_SIZE:
+                self._verifying_keys.popitem(last=False)
+
+        return verifying_key
+
+    def _verify(self, jwt_token, gateway_name, public_key, algorithm):
+        verifying_key = self._get_verifying_key(gateway_name, public_key, algorithm)
+        return self._decode_jwt(jwt_token, verifying_key, algorithm)
+
+    def _reload_public_key(self, gateway_name, iss):
+        try:
+            return self.public_key_provider.reload(gateway_name, iss)
+        except Exception:
+            logger.exception("reload public key failed, gateway=%s, issuer=%s", gateway_name, iss)
+            return None
+
     def _decode_jwt(self, jwt_payload, public_key, algorithm):
         return jwt.decode(
             jwt_payload,
@@ -155,6 +333,15 @@ class DefaultJWTProvider(JWTProvider):
         if not jwt_token:
             return None
 
+        token_cache = self.token_cache
+        cache_key = token_cache.make_key(jwt_token) if token_cache is not None else b""
+        cached = token_cache.get(cache_key) if token_cache is not None else None
+        if cached is not None:
+            gateway_name, iss, verified_public_key, payload = cached
+            # the token is trusted only if it was verified by the current public key of the gateway
+            if self.public_key_provider.provide(gateway_name, iss) == verified_public_key:
+                return DecodedJWT(gateway_name=gateway_name, payload=payload)
+
         try:
             jwt_header = self._decode_jwt_header(jwt_token)
             gateway_name = jwt_header.get("kid") or self.default_gateway_name
@@ -166,9 +353,21 @@ class DefaultJWTProvider(JWTProvider):
                 return None
 
             algorithm = jwt_header.get("alg") or self.algorithm
-            decoded = self._decode_jwt(jwt_token, public_key, algorithm)
+            try:
+                decoded = self._verify(jwt_token, gateway_name, public_key, algorithm)
+            except jwt.InvalidSignatureError:
+                # the public key may be rotated, and the one cached in this process is outdated
+                reloaded_public_key = self._reload_public_key(gateway_name, iss)
+                if not reloaded_public_key or reloaded_public_key == public_key:
+                    raise
+
+                public_key = reloaded_public_key
+                decoded = self._verify(jwt_token, gateway_name, public_key, algorithm)
+
+            if token_cache is not None:
+                token_cache.set(cache_key, gateway_name, iss, public_key, decoded)
 
-            return DecodedJWT(gateway_name=gateway_name, payload=decoded)
+            return DecodedJWT(gateway_name=gateway_name, payload=dict(decoded))
 
         except jwt.PyJWTError as e:
             if not self.allow_invalid_jwt_token:
@@ -11,15 +11,24 @@
 
 import os
 import re
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 import yaml
 from packaging.version import InvalidVersion
 from packaging.version import Version as _Version
 
 from apigw_manager.core import configuration
+from apigw_manager.core.cache import ApiResponseCache
 from bkapi_client_core.config import SettingKeys, settings
 
+DEFAULT_SYNC_MAX_WORKERS = 4
+DEFAULT_API_CACHE_TTL = 0
+
+_api_cache = None
+_api_cache_lock = threading.Lock()
+
 
 def get_configuration(**kwargs):
     """Generate management configuration according to the settings"""
@@ -40,6 +49,9 @@ def get_configuration(**kwargs):
         if value is not None:
             kwargs[key] = value
 
+    if "api_cache" not in kwargs:
+        kwargs["api_cache"] = get_api_cache()
+
     host = kwargs.pop("host", "")
     if not host:
         host = _get_host_from_settings()
@@ -66,9 +78,62 @@ def _get_host_from_settings():
     return ""
 
 
+def get_sync_max_workers():
+    """The max number of concurrent requests when syncing, it can be set by `BK_APIGW_SYNC_MAX_WORKERS`"""
+    max_workers = settings.get("BK_APIGW_SYNC_MAX_WORKERS")
+    if max_workers is None:
+        return DEFAULT_SYNC_MAX_WORKERS
+
+    return max(int(max_workers), 1)
+
+
+def get_api_cache():
+    """The process-wide cache of the gateway management reads, None if it is disabled.
+
+    The cache is disabled by default, the entries expire after `BK_APIGW_API_CACHE_TTL` seconds if it is set, and will
+    be persisted into `BK_APIGW_API_CACHE_FILE` if it is set, so that they are shared by the commands running in
+    different processes.
+    """
+    global _api_cache
+
+    ttl = settings.get("BK_APIGW_API_CACHE_TTL")
+    ttl = DEFAULT_API_CACHE_TTL if ttl is None else int(ttl)
+    if ttl <= 0:
+        return None
+
+    path = settings.get("BK_APIGW_API_CACHE_FILE") or None
+    with _api_cache_lock:
+        if _api_cache is None or (_api_cache.ttl, _api_cache.path) != (ttl, path):
+            _api_cache = ApiResponseCache(ttl=ttl, path=path)
+
+        return _api_cache
+
+
+def map_concurrently(func, items, max_workers=None):
+    """Call func with each item in a bounded thread pool, the results are in the order of items.
+
+    All the items will be processed, then the first error in the order of items will be raised.
+    """
+    items = list(items)
+    if max_workers is None:
+        max_workers = get_sync_max_workers()
+
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+
+    return [future.result() for future in futures]
+
+
+# the libyaml based loader is much faster, it is available when PyYAML is built with libyaml
+YamlLoader = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
+
 def yaml_load(content):
     """Load YAML"""
-    return yaml.load(content, Loader=yaml.FullLoader)
+    return yaml.load(content, Loader=YamlLoader)
 
 
 def parse_value_list(*values):
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, suppress
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # not available on Windows, the processes may overwrite the entries saved by each other
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStats(object):
+    """Hit/miss statistics of a cache"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self):
+        return "%s hits, %s misses" % (self.hits, self.misses)
+
+
+class ApiResponseCache(object):
+    """
+    TTL based cache of the responses of the idempotent gateway management reads, it is used as
+    `Configuration.api_cache`.
+
+    - the entries of a gateway are dropped by `invalidate` after writing to the gateway;
+    - the entries can be persisted into a file by `save`, and loaded by `load`, so that they are shared by the
+      commands running in different processes; the file is merged on saving, the newer entries and the
+      invalidations of the other processes are kept;
+    - the statistics of the whole cache are in `stats`, and the ones of a block of code can be tracked by `track`.
+    """
+
+    version = 1
+    # the key of the invalidation of all the gateways
+    ALL_GATEWAYS = "*"
+
+    def __init__(self, ttl=300, path=None, clock=time.time):
+        self.ttl = ttl
+        self.path = path
+        self.clock = clock
+        self.stats = CacheStats()
+
+        self._lock = threading.Lock()
+        # (gateway_name, operation_id, data) -> (stored_at, expires_at, result)
+        self._entries: Dict[Tuple[str, str, str], Tuple[float, float, Any]] = {}
+        # gateway_name -> the time of the last invalidation, the entries stored before it are stale
+        self._invalidated: Dict[str, float] = {}
+        self._local = threading.local()
+        self._loaded_mtime: Optional[float] = None
+        # the number of changes, and the one persisted by the last saving
+        self._changes = 0
+        self._saved_changes = 0
+        # the threads of a process save the same file, such as the commands run by the sync orchestrator
+        self._save_lock = threading.Lock()
+
+    def _make_key(self, operation_id, data):
+        gateway_name = data.get("gateway_name") if isinstance(data, dict) else None
+        return gateway_name or "", operation_id, json.dumps(data, sort_keys=True, default=str)
+
+    def _count(self, hit):
+        for stats in [self.stats] + getattr(self._local, "tracking", []):
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+
+    def _is_stale(self, gateway_name, stored_at, invalidated: Dict[str, float]):
+        return stored_at <= max(invalidated.get(gateway_name, 0), invalidated.get(self.ALL_GATEWAYS, 0))
+
+    def try_get(self, operation_id, data) -> Tuple[bool, Any]:
+        key = self._make_key(operation_id, data)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= self.clock():
+                del self._entries[key]
+                entry = None
+
+            self._count(entry is not None)
+
+        if entry is None:
+            return False, None
+
+        return True, entry[2]
+
+    def update(self, operation_id, data, result):
+        if self.ttl <= 0:
+            return
+
+        key = self._make_key(operation_id, data)
+        with self._lock:
+            now = self.clock()
+            self._entries[key] = (now, now + self.ttl, result)
+            self._changes += 1
+
+    def invalidate(self, gateway_name=None):
+        """Drop the entries of the gateway, or all the entries if gateway_name is None"""
+        with self._lock:
+            gateway_name = self.ALL_GATEWAYS if gateway_name is None else gateway_name
+            # the invalidation is persisted, so that the entries saved by the other processes are dropped too
+            self._invalidated[gateway_name] = self.clock()
+            keys = [key for key in self._entries if gateway_name in (self.ALL_GATEWAYS, key[0])]
+            for key in keys:
+                del self._entries[key]
+
+            self._changes += 1
+
+    def clear(self):
+        """Forget all the entries in memory, the persisted ones will be loaded again"""
+        with self._lock:
+            self._entries.clear()
+            self._invalidated.clear()
+            self.stats = CacheStats()
+            self._loaded_mtime = None
+            self._saved_changes = self._changes
+
+    @contextmanager
+    def track(self):
+        """Track the statistics of the calls in the block of the current thread"""
+        stats = CacheStats()
+        tracking: List[CacheStats] = getattr(self._local, "tracking", [])
+        self._local.tracking = tracking + [stats]
+        try:
+            yield stats
+        finally:
+            self._local.tracking = tracking
+
+    def load(self):
+        """Merge the persisted entries if the file changed since the last loading, the newer entries win"""
+        if not self.path:
+            return
+
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return
+
+        if mtime != self._loaded_mtime:
+            self._merge(self._read(), mtime)
+
+    def save(self):
+        """Persist the entries which are not expired, if the entries changed"""
+        if not self.path or self._changes == self._saved_changes:
+            return
+
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as err:
+            logger.warning("persist the api cache to %s failed: %s", self.path, err)
+            return
+
+        with self._save_lock, self._lock_file():
+            # the file may be updated by the other processes since it was loaded
+            self._merge(self._read(), None)
+            now = self.clock()
+            with self._lock:
+                changes = self._changes
+                entries = [
+                    list(key) + [stored_at, expires_at, result]
+                    for key, (stored_at, expires_at, result) in self._entries.items()
+                    if expires_at > now
+                ]
+                # the entries stored before now - ttl are expired, so are the invalidations
+                invalidated = {name: at for name, at in self._invalidated.items() if at > now - self.ttl}
+
+            try:
+                self._write({"version": self.version, "entries": entries, "invalidated": invalidated})
+                self._loaded_mtime = os.stat(self.path).st_mtime
+            except (OSError, TypeError, ValueError) as err:
+                # the changes are kept, they will be persisted by the next saving
+                logger.warning("persist the api cache to %s failed: %s", self.path, err)
+                return
+
+            with self._lock:
+                self._saved_changes = max(self._saved_changes, changes)
+
+    def _write(self, data: Dict):
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self.path) or ".", prefix=os.path.basename(self.path) + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as fp:
+                json.dump(data, fp)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            with suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+    @contextmanager
+    def _lock_file(self):
+        """Lock the sidecar file of the cache file, so that the processes do not save at the same time"""
+        if fcntl is None:
+            yield
+            return
+
+        try:
+            fd = os.open(self.path + ".lock", os.O_WRONLY | os.O_CREAT, 0o644)
+        except OSError:
+            yield
+            return
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # the lock is released by closing the file
+            os.close(fd)
+
+    def _read(self) -> Dict:
+        try:
+            with open(self.path) as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != self.version:
+            return {}
+
+        return data
+
+    def _merge(self, data: Dict, mtime: Optional[float]):
+        now = self.clock()
+        with self._lock:
+            # the invalidations of the other processes drop the entries stored before them
+            newer = {
+                gateway_name: invalidated
+                for gateway_name, invalidated in (data.get("invalidated") or {}).items()
+                if invalidated > self._invalidated.get(gateway_name, 0)
+            }
+            self._invalidated.update(newer)
+            stale = [key for key, entry in self._entries.items() if self._is_stale(key[0], entry[0], newer)]
+            for key in stale:
+                del self._entries[key]
+
+            for gateway_name, operation_id, data_key, stored_at, expires_at, result in data.get("entries") or []:
+                key = (gateway_name, operation_id, data_key)
+                current = self._entries.get(key)
+                if (
+                    expires_at > now
+                    and (current is None or current[0] < stored_at)
+                    and not self._is_stale(gateway_name, stored_at, self._invalidated)
+                ):
+                    self._entries[key] = (stored_at, expires_at, result)
+
+            if mtime is not None:
+                self._loaded_mtime = mtime
@@ -30,6 +30,7 @@ class Handler(object):
         self.config = config  # type: configuration.Configuration
 
         self.client = BKAPIGatewayClient(endpoint=config.host, stage=config.stage)
+        self._tenant_id = None
 
     def __post_init__(self):
         pass
@@ -59,10 +60,21 @@ class Handler(object):
 
         return False
 
+    def _invalidate_cache(self, gateway_name):
+        """Drop the cached responses of the gateway, it should be called after writing to the gateway"""
+        invalidate = getattr(self.config.api_cache, "invalidate", None)
+        if invalidate:
+            invalidate(gateway_name)
+
+    def _is_read_operation(self, operation):
+        method = getattr(operation, "method", None)
+        return isinstance(method, str) and method.upper() in ("GET", "HEAD", "OPTIONS")
+
     def _call_with_cache(self, operation, **kwargs):
         """Call the API instance, allow data to be retrieved from the cache"""
         cache_key = {
             "gateway_name": kwargs.get("gateway_name", self.config.gateway_name),
+            "host": self.config.host,
             "kwargs": kwargs,
         }
 
@@ -84,6 +96,12 @@ class Handler(object):
             BKPAAS_APP_TENANT_ID 是应用的租户模式标识，表示应用是全租户还是单租户
             BK_APP_TENANT_ID 是应用所属的租户 ID，表示应用是属于哪个租户的，即由哪个租户产生的
         """
+        if self._tenant_id is None:
+            self._tenant_id = self._load_tenant_id()
+
+        return self._tenant_id
+
+    def _load_tenant_id(self):
         # [大多数是外部 SaaS 场景] PaaS 平台上部署运行的应用，会自动内置 BKPAAS_APP_TENANT_ID 环境变量，表示应用是全租户的还是单租户的
         paas_app_tenant_id = os.environ.get("BKPAAS_APP_TENANT_ID")
         if paas_app_tenant_id is not None:
@@ -101,8 +119,9 @@ class Handler(object):
 
     def _call(self, operation, files=None, **kwargs):
         """Call the API instance"""
+        gateway_name = kwargs.pop("gateway_name", self.config.gateway_name)
         data = {
-            "path_params": {"api_name": kwargs.pop("gateway_name", self.config.gateway_name)},
+            "path_params": {"api_name": gateway_name},
             "data": kwargs,
             "headers": {
                 "X-Bkapi-Authorization": kwargs.pop("x_bkapi_authorization", self._get_bkapi_authorization()),
@@ -113,23 +132,15 @@ class Handler(object):
             "files": files,
         }
 
-        operation_id = operation.name
-        logger.debug("call api %s, data: %s", operation_id, data)
-
-        try:
-            return operation(**data)
-        except ResponseError as err:
-            message = "%s\n%s\nResponse: %s" % (err, err.curl_command, err.response_text)
-            raise ApiResponseError(message)
-        except Exception as err:
-            raise ApiException(operation_id) from err
+        return self._request(operation, data, gateway_name)
 
     def _call_v2(self, operation, files=None, **kwargs):
         """Call the API instance：
           - Uses "gateway_name" as the key in `path_params` instead of "api_name".
         """
 
-        path_params = {"gateway_name": kwargs.pop("gateway_name", self.config.gateway_name)}
+        gateway_name = kwargs.pop("gateway_name", self.config.gateway_name)
+        path_params = {"gateway_name": gateway_name}
         if "{stage_name}" in operation.path:
             path_params["stage_name"] = kwargs.get("name")
 
@@ -145,6 +156,9 @@ class Handler(object):
             "files": files,
         }
 
+        return self._request(operation, data, gateway_name)
+
+    def _request(self, operation, data, gateway_name):
         operation_id = operation.name
         logger.debug("call api %s, data: %s", operation_id, data)
 
@@ -155,6 +169,10 @@ class Handler(object):
             raise ApiResponseError(message)
         except Exception as err:
             raise ApiException(operation_id) from err
+        finally:
+            # the gateway may be changed even if the request failed
+            if not self._is_read_operation(operation):
+                self._invalidate_cache(gateway_name)
 
     def _parse_result(self, result, convertor, code=0):
         """Check the code and convert the result"""
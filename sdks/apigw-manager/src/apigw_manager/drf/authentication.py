@@ -8,15 +8,17 @@
 # specific language governing permissions and limitations under the License.
 
 import logging
+import threading
 from collections import namedtuple
-from typing import ClassVar, Type
+from typing import ClassVar, Dict, Type
 
 from django.conf import settings
 from django.contrib import auth
+from django.core.signals import setting_changed
 from django.utils.module_loading import import_string
 from rest_framework.authentication import BaseAuthentication
 
-from apigw_manager.apigw.providers import CachePublicKeyProvider, PublicKeyProvider
+from apigw_manager.apigw.providers import JWTProvider, LocalCachePublicKeyProvider, PublicKeyProvider
 from apigw_manager.apigw.utils import get_configuration
 
 logger = logging.getLogger(__name__)
@@ -35,24 +37,52 @@ class ApiGatewayJWTAuthentication(BaseAuthentication):
 
     JWT_KEY_NAME = "HTTP_X_BKAPI_JWT"
     ALGORITHM = "RS512"
-    PUBLIC_KEY_PROVIDER_CLS: ClassVar[Type[PublicKeyProvider]] = CachePublicKeyProvider
+    PUBLIC_KEY_PROVIDER_CLS: ClassVar[Type[PublicKeyProvider]] = LocalCachePublicKeyProvider
+
+    # the jwt providers shared by all instances in the process, keyed by the authentication class
+    _providers: ClassVar[Dict[type, JWTProvider]] = {}
+    _providers_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self):
+        # DRF creates the authentication instances for every request, so the provider is only created once
+        self.provider = self.get_provider()
+
+    @classmethod
+    def get_provider(cls) -> JWTProvider:
+        provider = cls._providers.get(cls)
+        if provider is not None:
+            return provider
+
+        with cls._providers_lock:
+            provider = cls._providers.get(cls)
+            if provider is None:
+                provider = cls._providers[cls] = cls.make_provider()
+
+        return provider
+
+    @classmethod
+    def make_provider(cls) -> JWTProvider:
         configuration = get_configuration()
         jwt_provider_cls = import_string(
             configuration.jwt_provider_cls or "apigw_manager.apigw.providers.DefaultJWTProvider"
         )
-        algorithm = getattr(settings, "APIGW_JWT_ALGORITHM", self.ALGORITHM)
+        algorithm = getattr(settings, "APIGW_JWT_ALGORITHM", cls.ALGORITHM)
         allow_invalid_jwt_token = getattr(settings, "APIGW_ALLOW_INVALID_JWT_TOKEN", False)
 
-        self.provider = jwt_provider_cls(
-            jwt_key_name=self.JWT_KEY_NAME,
+        return jwt_provider_cls(
+            jwt_key_name=cls.JWT_KEY_NAME,
             default_gateway_name=configuration.gateway_name,
             algorithm=algorithm,
             allow_invalid_jwt_token=allow_invalid_jwt_token,
-            public_key_provider=self.PUBLIC_KEY_PROVIDER_CLS(default_gateway_name=configuration.gateway_name),
+            public_key_provider=cls.PUBLIC_KEY_PROVIDER_CLS(default_gateway_name=configuration.gateway_name),
         )
 
+    @classmethod
+    def reset_providers(cls):
+        """Drop the shared providers, they will be created again with the current settings"""
+        with cls._providers_lock:
+            cls._providers.clear()
+
     def authenticate(self, request):
         """it will get jwt from the provider
         then:
@@ -109,3 +139,10 @@ class ApiGatewayJWTAuthentication(BaseAuthentication):
             verified=verified,
             **credentials,
         )
+
+
+def _reset_providers_on_setting_changed(sender, setting, **kwargs):
+    ApiGatewayJWTAuthentication.reset_providers()
+
+
+setting_changed.connect(_reset_providers_on_setting_changed, dispatch_uid="apigw_manager.drf.reset_providers")
@@ -13,10 +13,19 @@ this command will generate the resources.yaml from the drf_spectacular config of
 if only want part of the apis:
 1. add the `tags` in `@extend_schema` of each method in the views.py
 2. call this command with tag, e.g. `python manage.py generate_resource_yaml.py --tag=foo --tag=bar`
+
+the generated operations are cached, only the views whose source changed will be generated again,
+call this command with `--no-cache` to generate all the apis.
 """
 
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
@@ -25,6 +34,11 @@ from drf_spectacular.renderers import OpenApiYamlRenderer
 from drf_spectacular.settings import spectacular_settings
 from drf_spectacular.validation import validate_schema
 
+from apigw_manager.drf.schema_cache import CACHE_FILE_NAME, SchemaFragmentCache, get_default_cache_dir
+
+# the minimum number of paths validated by a process
+VALIDATION_CHUNK_SIZE = 100
+
 
 def post_process_only_keep_the_apis_with_specified_tags(tags: List) -> callable:
     def only_keep_the_apis_with_specified_tags(result, generator, request, public):
@@ -122,6 +136,36 @@ def post_process_mcp_server_config(mcp_server_tools: list, delete_mcp_flag: bool
     return get_mcp_server_tools
 
 
+def validate_schema_concurrently(schema: Dict, max_workers: int):
+    """Validate the paths of the schema in chunks by processes, the other sections are validated with the first chunk"""
+    paths = list((schema.get("paths") or {}).items())
+    chunk_size = max(VALIDATION_CHUNK_SIZE, math.ceil(len(paths) / max(max_workers, 1)))
+    # validation is CPU bound, threads would not help, and the schema is shared with the processes by forking
+    if max_workers <= 1 or len(paths) <= chunk_size or "fork" not in multiprocessing.get_all_start_methods():
+        validate_schema(schema)
+        return
+
+    chunks = []
+    for index in range(0, len(paths), chunk_size):
+        chunk = dict(schema, paths=dict(paths[index : index + chunk_size]))
+        if index:
+            chunk.pop("components", None)
+        chunks.append(chunk)
+
+    with ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("fork")) as executor:
+        # the first error will be raised
+        list(executor.map(validate_schema, chunks))
+
+
+@contextmanager
+def _timeit(timings: Dict[str, float], phase: str):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - started
+
+
 class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
@@ -129,16 +173,71 @@ class Command(BaseCommand):
             nargs="*",
             help="if set only generate the specified tags api to resources.yaml",
         )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            dest="no_cache",
+            help="generate the schema of all the apis, the cached schema fragments will not be used",
+        )
+        parser.add_argument(
+            "--cache-dir",
+            dest="cache_dir",
+            help="the directory of the schema fragments cache, "
+            "default to settings.BK_APIGW_RESOURCES_YAML_CACHE_DIR or a temporary directory",
+        )
+        parser.add_argument(
+            "--validate-workers",
+            type=int,
+            dest="validate_workers",
+            help="the number of processes to validate the schema",
+        )
 
     def handle(self, *args, **kwargs):
         define_dir = Path(settings.BASE_DIR)
         resources_path = define_dir / "resources.yaml"
         self.stdout.write(f"will generate {resources_path}")
 
+        self._add_postprocessing_hooks(kwargs.get("tag"))
+
+        generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+        renderer = OpenApiYamlRenderer()
+
+        cache = None
+        if not kwargs.get("no_cache"):
+            cache_dir = kwargs.get("cache_dir") or get_default_cache_dir()
+            cache = SchemaFragmentCache(os.path.join(cache_dir, CACHE_FILE_NAME)).load()
+            cache.install(generator)
+
+        timings: Dict[str, float] = {}
+        schema = self._generate_schema(generator, timings)
+
+        if cache and cache.is_validated(schema):
+            self.stdout.write("schema of all apis not changed, skip validation")
+        else:
+            validate_workers = kwargs.get("validate_workers") or min(4, os.cpu_count() or 1)
+            with _timeit(timings, "validate"):
+                self._validate_schema(schema, validate_workers)
+
+        self.stdout.write(f"render resources.yaml to {resources_path}")
+        with _timeit(timings, "render"):
+            output = renderer.render(schema, renderer_context={})
+            with open(resources_path, "wb") as f:
+                f.write(output)
+
+        if cache:
+            if "validate" in timings:
+                cache.set_validated(schema)
+            cache.save()
+            self.stdout.write(f"schema fragments: {cache.hits} reused, {cache.misses} generated")
+
+        for phase in ["generate", "postprocess", "validate", "render"]:
+            if phase in timings:
+                self.stdout.write(f"{phase}: {timings[phase]:.3f}s")
+
+    def _add_postprocessing_hooks(self, tags):
         if hasattr(settings, "BK_APIGW_STAGE_ENABLE_MCP_SERVERS") and settings.BK_APIGW_STAGE_ENABLE_MCP_SERVERS:
             spectacular_settings.POSTPROCESSING_HOOKS.append(
                 post_process_mcp_server_config([], delete_mcp_flag=True))
-        tags = kwargs.get("tag")
         if tags:
             self.stdout.write(f"get tags, will only use the apis with tags: {tags}")
             spectacular_settings.POSTPROCESSING_HOOKS.append(post_process_only_keep_the_apis_with_specified_tags(tags))
@@ -148,19 +247,25 @@ class Command(BaseCommand):
         self.stdout.write(f"process the project sub_path={settings.BK_APIGW_STAGE_BACKEND_SUBPATH}")
         spectacular_settings.POSTPROCESSING_HOOKS.append(post_process_inject_method_and_path)
 
-        generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
-        renderer = OpenApiYamlRenderer()
-        schema = generator.get_schema(request=None, public=True)
+    def _generate_schema(self, generator, timings: Dict[str, float]) -> Dict:
+        parse = generator.parse
 
+        def timed_parse(*args, **kwargs):
+            with _timeit(timings, "generate"):
+                return parse(*args, **kwargs)
+
+        generator.parse = timed_parse
+        with _timeit(timings, "postprocess"):
+            schema = generator.get_schema(request=None, public=True)
+        # the post-processing hooks run after the generation in get_schema
+        timings["postprocess"] -= timings.get("generate", 0.0)
+        return schema
+
+    def _validate_schema(self, schema: Dict, validate_workers: int):
         self.stdout.write("validate schema of all apis")
         try:
-            validate_schema(schema)
+            validate_schema_concurrently(schema, validate_workers)
             self.stdout.write("schema validated")
         except Exception as e:
             self.stdout.write(f"schema validation failed: {str(e)}")
-            raise SchemaValidationError(e)
-
-        self.stdout.write(f"render resources.yaml to {resources_path}")
-        output = renderer.render(schema, renderer_context={})
-        with open(resources_path, "wb") as f:
-            f.write(output)
+            raise SchemaValidationError(e) from e
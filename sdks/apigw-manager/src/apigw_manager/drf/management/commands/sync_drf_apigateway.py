@@ -26,11 +26,27 @@ the steps of syncing
 from pathlib import Path
 
 from django.conf import settings
-from django.core.management import call_command
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+
+from apigw_manager.apigw.orchestrator import SyncOrchestrator, make_sync_steps
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=None,
+            help="the max number of steps running concurrently, default to settings.BK_APIGW_SYNC_MAX_WORKERS or 4",
+        )
+        parser.add_argument(
+            "--skip-unchanged",
+            default=False,
+            action="store_true",
+            help="skip the steps whose definitions are unchanged since the last successful sync, "
+            "the changes made on the gateway side will not be restored by the skipped steps",
+        )
+
     def handle(self, *args, **kwargs):
         gateway_name = settings.BK_APIGW_NAME
 
@@ -38,64 +54,32 @@ class Command(BaseCommand):
         definition_file_path = file_dir / "definition.yaml"
         resources_file_path = file_dir / "resources.yaml"
 
-        self.stdout.write(f"call sync_apigw_config with definition: {definition_file_path}")
-        call_command(
-            "sync_apigw_config",
-            f"--gateway-name={gateway_name}",
-            f"--file={definition_file_path}",
-        )
-
-        self.stdout.write(f"call sync_apigw_stage with definition: {definition_file_path}")
-        call_command(
-            "sync_apigw_stage",
-            f"--gateway-name={gateway_name}",
-            f"--file={definition_file_path}",
+        steps = make_sync_steps(
+            gateway_name,
+            str(definition_file_path),
+            str(resources_file_path),
+            stages=[settings.BK_APIGW_STAGE_NAME],
+            doc_language=settings.BK_APIGW_RELEASE_DOC_LANGUAGE,
+            # if BK_APIGW_RESOURCE_DOCS_BASE_DIR is not empty, then sync the resource docs
+            sync_resource_docs=bool(getattr(settings, "BK_APIGW_RESOURCE_DOCS_BASE_DIR", None)),
+            # if BK_APIGW_STAGE_ENABLE_MCP_SERVERS is True, then sync the mcp servers
+            sync_mcp_servers=bool(getattr(settings, "BK_APIGW_STAGE_ENABLE_MCP_SERVERS", False)),
         )
-        self.stdout.write(f"call sync_apigw_resources with resources: {resources_file_path}")
-        call_command(
-            "sync_apigw_resources",
-            f"--gateway-name={gateway_name}",
-            "--delete",
-            f"--file={resources_file_path}",
-            f"--doc_language={settings.BK_APIGW_RELEASE_DOC_LANGUAGE}",
-        )
-
-        # if BK_APIGW_RESOURCE_DOCS_BASE_DIR is not empty, then sync the resource docs
-        if hasattr(settings, "BK_APIGW_RESOURCE_DOCS_BASE_DIR") and settings.BK_APIGW_RESOURCE_DOCS_BASE_DIR:
-            self.stdout.write(f"call sync_resource_docs_by_archive with definition: {definition_file_path}")
-            call_command(
-                "sync_resource_docs_by_archive",
-                f"--gateway-name={gateway_name}",
-                f"--file={definition_file_path}",
-                "--safe-mode",
-            )
-
-        self.stdout.write(f"call grant_apigw_permissions with definition: {definition_file_path}")
-        call_command(
-            "grant_apigw_permissions",
-            f"--gateway-name={gateway_name}",
-            f"--file={definition_file_path}",
-        )
-
         self.stdout.write(
-            f"call create_version_and_release_apigw with definition: {definition_file_path}, stage: {settings.BK_APIGW_STAGE_NAME}"
+            f"sync gateway {gateway_name} with definition: {definition_file_path}, resources: {resources_file_path}"
         )
-        call_command(
-            "create_version_and_release_apigw",
-            f"--gateway-name={gateway_name}",
-            f"--file={definition_file_path}",
-            f"--stage={settings.BK_APIGW_STAGE_NAME}",
+
+        orchestrator = SyncOrchestrator(
+            gateway_name,
+            steps,
+            max_workers=kwargs.get("max_workers"),
+            skip_unchanged=kwargs.get("skip_unchanged", False),
         )
+        results = orchestrator.run()
 
-        self.stdout.write(f"call fetch_apigw_public_key {gateway_name}")
-        call_command("fetch_apigw_public_key", f"--gateway-name={gateway_name}")
+        for result in results:
+            self.stdout.write(f"{result.name}: {result.status}, {result.elapsed:.3f}s")
 
-        # if BK_APIGW_STAGE_ENABLE_MCP_SERVERS is True, then sync the mcp servers
-        if hasattr(settings, "BK_APIGW_STAGE_ENABLE_MCP_SERVERS") and settings.BK_APIGW_STAGE_ENABLE_MCP_SERVERS:
-            self.stdout.write(f"call sync_apigw_stage_mcp_servers for {gateway_name}")
-            self.stdout.write(f"call sync_apigw_stage_mcp_servers with definition: {definition_file_path}")
-            call_command(
-                "sync_apigw_stage_mcp_servers",
-                f"--gateway-name={gateway_name}",
-                f"--file={definition_file_path}",
-            )
+        failed = [result.name for result in results if not result.ok]
+        if failed:
+            raise CommandError(f"sync gateway {gateway_name} failed, the steps not finished: {', '.join(failed)}")
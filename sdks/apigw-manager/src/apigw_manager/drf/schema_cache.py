@@ -0,0 +1,405 @@
+# -*- coding: utf-8 -*-
+# TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+# Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+# Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://opensource.org/licenses/MIT
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import ast
+import copy
+import hashlib
+import importlib
+import importlib.metadata
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import tempfile
+from typing import Dict, Optional, Set, Tuple
+
+import drf_spectacular
+from django.conf import settings
+from django.utils import translation
+from drf_spectacular.openapi import AutoSchema
+from drf_spectacular.plumbing import ResolvedComponent
+from rest_framework.utils.encoders import JSONEncoder
+
+CACHE_FILE_NAME = "resources_schema_cache.json"
+
+
+def get_default_cache_dir() -> str:
+    """The directory of the cache, a temporary directory of the project will be used if not configured"""
+    cache_dir = getattr(settings, "BK_APIGW_RESOURCES_YAML_CACHE_DIR", None)
+    if cache_dir:
+        return str(cache_dir)
+
+    project = hashlib.sha256(str(getattr(settings, "BASE_DIR", "")).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), "apigw-manager", project)
+
+
+class SchemaFragmentCache:
+    """Caches the operations generated by drf_spectacular, together with the components they refer to.
+
+    A cached operation is reused when the endpoint is the same and none of its source files changed. The source files
+    are the modules of the view class, the modules of the referred components, such as the serializers and their
+    models, and the project modules used by them, directly or indirectly.
+    """
+
+    version = 1
+
+    def __init__(self, path: str):
+        self.path = path
+        # digest of the last schema which passed the validation
+        self.validated = ""
+        self.hits = 0
+        self.misses = 0
+
+        self._fragments: Dict[str, Dict] = {}
+        # the fragments used by this generation, the others are stale and will be dropped on saving
+        self._used: Dict[str, Dict] = {}
+        self._generated: Dict[str, Tuple] = {}
+        self._digests: Dict[str, str] = {}
+        self._project_sources: Dict[str, Set[str]] = {}
+        self._settings_digest = ""
+        self._changed = False
+
+    def load(self) -> "SchemaFragmentCache":
+        try:
+            with open(self.path) as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return self
+
+        if not isinstance(data, dict) or data.get("version") != self.version:
+            return self
+
+        self._fragments = data.get("fragments") or {}
+        self.validated = data.get("validated") or ""
+        return self
+
+    def save(self):
+        if not self._changed and self._used.keys() == self._fragments.keys():
+            return
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = "%s.%s.tmp" % (self.path, os.getpid())
+        with open(temp_path, "w") as fp:
+            json.dump({"version": self.version, "validated": self.validated, "fragments": self._used}, fp)
+        os.replace(temp_path, self.path)
+
+    def set_validated(self, schema: Dict):
+        digest = _hash_value(schema)
+        if digest != self.validated:
+            self.validated = digest
+            self._changed = True
+
+    def is_validated(self, schema: Dict) -> bool:
+        return bool(self.validated) and self.validated == _hash_value(schema)
+
+    def install(self, generator):
+        """Make the generator reuse the cached operations, the generator is returned for convenience"""
+        create_view = generator.create_view
+        parse = generator.parse
+
+        def create_cached_view(callback, method, request=None):
+            # the views, and the packages they depend on, are imported with the urls by now
+            if not self._settings_digest:
+                self._settings_digest = self._make_settings_digest()
+
+            view = create_view(callback, method, request)
+            if isinstance(view.schema, AutoSchema):
+                # the inspector may be shared by the instances of the view class, so pin a copy to this view
+                view.schema = self._wrap(view, copy.copy(view.schema))
+            return view
+
+        def parse_and_collect(input_request, public):
+            result = parse(input_request, public)
+            # the registry is complete now, and the post-processing hooks which modify the schema are not run yet
+            self._collect(generator.registry)
+            return result
+
+        generator.create_view = create_cached_view
+        generator.parse = parse_and_collect
+        return generator
+
+    def _make_settings_digest(self) -> str:
+        return _hash_value(
+            [
+                drf_spectacular.__version__,
+                # the field classes and the OpenAPI extensions of the installed packages are not tracked as sources
+                _get_distribution_versions(),
+                getattr(settings, "SPECTACULAR_SETTINGS", {}),
+                getattr(settings, "REST_FRAMEWORK", {}),
+                translation.get_language(),
+            ]
+        )
+
+    def _wrap(self, view, schema: AutoSchema) -> AutoSchema:
+        get_operation = schema.get_operation
+
+        def get_cached_operation(path, path_regex, path_prefix, method, registry):
+            key = self._make_key(view, schema, path, path_regex, path_prefix, method)
+            fragment = self._fragments.get(key)
+            if fragment is not None and self._restore(fragment, registry):
+                self.hits += 1
+                self._used[key] = fragment
+                return copy.deepcopy(fragment["operation"])
+
+            self.misses += 1
+            operation = get_operation(path, path_regex, path_prefix, method, registry)
+            self._generated[key] = (view, operation)
+            return operation
+
+        schema.get_operation = get_cached_operation
+        return schema
+
+    def _make_key(self, view, schema, path, path_regex, path_prefix, method) -> str:
+        return _hash_value(
+            [
+                self.version,
+                self._settings_digest,
+                _get_object_path(view.__class__),
+                _get_object_path(schema.__class__),
+                getattr(view, "action", None),
+                path,
+                path_regex,
+                path_prefix,
+                method,
+            ]
+        )
+
+    def _restore(self, fragment: Dict, registry) -> bool:
+        if any(self._get_digest(file) != digest for file, digest in fragment["sources"].items()):
+            return False
+
+        for component in fragment["components"]:
+            registry.register_on_missing(
+                ResolvedComponent(
+                    name=component["name"],
+                    type=component["type"],
+                    schema=copy.deepcopy(component["schema"]),
+                    # the path is kept when the object can not be imported, it is only used to detect name collisions
+                    object=_import_object(component["object"]) or component["object"],
+                )
+            )
+
+        return True
+
+    def _collect(self, registry):
+        for key, (view, operation) in self._generated.items():
+            components = _find_components(operation, registry)
+            objects = [component.object for component in components]
+            try:
+                fragment = {
+                    "operation": _normalize(operation),
+                    "components": [
+                        {
+                            "name": component.name,
+                            "type": component.type,
+                            "schema": _normalize(component.schema),
+                            "object": _get_object_path(_get_class(component.object)),
+                        }
+                        for component in components
+                    ],
+                    "sources": {file: self._get_digest(file) for file in sorted(self._get_sources(view, objects))},
+                }
+            except (TypeError, ValueError):
+                # not serializable, it will be generated every time
+                continue
+
+            self._used[key] = fragment
+            self._changed = True
+
+        self._generated = {}
+
+    def _get_sources(self, view, objects) -> Set[str]:
+        classes = [view.__class__] + [_get_class(obj) for obj in objects]
+        # the model of a serializer may be defined in a module which is not imported by the view module
+        classes.extend(_get_model(cls) for cls in classes[1:])
+
+        files = set()
+        modules = []
+        for cls in filter(inspect.isclass, classes):
+            for base in inspect.getmro(cls):
+                files.add(_get_source_file(base))
+                modules.append(base.__module__)
+
+        # the serializers, models, choices and helpers are imported by the project modules, directly or indirectly
+        base_dir = getattr(settings, "BASE_DIR", None)
+        if base_dir:
+            files.update(self._get_project_sources(modules, os.path.join(os.path.abspath(str(base_dir)), "")))
+
+        files.discard(None)
+        return files
+
+    def _get_project_sources(self, module_names, base_dir: str) -> Set[str]:
+        """Returns the files of the project modules under base_dir which are used by the modules, recursively"""
+        files: Set[str] = set()
+        for name in set(module_names):
+            if name not in self._project_sources:
+                self._project_sources[name] = _find_project_sources(sys.modules.get(name), base_dir)
+            files.update(self._project_sources[name])
+
+        return files
+
+    def _get_digest(self, file: str) -> str:
+        if file not in self._digests:
+            try:
+                with open(file, "rb") as fp:
+                    self._digests[file] = hashlib.sha256(fp.read()).hexdigest()
+            except OSError:
+                self._digests[file] = ""
+
+        return self._digests[file]
+
+
+def _hash_value(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _normalize(value):
+    """Convert the lazy strings, decimals and so on to the basic types"""
+    return json.loads(json.dumps(value, cls=JSONEncoder))
+
+
+def _get_class(obj):
+    return obj if inspect.isclass(obj) else obj.__class__
+
+
+def _get_distribution_versions() -> Dict[str, str]:
+    """The versions of djangorestframework and the installed distributions which provide the loaded modules"""
+    names = {"djangorestframework"}
+    packages = importlib.metadata.packages_distributions()
+    for module_name in list(sys.modules):
+        names.update(packages.get(module_name.partition(".")[0], []))
+
+    versions = {}
+    for name in names:
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            continue
+
+    return versions
+
+
+def _find_project_sources(module, base_dir: str) -> Set[str]:
+    files: Set[str] = set()
+    pending = [module]
+    while pending:
+        module = pending.pop()
+        file = _get_source_file(module) if module else None
+        # the virtual environment may be placed under the project directory
+        if not file or file in files or not file.startswith(base_dir) or "site-packages" in file:
+            continue
+
+        files.add(file)
+        for value in list(vars(module).values()):
+            pending.append(value if inspect.ismodule(value) else sys.modules.get(_get_module_name(value)))
+        # the imported constants, such as a list of choices, do not tell where they come from
+        pending.extend(sys.modules.get(name) for name in _get_imported_modules(module, file))
+
+    return files
+
+
+def _get_imported_modules(module, file: str) -> Set[str]:
+    try:
+        with open(file, "rb") as fp:
+            tree = ast.parse(fp.read(), file)
+    except (OSError, SyntaxError, ValueError):
+        return set()
+
+    names = set()
+    package = getattr(module, "__package__", None) or ""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                name = importlib.util.resolve_name("." * node.level + (node.module or ""), package)
+            except (ImportError, ValueError):
+                continue
+            names.add(name)
+            # from package import module
+            names.update("%s.%s" % (name, alias.name) for alias in node.names)
+
+    return names
+
+
+def _get_model(cls):
+    return getattr(getattr(cls, "Meta", None), "model", None)
+
+
+def _get_module_name(obj) -> str:
+    module_name = getattr(obj, "__module__", None)
+    return module_name if isinstance(module_name, str) else ""
+
+
+def _get_object_path(cls) -> str:
+    return "%s:%s" % (cls.__module__, cls.__qualname__)
+
+
+def _import_object(path: str):
+    module_name, _, qualname = path.partition(":")
+    try:
+        obj = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            obj = getattr(obj, name)
+    except (ImportError, AttributeError, ValueError):
+        return None
+
+    return obj
+
+
+def _get_source_file(obj) -> Optional[str]:
+    if not inspect.ismodule(obj):
+        obj = sys.modules.get(getattr(obj, "__module__", None) or "")
+
+    file = getattr(obj, "__file__", None)
+    return os.path.abspath(file) if file else None
+
+
+def _find_components(operation, registry):
+    """Returns the components referred by the operation, directly or indirectly"""
+    components = {}
+    pending = [operation]
+    while pending:
+        value = pending.pop()
+        for key in _find_refs(value):
+            if key in components:
+                continue
+
+            try:
+                component = registry[key]
+            except KeyError:
+                continue
+
+            components[key] = component
+            pending.append(component.schema)
+
+    return list(components.values())
+
+
+def _find_refs(value):
+    refs = []
+    if isinstance(value, dict):
+        ref = value.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/components/"):
+            _, _, component_type, name = ref.split("/", 3)
+            refs.append((name, component_type))
+
+        # the security schemes are referred by name
+        for requirement in value.get("security") or []:
+            if isinstance(requirement, dict):
+                refs.extend((name, ResolvedComponent.SECURITY_SCHEMA) for name in requirement)
+
+        for item in value.values():
+            refs.extend(_find_refs(item))
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            refs.extend(_find_refs(item))
+
+    return refs
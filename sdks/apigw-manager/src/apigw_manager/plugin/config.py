@@ -8,11 +8,13 @@
 # specific language governing permissions and limitations under the License.
 
 import ast
+import dataclasses
 import json
 import jsonschema
 import ipaddress
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 
 from .constants import Draft7Schema
@@ -865,6 +867,62 @@ def build_proxy_cache(
     }
 
 
+def build_plugin_configs(
+    builder: Callable[..., Dict[str, str]], inputs: Iterable[Union[Tuple, Dict[str, Any]]]
+) -> List[Dict[str, str]]:
+    """generate plugin configs for many resources by the builder, identical inputs are built only once
+
+    Args:
+        builder (Callable[..., Dict[str, str]]): the plugin config builder, such as build_bk_rate_limit
+        inputs (Iterable[Union[Tuple, Dict[str, Any]]]): the arguments of each resource, a tuple of the positional
+            arguments or a dict of the keyword arguments
+
+    Raises:
+        the errors raised by the builder
+
+    Returns:
+        the plugin configs, in the same order as the inputs, e.g.
+        [
+            {"type": "bk-rate-limit", "yaml": "rates:\n  __default:\n  - period: 1\n    tokens: 10\n"},
+            {"type": "bk-rate-limit", "yaml": "rates:\n  __default:\n  - period: 1\n    tokens: 10\n"},
+        ]
+    """
+    built: Dict[Any, Dict[str, str]] = {}
+    configs = []
+    for arguments in inputs:
+        args, kwargs = ((), arguments) if isinstance(arguments, dict) else (tuple(arguments), {})
+
+        key = _freeze((args, kwargs))
+        try:
+            config = built.get(key)
+        except TypeError:
+            # unhashable arguments, build it every time
+            key, config = None, None
+
+        if config is None:
+            config = builder(*args, **kwargs)
+            if key is not None:
+                built[key] = config
+
+        # the configs are copied, so that modifying one of them will not affect the others
+        configs.append(dict(config))
+
+    return configs
+
+
+def _freeze(value):
+    """convert the value to a hashable one, the types are kept so that 1 and True are different"""
+    if isinstance(value, dict):
+        return dict, tuple(sorted(((_freeze(k), _freeze(v)) for k, v in value.items()), key=repr))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(i) for i in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_freeze(i) for i in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return type(value), _freeze(dataclasses.asdict(value))
+    return type(value), value
+
+
 def _check_percentage(percentage: int, location: str):
     if percentage and not (0 < percentage <= 100):
         raise ValueError(f"The percentage of {location} must be greater than 0 and less than or equal to 100")
@@ -910,13 +968,28 @@ def _check_vars(vars: str, location: str):
                 raise TypeError(f"The vars of {location} at index [{index}][{i}] should be list")
 
 
+def get_json_schema_validator(schema: Dict[str, Any]):
+    """get the validator of the json schema, the schema is checked and the validator is compiled only once"""
+    return _get_json_schema_validator(json.dumps(schema, sort_keys=True))
+
+
+@lru_cache(maxsize=None)
+def _get_json_schema_validator(schema_key: str):
+    schema = json.loads(schema_key)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+# the schemas are usually shared by many resources, only the valid ones are cached
+@lru_cache(maxsize=1024)
 def _validate_json_schema(schema_name: str, json_schema: str):
     try:
         data = json.loads(json_schema)
     except json.JSONDecodeError:
         raise ValueError(f"Your {schema_name} Schema is not a valid JSON")
 
-    try:
-        jsonschema.validate(instance=data, schema=Draft7Schema)
-    except jsonschema.exceptions.ValidationError as err:
+    # the same as jsonschema.validate, which checks the schema and creates the validator for every call
+    err = jsonschema.exceptions.best_match(get_json_schema_validator(Draft7Schema).iter_errors(data))
+    if err is not None:
         raise ValueError(f"Your {schema_name} Schema is not valid: {err}")
@@ -40,7 +40,10 @@ def test_handle_no_save(command, manager, public_key_manager):
     public_key_manager.set.assert_not_called()
 
 
-def test_handle(command, manager, public_key_manager):
+def test_handle(mocker, command, manager, public_key_manager):
+    invalidate = mocker.patch("apigw_manager.apigw.helper.public_key_cache.invalidate")
+
     command.handle(print_=True, no_save=False)
     manager.public_key.assert_called()
     public_key_manager.set.assert_called()
+    invalidate.assert_called_once_with(mocker.ANY)
@@ -23,6 +23,19 @@ def resource_signature_manager(mocker):
     return mocker.MagicMock()
 
 
+@pytest.fixture()
+def definition():
+    return {
+        "swagger": "2.0",
+        "paths": {
+            "/users/": {
+                "get": {"operationId": "list_users"},
+                "post": {"operationId": "create_user"},
+            },
+        },
+    }
+
+
 @pytest.fixture()
 def command(mocker, manager, resource_signature_manager):
     command = Command()
@@ -69,3 +82,108 @@ def test_update_signature(mocker, command, configuration, resource_signature_man
         resource_signature_manager.mark_dirty.assert_called_once_with(configuration.gateway_name)
     else:
         resource_signature_manager.mark_clean.assert_not_called()
+
+
+class TestIncrementalSync:
+    @pytest.fixture(autouse=True)
+    def _setup(self, command, manager, configuration, definition):
+        self.command = command
+        self.manager = manager
+        self.configuration = configuration
+        manager.sync_resources_config.return_value = {"added": [], "deleted": [], "updated": []}
+
+        self.sync(definition)
+        manager.sync_resources_config.reset_mock()
+
+    def sync(self, definition, **kwargs):
+        options = {"delete": True, "doc_language": None, "delta": True}
+        options.update(kwargs)
+        self.command.do(self.manager, definition, self.configuration, **options)
+
+    def test_unchanged(self, definition, capsys):
+        self.sync(definition)
+
+        self.manager.sync_resources_config.assert_not_called()
+        assert "unchanged" in capsys.readouterr().out
+
+    def test_delta(self, definition):
+        definition["paths"]["/users/"]["post"]["description"] = "changed"
+        definition["paths"]["/users/{id}/"] = {"get": {"operationId": "get_user"}}
+
+        self.sync(definition)
+
+        self.manager.sync_resources_config.assert_called_once_with(
+            content={
+                "swagger": "2.0",
+                "paths": {
+                    "/users/": {"post": {"operationId": "create_user", "description": "changed"}},
+                    "/users/{id}/": {"get": {"operationId": "get_user"}},
+                },
+            },
+            delete=False,
+        )
+
+        # the fingerprints are updated
+        self.manager.sync_resources_config.reset_mock()
+        self.sync(definition)
+        self.manager.sync_resources_config.assert_not_called()
+
+    def test_removed(self, definition):
+        del definition["paths"]["/users/"]["post"]
+
+        self.sync(definition)
+
+        self.manager.sync_resources_config.assert_called_once_with(content=definition, delete=True)
+
+    def test_removed_without_delete(self, definition):
+        # the options are changed, so it is a full synchronization
+        self.sync(definition, delete=False)
+        self.manager.sync_resources_config.reset_mock()
+
+        del definition["paths"]["/users/"]["post"]
+        definition["paths"]["/users/"]["get"]["description"] = "changed"
+        self.sync(definition, delete=False)
+
+        self.manager.sync_resources_config.assert_called_once_with(
+            content={"swagger": "2.0", "paths": {"/users/": definition["paths"]["/users/"]}},
+            delete=False,
+        )
+
+    def test_only_removed_without_delete(self, definition):
+        self.sync(definition, delete=False)
+        self.manager.sync_resources_config.reset_mock()
+
+        del definition["paths"]["/users/"]["post"]
+        self.sync(definition, delete=False)
+        self.manager.sync_resources_config.assert_not_called()
+
+        # the removed resource is deleted by a synchronization with `--delete`
+        self.sync(definition)
+        self.manager.sync_resources_config.assert_called_once_with(content=definition, delete=True)
+
+    def test_shared_changed(self, definition):
+        definition["info"] = {"title": "changed"}
+
+        self.sync(definition)
+
+        self.manager.sync_resources_config.assert_called_once_with(content=definition, delete=True)
+
+    def test_full_by_default(self, definition):
+        # the resources may be changed on the gateway side, they are restored by a full synchronization
+        self.sync(definition, delta=False)
+
+        self.manager.sync_resources_config.assert_called_once_with(content=definition, delete=True)
+
+    def test_dry_run(self, definition, capsys):
+        definition["paths"]["/users/"]["post"]["description"] = "changed"
+        definition["paths"]["/users/{id}/"] = {"get": {"operationId": "get_user"}}
+        del definition["paths"]["/users/"]["get"]
+
+        self.sync(definition, dry_run=True)
+
+        self.manager.sync_resources_config.assert_not_called()
+        output = capsys.readouterr().out
+        assert "added 1, changed 1, removed 1, unchanged 0" in output
+        assert "  + get_user" in output
+        assert "  ~ create_user" in output
+        assert "  - list_users" in output
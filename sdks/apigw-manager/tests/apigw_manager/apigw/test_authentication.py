@@ -10,9 +10,12 @@
 """
 
 import pytest
+from django.contrib import auth
 from django.contrib.auth.models import AnonymousUser
+from django.contrib.auth.signals import user_login_failed
 from django.core.cache import caches
 from django.core.cache.backends.dummy import DummyCache
+from django.core.exceptions import PermissionDenied
 
 from apigw_manager.apigw import authentication, providers
 from apigw_manager.apigw.providers import CachePublicKeyProvider, DefaultJWTProvider, SettingsPublicKeyProvider
@@ -196,7 +199,9 @@ class TestApiGatewayJWTUserMiddleware:
 
     @pytest.fixture(autouse=True)
     def _patch_authenticate(self, mocker):
-        self.authenticate_function = mocker.patch("django.contrib.auth.authenticate")
+        self.authenticate_function = mocker.patch(
+            "apigw_manager.apigw.authentication.get_user_resolver"
+        ).return_value.resolve
 
     @pytest.fixture(autouse=True)
     def _setup_user(self, mocker):
@@ -238,6 +243,120 @@ class TestApiGatewayJWTUserMiddleware:
         mock_response.assert_called_with(jwt_request)
 
 
+class TestBackendUserResolver:
+    @pytest.fixture(autouse=True)
+    def _setup_resolver(self, settings):
+        settings.AUTHENTICATION_BACKENDS = [
+            "django.contrib.auth.backends.ModelBackend",
+            "apigw_manager.apigw.authentication.UserModelBackend",
+        ]
+        self.resolver = authentication.BackendUserResolver()
+
+    def test_resolve(self, mock_request):
+        user = self.resolver.resolve(mock_request, gateway_name="test", bk_username="admin", verified=True)
+
+        assert user.username == "admin"
+        assert user.is_authenticated is True
+        assert user.backend == "apigw_manager.apigw.authentication.UserModelBackend"
+        assert self.resolver.stats.as_dict()["resolved"] == 1
+
+    def test_resolve_anonymous_user(self, mock_request):
+        user = self.resolver.resolve(mock_request, gateway_name="test", bk_username="admin", verified=False)
+        assert isinstance(user, AnonymousUser)
+
+    def test_resolve_same_as_authenticate(self, mock_request):
+        credentials = {"gateway_name": "test", "bk_username": "admin", "verified": True, "tenant_id": "system"}
+
+        user = self.resolver.resolve(mock_request, **credentials)
+        expected = auth.authenticate(mock_request, **credentials)
+
+        assert user.username == expected.username
+        assert user.tenant_id == expected.tenant_id
+        assert user.backend == expected.backend
+
+    def test_compatible_backends_cached(self, mocker, mock_request):
+        mock_signature = mocker.patch.object(authentication, "signature", wraps=authentication.signature)
+
+        for _ in range(3):
+            self.resolver.resolve(mock_request, gateway_name="test", bk_username="admin", verified=True)
+
+        # inspected once for each backend
+        assert mock_signature.call_count == 2
+
+    def test_resolve_permission_denied(self, mocker, mock_request):
+        failed = mocker.MagicMock()
+        user_login_failed.connect(failed)
+        mocker.patch.object(authentication.UserModelBackend, "authenticate", side_effect=PermissionDenied)
+
+        try:
+            assert self.resolver.resolve(mock_request, gateway_name="test", bk_username="admin", verified=True) is None
+        finally:
+            user_login_failed.disconnect(failed)
+
+        failed.assert_called_once()
+
+    def test_resolve_not_found(self, settings, mock_request):
+        settings.AUTHENTICATION_BACKENDS = ["django.contrib.auth.backends.ModelBackend"]
+        resolver = authentication.BackendUserResolver()
+
+        assert resolver.resolve(mock_request, gateway_name="test", bk_username="admin", verified=True) is None
+
+
+class TestCachedUserResolver:
+    @pytest.fixture(autouse=True)
+    def _setup_resolver(self, settings, mocker):
+        settings.APIGW_JWT_USER_CACHE_SIZE = 2
+        self.resolver = authentication.CachedUserResolver()
+        self.authenticate = mocker.spy(self.resolver, "authenticate")
+        self.mock_time = mocker.patch("apigw_manager.apigw.authentication.time.time", return_value=1000)
+
+    def test_resolve(self, mock_request):
+        user = self.resolver.resolve(mock_request, gateway_name="test", bk_username="admin", verified=True)
+        cached = self.resolver.resolve(mock_request, gateway_name="test", bk_username="admin", verified=True)
+
+        assert cached.username == user.username
+        assert cached is not user
+        assert self.authenticate.call_count == 1
+        assert self.resolver.stats.as_dict()["cache_hits"] == 1
+
+        self.resolver.resolve(mock_request, gateway_name="test", bk_username="admin", verified=True, tenant_id="t")
+        assert self.authenticate.call_count == 2
+
+    def test_resolve_expired(self, mock_request):
+        self.resolver.resolve(mock_request, gateway_name="test", bk_username="admin", verified=True)
+
+        self.mock_time.return_value = 1010
+        self.resolver.resolve(mock_request, gateway_name="test", bk_username="admin", verified=True)
+        assert self.authenticate.call_count == 2
+
+    def test_resolve_evicted(self, mock_request):
+        for username in ["admin", "foo", "bar", "admin"]:
+            self.resolver.resolve(mock_request, gateway_name="test", bk_username=username, verified=True)
+
+        assert self.authenticate.call_count == 4
+
+    def test_resolve_unhashable(self, mock_request):
+        for _ in range(2):
+            self.resolver.resolve(mock_request, gateway_name="test", bk_username="admin", verified=True, extra=[])
+
+        assert self.authenticate.call_count == 2
+
+
+class TestGetUserResolver:
+    def test_default(self):
+        resolver = authentication.get_user_resolver()
+
+        assert type(resolver) is authentication.BackendUserResolver
+        assert authentication.get_user_resolver() is resolver
+
+    def test_reset_on_setting_changed(self, settings):
+        resolver = authentication.get_user_resolver()
+
+        settings.APIGW_JWT_USER_RESOLVER_CLS = "apigw_manager.apigw.authentication.CachedUserResolver"
+        assert isinstance(authentication.get_user_resolver(), authentication.CachedUserResolver)
+        assert authentication.get_user_resolver() is not resolver
+
+
 class TestUserModelBackend:
     @pytest.fixture(autouse=True)
     def _setup_backend(self):
@@ -8,9 +8,12 @@
  * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
  * specific language governing permissions and limitations under the License.
 """
+from io import StringIO
+
 import pytest
 
 from apigw_manager.apigw import command
+from apigw_manager.apigw.utils import get_api_cache
 
 
 class TestApiCommand:
@@ -32,6 +35,35 @@ class TestApiCommand:
         assert gateway_name == result.gateway_name
         assert host.startswith(result.host)
 
+    def test_execute_with_api_cache(self, settings, tmp_path, mocker):
+        settings.BK_APIGW_API_CACHE_TTL = 300
+        settings.BK_APIGW_API_CACHE_FILE = str(tmp_path / "api.json")
+        persisted = get_api_cache()
+        persisted.update("get_apigw_public_key", {"gateway_name": "foo"}, {"public_key": "key"})
+        persisted.save()
+        persisted.clear()
+
+        def do(manager, configuration, *args, **kwargs):
+            api_cache = configuration.api_cache
+            assert api_cache.try_get("get_apigw_public_key", {"gateway_name": "foo"}) == (True, {"public_key": "key"})
+            api_cache.try_get("get_apigw_public_key", {"gateway_name": "bar"})
+
+        self.command.manager_class = mocker.MagicMock()
+        mocker.patch.object(self.command, "do", side_effect=do)
+        stdout = StringIO()
+
+        self.command.execute(stdout=stdout, skip_checks=True, force_color=False, no_color=False)
+
+        assert "api cache: 1 hits, 1 misses" in stdout.getvalue()
+
+    def test_execute_without_api_cache(self, mocker):
+        self.command.manager_class = mocker.MagicMock()
+        stdout = StringIO()
+
+        self.command.execute(stdout=stdout, skip_checks=True, force_color=False, no_color=False)
+
+        assert stdout.getvalue() == ""
+
 
 class TestDefinitionCommand:
     @pytest.fixture(autouse=True)
@@ -8,14 +8,26 @@
  * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
  * specific language governing permissions and limitations under the License.
 """
+import os
+import threading
+import time
+
 import pytest
+import yaml
 
 from apigw_manager.apigw.helper import (
     ContextManager,
     Definition,
+    DefinitionDocument,
+    DefinitionLoader,
+    LocalPublicKeyCache,
     PublicKeyManager,
     ReleaseVersionManager,
+    ResourceFingerprintManager,
+    ResourceFingerprints,
     ResourceSignatureManager,
+    SyncSignatureManager,
+    public_key_cache,
 )
 from apigw_manager.apigw.models import Context
 
@@ -58,6 +70,99 @@ class TestDefinition:
         assert result["level"] == level
 
 
+class TestDefinitionDocument:
+    def test_sections(self):
+        document = DefinitionDocument(
+            "# comment\nspec_version: 2\nstages:\n- name: prod\n  vars: {}\napigateway:\n  description: |\n    text\n"
+        )
+
+        assert document.sections == {
+            "spec_version": "spec_version: 2\n",
+            "stages": "stages:\n- name: prod\n  vars: {}\n",
+            "apigateway": "apigateway:\n  description: |\n    text\n",
+        }
+        assert document.get("stages") == [{"name": "prod", "vars": {}}]
+        assert document.get("release") is None
+        # only the required sections are parsed
+        assert set(document._parsed) == {"stages"}
+        assert document.get_all()["apigateway"] == {"description": "text\n"}
+
+    @pytest.mark.parametrize(
+        "rendered",
+        [
+            "a: &default\n  b: 1\nc: *default\n",
+            "---\na: 1\n",
+            "{a: 1}\n",
+            "a: 1\na: 2\n",
+            "  a: 1\n",
+        ],
+    )
+    def test_unsplittable(self, rendered):
+        document = DefinitionDocument(rendered)
+
+        assert document.sections is None
+        assert document.get("a") == yaml.load(rendered, Loader=yaml.FullLoader)["a"]
+
+
+class TestDefinitionLoader:
+    @pytest.fixture()
+    def loader(self):
+        return DefinitionLoader()
+
+    @pytest.fixture()
+    def definition_file(self, tmp_path):
+        path = tmp_path / "definition.yaml"
+        path.write_text("stage:\n  name: {{ settings.STAGE_NAME }}\napigateway:\n  description: {{ data.description }}\n")
+        return path
+
+    def test_load_from(self, loader, definition_file, settings):
+        settings.STAGE_NAME = "prod"
+        context = {"data": {"description": "gateway"}, "settings": settings, "environ": os.environ}
+
+        definition = loader.load_from(str(definition_file), context)
+        assert definition.get("stage.name") == "prod"
+        assert definition.get("apigateway") == {"description": "gateway"}
+
+        # the sections of the shared document are copied
+        definition.get("stage")["name"] = "changed"
+        cached = loader.load_from(str(definition_file), context)
+        assert cached._document is definition._document
+        assert cached.get("stage.name") == "prod"
+
+        # the settings which are not referred do not matter
+        settings.OTHER = "other"
+        assert loader.load_from(str(definition_file), context)._document is definition._document
+
+    def test_context_changed(self, loader, definition_file, settings):
+        settings.STAGE_NAME = "prod"
+        context = {"data": {"description": "gateway"}, "settings": settings}
+        assert loader.load_from(str(definition_file), context).get("stage.name") == "prod"
+
+        settings.STAGE_NAME = "test"
+        assert loader.load_from(str(definition_file), context).get("stage.name") == "test"
+
+        context["data"]["description"] = "changed"
+        assert loader.load_from(str(definition_file), context).get("apigateway.description") == "changed"
+
+    def test_file_changed(self, loader, definition_file, settings):
+        settings.STAGE_NAME = "prod"
+        loader.load_from(str(definition_file), {"data": {}, "settings": settings})
+
+        definition_file.write_text("stage:\n  name: changed\n")
+        os.utime(definition_file, ns=(0, 0))
+
+        assert loader.load_from(str(definition_file), {"data": {}, "settings": settings}).get("stage.name") == "changed"
+
+    def test_max_size(self, definition_file, settings):
+        loader = DefinitionLoader(max_size=1)
+
+        for description in ["a", "b", "c"]:
+            loader.load(f"description: {description}", {})
+
+        assert len(loader._templates) == 1
+        assert len(loader._documents) == 1
+
+
 class TestContextManager:
     @pytest.fixture(autouse=True)
     def _setup_manager(self, faker):
@@ -158,6 +263,140 @@ class TestPublicKeyManager:
         assert self.manager.current() == context.value
 
 
+class TestLocalPublicKeyCache:
+    @pytest.fixture(autouse=True)
+    def _setup_cache(self, mocker):
+        self.cache = LocalPublicKeyCache()
+        self.mock_time = mocker.patch("apigw_manager.apigw.helper.time.time", return_value=1000)
+
+    def test_get_or_load(self, mocker):
+        load = mocker.MagicMock(return_value="public_key")
+
+        assert self.cache.get_or_load(("", "gateway"), load, 300, 30) == "public_key"
+        assert self.cache.get_or_load(("", "gateway"), load, 300, 30) == "public_key"
+        assert load.call_count == 1
+
+        self.mock_time.return_value = 1300
+        load.return_value = "refreshed"
+        assert self.cache.get_or_load(("", "gateway"), load, 300, 30) == "refreshed"
+        assert load.call_count == 2
+
+    def test_reload(self, mocker):
+        load = mocker.MagicMock(return_value="public_key")
+        assert self.cache.get_or_load(("", "gateway"), load, 300, 30) == "public_key"
+
+        load.return_value = "rotated"
+        assert self.cache.reload(("", "gateway"), load, 300, 30, 10) == "rotated"
+        assert self.cache.get_or_load(("", "gateway"), load, 300, 30) == "rotated"
+
+        # rate limited
+        self.mock_time.return_value = 1005
+        assert self.cache.reload(("", "gateway"), load, 300, 30, 10) is None
+        assert load.call_count == 2
+
+        self.mock_time.return_value = 1010
+        assert self.cache.reload(("", "gateway"), load, 300, 30, 10) == "rotated"
+        assert load.call_count == 3
+
+    def test_get_or_load_negative(self, mocker):
+        load = mocker.MagicMock(return_value=None)
+
+        assert self.cache.get_or_load(("", "gateway"), load, 300, 30) is None
+        assert self.cache.get_or_load(("", "gateway"), load, 300, 30) is None
+        assert load.call_count == 1
+
+        self.mock_time.return_value = 1030
+        assert self.cache.get_or_load(("", "gateway"), load, 300, 30) is None
+        assert load.call_count == 2
+
+    def test_get_or_load_error(self, mocker):
+        load = mocker.MagicMock(side_effect=ValueError)
+        with pytest.raises(ValueError):
+            self.cache.get_or_load(("", "gateway"), load, 300, 30)
+
+        load = mocker.MagicMock(return_value="public_key")
+        self.cache.get_or_load(("", "gateway"), load, 300, 30)
+
+        # the stale public key is used when refreshing failed
+        self.mock_time.return_value = 1300
+        load.side_effect = ValueError
+        assert self.cache.get_or_load(("", "gateway"), load, 300, 30) == "public_key"
+
+    def test_get_or_load_stale_while_refreshing(self, mocker):
+        self.cache.get_or_load(("", "gateway"), lambda: "stale", 300, 30)
+        self.mock_time.return_value = 1300
+
+        load_lock = self.cache._get_load_lock(("", "gateway"))
+        with load_lock:
+            assert self.cache.get_or_load(("", "gateway"), mocker.MagicMock(), 300, 30) == "stale"
+
+    def test_get_or_load_single_flight(self, mocker):
+        mocker.stop(self.mock_time)
+        started = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return "public_key"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.cache.get_or_load(("", "gateway"), load, 300, 30)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["public_key"] * 4
+        assert len(calls) == 1
+
+    def test_invalidate(self, mocker):
+        load = mocker.MagicMock(return_value="public_key")
+        self.cache.get_or_load(("", "gateway"), load, 300, 30)
+        self.cache.get_or_load(("issuer", "gateway"), load, 300, 30)
+        self.cache.get_or_load(("", "other"), load, 300, 30)
+
+        self.cache.invalidate("gateway")
+        self.cache.get_or_load(("", "gateway"), load, 300, 30)
+        self.cache.get_or_load(("issuer", "gateway"), load, 300, 30)
+        self.cache.get_or_load(("", "other"), load, 300, 30)
+        assert load.call_count == 5
+
+        self.cache.clear()
+        self.cache.get_or_load(("", "other"), load, 300, 30)
+        assert load.call_count == 6
+
+    def test_invalidate_while_loading(self):
+        def load():
+            self.cache.invalidate("gateway")
+            return "outdated"
+
+        assert self.cache.get_or_load(("", "gateway"), load, 300, 30) == "outdated"
+        assert self.cache.get_or_load(("", "gateway"), lambda: "public_key", 300, 30) == "public_key"
+
+
+@pytest.mark.parametrize("key", ["gateway", "issuer:gateway"])
+def test_public_key_cache_invalidated_on_context_changed(mocker, key):
+    invalidate = mocker.patch.object(public_key_cache, "invalidate")
+
+    PublicKeyManager().set_value(key, "public_key")
+    invalidate.assert_called_with("gateway")
+
+    Context.objects.filter(scope=PublicKeyManager.scope, key=key).get().delete()
+    assert invalidate.call_count == 2
+
+
+def test_public_key_cache_cleared_on_setting_changed(mocker, settings):
+    clear = mocker.patch.object(public_key_cache, "clear")
+
+    settings.APIGW_PUBLIC_KEY = "public_key"
+    clear.assert_called_once_with()
+
+
 class TestReleaseVersionManager:
     @pytest.fixture(autouse=True)
     def _setup_manager(self):
@@ -258,3 +497,135 @@ class TestResourceSignatureManager:
             "is_dirty": True,
             "signature": "signature",
         }
+
+
+@pytest.fixture()
+def resources_definition():
+    return {
+        "swagger": "2.0",
+        "definitions": {"User": {"type": "object"}},
+        "paths": {
+            "/users/": {
+                "parameters": [{"name": "tenant", "in": "header"}],
+                "get": {"operationId": "list_users"},
+                "post": {"operationId": "create_user"},
+            },
+            "/groups/": {
+                "get": {"summary": "no operation id"},
+            },
+        },
+    }
+
+
+class TestResourceFingerprints:
+    def test_from_definition(self, resources_definition):
+        fingerprints = ResourceFingerprints.from_definition(resources_definition)
+
+        assert sorted(fingerprints.resources) == ["GET /groups/", "create_user", "list_users"]
+        assert ResourceFingerprints.from_definition(resources_definition).to_dict() == fingerprints.to_dict()
+
+    def test_diff_never_synced(self, resources_definition):
+        diff = ResourceFingerprints.from_definition(resources_definition).diff(None)
+
+        assert diff.shared_changed is True
+        assert diff.added == ["GET /groups/", "create_user", "list_users"]
+
+    def test_diff(self, resources_definition):
+        synced = ResourceFingerprints.from_definition(resources_definition)
+
+        resources_definition["paths"]["/users/"]["post"]["description"] = "changed"
+        del resources_definition["paths"]["/groups/"]
+        resources_definition["paths"]["/users/{id}/"] = {"get": {"operationId": "get_user"}}
+        diff = ResourceFingerprints.from_definition(resources_definition).diff(synced)
+
+        assert diff.has_changes
+        assert diff.shared_changed is False
+        assert diff.added == ["get_user"]
+        assert diff.changed == ["create_user"]
+        assert diff.removed == ["GET /groups/"]
+        assert diff.unchanged == 1
+
+    def test_diff_path_level_fields(self, resources_definition):
+        synced = ResourceFingerprints.from_definition(resources_definition)
+
+        resources_definition["paths"]["/users/"]["parameters"] = []
+        diff = ResourceFingerprints.from_definition(resources_definition).diff(synced)
+
+        assert diff.changed == ["create_user", "list_users"]
+
+    @pytest.mark.parametrize(
+        ("definition_changes", "options"),
+        [
+            ({"definitions": {}}, {}),
+            ({}, {"delete": True}),
+        ],
+    )
+    def test_diff_shared_changed(self, resources_definition, definition_changes, options):
+        synced = ResourceFingerprints.from_definition(resources_definition)
+
+        resources_definition.update(definition_changes)
+        diff = ResourceFingerprints.from_definition(resources_definition, **options).diff(synced)
+
+        assert diff.shared_changed is True
+        assert diff.unchanged == 3
+
+    def test_diff_unchanged(self, resources_definition):
+        synced = ResourceFingerprints.from_definition(resources_definition)
+
+        assert not ResourceFingerprints.from_definition(resources_definition).diff(synced).has_changes
+
+    def test_select(self, resources_definition):
+        selected = ResourceFingerprints.select(resources_definition, ["create_user"])
+
+        assert selected == {
+            "swagger": "2.0",
+            "definitions": {"User": {"type": "object"}},
+            "paths": {
+                "/users/": {
+                    "parameters": [{"name": "tenant", "in": "header"}],
+                    "post": {"operationId": "create_user"},
+                },
+            },
+        }
+        assert len(resources_definition["paths"]["/users/"]) == 3
+
+
+class TestResourceFingerprintManager:
+    def test_get_not_found(self, faker):
+        assert ResourceFingerprintManager().get(faker.pystr()) is None
+
+    def test_set(self, faker, resources_definition):
+        gateway_name = faker.pystr()
+        fingerprints = ResourceFingerprints.from_definition(resources_definition)
+
+        ResourceFingerprintManager().set(gateway_name, fingerprints)
+
+        assert ResourceFingerprintManager().get(gateway_name).to_dict() == fingerprints.to_dict()
+
+
+class TestSyncSignatureManager:
+    @pytest.fixture(autouse=True)
+    def _setup_manager(self):
+        self.manager = SyncSignatureManager()
+
+    def test_get_signatures(self, faker):
+        gateway_name = faker.pystr()
+        self.manager.set_signature(gateway_name, "config", "config-signature")
+        self.manager.set_signature(gateway_name, "stage", "stage-signature")
+        self.manager.set_signature(faker.pystr(), "resources", "resources-signature")
+
+        assert self.manager.get_signatures(gateway_name, ["config", "stage", "resources"]) == {
+            "config": "config-signature",
+            "stage": "stage-signature",
+        }
+
+    def test_reset(self, faker):
+        gateway_name = faker.pystr()
+        other_gateway_name = gateway_name + "-other"
+        self.manager.set_signature(gateway_name, "config", "signature")
+        self.manager.set_signature(other_gateway_name, "config", "signature")
+
+        self.manager.reset(gateway_name)
+
+        assert self.manager.get_signatures(gateway_name, ["config"]) == {}
+        assert self.manager.get_signatures(other_gateway_name, ["config"]) == {"config": "signature"}
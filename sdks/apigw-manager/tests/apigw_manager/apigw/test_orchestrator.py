@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import pytest
+import yaml
+
+from apigw_manager.apigw.helper import PublicKeyManager, ResourceSignatureManager
+from apigw_manager.apigw.orchestrator import (
+    DefinitionInput,
+    ResourceDocsInput,
+    SyncOrchestrator,
+    SyncStep,
+    SyncStepResult,
+    make_sync_steps,
+)
+
+
+@pytest.fixture()
+def docs_dir(tmp_path):
+    path = tmp_path / "docs"
+    path.mkdir()
+    (path / "zh").mkdir()
+    (path / "zh" / "anything.md").write_text("# anything")
+    return path
+
+
+@pytest.fixture()
+def definition(docs_dir):
+    return {
+        "spec_version": 1,
+        "release": {"version": "1.0.0", "title": "title", "comment": "comment"},
+        "apigateway": {"description": "gateway", "is_public": True, "maintainers": ["admin"]},
+        "stage": {"name": "prod", "vars": {}},
+        "grant_permissions": [{"bk_app_code": "app1"}, {"bk_app_code": "app2"}],
+        "resource_docs": {"basedir": str(docs_dir)},
+    }
+
+
+@pytest.fixture()
+def definition_file(tmp_path, definition):
+    path = tmp_path / "definition.yaml"
+    path.write_text(yaml.dump(definition))
+    return path
+
+
+@pytest.fixture()
+def resources_file(tmp_path):
+    path = tmp_path / "resources.yaml"
+    path.write_text(yaml.dump({"swagger": "2.0", "paths": {"/anything/": {"get": {"operationId": "anything"}}}}))
+    return path
+
+
+@pytest.fixture()
+def steps(fake_gateway_name, definition_file, resources_file):
+    return make_sync_steps(
+        fake_gateway_name,
+        str(definition_file),
+        str(resources_file),
+        stages=["prod"],
+        sync_resource_docs=True,
+    )
+
+
+def _statuses(results):
+    return {result.name: result.status for result in results}
+
+
+class TestDefinitionInput:
+    def test_digest_namespaces(self, definition_file, definition):
+        loaded = {}
+        digest = DefinitionInput(str(definition_file), ["stage"]).digest(loaded)
+
+        definition["apigateway"]["description"] = "changed"
+        definition_file.write_text(yaml.dump(definition))
+
+        # the rendered definition is shared by the inputs
+        assert DefinitionInput(str(definition_file), ["stage"]).digest(loaded) == digest
+        assert DefinitionInput(str(definition_file), ["stage"]).digest({}) == digest
+        assert DefinitionInput(str(definition_file), ["apigateway"]).digest({}) != digest
+
+    def test_digest_rendered(self, tmp_path, settings):
+        path = tmp_path / "definition.yaml"
+        path.write_text("stage:\n  name: {{ settings.STAGE_NAME }}\n")
+
+        settings.STAGE_NAME = "prod"
+        digest = DefinitionInput(str(path), ["stage"]).digest({})
+        settings.STAGE_NAME = "test"
+
+        assert DefinitionInput(str(path), ["stage"]).digest({}) != digest
+
+    def test_resource_docs_digest(self, definition_file, docs_dir):
+        digest = ResourceDocsInput(str(definition_file)).digest({})
+        assert ResourceDocsInput(str(definition_file)).digest({}) == digest
+
+        (docs_dir / "zh" / "anything.md").write_text("# changed")
+        assert ResourceDocsInput(str(definition_file)).digest({}) != digest
+
+
+class TestMakeSyncSteps:
+    def test_steps(self, steps):
+        assert {step.name: step.depends_on for step in steps} == {
+            "config": [],
+            "stage": ["config"],
+            "resources": ["config"],
+            "resource_docs": ["resources"],
+            "grant_permissions": ["resources"],
+            "release": ["stage", "resources", "resource_docs"],
+            "public_key": ["config"],
+        }
+
+    def test_optional_steps(self, fake_gateway_name, definition_file):
+        steps = make_sync_steps(
+            fake_gateway_name, str(definition_file), grant_permissions=False, sync_mcp_servers=True
+        )
+
+        assert {step.name: step.depends_on for step in steps} == {
+            "config": [],
+            "stage": ["config"],
+            "release": ["stage"],
+            "public_key": ["config"],
+            "mcp_servers": ["release"],
+        }
+
+
+class TestSyncOrchestrator:
+    @pytest.fixture(autouse=True)
+    def _setup(self, fake_gateway, fake_gateway_name):
+        self.gateway = fake_gateway
+        self.gateway_name = fake_gateway_name
+
+    def test_check_steps(self):
+        with pytest.raises(ValueError, match="duplicated"):
+            SyncOrchestrator(self.gateway_name, [SyncStep("a", "a"), SyncStep("a", "a")])
+
+        with pytest.raises(ValueError, match="not declared"):
+            SyncOrchestrator(self.gateway_name, [SyncStep("a", "a", depends_on=["b"]), SyncStep("b", "b")])
+
+    def test_run(self, steps):
+        results = SyncOrchestrator(self.gateway_name, steps, max_workers=1).run()
+
+        assert [result.name for result in results] == [step.name for step in steps]
+        assert all(result.status == SyncStepResult.SUCCEEDED for result in results)
+        assert len(self.gateway.called("grant_permissions")) == 2
+        assert len(self.gateway.called("release")) == 1
+        assert self.gateway.called("release")[0]["body"]["stage_names"] == ["prod"]
+        assert PublicKeyManager().get(self.gateway_name) == "public-key"
+        assert ResourceSignatureManager().is_dirty(self.gateway_name) is False
+
+    # the steps write the database in their own threads, the changes should be committed
+    @pytest.mark.django_db(transaction=True)
+    def test_run_concurrently(self, steps):
+        self.gateway.delay = 0.1
+
+        results = SyncOrchestrator(self.gateway_name, steps, max_workers=4).run()
+
+        assert all(result.status == SyncStepResult.SUCCEEDED for result in results)
+        # stage, resources and public key do not depend on each other
+        assert self.gateway.max_concurrency > 1
+        assert PublicKeyManager().get(self.gateway_name) == "public-key"
+
+    def test_skip_unchanged(self, steps):
+        SyncOrchestrator(self.gateway_name, steps, max_workers=1).run()
+        self.gateway.reset()
+
+        results = SyncOrchestrator(self.gateway_name, steps, max_workers=1, skip_unchanged=True).run()
+
+        assert _statuses(results) == {
+            "config": SyncStepResult.SKIPPED,
+            "stage": SyncStepResult.SKIPPED,
+            "resources": SyncStepResult.SKIPPED,
+            "resource_docs": SyncStepResult.SKIPPED,
+            "grant_permissions": SyncStepResult.SKIPPED,
+            # depend on the gateway state
+            "release": SyncStepResult.SUCCEEDED,
+            "public_key": SyncStepResult.SUCCEEDED,
+        }
+        assert {request["operation"] for request in self.gateway.requests} == {
+            "get_latest_resource_version",
+            "list_resource_versions",
+            "create_resource_version",
+            "release",
+            "get_apigw_public_key",
+        }
+
+    def test_run_unchanged_by_default(self, steps):
+        SyncOrchestrator(self.gateway_name, steps, max_workers=1).run()
+
+        # the gateway may be changed on the gateway side, so the unchanged steps run again by default
+        results = SyncOrchestrator(self.gateway_name, steps, max_workers=1).run()
+
+        assert all(result.status == SyncStepResult.SUCCEEDED for result in results)
+
+    def test_changes_propagated(self, steps, definition_file, definition, resources_file):
+        SyncOrchestrator(self.gateway_name, steps, max_workers=1).run()
+
+        definition["grant_permissions"].append({"bk_app_code": "app3"})
+        definition_file.write_text(yaml.dump(definition))
+        resources_file.write_text(yaml.dump({"swagger": "2.0", "paths": {}}))
+        self.gateway.reset()
+
+        results = SyncOrchestrator(self.gateway_name, steps, max_workers=1, skip_unchanged=True).run()
+
+        assert _statuses(results) == {
+            "config": SyncStepResult.SKIPPED,
+            "stage": SyncStepResult.SKIPPED,
+            "resources": SyncStepResult.SUCCEEDED,
+            "resource_docs": SyncStepResult.SUCCEEDED,
+            "grant_permissions": SyncStepResult.SUCCEEDED,
+            "release": SyncStepResult.SUCCEEDED,
+            "public_key": SyncStepResult.SUCCEEDED,
+        }
+        assert len(self.gateway.called("grant_permissions")) == 3
+
+    @pytest.mark.django_db(transaction=True)
+    def test_failed(self, steps):
+        self.gateway.failures.add("sync_resources")
+
+        results = SyncOrchestrator(self.gateway_name, steps, max_workers=4).run()
+
+        assert _statuses(results) == {
+            "config": SyncStepResult.SUCCEEDED,
+            "stage": SyncStepResult.SUCCEEDED,
+            "resources": SyncStepResult.FAILED,
+            "resource_docs": SyncStepResult.CANCELLED,
+            "grant_permissions": SyncStepResult.CANCELLED,
+            "release": SyncStepResult.CANCELLED,
+            "public_key": SyncStepResult.SUCCEEDED,
+        }
+        assert isinstance(results[2].error, SystemExit)
+        assert self.gateway.called("release") == []
+
+        # the failed steps will run again
+        self.gateway.failures.clear()
+        self.gateway.reset()
+        results = SyncOrchestrator(self.gateway_name, steps, max_workers=1, skip_unchanged=True).run()
+
+        assert _statuses(results)["stage"] == SyncStepResult.SKIPPED
+        assert all(
+            _statuses(results)[name] == SyncStepResult.SUCCEEDED
+            for name in ["resources", "resource_docs", "grant_permissions", "release"]
+        )
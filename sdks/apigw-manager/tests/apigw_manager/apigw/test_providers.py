@@ -16,7 +16,10 @@ from apigw_manager.apigw.providers import (
     CachePublicKeyProvider,
     DefaultJWTProvider,
     DummyEnvPayloadJWTProvider,
+    JWTTokenInvalid,
+    LocalCachePublicKeyProvider,
     SettingsPublicKeyProvider,
+    VerifiedTokenCache,
 )
 
 
@@ -103,11 +106,50 @@ class TestCachePublicKeyProvider:
         )
 
 
+class TestLocalCachePublicKeyProvider:
+    def test_provide(self, mocker, fake_gateway_name, public_key_in_db):
+        provider = LocalCachePublicKeyProvider("testing")
+        get_best_matched = mocker.spy(provider.public_key_manager, "get_best_matched")
+
+        assert provider.provide(fake_gateway_name) == public_key_in_db
+        assert provider.provide(fake_gateway_name) == public_key_in_db
+        assert get_best_matched.call_count == 1
+
+        assert provider.provide(fake_gateway_name, "issuer") == public_key_in_db
+        assert get_best_matched.call_count == 2
+
+    def test_provide_not_found(self, mocker, fake_gateway_name):
+        provider = LocalCachePublicKeyProvider("testing")
+        get_best_matched = mocker.spy(provider.public_key_manager, "get_best_matched")
+
+        assert provider.provide(fake_gateway_name) is None
+        assert provider.provide(fake_gateway_name) is None
+        assert get_best_matched.call_count == 1
+
+    def test_provide_updated(self, fake_gateway_name, public_key_in_db, public_key_context):
+        provider = LocalCachePublicKeyProvider("testing")
+        assert provider.provide(fake_gateway_name) == public_key_in_db
+
+        public_key_context.value = "updated"
+        public_key_context.save()
+        assert provider.provide(fake_gateway_name) == "updated"
+
+    def test_provide_cache_disabled(self, mocker, settings, fake_gateway_name, public_key_in_db):
+        settings.APIGW_JWT_PUBLIC_KEY_REFRESH_SECONDS = 0
+        provider = LocalCachePublicKeyProvider("testing")
+        get_best_matched = mocker.spy(provider.public_key_manager, "get_best_matched")
+
+        provider.provide(fake_gateway_name)
+        provider.provide(fake_gateway_name)
+        assert get_best_matched.call_count == 2
+
+
 class TestDefaultJWTProvider:
     @pytest.fixture()
     def public_key_provider(self, mocker, public_key):
         public_key_provider = mocker.MagicMock()
         public_key_provider.provide.return_value = public_key
+        public_key_provider.reload.return_value = None
         return public_key_provider
 
     @pytest.fixture()
@@ -139,6 +181,121 @@ class TestDefaultJWTProvider:
         assert decoded.api_name == fake_gateway_name
         assert decoded.payload == jwt_decoded
 
+    def test_provide_cached(self, mocker, provider, jwt_request, jwt_decoded):
+        decode = mocker.spy(provider, "_decode_jwt")
+
+        assert provider.provide(jwt_request).payload == jwt_decoded
+        assert provider.provide(jwt_request).payload == jwt_decoded
+        assert decode.call_count == 1
+
+    def test_provide_cached_payload_isolated(self, provider, jwt_request, jwt_decoded):
+        provider.provide(jwt_request).payload["user"]["bk_username"] = "changed"
+        provider.provide(jwt_request).payload["app"]["bk_app_code"] = "changed"
+
+        assert provider.provide(jwt_request).payload == jwt_decoded
+
+    def test_provide_public_key_changed(self, public_key_provider, provider, jwt_request):
+        provider.provide(jwt_request)
+
+        # the cached token should be verified again with the new public key
+        public_key_provider.provide.return_value = "changed"
+        with pytest.raises(JWTTokenInvalid):
+            provider.provide(jwt_request)
+
+    def test_provide_public_key_rotated(self, public_key_provider, provider, jwt_request, public_key, jwt_decoded):
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        outdated_public_key = (
+            rsa.generate_private_key(public_exponent=65537, key_size=1024)
+            .public_key()
+            .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+            .decode()
+        )
+        public_key_provider.provide.return_value = outdated_public_key
+        with pytest.raises(JWTTokenInvalid):
+            provider.provide(jwt_request)
+
+        public_key_provider.reload.return_value = public_key
+        assert provider.provide(jwt_request).payload == jwt_decoded
+
+    def test_provide_cache_disabled(self, mocker, settings, public_key_provider, jwt_algorithm, jwt_request):
+        settings.APIGW_JWT_TOKEN_CACHE_SIZE = 0
+        provider = DefaultJWTProvider("HTTP_X_BKAPI_JWT", "gateway", jwt_algorithm, False, public_key_provider)
+        decode = mocker.spy(provider, "_decode_jwt")
+
+        provider.provide(jwt_request)
+        provider.provide(jwt_request)
+
+        assert provider.token_cache is None
+        assert decode.call_count == 2
+
+    def test_provide_invalid_token(self, provider, jwt_request, jwt_encoded):
+        jwt_request.META[provider.jwt_key_name] = jwt_encoded[:-4]
+
+        for _ in range(2):
+            with pytest.raises(JWTTokenInvalid):
+                provider.provide(jwt_request)
+
+    def test_verifying_key_cached(self, mocker, provider, public_key, jwt_algorithm):
+        key = provider._get_verifying_key("gateway", public_key, jwt_algorithm)
+        assert not isinstance(key, str)
+        assert provider._get_verifying_key("gateway", public_key, jwt_algorithm) is key
+
+        prepare_key = mocker.patch("jwt.algorithms.RSAAlgorithm.prepare_key")
+        assert provider._get_verifying_key("gateway", "changed", jwt_algorithm) is prepare_key.return_value
+
+    def test_verifying_key_evicted(self, mocker, provider, public_key, jwt_algorithm):
+        mocker.patch.object(provider, "VERIFYING_KEY_CACHE_SIZE", 2)
+        for gateway_name in ["a", "b", "a", "c"]:
+            provider._get_verifying_key(gateway_name, public_key, jwt_algorithm)
+
+        assert list(provider._verifying_keys.keys()) == [("a", jwt_algorithm), ("c", jwt_algorithm)]
+
+    def test_verifying_key_unknown_algorithm(self, provider, public_key):
+        assert provider._get_verifying_key("gateway", public_key, "unknown") == public_key
+
+
+class TestVerifiedTokenCache:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mocker):
+        self.cache = VerifiedTokenCache(2, 60)
+        self.mock_time = mocker.patch("apigw_manager.apigw.providers.time.time", return_value=1000)
+
+    def test_get(self):
+        key = self.cache.make_key("token")
+        assert self.cache.get(key) is None
+
+        self.cache.set(key, "gateway", "iss", "public_key", {"foo": "bar"})
+        assert self.cache.get(key) == ("gateway", "iss", "public_key", {"foo": "bar"})
+
+        self.mock_time.return_value = 1060
+        assert self.cache.get(key) is None
+
+    def test_get_token_expired(self):
+        key = self.cache.make_key("token")
+        self.cache.set(key, "gateway", "iss", "public_key", {"exp": 1010})
+
+        self.mock_time.return_value = 1009
+        assert self.cache.get(key) is not None
+
+        self.mock_time.return_value = 1010
+        assert self.cache.get(key) is None
+
+    def test_evict(self):
+        keys = [self.cache.make_key(str(i)) for i in range(3)]
+        self.cache.set(keys[0], "gateway", "iss", "public_key", {})
+        self.cache.set(keys[1], "gateway", "iss", "public_key", {})
+        self.cache.get(keys[0])
+        self.cache.set(keys[2], "gateway", "iss", "public_key", {})
+
+        assert self.cache.get(keys[0]) is not None
+        assert self.cache.get(keys[1]) is None
+        assert self.cache.get(keys[2]) is not None
+
+        self.cache.clear()
+        assert self.cache.get(keys[0]) is None
+
 
 class TestDummyEnvPayloadJWTProvider:
     @pytest.mark.parametrize(
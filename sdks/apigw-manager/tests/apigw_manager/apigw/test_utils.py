@@ -11,13 +11,23 @@
 
 import os
 import tempfile
+import threading
 import zipfile
 
 import pytest
+from bkapi_client_core.config import settings as bkapi_settings
 from django.conf import settings
 from packaging.version import InvalidVersion
 
-from apigw_manager.apigw.utils import ZipArchiveFile, get_configuration, parse_value_list, parse_version
+from apigw_manager.apigw.utils import (
+    ZipArchiveFile,
+    get_api_cache,
+    get_configuration,
+    get_sync_max_workers,
+    map_concurrently,
+    parse_value_list,
+    parse_version,
+)
 
 
 class TestGetConfiguration:
@@ -121,6 +131,74 @@ class TestGetConfiguration:
         assert configuration.host == expected
 
 
+class TestMapConcurrently:
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_keep_order(self, max_workers):
+        assert map_concurrently(lambda x: x * 2, range(10), max_workers) == [x * 2 for x in range(10)]
+
+    def test_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        # all the items are waiting for each other, it will be broken if they are called one by one
+        assert map_concurrently(lambda x: barrier.wait() >= 0, range(3), 3) == [True, True, True]
+
+    def test_raise_first_error(self):
+        called = []
+
+        def func(x):
+            called.append(x)
+            if x > 0:
+                raise ValueError(x)
+            return x
+
+        with pytest.raises(ValueError, match="1"):
+            map_concurrently(func, range(3), 2)
+
+        assert sorted(called) == [0, 1, 2]
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, 4),
+            (8, 8),
+            ("2", 2),
+            (0, 1),
+        ],
+    )
+    def test_get_sync_max_workers(self, settings, value, expected):
+        if value is not None:
+            settings.BK_APIGW_SYNC_MAX_WORKERS = value
+
+        assert get_sync_max_workers() == expected
+
+
+class TestGetApiCache:
+    def test_default(self):
+        assert get_api_cache() is None
+        assert get_configuration().api_cache is None
+
+    def test_enabled(self, settings):
+        settings.BK_APIGW_API_CACHE_TTL = 300
+        api_cache = get_api_cache()
+
+        assert api_cache.ttl == 300
+        assert api_cache.path is None
+        assert get_api_cache() is api_cache
+        assert get_configuration().api_cache is api_cache
+
+    def test_settings_changed(self, settings, tmp_path):
+        settings.BK_APIGW_API_CACHE_TTL = 300
+        api_cache = get_api_cache()
+
+        settings.BK_APIGW_API_CACHE_TTL = "60"
+        settings.BK_APIGW_API_CACHE_FILE = str(tmp_path / "api.json")
+        bkapi_settings.reset()
+
+        assert get_api_cache() is not api_cache
+        assert get_api_cache().ttl == 60
+        assert get_api_cache().path == settings.BK_APIGW_API_CACHE_FILE
+
+
 class TestParseValueList:
     def test_multiple_values(self):
         result = parse_value_list(
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+* TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+* Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+* Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at http://opensource.org/licenses/MIT
+* Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+* an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+* specific language governing permissions and limitations under the License.
+"""
+import threading
+
+import pytest
+
+from apigw_manager.core.cache import ApiResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture()
+def cache(clock):
+    return ApiResponseCache(ttl=10, clock=clock)
+
+
+def _key(gateway_name, **kwargs):
+    return {"gateway_name": gateway_name, "kwargs": kwargs}
+
+
+class TestApiResponseCache:
+    def test_try_get(self, cache):
+        assert cache.try_get("get_apigw_public_key", _key("foo")) == (False, None)
+
+        cache.update("get_apigw_public_key", _key("foo"), {"public_key": "key"})
+
+        assert cache.try_get("get_apigw_public_key", _key("foo")) == (True, {"public_key": "key"})
+        assert cache.try_get("get_apigw_public_key", _key("bar")) == (False, None)
+        assert cache.try_get("get_apigw_public_key", _key("foo", version="1.0.0")) == (False, None)
+        assert str(cache.stats) == "1 hits, 3 misses"
+
+    def test_expired(self, cache, clock):
+        cache.update("get_apigw_public_key", _key("foo"), {})
+
+        clock.now += 10
+        assert cache.try_get("get_apigw_public_key", _key("foo")) == (False, None)
+
+    def test_disabled(self, clock):
+        cache = ApiResponseCache(ttl=0, clock=clock)
+        cache.update("get_apigw_public_key", _key("foo"), {})
+
+        assert cache.try_get("get_apigw_public_key", _key("foo")) == (False, None)
+
+    @pytest.mark.parametrize(
+        ("gateway_name", "foo_cached", "bar_cached"),
+        [
+            ("foo", False, True),
+            (None, False, False),
+        ],
+    )
+    def test_invalidate(self, cache, gateway_name, foo_cached, bar_cached):
+        cache.update("get_apigw_public_key", _key("foo"), {})
+        cache.update("get_apigw_public_key", _key("bar"), {})
+
+        cache.invalidate(gateway_name)
+
+        assert cache.try_get("get_apigw_public_key", _key("foo"))[0] is foo_cached
+        assert cache.try_get("get_apigw_public_key", _key("bar"))[0] is bar_cached
+
+    def test_track(self, cache):
+        cache.update("get_apigw_public_key", _key("foo"), {})
+
+        with cache.track() as outer:
+            cache.try_get("get_apigw_public_key", _key("foo"))
+            with cache.track() as inner:
+                cache.try_get("get_apigw_public_key", _key("bar"))
+
+        cache.try_get("get_apigw_public_key", _key("foo"))
+
+        assert (outer.hits, outer.misses) == (1, 1)
+        assert (inner.hits, inner.misses) == (0, 1)
+        assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+    def test_persist(self, clock, tmp_path):
+        path = str(tmp_path / "cache" / "api.json")
+        cache = ApiResponseCache(ttl=10, path=path, clock=clock)
+        cache.update("get_apigw_public_key", _key("foo"), {"public_key": "key"})
+        cache.save()
+
+        cache = ApiResponseCache(ttl=10, path=path, clock=clock)
+        cache.load()
+        assert cache.try_get("get_apigw_public_key", _key("foo")) == (True, {"public_key": "key"})
+
+        clock.now += 10
+        cache = ApiResponseCache(ttl=10, path=path, clock=clock)
+        cache.load()
+        assert cache.try_get("get_apigw_public_key", _key("foo")) == (False, None)
+
+    def test_load_invalid_file(self, clock, tmp_path):
+        path = tmp_path / "api.json"
+        path.write_text("invalid")
+
+        cache = ApiResponseCache(ttl=10, path=str(path), clock=clock)
+        cache.load()
+
+        assert cache.try_get("get_apigw_public_key", _key("foo")) == (False, None)
+
+    def test_save_merged(self, clock, tmp_path):
+        path = str(tmp_path / "api.json")
+        cache = ApiResponseCache(ttl=10, path=path, clock=clock)
+        cache.update("get_apigw_public_key", _key("foo"), {"public_key": "old"})
+        cache.update("get_apigw_public_key", _key("bar"), {"public_key": "bar"})
+        cache.save()
+
+        # another process updates foo and writes to baz after the file is loaded
+        clock.now += 1
+        other = ApiResponseCache(ttl=10, path=path, clock=clock)
+        other.load()
+        other.update("get_apigw_public_key", _key("foo"), {"public_key": "new"})
+        other.update("get_apigw_public_key", _key("baz"), {"public_key": "baz"})
+        other.invalidate("bar")
+        other.save()
+
+        cache.update("get_apigw_public_key", _key("qux"), {"public_key": "qux"})
+        cache.save()
+
+        cache = ApiResponseCache(ttl=10, path=path, clock=clock)
+        cache.load()
+        assert cache.try_get("get_apigw_public_key", _key("foo")) == (True, {"public_key": "new"})
+        assert cache.try_get("get_apigw_public_key", _key("bar")) == (False, None)
+        assert cache.try_get("get_apigw_public_key", _key("baz")) == (True, {"public_key": "baz"})
+        assert cache.try_get("get_apigw_public_key", _key("qux")) == (True, {"public_key": "qux"})
+
+    def test_load_changed_file(self, clock, tmp_path):
+        path = str(tmp_path / "api.json")
+        cache = ApiResponseCache(ttl=10, path=path, clock=clock)
+        cache.update("get_apigw_public_key", _key("foo"), {"public_key": "old"})
+        cache.save()
+
+        clock.now += 1
+        other = ApiResponseCache(ttl=10, path=path, clock=clock)
+        other.invalidate("foo")
+        other.save()
+
+        cache.load()
+        assert cache.try_get("get_apigw_public_key", _key("foo")) == (False, None)
+
+    def test_save_concurrently(self, tmp_path):
+        path = str(tmp_path / "api.json")
+        caches = [ApiResponseCache(ttl=10, path=path) for _ in range(4)]
+
+        def save(cache, gateway_name):
+            for i in range(20):
+                cache.update("get_apigw_public_key", _key(gateway_name, i=i), {})
+                cache.save()
+
+        threads = [threading.Thread(target=save, args=(cache, "gw%s" % i)) for i, cache in enumerate(caches)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        cache = ApiResponseCache(ttl=10, path=path)
+        cache.load()
+        assert len(cache._entries) == 80
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_save_failed(self, clock, tmp_path, mocker):
+        path = str(tmp_path / "api.json")
+        cache = ApiResponseCache(ttl=10, path=path, clock=clock)
+        cache.update("get_apigw_public_key", _key("foo"), {"public_key": "key"})
+
+        mocker.patch("apigw_manager.core.cache.os.replace", side_effect=OSError("failed"))
+        cache.save()
+        assert not list(tmp_path.glob("*.tmp"))
+
+        # the changes are persisted by the next saving
+        mocker.stopall()
+        cache.save()
+        cache = ApiResponseCache(ttl=10, path=path, clock=clock)
+        cache.load()
+        assert cache.try_get("get_apigw_public_key", _key("foo")) == (True, {"public_key": "key"})
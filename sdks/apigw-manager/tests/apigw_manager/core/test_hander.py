@@ -84,11 +84,42 @@ class TestHandler:
 
         cache_key = {
             "gateway_name": gateway_name,
+            "host": handler.config.host,
             "kwargs": {"gateway_name": gateway_name, "foo": "bar"},
         }
         mock_get_from_cache.assert_called_once_with(operation_id, cache_key)
         mock_put_into_cache.assert_called_once_with(operation_id, cache_key, result)
 
+    @pytest.mark.parametrize(
+        "method, invalidated",
+        [
+            ("GET", False),
+            ("POST", True),
+            ("DELETE", True),
+        ],
+    )
+    def test_call_invalidate_cache(self, handler: Handler, api_cache, operation, faker, method, invalidated):
+        operation.method = method
+        gateway_name = faker.pystr()
+
+        handler._call(operation, gateway_name=gateway_name)
+
+        if invalidated:
+            api_cache.invalidate.assert_called_once_with(gateway_name)
+        else:
+            api_cache.invalidate.assert_not_called()
+
+    def test_call_v2_invalidate_cache_when_failed(self, handler: Handler, api_cache, operation, faker):
+        operation.method = "PUT"
+        operation.path = "/api/v2/open/gateways/{gateway_name}/"
+        operation.side_effect = HTTPResponseError()
+        gateway_name = faker.pystr()
+
+        with pytest.raises(ApiResponseError):
+            handler._call_v2(operation, gateway_name=gateway_name)
+
+        api_cache.invalidate.assert_called_once_with(gateway_name)
+
     def test_call_connect_error(self, handler: Handler, operation):
         operation.side_effect = HTTPResponseError()
         with pytest.raises(ApiResponseError):
@@ -129,6 +160,15 @@ class TestHandler:
         monkeypatch.setenv("BKPAAS_APP_TENANT_ID", "123")
         assert handler._get_tenant_id() == "123"
 
+    def test_get_tenant_id_cached(self, handler: Handler, mocker):
+        handler.config.bk_app_tenant_id = "123"
+        mock_logger = mocker.patch("apigw_manager.core.handler.logger")
+
+        assert handler._get_tenant_id() == "123"
+        handler.config.bk_app_tenant_id = "456"
+        assert handler._get_tenant_id() == "123"
+        assert mock_logger.warning.call_count <= 1
+
     def test_get_tenant_id_from_env_default_system(self, handler: Handler, monkeypatch):
         monkeypatch.setenv("BKPAAS_APP_TENANT_ID", "")
         assert handler._get_tenant_id() == "system"
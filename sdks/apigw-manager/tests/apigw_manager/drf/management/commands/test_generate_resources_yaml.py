@@ -8,6 +8,7 @@
 # specific language governing permissions and limitations under the License.
 
 import argparse
+from io import StringIO
 from types import SimpleNamespace
 from unittest.mock import Mock, mock_open, patch
 
@@ -19,6 +20,7 @@ from apigw_manager.drf.management.commands.generate_resources_yaml import (
     post_process_inject_method_and_path,
     post_process_mcp_server_config,
     post_process_only_keep_the_apis_with_specified_tags,
+    validate_schema_concurrently,
 )
 
 
@@ -249,6 +251,39 @@ class TestPostProcess:
 
         with pytest.raises(Exception, match="enableMcp=True"):
             f(result, Mock(), Mock(), Mock())
+class TestValidateSchemaConcurrently:
+    @pytest.fixture()
+    def schema(self):
+        return {
+            "openapi": "3.0.3",
+            "info": {"title": "test", "version": "1.0.0"},
+            "paths": {
+                f"/api/v1/things/{index}/": {
+                    "get": {"operationId": f"thing{index}", "responses": {"200": {"description": "ok"}}}
+                }
+                for index in range(5)
+            },
+            "components": {"schemas": {}},
+        }
+
+    @patch("apigw_manager.drf.management.commands.generate_resources_yaml.VALIDATION_CHUNK_SIZE", 2)
+    def test_validate(self, schema):
+        validate_schema_concurrently(schema, 3)
+
+    @patch("apigw_manager.drf.management.commands.generate_resources_yaml.VALIDATION_CHUNK_SIZE", 2)
+    def test_validate_failed(self, schema):
+        schema["paths"]["/api/v1/things/4/"]["get"]["responses"] = "invalid"
+
+        with pytest.raises(Exception, match="invalid"):
+            validate_schema_concurrently(schema, 3)
+
+    @patch("apigw_manager.drf.management.commands.generate_resources_yaml.validate_schema")
+    def test_validate_serially(self, mocked_validate_schema, schema):
+        validate_schema_concurrently(schema, 4)
+
+        mocked_validate_schema.assert_called_once_with(schema)
+
+
 class TestCommand:
     @patch("apigw_manager.drf.management.commands.generate_resources_yaml.open", new_callable=mock_open)
     @patch("apigw_manager.drf.management.commands.generate_resources_yaml.OpenApiYamlRenderer")
@@ -359,3 +394,30 @@ class TestCommand:
             ):
                 with pytest.raises(TypeError, match="NoneType.*callable"):
                     Command().handle()
+
+    @patch("apigw_manager.drf.management.commands.generate_resources_yaml.OpenApiYamlRenderer")
+    @patch("apigw_manager.drf.management.commands.generate_resources_yaml.validate_schema")
+    @patch("apigw_manager.drf.management.commands.generate_resources_yaml.spectacular_settings")
+    def test_handle_skip_validated(
+        self, mocked_spectacular_settings, mocked_validate_schema, mocked_renderer_cls, settings, tmp_path
+    ):
+        settings.BASE_DIR = str(tmp_path)
+        settings.BK_APIGW_STAGE_ENABLE_MCP_SERVERS = False
+        settings.BK_APIGW_STAGE_BACKEND_SUBPATH = ""
+        mocked_spectacular_settings.POSTPROCESSING_HOOKS = []
+        mocked_spectacular_settings.DEFAULT_GENERATOR_CLASS.return_value.get_schema.return_value = {"openapi": "3.0.0"}
+        mocked_renderer_cls.return_value.render.return_value = b"rendered"
+
+        stdout = StringIO()
+        Command(stdout=stdout).handle(cache_dir=str(tmp_path / "cache"))
+        assert "validate: " in stdout.getvalue()
+        assert "render: " in stdout.getvalue()
+
+        stdout = StringIO()
+        Command(stdout=stdout).handle(cache_dir=str(tmp_path / "cache"))
+        assert "skip validation" in stdout.getvalue()
+        assert "validate: " not in stdout.getvalue()
+        mocked_validate_schema.assert_called_once_with({"openapi": "3.0.0"})
+
+        Command(stdout=StringIO()).handle(no_cache=True)
+        assert mocked_validate_schema.call_count == 2
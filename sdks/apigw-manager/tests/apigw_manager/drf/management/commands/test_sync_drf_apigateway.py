@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+# Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+# Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://opensource.org/licenses/MIT
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+from io import StringIO
+
+import pytest
+import yaml
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apigw_manager.drf.management.commands.sync_drf_apigateway import Command
+
+
+@pytest.fixture(autouse=True)
+def _setup_settings(settings, tmp_path, fake_gateway, fake_gateway_name):
+    settings.BASE_DIR = str(tmp_path)
+    settings.BK_APIGW_STAGE_NAME = "prod"
+    settings.BK_APIGW_RELEASE_DOC_LANGUAGE = ""
+    settings.BK_APIGW_RESOURCE_DOCS_BASE_DIR = ""
+    settings.BK_APIGW_STAGE_ENABLE_MCP_SERVERS = False
+
+    (tmp_path / "definition.yaml").write_text(
+        yaml.dump(
+            {
+                "spec_version": 1,
+                "release": {"version": "1.0.0"},
+                "apigateway": {"description": "gateway", "maintainers": ["admin"]},
+                "stage": {"name": "prod"},
+            }
+        )
+    )
+    (tmp_path / "resources.yaml").write_text(yaml.dump({"swagger": "2.0", "paths": {}}))
+
+
+def _sync(*args):
+    stdout = StringIO()
+    call_command(Command(), "--max-workers=1", *args, stdout=stdout)
+    return stdout.getvalue()
+
+
+def test_sync(fake_gateway):
+    output = _sync()
+
+    assert "config: succeeded" in output
+    assert "grant_permissions: succeeded" in output
+    assert "release: succeeded" in output
+    assert "resource_docs" not in output
+    assert fake_gateway.called("release")[0]["body"]["stage_names"] == ["prod"]
+
+    output = _sync()
+    assert "config: succeeded" in output
+    assert "resources: succeeded" in output
+
+    output = _sync("--skip-unchanged")
+    assert "config: skipped" in output
+    assert "resources: skipped" in output
+    assert "release: succeeded" in output
+
+
+def test_sync_failed(fake_gateway):
+    fake_gateway.failures.add("sync_api")
+
+    with pytest.raises(CommandError, match="config, stage, resources"):
+        _sync()
+
+    assert fake_gateway.called("release") == []
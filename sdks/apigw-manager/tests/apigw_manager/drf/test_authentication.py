@@ -44,6 +44,26 @@ class TestApiGatewayJWTAuthentication:
 
         assert header == "HTTP_X_BKAPI_JWT"
 
+    def test_provider_shared(self):
+        class MyAuthentication(ApiGatewayJWTAuthentication):
+            ALGORITHM = "RS256"
+
+        authentication = ApiGatewayJWTAuthentication()
+        assert ApiGatewayJWTAuthentication().provider is authentication.provider
+
+        my_authentication = MyAuthentication()
+        assert my_authentication.provider is not authentication.provider
+        assert my_authentication.provider.algorithm == "RS256"
+        assert MyAuthentication().provider is my_authentication.provider
+
+    def test_provider_reset_on_setting_changed(self, settings):
+        provider = ApiGatewayJWTAuthentication().provider
+
+        settings.APIGW_JWT_ALGORITHM = "RS256"
+        authentication = ApiGatewayJWTAuthentication()
+        assert authentication.provider is not provider
+        assert authentication.provider.algorithm == "RS256"
+
     def test_make_app(self):
         authentication = ApiGatewayJWTAuthentication()
         app = authentication.make_app(bk_app_code="my_app", verified=True)
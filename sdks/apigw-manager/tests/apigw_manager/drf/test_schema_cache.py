@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+# Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+# Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://opensource.org/licenses/MIT
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+import importlib
+import sys
+import textwrap
+
+import pytest
+from django.urls import path
+from drf_spectacular.generators import SchemaGenerator
+
+from apigw_manager.drf import schema_cache
+from apigw_manager.drf.schema_cache import SchemaFragmentCache
+
+VIEWS = """
+from rest_framework import serializers
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema
+
+
+class ThingSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    {extra_field}
+
+
+class ThingView(APIView):
+    @extend_schema(responses=ThingSerializer, operation_id="get_thing")
+    def get(self, request):
+        pass
+
+
+class OtherView(APIView):
+    @extend_schema(responses=ThingSerializer, operation_id="get_other")
+    def get(self, request):
+        pass
+"""
+
+
+@pytest.fixture()
+def views_module(settings, tmp_path, monkeypatch):
+    settings.REST_FRAMEWORK = {"DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema"}
+    settings.BASE_DIR = str(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    module_path = tmp_path / "schema_cache_views.py"
+    module_path.write_text(textwrap.dedent(VIEWS.format(extra_field="")))
+    module = importlib.import_module("schema_cache_views")
+    yield module
+
+    sys.modules.pop("schema_cache_views", None)
+
+
+@pytest.fixture()
+def cache_path(tmp_path):
+    return str(tmp_path / "cache" / "schema.json")
+
+
+def _generate(module, cache_path):
+    generator = SchemaGenerator(
+        patterns=[
+            path("things/", module.ThingView.as_view()),
+            path("others/", module.OtherView.as_view()),
+        ]
+    )
+    cache = SchemaFragmentCache(cache_path).load()
+    cache.install(generator)
+    schema = generator.get_schema(request=None, public=True)
+    cache.save()
+    return cache, schema
+
+
+class TestSchemaFragmentCache:
+    def test_reuse(self, views_module, cache_path):
+        cache, schema = _generate(views_module, cache_path)
+        assert (cache.hits, cache.misses) == (0, 2)
+
+        cache, cached_schema = _generate(views_module, cache_path)
+        assert (cache.hits, cache.misses) == (2, 0)
+        assert cached_schema == schema
+        assert "Thing" in cached_schema["components"]["schemas"]
+
+    def test_source_changed(self, views_module, cache_path, tmp_path):
+        _generate(views_module, cache_path)
+
+        (tmp_path / "schema_cache_views.py").write_text(
+            textwrap.dedent(VIEWS.format(extra_field="count = serializers.IntegerField()"))
+        )
+        module = importlib.reload(views_module)
+
+        cache, schema = _generate(module, cache_path)
+        assert (cache.hits, cache.misses) == (0, 2)
+        assert "count" in schema["components"]["schemas"]["Thing"]["properties"]
+
+    def test_indirect_source_changed(self, settings, tmp_path, monkeypatch, cache_path):
+        settings.REST_FRAMEWORK = {"DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema"}
+        settings.BASE_DIR = str(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        # the choices are only imported by the serializer module, which is not the module of the view
+        (tmp_path / "schema_cache_choices.py").write_text('COLORS = ["red"]\n')
+        (tmp_path / "schema_cache_serializers.py").write_text(
+            textwrap.dedent(
+                """
+                from rest_framework import serializers
+
+                from schema_cache_choices import COLORS
+
+
+                class ThingSerializer(serializers.Serializer):
+                    color = serializers.ChoiceField(choices=COLORS)
+                """
+            )
+        )
+        (tmp_path / "schema_cache_views.py").write_text(
+            "from schema_cache_serializers import ThingSerializer\n"
+            + textwrap.dedent(VIEWS.format(extra_field="").replace("class ThingSerializer", "class UnusedSerializer"))
+        )
+        names = ["schema_cache_choices", "schema_cache_serializers", "schema_cache_views"]
+        module = importlib.import_module("schema_cache_views")
+
+        try:
+            _generate(module, cache_path)
+
+            (tmp_path / "schema_cache_choices.py").write_text('COLORS = ["red", "blue"]\n')
+            for name in names:
+                importlib.reload(sys.modules[name])
+
+            cache, schema = _generate(module, cache_path)
+        finally:
+            for name in names:
+                sys.modules.pop(name, None)
+
+        assert (cache.hits, cache.misses) == (0, 2)
+        assert schema["components"]["schemas"]["ColorEnum"]["enum"] == ["red", "blue"]
+
+    def test_package_upgraded(self, views_module, cache_path, mocker):
+        _generate(views_module, cache_path)
+
+        mocker.patch.object(schema_cache, "_get_distribution_versions", return_value={"djangorestframework": "0.0.1"})
+
+        cache, _ = _generate(views_module, cache_path)
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_invalid_cache_file(self, views_module, cache_path, tmp_path):
+        (tmp_path / "cache").mkdir()
+        (tmp_path / "cache" / "schema.json").write_text("invalid")
+
+        cache, _ = _generate(views_module, cache_path)
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_validated(self, cache_path):
+        cache = SchemaFragmentCache(cache_path).load()
+        assert cache.is_validated({"openapi": "3.0.3"}) is False
+
+        cache.set_validated({"openapi": "3.0.3"})
+        cache.save()
+
+        cache = SchemaFragmentCache(cache_path).load()
+        assert cache.is_validated({"openapi": "3.0.3"}) is True
+        assert cache.is_validated({"openapi": "3.0.3", "paths": {}}) is False
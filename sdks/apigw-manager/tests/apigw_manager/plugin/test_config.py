@@ -9,6 +9,7 @@
 import json
 
 import pytest
+from jsonschema.exceptions import SchemaError
 from apigw_manager.plugin.config import (
     build_bk_cors,
     build_bk_header_rewrite,
@@ -27,6 +28,8 @@ from apigw_manager.plugin.config import (
     build_bk_legacy_invalid_params,
     build_proxy_cache,
     build_stage_plugin_config_for_definition_yaml,
+    build_plugin_configs,
+    get_json_schema_validator,
     UnhealthyConfig,
     HealthyConfig,
     AbortConfig,
@@ -800,6 +803,68 @@ class TestBuildPluginConfig:
         assert build_proxy_cache(cache_method, cache_ttl) == expected
 
 
+class TestBuildPluginConfigs:
+    def test_build_plugin_configs(self, mocker):
+        builder = mocker.Mock(wraps=build_bk_rate_limit)
+
+        configs = build_plugin_configs(
+            builder,
+            [
+                (1, 10, None),
+                {"default_period": 60, "default_tokens": 10, "specific_app_limits": [("app", 1, 5)]},
+                (1, 10, None),
+                {"default_period": 60, "default_tokens": 10, "specific_app_limits": [("app", 1, 5)]},
+            ],
+        )
+
+        assert builder.call_count == 2
+        assert configs == [
+            build_bk_rate_limit(1, 10, None),
+            build_bk_rate_limit(60, 10, [("app", 1, 5)]),
+            build_bk_rate_limit(1, 10, None),
+            build_bk_rate_limit(60, 10, [("app", 1, 5)]),
+        ]
+        assert configs[0] is not configs[2]
+
+    def test_build_plugin_configs_with_dataclasses(self, mocker):
+        builder = mocker.Mock(wraps=build_api_breaker)
+        arguments = ("", {}, UnhealthyConfig(http_statuses=[503]), HealthyConfig(http_statuses=[200]))
+
+        configs = build_plugin_configs(
+            builder,
+            [arguments, ("", {}, UnhealthyConfig(http_statuses=[503]), HealthyConfig(http_statuses=[200])), arguments],
+        )
+
+        assert builder.call_count == 1
+        assert configs == [build_api_breaker(*arguments)] * 3
+
+    def test_build_plugin_configs_types_kept(self, mocker):
+        builder = mocker.Mock(return_value={"type": "test", "yaml": ""})
+
+        build_plugin_configs(builder, [(1,), (True,), (1.0,)])
+
+        assert builder.call_count == 3
+
+    def test_build_plugin_configs_error(self):
+        with pytest.raises(ValueError, match="default_period should be"):
+            build_plugin_configs(build_bk_rate_limit, [(1, 10, None), (2, 10, None)])
+
+
+class TestGetJsonSchemaValidator:
+    def test_cached(self):
+        schema = {"type": "object", "required": ["name"]}
+
+        validator = get_json_schema_validator(schema)
+
+        assert get_json_schema_validator({"required": ["name"], "type": "object"}) is validator
+        assert validator.is_valid({"name": "test"})
+        assert not validator.is_valid({})
+
+    def test_invalid_schema(self):
+        with pytest.raises(SchemaError, match="'invalid' is not valid"):
+            get_json_schema_validator({"type": "invalid"})
+
+
 class TestBuildStagePluginConfigForDefinitionYaml:
     def test_build_stage_plugin_config_for_definition_yaml(self):
         yaml_str = """a
@@ -12,17 +12,60 @@ import jwt
 import pytest
 from bkapi_client_core.config import settings as bkapi_settings
 
+from apigw_manager.apigw.helper import public_key_cache
+from apigw_manager.apigw.utils import get_api_cache
+from tests.fake_gateway import FakeGateway
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix, tmp_path_factory):
+    from django.conf import settings
+
+    database = settings.DATABASES["default"]
+    if database["ENGINE"] != "django.db.backends.sqlite3":
+        return
+
+    # the sync steps access the database in their own threads, the tables of an in-memory database are locked
+    # without waiting, so use a file database, and begin the transactions immediately to wait for the locks
+    database["TEST"]["NAME"] = str(tmp_path_factory.mktemp("db") / "test.sqlite3")
+    database.setdefault("OPTIONS", {})["transaction_mode"] = "IMMEDIATE"
+
 
 @pytest.fixture(autouse=True)
 def _reset_bkapi_settings():
     bkapi_settings.reset()
 
 
+@pytest.fixture(autouse=True)
+def _clear_public_key_cache():
+    public_key_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_api_cache():
+    yield
+
+    api_cache = get_api_cache()
+    if api_cache is not None:
+        api_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def _mark_django_db(db):
     pass
 
 
+@pytest.fixture()
+def fake_gateway(settings):
+    gateway = FakeGateway().start()
+    settings.BK_API_URL_TMPL = gateway.url_tmpl
+
+    try:
+        yield gateway
+    finally:
+        gateway.stop()
+
+
 @pytest.fixture()
 def fake_gateway_name(settings, faker):
     gateway_name = faker.pystr()
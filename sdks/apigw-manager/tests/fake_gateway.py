@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _ok(data):
+    return {"code": 0, "data": data}
+
+
+class FakeGateway:
+    """A local fake of the admin APIs of bk-apigateway which are used by the sync commands.
+
+    It serves in a background thread, and the handled requests are recorded in `requests`.
+    """
+
+    def __init__(self, delay=0.0):
+        # seconds to wait before responding, it makes the concurrent requests observable
+        self.delay = delay
+        # the operation names which should respond errors
+        self.failures = set()
+        self.requests = []
+        self.max_concurrency = 0
+
+        self._concurrency = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+        self.routes = [
+            ("POST", r"/api/v1/apis/(?P<gateway>[^/]+)/sync/$", "sync_api", self._sync_api),
+            ("POST", r"/api/v1/apis/(?P<gateway>[^/]+)/stages/sync/$", "sync_stage", self._sync_stage),
+            ("POST", r"/api/v1/apis/(?P<gateway>[^/]+)/resources/sync/$", "sync_resources", self._sync_resources),
+            (
+                "POST",
+                r"/api/v1/apis/(?P<gateway>[^/]+)/resource-docs/import/by-archive/$",
+                "import_resource_docs_by_archive",
+                lambda body, **kwargs: _ok({}),
+            ),
+            (
+                "POST",
+                r"/api/v1/apis/(?P<gateway>[^/]+)/permissions/grant/$",
+                "grant_permissions",
+                lambda body, **kwargs: _ok({}),
+            ),
+            (
+                "GET",
+                r"/api/v1/apis/(?P<gateway>[^/]+)/resource_versions/latest/$",
+                "get_latest_resource_version",
+                lambda body, **kwargs: _ok({}),
+            ),
+            (
+                "GET",
+                r"/api/v1/apis/(?P<gateway>[^/]+)/resource_versions/$",
+                "list_resource_versions",
+                lambda body, **kwargs: _ok({"count": 0, "results": []}),
+            ),
+            (
+                "POST",
+                r"/api/v1/apis/(?P<gateway>[^/]+)/resource_versions/$",
+                "create_resource_version",
+                lambda body, **kwargs: _ok({"version": body["version"], "title": body.get("title", "")}),
+            ),
+            ("POST", r"/api/v1/apis/(?P<gateway>[^/]+)/resource_versions/release/$", "release", self._release),
+            (
+                "GET",
+                r"/api/v1/apis/(?P<gateway>[^/]+)/public_key/$",
+                "get_apigw_public_key",
+                lambda body, **kwargs: _ok({"public_key": "public-key", "issuer": ""}),
+            ),
+            (
+                "POST",
+                r"/api/v2/sync/gateways/(?P<gateway>[^/]+)/stages/(?P<stage>[^/]+)/mcp-servers/$",
+                "v2_sync_stage_mcp_servers",
+                lambda body, stage, **kwargs: {"data": [{"id": 1, "name": stage, "action": "updated"}]},
+            ),
+        ]
+
+    @property
+    def url_tmpl(self):
+        return "http://127.0.0.1:%s/api/{api_name}/" % self._server.server_port
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def called(self, operation):
+        """Returns the requests of the operation"""
+        return [request for request in self.requests if request["operation"] == operation]
+
+    def reset(self):
+        with self._lock:
+            self.requests = []
+            self.max_concurrency = 0
+
+    def _sync_api(self, body, gateway, **kwargs):
+        return _ok({"id": 1, "name": gateway})
+
+    def _sync_stage(self, body, **kwargs):
+        return _ok({"id": 1, "name": body["name"]})
+
+    def _sync_resources(self, body, **kwargs):
+        return _ok({"added": [], "updated": [], "deleted": []})
+
+    def _release(self, body, **kwargs):
+        return _ok(
+            {
+                "version": body["version"],
+                "resource_version_title": body.get("title", ""),
+                "stage_names": body.get("stage_names") or [],
+            }
+        )
+
+    def _dispatch(self, method, path, body):
+        for route_method, pattern, operation, handler in self.routes:
+            match = re.search(pattern, path)
+            if route_method != method or not match:
+                continue
+
+            with self._lock:
+                self.requests.append({"operation": operation, "path": path, "body": body, **match.groupdict()})
+                self._concurrency += 1
+                self.max_concurrency = max(self.max_concurrency, self._concurrency)
+
+            try:
+                time.sleep(self.delay)
+                if operation in self.failures:
+                    return 500, {"code": 1, "message": "error"}
+
+                return 200, handler(body, **match.groupdict())
+            finally:
+                with self._lock:
+                    self._concurrency -= 1
+
+        return 404, {"code": 404, "message": "not found"}
+
+    def _make_handler(self):
+        gateway = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _handle(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                content = self.rfile.read(length) if length else b""
+                body = {}
+                if content and self.headers.get("Content-Type", "").startswith("application/json"):
+                    body = json.loads(content)
+
+                status, data = gateway._dispatch(method, self.path.split("?", 1)[0], body)
+                payload = json.dumps(data).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):  # noqa: N802
+                self._handle("GET")
+
+            def do_POST(self):  # noqa: N802
+                self._handle("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
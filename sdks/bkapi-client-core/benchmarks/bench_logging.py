@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+"""
+Microbenchmark of the request/response logging path.
+
+It compares the current implementation with the previous one, which built the log arguments eagerly
+and deep-copied the data to mask the sensitive values.
+
+Usage: python benchmarks/bench_logging.py [--items 5000] [--number 200]
+"""
+import argparse
+import copy
+import io
+import json
+import logging
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests  # noqa: E402
+
+from bkapi_client_core import client as client_module  # noqa: E402
+from bkapi_client_core.client import BaseClient, ResponseHeadersRepresenter  # noqa: E402
+from bkapi_client_core.utils import CurlRequest, _SensitiveCleaner  # noqa: E402
+
+SENSITIVE_KEYS = ["bk_app_secret", "app_secret", "bk_token", "bk_ticket", "access_token"]
+
+
+def legacy_clean(data):
+    """The previous implementation: deep copy, then mask in place"""
+
+    def _clean(data):
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if isinstance(value, (dict, list)):
+                    _clean(value)
+                elif key in SENSITIVE_KEYS and value:
+                    data[key] = "***"
+        elif isinstance(data, list):
+            for item in data:
+                _clean(item)
+
+    data = copy.deepcopy(data)
+    _clean(data)
+    return data
+
+
+def legacy_handle_response(operation, context, response):
+    """The previous implementation: the log arguments are built even if the record is not emitted"""
+    response_headers_representer = ResponseHeadersRepresenter(response.headers)
+    client_module.logger.debug(
+        "request to %s with context %s, status_code: %s, %s\n%s",
+        operation,
+        context,
+        response.status_code,
+        response_headers_representer,
+        CurlRequest(response.request),
+    )
+    return response
+
+
+def make_payload(items):
+    return {
+        "bk_app_code": "demo",
+        "bk_app_secret": "secret",
+        "bk_token": "token",
+        "hosts": [{"bk_host_id": i, "bk_host_innerip": "10.0.0.%s" % (i % 255), "tags": ["a", "b"]} for i in range(items)],
+    }
+
+
+def make_response(payload):
+    request = requests.Request(
+        "POST",
+        "http://bkapi.example.com/api/cc/search_host/",
+        json=payload,
+        headers={"X-Bkapi-Authorization": json.dumps({"bk_app_code": "demo", "bk_app_secret": "secret"})},
+    ).prepare()
+    response = requests.Response()
+    response.status_code = 200
+    response.request = request
+    response.headers["X-Bkapi-Request-Id"] = "request-id"
+    return response
+
+
+def measure(func, number):
+    seconds = timeit.timeit(func, number=number) / number
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds * 1e6, peak / 1024
+
+
+def report(title, cases, number):
+    print(title)
+    print("  %-10s %14s %14s" % ("impl", "us/call", "peak KB"))
+    for name, func in cases:
+        us, kb = measure(func, number)
+        print("  %-10s %14.1f %14.1f" % (name, us, kb))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=5000, help="the number of items in the JSON payload")
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = make_payload(args.items)
+    response = make_response(payload)
+    cleaner = _SensitiveCleaner(SENSITIVE_KEYS)
+    client = BaseClient("http://bkapi.example.com")
+    operation = "cc.search_host"
+    context = {"data": payload}
+
+    report(
+        "mask sensitive values of a payload with %s items" % args.items,
+        [("legacy", lambda: legacy_clean(payload)), ("current", lambda: cleaner.clean(payload))],
+        args.number,
+    )
+
+    client_module.logger.setLevel(logging.INFO)
+    report(
+        "handle a response, debug logging disabled",
+        [
+            ("legacy", lambda: legacy_handle_response(operation, context, response)),
+            ("current", lambda: client._handle_response(operation, context, response)),
+        ],
+        args.number * 100,
+    )
+
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    client_module.logger.addHandler(handler)
+    client_module.logger.setLevel(logging.DEBUG)
+    client_module.logger.propagate = False
+
+    def emit(func):
+        def _emit():
+            func(operation, {}, response)
+            stream.seek(0)
+            stream.truncate()
+
+        return _emit
+
+    report(
+        "handle a response, debug logging enabled and emitted",
+        [("legacy", emit(legacy_handle_response)), ("current", emit(client._handle_response))],
+        args.number,
+    )
+
+
+if __name__ == "__main__":
+    main()
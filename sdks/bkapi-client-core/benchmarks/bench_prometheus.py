@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+"""
+Microbenchmark of the per-request overhead of the prometheus metrics.
+
+The requests are sent by an adapter which returns the responses immediately,
+so that the overhead of the client and the collector is measured without network.
+It compares the metrics disabled, the previous collector which resolved the labels and
+created a response hook for every request, the compatible request hook with the cached labels,
+and the current collector which observes the responses by the operation-responded hook.
+
+Usage: python benchmarks/bench_prometheus.py [--number 5000]
+"""
+import argparse
+import datetime
+import os
+import sys
+import timeit
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prometheus_client import CollectorRegistry  # noqa: E402
+from requests import Request, Response  # noqa: E402
+from requests.adapters import BaseAdapter  # noqa: E402
+
+from bkapi_client_core import prometheus  # noqa: E402
+from bkapi_client_core.base import Operation, OperationGroup  # noqa: E402
+from bkapi_client_core.client import BaseClient  # noqa: E402
+from bkapi_client_core.config import HookEvent  # noqa: E402
+from bkapi_client_core.property import bind_property  # noqa: E402
+from bkapi_client_core.session import deregister_global_hook, register_global_hook  # noqa: E402
+
+
+class ImmediateAdapter(BaseAdapter):
+    def send(self, request, **kwargs):
+        response = Response()
+        response.status_code = 200
+        response._content = b'{"result": true}'
+        response.headers["Content-Length"] = "16"
+        response.headers["X-Bkapi-Request-Id"] = "1234"
+        response.request = request
+        response.url = request.url
+        response.elapsed = datetime.timedelta(milliseconds=5)
+        return response
+
+    def close(self):
+        pass
+
+
+class Group(OperationGroup):
+    get_user = bind_property(Operation, name="get_user", method="POST", path="/users/")
+
+
+class Client(BaseClient):
+    api = bind_property(Group, name="api")
+
+
+class LegacyCollector(prometheus.HookCollector):
+    """The previous implementation: the labels are resolved and a partial is created for every request"""
+
+    def response_hook(self, response, bkapi_operation, **kwargs):
+        name = str(bkapi_operation)
+        method = response.request.method
+
+        self.metric_requests_duration_seconds.labels(operation=name, method=method).observe(
+            response.elapsed.total_seconds()
+        )
+        self.metric_responses_total.labels(operation=name, method=method, status=response.status_code).inc()
+
+        request_content_length = response.request.headers.get("Content-Length")
+        if request_content_length and request_content_length.isdigit():
+            self.metric_requests_body_bytes.labels(operation=name, method=method).observe(int(request_content_length))
+
+        response_content_length = response.headers.get("Content-Length")
+        if response_content_length and response_content_length.isdigit():
+            self.metric_responses_body_bytes.labels(operation=name, method=method).observe(
+                int(response_content_length)
+            )
+
+    def request_hook(self, context, operation):
+        hooks = context.setdefault("hooks", {})
+        hooks.setdefault(HookEvent.RESPONSE, []).append(partial(self.response_hook, bkapi_operation=operation))
+        return context
+
+
+def make_collector(cls, **kwargs):
+    return cls(
+        registry=CollectorRegistry(),
+        namespace="",
+        subsystem="",
+        duration_buckets=prometheus.default_duration_buckets,
+        bytes_buckets=prometheus.default_bytes_buckets,
+        **kwargs,
+    )
+
+
+def measure(client, hook, number):
+    if hook is not None:
+        register_global_hook(*hook)
+
+    try:
+        timer = timeit.Timer(lambda: client.api.get_user({"username": "admin"}))
+        return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+    finally:
+        if hook is not None:
+            deregister_global_hook(*hook)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    client = Client("http://bkapi.example.com")
+    client.session.mount("http://", ImmediateAdapter())
+    # reading the proxies from the environment is slow and noisy
+    client.session.trust_env = False
+    client._reuse_session_connection = True
+
+    legacy = make_collector(LegacyCollector)
+    current = make_collector(prometheus.HookCollector)
+    exemplar = make_collector(prometheus.HookCollector, exemplar=prometheus.request_id_exemplar)
+    sampled = make_collector(prometheus.HookCollector, sample_rate=0.1)
+    cases = [
+        ("disabled", None),
+        ("legacy", (HookEvent.OPERATION_PREPARED, legacy.request_hook)),
+        ("request hook", (HookEvent.OPERATION_PREPARED, current.request_hook)),
+        ("current", (HookEvent.OPERATION_RESPONDED, current.responded_hook)),
+        ("exemplar", (HookEvent.OPERATION_RESPONDED, exemplar.responded_hook)),
+        ("sample 10%", (HookEvent.OPERATION_RESPONDED, sampled.responded_hook)),
+    ]
+
+    request = client.session.prepare_request(Request("POST", "http://bkapi.example.com/users/", json={"a": 1}))
+    response = ImmediateAdapter().send(request)
+    operation = client.api.get_user
+
+    def legacy_hooks():
+        for hook in legacy.request_hook({}, operation)["hooks"][HookEvent.RESPONSE]:
+            hook(response)
+
+    print("observe a response by the collector hooks only")
+    print("  %-12s %12s" % ("collector", "us/request"))
+    for name, func in [
+        ("legacy", legacy_hooks),
+        ("current", lambda: current.responded_hook(response, operation)),
+        ("sample 10%", lambda: sampled.responded_hook(response, operation)),
+    ]:
+        us = min(timeit.repeat(func, repeat=5, number=args.number)) / args.number * 1e6
+        print("  %-12s %12.1f" % (name, us))
+
+    print("request by a client")
+    # warm up
+    measure(client, None, 100)
+
+    disabled = None
+    print("  %-12s %12s %12s" % ("collector", "us/request", "overhead"))
+    for name, hook in cases:
+        us = measure(client, hook, args.number)
+        if disabled is None:
+            disabled = us
+        print("  %-12s %12.1f %12.1f" % (name, us, us - disabled))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+"""
+Benchmark of the peak memory when reading a large JSON response.
+
+It compares parsing the whole response with iterating the items of the response incrementally,
+the response is served by a local server in chunked encoding.
+
+Usage: python benchmarks/bench_streaming.py [--items 500000]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bkapi_client_core.base import Operation, OperationGroup  # noqa: E402
+from bkapi_client_core.client import BaseClient  # noqa: E402
+from bkapi_client_core.property import bind_property  # noqa: E402
+
+ITEM = '{"bk_host_id": %s, "bk_host_innerip": "10.0.0.1", "bk_cloud_id": 0, "bk_os_name": "linux centos"}'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    items = 0
+
+    def do_GET(self):  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        self.write_chunk(b'{"result": true, "data": {"count": %d, "info": [' % self.items)
+        batch = []
+        for i in range(self.items):
+            batch.append(ITEM % i)
+            if len(batch) == 1000 or i == self.items - 1:
+                prefix = "," if i >= len(batch) else ""
+                self.write_chunk((prefix + ",".join(batch)).encode())
+                batch = []
+        self.write_chunk(b"]}}")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def write_chunk(self, chunk):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+
+    def log_message(self, *args):
+        pass
+
+
+class Group(OperationGroup):
+    list_hosts = bind_property(Operation, name="list_hosts", method="GET", path="/hosts/")
+
+
+class Client(BaseClient):
+    api = bind_property(Group, name="api")
+
+
+def read_all(client):
+    return sum(1 for _ in client.api.list_hosts()["data"]["info"])
+
+
+def read_stream(client):
+    with client.api.list_hosts.stream() as stream:
+        return sum(1 for _ in stream.iter_json_items(("data", "info")))
+
+
+def measure(func, client):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = func(client)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=500000, help="the number of items in the response")
+    args = parser.parse_args()
+
+    Handler.items = args.items
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    client = Client("http://127.0.0.1:%s" % server.server_port)
+    size = len(ITEM % 0) * args.items / 1024 / 1024
+    print("read a response with %s items, about %.1f MB" % (args.items, size))
+    print("  %-10s %10s %12s %14s" % ("impl", "items", "seconds", "peak MB"))
+    for name, func in [("json", read_all), ("stream", read_stream)]:
+        count, elapsed, peak = measure(func, client)
+        print("  %-10s %10s %12.2f %14.1f" % (name, count, elapsed, peak))
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+"""
+Microbenchmark of the url rendering on the request hot path.
+
+It compares the precompiled url templates with the previous implementation,
+which created a `string.Formatter` and parsed the template for every request.
+
+Usage: python benchmarks/bench_url_render.py [--number 200000]
+"""
+import argparse
+import os
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from requests.sessions import merge_setting  # noqa: E402
+
+from bkapi_client_core.apigateway import APIGatewayClient  # noqa: E402
+from bkapi_client_core.session import _UrlTemplate  # noqa: E402
+
+
+class LegacyUrlRender(string.Formatter):
+    """The previous implementation"""
+
+    def __init__(self, url, common_path_params=None):
+        self.url = url
+        self.common_path_params = common_path_params
+
+    def render(self, path_params=None):
+        real_path_params = merge_setting(path_params, self.common_path_params)
+        return self.format(self.url, **real_path_params)
+
+    def get_field(self, field_name, args, kwargs):
+        field_name = field_name.strip()
+        return kwargs[field_name], field_name
+
+
+def legacy_get_endpoint(client):
+    gateway_name = client._get_gateway_name()
+    return client._endpoint.format(gateway_name=gateway_name, api_name=gateway_name, stage_name=client._stage)
+
+
+def report(title, cases, number):
+    print(title)
+    print("  %-10s %14s" % ("impl", "ns/call"))
+    for name, func in cases:
+        seconds = timeit.timeit(func, number=number) / number
+        print("  %-10s %14.1f" % (name, seconds * 1e9))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=200000)
+    args = parser.parse_args()
+
+    url = "http://bkapi.example.com/api/demo/prod/api/v1/apps/{app_code}/modules/{module_name}/envs/{env}/"
+    path_params = {"app_code": "demo", "module_name": "default"}
+    common_path_params = {"env": "prod"}
+    static_url = "http://bkapi.example.com/api/demo/prod/api/v1/healthz/"
+
+    report(
+        "render a url with 3 path parameters",
+        [
+            ("legacy", lambda: LegacyUrlRender(url, common_path_params).render(path_params)),
+            ("current", lambda: _UrlTemplate.compile(url).render(path_params, common_path_params)),
+        ],
+        args.number,
+    )
+
+    report(
+        "render a url without path parameters",
+        [
+            ("legacy", lambda: LegacyUrlRender(static_url, common_path_params).render(None)),
+            ("current", lambda: _UrlTemplate.compile(static_url).render(None, common_path_params)),
+        ],
+        args.number,
+    )
+
+    client = APIGatewayClient(endpoint="http://bkapi.example.com/api/{api_name}", stage="prod")
+    client._gateway_name = "demo"
+    report(
+        "render the endpoint of an api gateway client",
+        [
+            ("legacy", lambda: legacy_get_endpoint(client)),
+            ("current", client._get_endpoint),
+        ],
+        args.number,
+    )
+
+
+if __name__ == "__main__":
+    main()
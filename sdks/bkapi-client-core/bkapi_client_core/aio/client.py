@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import asyncio
+import inspect
+import time
+from typing import Any, Awaitable, Dict, List, Optional, Union  # noqa
+
+from requests import Response  # noqa
+from requests.exceptions import RequestException
+
+from bkapi_client_core.aio.session import AsyncSession
+from bkapi_client_core.apigateway.client import APIGatewayClient
+from bkapi_client_core.base import Operation  # noqa
+from bkapi_client_core.batch import DEFAULT_BATCH_WORKERS, BatchItemResult, BatchResult, RateLimiter
+from bkapi_client_core.client import BaseClient
+from bkapi_client_core.config import HookEvent
+from bkapi_client_core.esb.client import ESBClient
+from bkapi_client_core.streaming import DEFAULT_CHUNK_SIZE, StreamingResponse  # noqa
+
+
+class AsyncClientMixin(object):
+    """
+    AsyncClientMixin makes the operations of a client awaitable,
+    the operation declarations can be shared with the synchronous client:
+
+        class AsyncClient(AsyncClientMixin, Client):
+            pass
+
+        result = await AsyncClient(endpoint=...).api.test({"key": "value"})
+    """
+
+    _session_class = AsyncSession
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    def handle_request(
+        self,
+        operation,  # type: Operation
+        context,  # type: Dict[str, Any]
+        reuse_session_connection=False,  # type: bool
+    ):
+        # type: (...) -> Awaitable[Optional[Response]]
+        # the connections of AsyncSession are always kept until `aclose`, see `_handle_request_async`
+        return self._handle_request_async(operation, context)
+
+    def parse_response(
+        self,
+        operation,  # type: Operation
+        response,  # type: Union[Awaitable[Optional[Response]], Optional[Response]]
+    ):
+        # type: (...) -> Awaitable[Any]
+        return self._parse_response_async(operation, response)
+
+    def batch_request(
+        self,
+        operation,  # type: Operation
+        contexts,  # type: List[Dict[str, Any]]
+        max_workers=DEFAULT_BATCH_WORKERS,  # type: int
+        rate_limit=None,  # type: Optional[float]
+        parse_response=True,  # type: bool
+    ):
+        # type: (...) -> Awaitable[BatchResult]
+        return self._batch_request_async(operation, contexts, max_workers, rate_limit, parse_response)
+
+    def stream_response(
+        self,
+        operation,  # type: Operation
+        response,  # type: Union[Awaitable[Optional[Response]], Optional[Response]]
+        chunk_size=DEFAULT_CHUNK_SIZE,  # type: int
+    ):
+        # type: (...) -> Awaitable[Optional[StreamingResponse]]
+        return self._stream_response_async(operation, response, chunk_size)
+
+    async def aclose(self):
+        """Close the session"""
+        await self.session.aclose()  # type: ignore
+
+    async def _handle_request_async(
+        self,
+        operation,  # type: Operation
+        context,  # type: Dict[str, Any]
+    ):
+        # type: (...) -> Optional[Response]
+        # the connections are kept by the session until it is closed,
+        # use `async with` or call `aclose` to release them
+        context = self.session.dispatch_hook(HookEvent.OPERATION_PREPARED, context, operation=operation)  # type: ignore
+        try:
+            response = await self.session.handle(**self._get_request_context(operation, context))  # type: ignore
+            return self._handle_response(operation, context, response)  # type: ignore
+        except RequestException as err:
+            self.session.dispatch_hook(HookEvent.OPERATION_ERROR, err, operation=operation)  # type: ignore
+            return self._handle_exception(operation, context, err)  # type: ignore
+
+    async def _batch_request_async(
+        self,
+        operation,  # type: Operation
+        contexts,  # type: List[Dict[str, Any]]
+        max_workers,  # type: int
+        rate_limit,  # type: Optional[float]
+        parse_response,  # type: bool
+    ):
+        # type: (...) -> BatchResult
+        semaphore = asyncio.Semaphore(max(max_workers, 1))
+        rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+
+        async def execute(index, context):
+            async with semaphore:
+                if rate_limiter is not None:
+                    await asyncio.sleep(rate_limiter.reserve())
+
+                start = time.monotonic()
+                try:
+                    result = await self.handle_request(operation, context)
+                    if parse_response:
+                        result = await self.parse_response(operation, result)
+                except Exception as err:
+                    return BatchItemResult(index, error=err, elapsed=time.monotonic() - start)
+
+                return BatchItemResult(index, result=result, elapsed=time.monotonic() - start)
+
+        start = time.monotonic()
+        items = await asyncio.gather(*[execute(index, context) for index, context in enumerate(contexts)])
+        result = BatchResult(list(items), time.monotonic() - start)
+
+        self.session.dispatch_hook(HookEvent.OPERATION_BATCH_FINISHED, result, operation=operation)  # type: ignore
+        return result
+
+    async def _parse_response_async(
+        self,
+        operation,  # type: Operation
+        response,  # type: Union[Awaitable[Optional[Response]], Optional[Response]]
+    ):
+        # type: (...) -> Any
+        # Operation.__call__ passes the result of handle_request directly, which is awaitable
+        if inspect.isawaitable(response):
+            response = await response
+
+        return super(AsyncClientMixin, self).parse_response(operation, response)  # type: ignore
+
+    async def _stream_response_async(
+        self,
+        operation,  # type: Operation
+        response,  # type: Union[Awaitable[Optional[Response]], Optional[Response]]
+        chunk_size,  # type: int
+    ):
+        # type: (...) -> Optional[StreamingResponse]
+        # the body has been read by the async session, the stream provides the same iterating interfaces
+        if inspect.isawaitable(response):
+            response = await response
+
+        return super(AsyncClientMixin, self).stream_response(operation, response, chunk_size)  # type: ignore
+
+
+class AsyncBaseClient(AsyncClientMixin, BaseClient):
+    pass
+
+
+class AsyncAPIGatewayClient(AsyncClientMixin, APIGatewayClient):
+    pass
+
+
+class AsyncESBClient(AsyncClientMixin, ESBClient):
+    pass
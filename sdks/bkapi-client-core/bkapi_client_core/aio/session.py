@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import asyncio
+import inspect
+import ssl
+import time
+from datetime import timedelta
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Optional, Tuple  # noqa
+
+import httpx
+from requests import Request, Response
+from requests.exceptions import ConnectionError, ConnectTimeout, ProxyError, ReadTimeout, RequestException, SSLError
+from requests.hooks import dispatch_hook
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+
+from bkapi_client_core.session import Session, _UrlTemplate
+from bkapi_client_core.streaming import DEFAULT_CHUNK_SIZE, is_stream_data
+
+# httpx>=0.26 accepts `proxy`, and the older versions only accept `proxies`
+_PROXY_OPTION = "proxy" if "proxy" in inspect.signature(httpx.AsyncClient.__init__).parameters else "proxies"
+
+_END = object()
+
+
+async def _iter_stream_data(data, chunk_size=DEFAULT_CHUNK_SIZE):
+    # type: (Any, int) -> AsyncIterator[bytes]
+    """Read the file-like object or the generator in the default executor, so the event loop is not blocked"""
+    loop = asyncio.get_running_loop()
+    if hasattr(data, "read"):
+        read = partial(data.read, chunk_size)
+        end = None  # type: Any
+    else:
+        read = partial(next, iter(data), _END)
+        end = _END
+
+    while True:
+        chunk = await loop.run_in_executor(None, read)
+        if chunk is end or (end is None and not chunk):
+            return
+
+        yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+class AsyncSession(Session):
+    """AsyncSession sends the requests with httpx on the event loop.
+
+    The requests are still prepared by requests.Session, so the headers, auth, cookies and hooks
+    work in the same way as Session, and the responses are converted to requests.Response,
+    so that the clients can handle them as usual.
+    """
+
+    def __init__(self, **kwargs):
+        # the options for creating httpx.AsyncClient, such as limits, http2
+        self.transport_options = {}  # type: Dict[str, Any]
+        self._transports = {}  # type: Dict[Tuple[Any, ...], httpx.AsyncClient]
+        super(AsyncSession, self).__init__(**kwargs)
+
+    async def handle(
+        self,
+        url,  # type: str
+        path_params=None,  # type: Optional[Dict[str, Any]]
+        timeout=None,  # type: Optional[float]
+        **kwargs,  # type: Any
+    ):
+        rendered_url = _UrlTemplate.compile(url).render(path_params, self.path_params)
+        return await self.request(url=rendered_url, timeout=timeout or self.timeout, **kwargs)
+
+    async def request(  # type: ignore
+        self,
+        method,  # type: str
+        url,  # type: str
+        params=None,
+        data=None,
+        headers=None,
+        cookies=None,
+        files=None,
+        auth=None,
+        timeout=None,
+        allow_redirects=True,
+        proxies=None,
+        hooks=None,
+        stream=None,
+        verify=None,
+        cert=None,
+        json=None,
+    ):
+        # type: (...) -> Response
+        request = Request(
+            method=method.upper(),
+            url=url,
+            headers=headers,
+            files=files,
+            data=data or {},
+            json=json,
+            params=params or {},
+            auth=auth,
+            cookies=cookies,
+            hooks=hooks,
+        )
+        prepared_request = self.prepare_request(request)
+
+        send_kwargs = self.merge_environment_settings(prepared_request.url, proxies or {}, stream, verify, cert)
+        send_kwargs["timeout"] = timeout
+
+        return await self.send_async(prepared_request, allow_redirects=allow_redirects, **send_kwargs)
+
+    async def send_async(
+        self,
+        request,  # type: Any
+        allow_redirects=True,  # type: bool
+        **kwargs,  # type: Any
+    ):
+        # type: (...) -> Response
+        """Send a prepared request with httpx, and dispatch the response hooks"""
+        transport = self._get_transport(
+            request.url,
+            verify=kwargs.get("verify", True),
+            cert=kwargs.get("cert"),
+            proxies=kwargs.get("proxies") or {},
+        )
+
+        start = time.perf_counter()
+        try:
+            http_response = await transport.request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=self._to_httpx_content(request.body),
+                follow_redirects=allow_redirects,
+                timeout=self._to_httpx_timeout(kwargs.get("timeout")),
+            )
+        except httpx.HTTPError as err:
+            raise self._to_request_exception(err, request)
+
+        response = self._build_response(request, http_response)
+        response.elapsed = timedelta(seconds=time.perf_counter() - start)
+
+        return dispatch_hook("response", request.hooks, response, **kwargs)
+
+    def fork(self):
+        session = super(AsyncSession, self).fork()
+        session.transport_options = dict(self.transport_options)
+        # the httpx clients are bound to the event loops which use them, they are not shared with the forks
+        session._transports = {}
+        return session
+
+    async def aclose(self):
+        """Close the httpx clients of the running event loop and the session"""
+        loop = asyncio.get_running_loop()
+        transports = []
+        for key in list(self._transports.keys()):
+            if key[0] is loop:
+                transports.append(self._transports.pop(key))
+
+        for transport in transports:
+            await transport.aclose()
+
+        self.close()
+
+    def _get_transport(
+        self,
+        url,  # type: str
+        verify,  # type: Any
+        cert,  # type: Any
+        proxies,  # type: Dict[str, str]
+    ):
+        # type: (...) -> httpx.AsyncClient
+        # httpx.AsyncClient holds the connection pool, and the tls and proxy settings are bound to it,
+        # so keep a client for each combination, the connections can not be used by other event loops either
+        loop = asyncio.get_running_loop()
+        proxy = select_proxy(url, proxies)
+        key = (loop, verify, cert, proxy)
+        transport = self._transports.get(key)
+        if transport is not None:
+            return transport
+
+        # the clients of the closed event loops can not be closed any more, just drop them
+        for other_key in list(self._transports.keys()):
+            if other_key[0].is_closed():
+                self._transports.pop(other_key, None)
+
+        options = dict(self.transport_options)
+        options.update(verify=verify, cert=cert, trust_env=False)
+        if proxy:
+            options[_PROXY_OPTION] = proxy
+
+        transport = self._transports[key] = httpx.AsyncClient(**options)
+        return transport
+
+    def _build_response(self, request, http_response):
+        # type: (Any, httpx.Response) -> Response
+        response = Response()
+        response.status_code = http_response.status_code
+        response.headers = CaseInsensitiveDict(http_response.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = http_response.reason_phrase
+        response.url = str(http_response.url)
+        response.request = request
+        response._content = http_response.content
+        response._content_consumed = True
+
+        # persist the cookies into the session, as requests.Session does
+        for cookie in http_response.cookies.jar:
+            self.cookies.set_cookie(cookie)
+
+        return response
+
+    def _to_httpx_content(self, body):
+        # type: (Any) -> Any
+        # httpx.AsyncClient only accepts the async iterables as the streaming body
+        if is_stream_data(body):
+            return _iter_stream_data(body)
+
+        return body
+
+    def _to_httpx_timeout(self, timeout):
+        # type: (Any) -> httpx.Timeout
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(None, connect=connect, read=read)
+
+        # requests does not time out by default
+        return httpx.Timeout(timeout)
+
+    def _to_request_exception(self, err, request):
+        # type: (httpx.HTTPError, Any) -> RequestException
+        if isinstance(err, httpx.ConnectTimeout):
+            exception_class = ConnectTimeout
+        elif isinstance(err, httpx.TimeoutException):
+            exception_class = ReadTimeout
+        elif isinstance(err, httpx.ProxyError):
+            exception_class = ProxyError
+        elif isinstance(err, httpx.ConnectError) and self._is_caused_by(err, ssl.SSLError):
+            exception_class = SSLError
+        elif isinstance(err, (httpx.ConnectError, httpx.NetworkError)):
+            exception_class = ConnectionError
+        else:
+            exception_class = RequestException
+
+        return exception_class(err, request=request)
+
+    def _is_caused_by(self, err, exception_class):
+        # type: (BaseException, type) -> bool
+        # httpx raises its own exceptions from the underlying ones
+        cause = err  # type: Optional[BaseException]
+        while cause is not None:
+            if isinstance(cause, exception_class):
+                return True
+            cause = cause.__cause__ or cause.__context__
+
+        return False
@@ -8,7 +8,7 @@
  * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
  * specific language governing permissions and limitations under the License.
 """
-from typing import Optional  # noqa
+from typing import Optional, Tuple  # noqa
 
 from bkapi_client_core.client import BaseClient
 from bkapi_client_core.config import SettingKeys, settings
@@ -21,6 +21,7 @@ class APIGatewayClient(BaseClient):
     _gateway_name = ""
     # _api_name 为兼容逻辑，推荐使用 _gateway_name
     _api_name = ""
+    _rendered_endpoint = None  # type: Optional[Tuple[Tuple[str, str, str], str]]
     name = "bkapi"
 
     def __init__(
@@ -52,8 +53,15 @@ class APIGatewayClient(BaseClient):
         # In order to prevent `gateway_name`, `api_name`, `stage_name` from conflicting with other path variables,
         # render the endpoint first.
         gateway_name = self._get_gateway_name()
-        # 兼容 endpoint 中包含 gateway_name，api_name
-        return self._endpoint.format(gateway_name=gateway_name, api_name=gateway_name, stage_name=self._stage)
+
+        # the endpoint is rendered only once unless the variables are changed
+        cache_key = (self._endpoint, gateway_name, self._stage)
+        if self._rendered_endpoint is None or self._rendered_endpoint[0] != cache_key:
+            # 兼容 endpoint 中包含 gateway_name，api_name
+            endpoint = self._endpoint.format(gateway_name=gateway_name, api_name=gateway_name, stage_name=self._stage)
+            self._rendered_endpoint = (cache_key, endpoint)
+
+        return self._rendered_endpoint[1]
 
     def _get_gateway_name(self):
         # type: (...) -> str
@@ -8,11 +8,14 @@
  * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
  * specific language governing permissions and limitations under the License.
 """
-from typing import Any, Dict, Optional  # noqa
+from typing import Any, Dict, Iterable, List, Optional, Tuple  # noqa
 
 from requests import Response  # noqa
 from typing_extensions import Protocol
 
+from bkapi_client_core.batch import DEFAULT_BATCH_WORKERS
+from bkapi_client_core.streaming import DEFAULT_CHUNK_SIZE
+
 
 class ClientProtocol(Protocol):
     """ClientProtocol represents a protocol required to implement a client that handles HTTP requests"""
@@ -33,6 +36,26 @@ class ClientProtocol(Protocol):
         # type: (...) -> Any
         raise NotImplementedError
 
+    def batch_request(
+        self,
+        operation,  # type: Operation
+        contexts,  # type: List[Dict[str, Any]]
+        max_workers,  # type: int
+        rate_limit=None,  # type: Optional[float]
+        parse_response=True,  # type: bool
+    ):
+        # type: (...) -> Any
+        raise NotImplementedError
+
+    def stream_response(
+        self,
+        operation,  # type: Operation
+        response,  # type: Optional[Response]
+        chunk_size,  # type: int
+    ):
+        # type: (...) -> Any
+        raise NotImplementedError
+
 
 class ManagerProtocol(Protocol):
     """ManagerProtocol is a protocol that the classes required to manage resources."""
@@ -198,13 +221,113 @@ class Operation(OperationResource):
             ),
         )
 
+    def stream(
+        self,
+        data=None,  # type: Optional[Any]
+        path_params=None,  # type: Optional[Dict[str, Any]]
+        params=None,  # type: Optional[Dict[str, Any]]
+        headers=None,  # type: Optional[Dict[str, Any]]
+        timeout=None,  # type: Optional[float]
+        proxies=None,  # type: Optional[Dict[str, Any]]
+        verify=None,  # type: Optional[bool]
+        chunk_size=DEFAULT_CHUNK_SIZE,  # type: int
+        **kwargs,
+    ):
+        """
+        Request to the api and return a StreamingResponse, the body is read incrementally by iterating it,
+        such as `iter_bytes`, `iter_ndjson` and `iter_json_items`.
+        Use it as a context manager to release the connection.
+
+        :param data: Request data to sent, file-like objects and generators are sent as the streaming body.
+        :param path_params: Variables parts of the url path.
+        :param params: Variables in the query string.
+        :param headers: HTTP Headers to send.
+        :param timeout: Seconds to wait for the server to send data before giving up.
+        :param proxies: Protocol proxies mappings.
+        :param verify: Should we verify the server TLS certificate.
+        :param chunk_size: The default size of the chunks to read.
+        :rtype: StreamingResponse
+        """
+        client = self._get_client()
+
+        response = client.handle_request(
+            self,
+            self._get_context(
+                data=data,
+                path_params=path_params,
+                params=params,
+                headers=headers,
+                timeout=timeout,
+                proxies=proxies,
+                verify=verify,
+                stream=True,
+                **kwargs,
+            ),
+        )
+
+        return client.stream_response(self, response, chunk_size=chunk_size)
+
+    def batch(
+        self,
+        requests,  # type: Iterable[Dict[str, Any]]
+        max_workers=DEFAULT_BATCH_WORKERS,  # type: int
+        rate_limit=None,  # type: Optional[float]
+        parse_response=True,  # type: bool
+    ):
+        """
+        Request to the api concurrently with each of the requests params,
+        and return the results in the same order, the errors are collected per request rather than raised.
+
+        :param requests: The params of each request, accepts the same keyword arguments as calling the operation,
+            such as `[{"data": {"bk_biz_id": 1}}, {"data": {"bk_biz_id": 2}}]`.
+        :param max_workers: The maximum number of requests in flight.
+        :param rate_limit: The maximum number of requests per second.
+        :param parse_response: Return the structured results like calling the operation, or the Responses.
+        :rtype: BatchResult
+        """
+        client = self._get_client()
+
+        return client.batch_request(
+            self,
+            [self._get_context(**request) for request in requests],
+            max_workers=max_workers,
+            rate_limit=rate_limit,
+            parse_response=parse_response,
+        )
+
 
 class OperationGroup(OperationResource):
     """
     OperationGroup provides grouping management capabilities for Operations,
     and also providing the dynamic registration mechanisms.
+
+    Besides `bind_property`, operations can be declared in a compact table,
+    which is cheap to import, the operations are instantiated only when accessed:
+
+        class Group(OperationGroup):
+            _operation_table = (
+                ("test", "GET", "/test/"),
+            )
     """
 
+    # (name, method, path) of the operations
+    _operation_table = ()  # type: Tuple[Tuple[str, str, str], ...]
+
+    @classmethod
+    def _get_operation_index(cls):
+        # type: () -> Dict[str, Tuple[str, str, str]]
+        # index the table of each class only once, check `__dict__` to avoid using the index of the parent class
+        index = cls.__dict__.get("_operation_index")
+        if index is None:
+            index = {}
+            for klass in reversed(cls.__mro__):
+                for declaration in klass.__dict__.get("_operation_table", ()):
+                    index[declaration[0]] = declaration
+
+            cls._operation_index = index
+
+        return index
+
     def get_client(self):
         """
         Returns the client acquired by the previous level.
@@ -244,8 +367,24 @@ class OperationGroup(OperationResource):
     ):
         # type: (...) -> Operation
         """
-        This is a trick to provide intelligence completion for dynamic registered operations.
+        This is a trick to provide intelligence completion for dynamic registered operations,
+        and it instantiates the operations declared in the operation table on first access.
 
         :raises AttributeError:
         """
-        raise AttributeError(name)
+        declaration = self._get_operation_index().get(name)
+        if declaration is None:
+            raise AttributeError(name)
+
+        _, method, path = declaration
+        operation = Operation(name=name, method=method, path=path)
+        operation.bind(name, self)
+
+        # cache the operation, so that __getattr__ will not be called next time
+        setattr(self, name, operation)
+        return operation
+
+    def __dir__(self):
+        names = set(super(OperationGroup, self).__dir__())
+        names.update(self._get_operation_index())
+        return sorted(names)
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional  # noqa
+
+DEFAULT_BATCH_WORKERS = 10
+
+
+class BatchItemResult(object):
+    """The result of a single request in a batch"""
+
+    __slots__ = ("index", "result", "error", "elapsed")
+
+    def __init__(
+        self,
+        index,  # type: int
+        result=None,  # type: Any
+        error=None,  # type: Optional[Exception]
+        elapsed=0.0,  # type: float
+    ):
+        self.index = index
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        # type: () -> bool
+        return self.error is None
+
+    def __repr__(self):
+        if self.ok:
+            return "<BatchItemResult %s: ok>" % self.index
+
+        return "<BatchItemResult %s: %r>" % (self.index, self.error)
+
+
+class BatchResult(object):
+    """The results of a batch, ordered as the requests"""
+
+    def __init__(
+        self,
+        items,  # type: List[BatchItemResult]
+        elapsed,  # type: float
+    ):
+        self.items = items
+        # seconds from the first request started to the last request finished
+        self.elapsed = elapsed
+
+    def __iter__(self):
+        # type: () -> Iterator[BatchItemResult]
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        # type: (int) -> BatchItemResult
+        return self.items[index]
+
+    @property
+    def succeeded(self):
+        # type: () -> int
+        return sum(1 for item in self.items if item.ok)
+
+    @property
+    def failed(self):
+        # type: () -> int
+        return len(self.items) - self.succeeded
+
+    @property
+    def results(self):
+        # type: () -> List[Any]
+        """The results of the requests, the result of a failed request is None"""
+        return [item.result for item in self.items]
+
+    @property
+    def errors(self):
+        # type: () -> Dict[int, Exception]
+        """The errors of the failed requests, keyed by the index"""
+        return {item.index: item.error for item in self.items if item.error is not None}
+
+    def raise_for_errors(self):
+        """Raise the error of the first failed request"""
+        for item in self.items:
+            if item.error is not None:
+                raise item.error
+
+
+class RateLimiter(object):
+    """RateLimiter spaces out the requests evenly, it is thread-safe"""
+
+    def __init__(
+        self,
+        rate,  # type: float
+    ):
+        """
+        :param rate: the maximum number of requests per second
+        """
+        if rate <= 0:
+            raise ValueError("rate should be greater than 0")
+
+        self._interval = 1.0 / rate
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        # type: () -> float
+        """Reserve a slot, returns the seconds to wait before the request"""
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_time)
+            self._next_time = scheduled + self._interval
+            return scheduled - now
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def execute_batch(
+    func,  # type: Callable[[Any], Any]
+    args_list,  # type: List[Any]
+    max_workers=DEFAULT_BATCH_WORKERS,  # type: int
+    rate_limiter=None,  # type: Optional[RateLimiter]
+):
+    # type: (...) -> BatchResult
+    """Call the func with each args in threads, the errors are collected rather than raised"""
+
+    def execute(index, args):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        start = time.monotonic()
+        try:
+            return BatchItemResult(index, result=func(args), elapsed=time.monotonic() - start)
+        except Exception as err:
+            return BatchItemResult(index, error=err, elapsed=time.monotonic() - start)
+
+    start = time.monotonic()
+    if not args_list:
+        return BatchResult([], 0.0)
+
+    with ThreadPoolExecutor(max_workers=max(min(max_workers, len(args_list)), 1)) as executor:
+        items = list(executor.map(execute, range(len(args_list)), args_list))
+
+    return BatchResult(items, time.monotonic() - start)
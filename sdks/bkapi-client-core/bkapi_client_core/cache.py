@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Union  # noqa
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from bkapi_client_core.base import Operation  # noqa
+from bkapi_client_core.session import Session, _UrlTemplate  # noqa
+
+DEFAULT_CACHE_TTL = 60
+
+
+class CacheResult:
+    # 命中未过期的缓存
+    HIT = "hit"
+    # 命中已过期的缓存，返回旧数据并在后台刷新
+    STALE = "stale"
+    # 缓存已过期，重新请求
+    EXPIRED = "expired"
+    # 未命中缓存
+    MISS = "miss"
+    # 复用相同请求的结果
+    COALESCED = "coalesced"
+
+
+class CacheEntry(object):
+    """CacheEntry keeps the data of a response, which can be pickled by the cache backends"""
+
+    def __init__(
+        self,
+        data,  # type: Dict[str, Any]
+        ttl,  # type: float
+        stale_ttl=0,  # type: float
+        created_at=None,  # type: Optional[float]
+    ):
+        self.data = data
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.created_at = time.time() if created_at is None else created_at
+
+    @classmethod
+    def from_response(cls, response, ttl, stale_ttl=0):
+        # type: (Response, float, float) -> CacheEntry
+        data = {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "content": response.content,
+            "encoding": response.encoding,
+            "url": response.url,
+            "reason": response.reason,
+        }
+        return cls(data, ttl, stale_ttl)
+
+    def to_response(self):
+        # type: () -> Response
+        """Returns a new response every time, so that the cached data will not be modified by the callers"""
+        response = Response()
+        response.status_code = self.data["status_code"]
+        response.headers = CaseInsensitiveDict(self.data["headers"])
+        response._content = self.data["content"]
+        response._content_consumed = True
+        response.encoding = self.data["encoding"]
+        response.url = self.data["url"]
+        response.reason = self.data["reason"]
+        return response
+
+    def is_fresh(self, now=None):
+        # type: (Optional[float]) -> bool
+        return (now or time.time()) < self.created_at + self.ttl
+
+    def is_usable(self, now=None):
+        # type: (Optional[float]) -> bool
+        """Whether the entry can be served, fresh or stale"""
+        return (now or time.time()) < self.created_at + self.ttl + self.stale_ttl
+
+
+class BaseCacheBackend(object):
+    def get(self, key):
+        # type: (str) -> Optional[CacheEntry]
+        raise NotImplementedError
+
+    def set(self, key, entry, timeout):
+        # type: (str, CacheEntry, float) -> None
+        raise NotImplementedError
+
+    def delete(self, key):
+        # type: (str) -> None
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class LRUCacheBackend(BaseCacheBackend):
+    """An in-process cache backend, the least recently used entries are dropped when it is full"""
+
+    def __init__(
+        self,
+        maxsize=1024,  # type: int
+    ):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # type: OrderedDict[str, Any]
+
+    def get(self, key):
+        # type: (str) -> Optional[CacheEntry]
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+
+            entry, expires_at = item
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry, timeout):
+        # type: (str, CacheEntry, float) -> None
+        with self._lock:
+            self._entries[key] = (entry, time.time() + timeout)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        # type: (str) -> None
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DjangoCacheBackend(BaseCacheBackend):
+    """A cache backend using the Django cache, the entries are shared by processes"""
+
+    def __init__(
+        self,
+        alias="default",  # type: str
+    ):
+        from django.core.cache import caches
+
+        self._cache = caches[alias]
+
+    def get(self, key):
+        # type: (str) -> Optional[CacheEntry]
+        return self._cache.get(key)
+
+    def set(self, key, entry, timeout):
+        # type: (str, CacheEntry, float) -> None
+        self._cache.set(key, entry, timeout)
+
+    def delete(self, key):
+        # type: (str) -> None
+        self._cache.delete(key)
+
+    def clear(self):
+        self._cache.clear()
+
+
+class _InflightCall(object):
+    def __init__(self):
+        self.event = threading.Event()
+        # the response is not shared with the waiters, each of them gets a new one built from the entry
+        self.entry = None  # type: Optional[CacheEntry]
+        self.error = None  # type: Optional[BaseException]
+
+
+class ResponseCache(object):
+    """
+    ResponseCache caches the successful responses of the specified operations, it is opt-in by operation,
+    only the read-only operations should be specified, the method is not checked,
+    because many read-only operations of the components are requested by POST:
+
+        cache = ResponseCache(operations={"bk_login.get_user": 300, "cc.search_business": 60})
+        client.enable_response_cache(cache)
+
+    The concurrent identical requests are coalesced into one, and the stale responses can be served
+    while refreshing in background.
+    """
+
+    def __init__(
+        self,
+        backend=None,  # type: Optional[BaseCacheBackend]
+        ttl=DEFAULT_CACHE_TTL,  # type: float
+        stale_ttl=0,  # type: float
+        operations=None,  # type: Optional[Union[Dict[str, float], Iterable[str]]]
+        key_prefix="bkapi",  # type: str
+    ):
+        """
+        :param backend: The cache backend, use an in-process LRU cache if not specified.
+        :param ttl: The default seconds for the responses to be fresh.
+        :param stale_ttl: The seconds after expired, in which the stale responses are served while refreshing.
+        :param operations: The names of the cached operations, or a mapping of the names and ttl,
+            the name is matched by suffix, such as `bk_login.get_user`.
+        :param key_prefix: The prefix of the cache keys.
+        """
+        self.backend = backend or LRUCacheBackend()
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.key_prefix = key_prefix
+        self._operations = {}  # type: Dict[str, float]
+        self._lock = threading.Lock()
+        self._inflight = {}  # type: Dict[str, _InflightCall]
+
+        for name in operations or ():
+            self.add_operation(name, operations[name] if isinstance(operations, dict) else None)
+
+    def add_operation(
+        self,
+        name,  # type: str
+        ttl=None,  # type: Optional[float]
+    ):
+        """Cache the responses of the operation, the ttl of the cache is used if ttl is not specified"""
+        self._operations[name] = self.ttl if ttl is None else ttl
+
+    def get_ttl(self, operation):
+        # type: (Operation) -> Optional[float]
+        """Returns the ttl of the operation, None means the operation is not cached"""
+        operation_name = str(operation)
+        for name, ttl in self._operations.items():
+            if operation_name == name or operation_name.endswith("." + name):
+                return ttl
+
+        return None
+
+    def make_key(
+        self,
+        operation,  # type: Operation
+        request_context,  # type: Dict[str, Any]
+        session,  # type: Session
+    ):
+        # type: (...) -> str
+        """The key consists of method, rendered url, params, data, headers, cookies and the authorization identity"""
+        url = _UrlTemplate.compile(request_context["url"]).render(
+            request_context.get("path_params"), session.path_params
+        )
+
+        params = dict(session.params or {})
+        params.update(request_context.get("params") or {})
+        headers = dict(session.headers)
+        headers.update(request_context.get("headers") or {})
+        auth = getattr(session.auth, "auth", None)
+        # the identity may travel in the cookies kept by the session
+        cookies = sorted([cookie.domain, cookie.path, cookie.name, cookie.value] for cookie in session.cookies)
+
+        identity = json.dumps(
+            [
+                request_context.get("method", operation.method).upper(),
+                url,
+                params,
+                request_context.get("json"),
+                request_context.get("data"),
+                headers,
+                cookies,
+                request_context.get("cookies"),
+                auth,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return "%s:response:%s:%s" % (self.key_prefix, operation, hashlib.sha1(identity.encode("utf-8")).hexdigest())
+
+    def fetch(
+        self,
+        key,  # type: str
+        ttl,  # type: float
+        request,  # type: Callable[[], Optional[Response]]
+        on_result=None,  # type: Optional[Callable[[str], Any]]
+    ):
+        # type: (...) -> Optional[Response]
+        """
+        Returns the cached response of the key, or calls request to get the response.
+
+        :param on_result: It is called with the CacheResult of the lookup.
+        """
+        now = time.time()
+        entry = self.backend.get(key)
+        if entry is not None:
+            if entry.is_fresh(now):
+                self._notify(on_result, CacheResult.HIT)
+                return entry.to_response()
+
+            if entry.is_usable(now):
+                self._notify(on_result, CacheResult.STALE)
+                self._refresh_in_background(key, ttl, request)
+                return entry.to_response()
+
+        self._notify(on_result, CacheResult.MISS if entry is None else CacheResult.EXPIRED)
+        return self._request_coalesced(key, ttl, request, on_result)
+
+    def delete(self, key):
+        # type: (str) -> None
+        self.backend.delete(key)
+
+    def clear(self):
+        self.backend.clear()
+
+    def _request_coalesced(self, key, ttl, request, on_result=None):
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _InflightCall()
+
+        if not leader:
+            call.event.wait()  # type: ignore
+            self._notify(on_result, CacheResult.COALESCED)
+            if call.error is not None:  # type: ignore
+                raise call.error  # type: ignore
+
+            return call.entry.to_response() if call.entry is not None else None  # type: ignore
+
+        try:
+            response = request()
+        except BaseException as err:
+            call.error = err  # type: ignore
+            raise
+        else:
+            call.entry = self._store(key, ttl, response)  # type: ignore
+            return response
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+            call.event.set()  # type: ignore
+
+    def _store(self, key, ttl, response):
+        # type: (str, float, Optional[Response]) -> Optional[CacheEntry]
+        if response is None:
+            return None
+
+        entry = CacheEntry.from_response(response, ttl, self.stale_ttl)
+        if self._is_cacheable(response):
+            # keep the entry for a while after it can not be served, so that the expiry can be told from the miss
+            timeout = (ttl + self.stale_ttl) * 2
+            self.backend.set(key, entry, timeout)
+
+        return entry
+
+    def _refresh_in_background(self, key, ttl, request):
+        with self._lock:
+            if key in self._inflight:
+                return
+
+        def refresh():
+            try:
+                self._request_coalesced(key, ttl, request)
+            except Exception:
+                # the stale response has been served, the error will be raised in the next request if it persists
+                pass
+
+        thread = threading.Thread(target=refresh, name="bkapi-cache-refresh")
+        thread.daemon = True
+        thread.start()
+
+    def _is_cacheable(self, response):
+        # type: (Optional[Response]) -> bool
+        if response is None or not response.ok:
+            return False
+
+        # the errors generated by the apigateway, such as rate limiting, should not be cached
+        return not response.headers.get("X-Bkapi-Error-Code")
+
+    def _notify(self, on_result, result):
+        if on_result is not None:
+            on_result(result)
@@ -10,7 +10,9 @@
 """
 import json
 import logging
-from typing import Any, Dict, Optional  # noqa
+import random
+from functools import partial
+from typing import Any, Dict, List, Optional  # noqa
 
 from requests import Response  # noqa
 from requests.exceptions import HTTPError, RequestException
@@ -18,7 +20,9 @@ from requests.sessions import merge_setting
 from requests.structures import CaseInsensitiveDict
 
 from bkapi_client_core.auth import BKApiAuthorization
-from bkapi_client_core.base import Operation  # noqa
+from bkapi_client_core.base import Operation, OperationResource  # noqa
+from bkapi_client_core.batch import DEFAULT_BATCH_WORKERS, BatchResult, RateLimiter, execute_batch  # noqa
+from bkapi_client_core.cache import ResponseCache  # noqa
 from bkapi_client_core.config import HookEvent
 from bkapi_client_core.exceptions import (
     APIGatewayResponseError,
@@ -27,7 +31,9 @@ from bkapi_client_core.exceptions import (
     JSONResponseError,
     ResponseError,
 )
+from bkapi_client_core.pool import ConnectionPool, get_default_pool  # noqa
 from bkapi_client_core.session import Session
+from bkapi_client_core.streaming import DEFAULT_CHUNK_SIZE, StreamingResponse, is_stream_data
 from bkapi_client_core.utils import CurlRequest, urljoin
 
 logger = logging.getLogger(__name__)
@@ -66,11 +72,16 @@ class RequestContextBuilder(object):
     def build_data(
         self,
         context,  # type: Dict[str, Any]
-        data=None,  # type: Optional[Dict[str, Any]]
+        data=None,  # type: Any
     ):
         if not data:
             return
 
+        # file-like objects and generators are sent as the streaming body without being read into memory
+        if is_stream_data(data):
+            context["data"] = data
+            return
+
         if context["method"] in ["GET", "HEAD", "OPTIONS"]:
             params = data.copy()
             params.update(context.get("params") or {})
@@ -126,7 +137,10 @@ class ResponseHeadersRepresenter(object):
 
 class BaseClient(object):
     _build_class = RequestContextBuilder
+    _session_class = Session
     _reuse_session_connection = False
+    _success_log_sample_rate = 1.0
+    response_cache = None  # type: Optional[ResponseCache]
     name = "client"
 
     def __init__(
@@ -136,7 +150,7 @@ class BaseClient(object):
         name=None,  # type: Optional[str]
     ):
         self._endpoint = endpoint
-        self.session = session or Session()
+        self.session = session or self._session_class()
         self._context_builder = self._build_class()
 
         if name:
@@ -147,6 +161,20 @@ class BaseClient(object):
     def get_client(self):
         return self
 
+    def fork(self):
+        """
+        Returns a client which shares the configurations and connections of this client,
+        it is cheap to create, and the changes of its session, such as headers and authorization,
+        do not affect this client.
+        """
+        client = self.__class__.__new__(self.__class__)
+        # the operation groups are bound to this client, they will be created again for the new client
+        client.__dict__.update(
+            (key, value) for key, value in self.__dict__.items() if not isinstance(value, OperationResource)
+        )
+        client.session = self.session.fork()
+        return client
+
     def __enter__(self):
         self._reuse_session_connection = True
         return self
@@ -165,23 +193,95 @@ class BaseClient(object):
         self,
         operation,  # type: Operation
         context,  # type: Dict[str, Any]
+        reuse_session_connection=False,  # type: bool
     ):
         # type: (...) -> Optional[Response]
-        """Handle operation with context"""
+        """Handle operation with context
 
+        :param reuse_session_connection: keep the connections of the session after the request,
+            they are always kept in the `with` block of the client or when the connection pool is set.
+        """
+        cache = self.response_cache
+        ttl = cache.get_ttl(operation) if cache is not None else None
+        if ttl is None or context.get("stream") or is_stream_data(context.get("data")):
+            return self._handle_request(operation, context, reuse_session_connection)
+
+        def on_result(result):
+            self.session.dispatch_hook(HookEvent.OPERATION_CACHE_LOOKUP, result, operation=operation)
+
+        # the key is made after the hooks, which may inject extra headers or params
+        context = self.session.dispatch_hook(HookEvent.OPERATION_PREPARED, context, operation=operation)
+        request_context = self._get_request_context(operation, context)
+        key = cache.make_key(operation, request_context, self.session)  # type: ignore
+        request = partial(self._send_request, operation, context, request_context, reuse_session_connection)
+        return cache.fetch(key, ttl, request, on_result)  # type: ignore
+
+    def _handle_request(
+        self,
+        operation,  # type: Operation
+        context,  # type: Dict[str, Any]
+        reuse_session_connection=False,  # type: bool
+    ):
+        # type: (...) -> Optional[Response]
         # you can inject extra context from hooks
         context = self.session.dispatch_hook(HookEvent.OPERATION_PREPARED, context, operation=operation)
+        return self._send_request(
+            operation, context, self._get_request_context(operation, context), reuse_session_connection
+        )
+
+    def _send_request(
+        self,
+        operation,  # type: Operation
+        context,  # type: Dict[str, Any]
+        request_context,  # type: Dict[str, Any]
+        reuse_session_connection=False,  # type: bool
+    ):
+        # type: (...) -> Optional[Response]
         try:
-            response = self.session.handle(**self._get_request_context(operation, context))
+            response = self.session.handle(**request_context)
             return self._handle_response(operation, context, response)
         except RequestException as err:
             self.session.dispatch_hook(HookEvent.OPERATION_ERROR, err, operation=operation)
             return self._handle_exception(operation, context, err)
         finally:
-            if not self._reuse_session_connection:
+            reused = reuse_session_connection or self._reuse_session_connection
+            if not reused and self.session.connection_pool is None:
                 # close the pooled connections to avoid connection leaks
                 self.close()
 
+    def batch_request(
+        self,
+        operation,  # type: Operation
+        contexts,  # type: List[Dict[str, Any]]
+        max_workers=DEFAULT_BATCH_WORKERS,  # type: int
+        rate_limit=None,  # type: Optional[float]
+        parse_response=True,  # type: bool
+    ):
+        # type: (...) -> BatchResult
+        """Handle operation with each context concurrently, the connections are shared in the batch"""
+
+        def execute(context):
+            # the connections are closed after the batch, instead of after every request
+            response = self.handle_request(operation, context, reuse_session_connection=True)
+            if not parse_response:
+                return response
+
+            return self.parse_response(operation, response)
+
+        try:
+            result = execute_batch(
+                execute,
+                contexts,
+                max_workers=max_workers,
+                rate_limiter=RateLimiter(rate_limit) if rate_limit else None,
+            )
+        finally:
+            if not self._reuse_session_connection and self.session.connection_pool is None:
+                self.close()
+
+        self.session.dispatch_hook(HookEvent.OPERATION_BATCH_FINISHED, result, operation=operation)
+        return result
+
     def parse_response(
         self,
         operation,  # type: Operation
@@ -193,6 +293,28 @@ class BaseClient(object):
         except RequestException as err:
             return self._handle_exception(operation, None, err)
 
+    def stream_response(
+        self,
+        operation,  # type: Operation
+        response,  # type: Optional[Response]
+        chunk_size=DEFAULT_CHUNK_SIZE,  # type: int
+    ):
+        # type: (...) -> Optional[StreamingResponse]
+        """Check the errors of the response requested with `stream=True`, and return it without reading the body"""
+        if response is None:
+            return None
+
+        try:
+            self._check_response_status(response)
+        except RequestException as err:
+            response.close()
+            return self._handle_exception(operation, None, err)
+
+        def on_close(stream):
+            self.session.dispatch_hook(HookEvent.OPERATION_STREAM_CLOSED, stream, operation=operation)
+
+        return StreamingResponse(response, chunk_size=chunk_size, on_close=on_close)
+
     def check_response_apigateway_error(
         self,
         response,  # type: Optional[Response]
@@ -249,6 +371,56 @@ class BaseClient(object):
         """
         self.session.timeout = timeout
 
+    def enable_connection_pool(
+        self,
+        pool=None,  # type: Optional[ConnectionPool]
+    ):
+        """
+        Share long-lived connections with other clients in the process,
+        the connections will not be closed after each request.
+
+        :param pool: the connection pool, use the process-wide pool if not specified
+        :type pool: ConnectionPool
+        """
+        self.session.connection_pool = pool or get_default_pool()
+
+    def disable_connection_pool(self):
+        """
+        Stop sharing connections, the connections will be closed after each request
+        """
+        self.session.connection_pool = None
+
+    def enable_response_cache(
+        self,
+        cache,  # type: ResponseCache
+    ):
+        """
+        Cache the successful responses of the operations specified by the cache,
+        the cache can be shared by clients.
+
+        :param cache: the response cache
+        :type cache: ResponseCache
+        """
+        self.response_cache = cache
+
+    def disable_response_cache(self):
+        """
+        Stop caching the responses
+        """
+        self.response_cache = None
+
+    def set_success_log_sample_rate(
+        self,
+        sample_rate,  # type: float
+    ):
+        """
+        Set the sampling rate of the debug logs for successful requests
+
+        :param sample_rate: a number between 0 and 1, 1 means logging all requests
+        :type sample_rate: float
+        """
+        self._success_log_sample_rate = float(sample_rate)
+
     def disable_ssl_verify(self):
         """
         Disable SSL certificate verification
@@ -308,18 +480,27 @@ class BaseClient(object):
         response,  # type: Response
     ):
         # type: (...) -> Response
-        response_headers_representer = ResponseHeadersRepresenter(response.headers)
-        logger.debug(
-            "request to %s with context %s, status_code: %s, %s\n%s",
-            operation,
-            context,
-            response.status_code,
-            response_headers_representer,
-            CurlRequest(response.request),
-        )
+        self.session.dispatch_hook(HookEvent.OPERATION_RESPONDED, response, operation=operation)
+
+        if logger.isEnabledFor(logging.DEBUG) and self._should_log_success():
+            logger.debug(
+                "request to %s with context %s, status_code: %s, %s\n%s",
+                operation,
+                context,
+                response.status_code,
+                ResponseHeadersRepresenter(response.headers),
+                CurlRequest(response.request),
+            )
 
         return response
 
+    def _should_log_success(self):
+        # type: () -> bool
+        if self._success_log_sample_rate >= 1:
+            return True
+
+        return random.random() < self._success_log_sample_rate
+
     def _handle_response_content(
         self,
         operation,  # type: Operation
@@ -328,24 +509,31 @@ class BaseClient(object):
         if response is None:
             return None
 
-        self.check_response_apigateway_error(response)
+        self._check_response_status(response)
 
         try:
-            response.raise_for_status()
-        except HTTPError as err:
+            return response.json()
+        except (TypeError, json.JSONDecodeError):
             response_headers_representer = ResponseHeadersRepresenter(response.headers)
-            raise HTTPResponseError(
-                "Error responded by Backend api, %s" % str(err),
+            raise JSONResponseError(
+                "The response is not a valid JSON",
                 response=response,
                 response_headers_representer=response_headers_representer,
             )
 
+    def _check_response_status(
+        self,
+        response,  # type: Response
+    ):
+        # type: (...) -> None
+        self.check_response_apigateway_error(response)
+
         try:
-            return response.json()
-        except (TypeError, json.JSONDecodeError):
+            response.raise_for_status()
+        except HTTPError as err:
             response_headers_representer = ResponseHeadersRepresenter(response.headers)
-            raise JSONResponseError(
-                "The response is not a valid JSON",
+            raise HTTPResponseError(
+                "Error responded by Backend api, %s" % str(err),
                 response=response,
                 response_headers_representer=response_headers_representer,
             )
@@ -20,8 +20,16 @@ except ImportError:
 class HookEvent:
     # 准备请求
     OPERATION_PREPARED = "operation-prepared"
+    # 收到响应
+    OPERATION_RESPONDED = "operation-responded"
     # 请求异常
     OPERATION_ERROR = "operation-error"
+    # 批量请求完成
+    OPERATION_BATCH_FINISHED = "operation-batch-finished"
+    # 流式响应关闭
+    OPERATION_STREAM_CLOSED = "operation-stream-closed"
+    # 查询响应缓存
+    OPERATION_CACHE_LOOKUP = "operation-cache-lookup"
     # 请求
     REQUEST = "request"
     # 响应
@@ -40,6 +48,18 @@ class SettingKeys:
     BK_API_AUTHORIZATION_COOKIES_MAPPING = "BK_API_AUTHORIZATION_COOKIES_MAPPING"
     BK_API_URL_TMPL = "BK_API_URL_TMPL"
 
+    # logging
+    BK_API_CLIENT_SUCCESS_LOG_SAMPLE_RATE = "BK_API_CLIENT_SUCCESS_LOG_SAMPLE_RATE"
+
+    # connection pool
+    BK_API_CLIENT_ENABLE_CONNECTION_POOL = "BK_API_CLIENT_ENABLE_CONNECTION_POOL"
+    BK_API_CLIENT_CONNECTION_POOL_OPTIONS = "BK_API_CLIENT_CONNECTION_POOL_OPTIONS"
+
+    # django helpers
+    BK_API_CLIENT_REUSE_CLIENT = "BK_API_CLIENT_REUSE_CLIENT"
+    BK_API_CLIENT_ACCESS_TOKEN_CACHE_TTL = "BK_API_CLIENT_ACCESS_TOKEN_CACHE_TTL"
+    BK_API_CLIENT_ACCESS_TOKEN_CACHE_SIZE = "BK_API_CLIENT_ACCESS_TOKEN_CACHE_SIZE"
+
     # esb
     BK_COMPONENT_API_URL = "BK_COMPONENT_API_URL"
     DEFAULT_BK_API_VER = "DEFAULT_BK_API_VER"
@@ -133,6 +153,12 @@ settings.set_defaults(
         SettingKeys.DEFAULT_BK_API_VER: "v2",
         SettingKeys.BK_API_USE_TEST_ENV: False,
         SettingKeys.BK_API_CLIENT_ENABLE_SSL_VERIFY: False,
+        SettingKeys.BK_API_CLIENT_SUCCESS_LOG_SAMPLE_RATE: 1.0,
+        SettingKeys.BK_API_CLIENT_ENABLE_CONNECTION_POOL: False,
+        SettingKeys.BK_API_CLIENT_CONNECTION_POOL_OPTIONS: {},
+        SettingKeys.BK_API_CLIENT_REUSE_CLIENT: False,
+        SettingKeys.BK_API_CLIENT_ACCESS_TOKEN_CACHE_TTL: 0,
+        SettingKeys.BK_API_CLIENT_ACCESS_TOKEN_CACHE_SIZE: 1024,
         SettingKeys.BK_API_AUTHORIZATION_COOKIES_MAPPING: {
             "bk_token": "bk_token",
         },
@@ -8,8 +8,13 @@
  * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
  * specific language governing permissions and limitations under the License.
 """
+import datetime
 import logging
-from typing import Optional, Type  # noqa
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple, Type  # noqa
 
 from bkapi_client_core.client import BaseClient  # noqa
 from bkapi_client_core.config import SettingKeys, settings
@@ -23,6 +28,137 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# the access token is refreshed in advance before it expires
+ACCESS_TOKEN_EXPIRES_MARGIN = 60
+DEFAULT_ACCESS_TOKEN_CACHE_SIZE = 1024
+
+
+class ClientFactory(object):
+    """
+    ClientFactory keeps the configured clients in the process,
+    the clients returned are forked from them, which share the configurations and connections.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}  # type: Dict[Any, BaseClient]
+
+    def get_client(
+        self,
+        key,  # type: Any
+        create,  # type: Callable[[], BaseClient]
+    ):
+        # type: (...) -> BaseClient
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = create()
+
+        return client.fork()
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+
+class AccessTokenCache(object):
+    """
+    AccessTokenCache keeps the access tokens of the users in the process until they are about to expire,
+    the least recently used ones are evicted when there are more than maxsize users.
+    """
+
+    def __init__(
+        self,
+        maxsize=DEFAULT_ACCESS_TOKEN_CACHE_SIZE,  # type: int
+    ):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._tokens = OrderedDict()  # type: OrderedDict[str, Tuple[str, float]]
+
+    def get(
+        self,
+        username,  # type: str
+        ttl,  # type: float
+        fetch,  # type: Callable[[], Any]
+    ):
+        # type: (...) -> Optional[str]
+        """Returns the cached access token of the user, or fetch the token object which is from bkoauth"""
+        now = time.time()
+        with self._lock:
+            cached = self._tokens.get(username)
+            if cached is not None:
+                if cached[1] > now:
+                    self._tokens.move_to_end(username)
+                    return cached[0]
+
+                del self._tokens[username]
+
+        token = fetch()
+        access_token = getattr(token, "access_token", None)
+        if not access_token:
+            return None
+
+        expires_at = now + ttl
+        expires = getattr(token, "expires", None)
+        if isinstance(expires, datetime.datetime):
+            expires_at = min(expires_at, _to_timestamp(expires) - ACCESS_TOKEN_EXPIRES_MARGIN)
+
+        if expires_at > now and self.maxsize > 0:
+            with self._lock:
+                self._tokens[username] = (access_token, expires_at)
+                self._tokens.move_to_end(username)
+                while len(self._tokens) > self.maxsize:
+                    self._tokens.popitem(last=False)
+
+        return access_token
+
+    def delete(
+        self,
+        username,  # type: str
+    ):
+        with self._lock:
+            self._tokens.pop(username, None)
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+
+
+def _to_timestamp(value):
+    # type: (datetime.datetime) -> float
+    if value.tzinfo is None:
+        # the naive datetime of bkoauth is in local time
+        return time.mktime(value.timetuple()) + value.microsecond / 1e6
+
+    return value.timestamp()
+
+
+client_factory = ClientFactory()
+access_token_cache = AccessTokenCache()
+
+
+def _get_access_token(
+    username,  # type: str
+    fetch,  # type: Callable[[], Any]
+):
+    # type: (...) -> Optional[str]
+    if not bkoauth:
+        return None
+
+    try:
+        ttl = settings.get(SettingKeys.BK_API_CLIENT_ACCESS_TOKEN_CACHE_TTL)
+        if ttl and username:
+            access_token_cache.maxsize = int(settings.get(SettingKeys.BK_API_CLIENT_ACCESS_TOKEN_CACHE_SIZE) or 0)
+            return access_token_cache.get(username, ttl, fetch)
+
+        return fetch().access_token
+    except Exception:
+        logger.warning("get access_token of user %s failed", username)
+        return None
+
+
 def _get_client_by_settings(
     client_cls,  # type: Type[BaseClient]
     bk_app_code=None,  # type: Optional[str]
@@ -31,6 +167,28 @@ def _get_client_by_settings(
     **kwargs,
 ):
     """Returns a client according to the django settings"""
+    if not settings.get(SettingKeys.BK_API_CLIENT_REUSE_CLIENT):
+        return _create_client_by_settings(client_cls, bk_app_code, bk_app_secret, accept_language, **kwargs)
+
+    key = (client_cls, bk_app_code, bk_app_secret, accept_language, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return _create_client_by_settings(client_cls, bk_app_code, bk_app_secret, accept_language, **kwargs)
+
+    return client_factory.get_client(
+        key,
+        partial(_create_client_by_settings, client_cls, bk_app_code, bk_app_secret, accept_language, **kwargs),
+    )
+
+
+def _create_client_by_settings(
+    client_cls,  # type: Type[BaseClient]
+    bk_app_code=None,  # type: Optional[str]
+    bk_app_secret=None,  # type: Optional[str]
+    accept_language=None,  # type: Optional[str]
+    **kwargs,
+):
     client = client_cls(**kwargs)
 
     client.update_bkapi_authorization(
@@ -42,6 +200,13 @@ def _get_client_by_settings(
     if not settings.get(SettingKeys.BK_API_CLIENT_ENABLE_SSL_VERIFY):
         client.disable_ssl_verify()
 
+    success_log_sample_rate = settings.get(SettingKeys.BK_API_CLIENT_SUCCESS_LOG_SAMPLE_RATE)
+    if success_log_sample_rate is not None:
+        client.set_success_log_sample_rate(success_log_sample_rate)
+
+    if settings.get(SettingKeys.BK_API_CLIENT_ENABLE_CONNECTION_POOL):
+        client.enable_connection_pool()
+
     if accept_language:
         client.session.set_accept_language(accept_language)
 
@@ -71,13 +236,7 @@ def get_client_by_request(
     """Returns a client according to the current request"""
 
     def get_access_token():
-        if not bkoauth:
-            return None
-        try:
-            token = bkoauth.get_access_token(request)
-            return token.access_token
-        except Exception:
-            logger.warning("get access_token by request failed")
+        return _get_access_token(request.user.username, lambda: bkoauth.get_access_token(request))
 
     _validate_user_authenticated(request.user)
 
@@ -103,13 +262,7 @@ def get_client_by_username(
     """Returns a client according to the username"""
 
     def get_access_token():
-        if not bkoauth:
-            return None
-        try:
-            token = bkoauth.get_access_token_by_user(username)
-            return token.access_token
-        except Exception:
-            logger.warning("get access_token by request failed")
+        return _get_access_token(username, lambda: bkoauth.get_access_token_by_user(username))
 
     client = _get_client_by_settings(client_cls, **kwargs)
     client.update_bkapi_authorization(access_token=get_access_token(), bk_username=username)
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple  # noqa
+
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, DEFAULT_RETRIES, HTTPAdapter
+from requests.compat import urlparse
+
+from bkapi_client_core.config import SettingKeys, settings
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter shared by all sessions which request to the same endpoint"""
+
+    def __init__(
+        self,
+        keep_alive=True,  # type: bool
+        **kwargs,  # type: Any
+    ):
+        self.keep_alive = keep_alive
+        super(PooledHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.keep_alive:
+            # enable TCP keep-alive, so that the idle connections will not be silently dropped by the middle boxes
+            socket_options = list(kwargs.get("socket_options") or _get_default_socket_options())
+            socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            kwargs["socket_options"] = socket_options
+
+        super(PooledHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+
+    def get_connection_stats(self):
+        # type: () -> Tuple[int, int]
+        """Returns the count of requests and the count of connections created by the pools of this adapter"""
+        num_requests = num_connections = 0
+
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+
+            num_requests += pool.num_requests
+            num_connections += pool.num_connections
+
+        return num_requests, num_connections
+
+
+def _get_default_socket_options():
+    from urllib3.connection import HTTPConnection
+
+    return HTTPConnection.default_socket_options
+
+
+class _PoolEntry(object):
+    def __init__(self, adapter):
+        self.adapter = adapter
+        self.last_used = time.time()
+        # the counters of the evicted adapters, so that the stats are monotonic
+        self.retired_requests = 0
+        self.retired_connections = 0
+
+
+class ConnectionPool(object):
+    """
+    ConnectionPool keeps long-lived connections for all sessions in the process.
+    The pooled adapters are keyed by endpoint (scheme, host and port),
+    so that the connections are reused across clients, sessions and requests.
+
+    It is thread-safe, and the pooled connections will be dropped in the forked child processes.
+    """
+
+    def __init__(
+        self,
+        pool_connections=DEFAULT_POOLSIZE,  # type: int
+        pool_maxsize=DEFAULT_POOLSIZE,  # type: int
+        max_retries=DEFAULT_RETRIES,  # type: Any
+        pool_block=DEFAULT_POOLBLOCK,  # type: bool
+        keep_alive=True,  # type: bool
+        idle_timeout=None,  # type: Optional[float]
+    ):
+        """
+        :param pool_connections: The number of urllib3 connection pools to cache for each endpoint.
+        :param pool_maxsize: The maximum number of connections to save in the pool for each endpoint.
+        :param max_retries: The maximum number of retries each connection should attempt.
+        :param pool_block: Whether the connection pool should block for connections.
+        :param keep_alive: Whether to enable TCP keep-alive for the pooled connections.
+        :param idle_timeout: Seconds after which the connections of an unused endpoint are closed.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._entries = {}  # type: Dict[Tuple[str, str, int], _PoolEntry]
+        self._adapter_hits = 0
+        self._adapter_misses = 0
+        self._evictions = 0
+        self._pid = os.getpid()
+
+    def get_adapter(
+        self,
+        url,  # type: str
+    ):
+        # type: (...) -> PooledHTTPAdapter
+        """Returns the shared adapter for the endpoint of the url"""
+        self._check_pid()
+
+        key = self._get_key(url)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _PoolEntry(None)
+            elif entry.adapter is not None and self._is_idle(entry, now):
+                self._evict(entry)
+
+            if entry.adapter is None:
+                # the endpoints which are never requested again are evicted here, so they will not be kept forever
+                self._evict_idle_entries(now)
+                entry.adapter = self._new_adapter()
+                self._adapter_misses += 1
+            else:
+                self._adapter_hits += 1
+
+            entry.last_used = now
+            return entry.adapter
+
+    def evict_idle(self):
+        # type: () -> int
+        """
+        Close the connections of the endpoints which have been idle for longer than `idle_timeout`.
+        The idle endpoints are also evicted when a new adapter is created,
+        call it periodically if the idle connections should be closed without new requests.
+        """
+        with self._lock:
+            return self._evict_idle_entries(time.time())
+
+    def stats(self):
+        # type: () -> Dict[str, Any]
+        """
+        Returns the pool metrics.
+        A connection hit means a request reused a pooled connection, a miss means a new connection was created.
+        """
+        endpoints = {}
+        connection_hits = connection_misses = 0
+
+        with self._lock:
+            entries = list(self._entries.items())
+
+        for (scheme, host, port), entry in entries:
+            num_requests, num_connections = entry.retired_requests, entry.retired_connections
+            if entry.adapter is not None:
+                current_requests, current_connections = entry.adapter.get_connection_stats()
+                num_requests += current_requests
+                num_connections += current_connections
+
+            hits = max(num_requests - num_connections, 0)
+            endpoints["%s://%s:%s" % (scheme, host, port)] = {
+                "requests": num_requests,
+                "connection_hits": hits,
+                "connection_misses": num_connections,
+            }
+            connection_hits += hits
+            connection_misses += num_connections
+
+        return {
+            "adapter_hits": self._adapter_hits,
+            "adapter_misses": self._adapter_misses,
+            "connection_hits": connection_hits,
+            "connection_misses": connection_misses,
+            "evictions": self._evictions,
+            "endpoints": endpoints,
+        }
+
+    def clear(self):
+        """Close all pooled connections"""
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.adapter is not None:
+                    entry.adapter.close()
+
+            self._entries.clear()
+
+    def _new_adapter(self):
+        # type: () -> PooledHTTPAdapter
+        return PooledHTTPAdapter(
+            keep_alive=self.keep_alive,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+            pool_block=self.pool_block,
+        )
+
+    def _evict_idle_entries(self, now):
+        # type: (float) -> int
+        if not self.idle_timeout:
+            return 0
+
+        evicted = 0
+        for entry in self._entries.values():
+            if entry.adapter is not None and self._is_idle(entry, now):
+                self._evict(entry)
+                evicted += 1
+
+        return evicted
+
+    def _is_idle(self, entry, now):
+        # type: (_PoolEntry, float) -> bool
+        return bool(self.idle_timeout) and now - entry.last_used > self.idle_timeout  # type: ignore
+
+    def _evict(self, entry):
+        # type: (_PoolEntry) -> None
+        num_requests, num_connections = entry.adapter.get_connection_stats()
+        entry.retired_requests += num_requests
+        entry.retired_connections += num_connections
+        entry.adapter.close()
+        entry.adapter = None
+        self._evictions += 1
+
+    def _check_pid(self):
+        pid = os.getpid()
+        if pid == self._pid:
+            return
+
+        with self._lock:
+            if pid == self._pid:
+                return
+
+            # The sockets are shared with the parent process after forking,
+            # drop them without closing, otherwise the connections of the parent process may be broken.
+            self._lock = threading.Lock()
+            self._entries = {}
+            self._pid = pid
+
+    def _get_key(self, url):
+        # type: (str) -> Tuple[str, str, int]
+        parsed = urlparse(url)
+        scheme = (parsed.scheme or "http").lower()
+        host = (parsed.hostname or "").lower()
+        port = parsed.port or _DEFAULT_PORTS.get(scheme, 0)
+        return scheme, host, port
+
+
+_DEFAULT_POOL = None  # type: Optional[ConnectionPool]
+_DEFAULT_POOL_LOCK = threading.Lock()
+
+
+def get_default_pool():
+    # type: () -> ConnectionPool
+    """Returns the process-wide connection pool, the options can be set by `BK_API_CLIENT_CONNECTION_POOL_OPTIONS`"""
+    global _DEFAULT_POOL  # noqa
+
+    if _DEFAULT_POOL is not None:
+        return _DEFAULT_POOL
+
+    with _DEFAULT_POOL_LOCK:
+        if _DEFAULT_POOL is None:
+            _DEFAULT_POOL = ConnectionPool(**(settings.get(SettingKeys.BK_API_CLIENT_CONNECTION_POOL_OPTIONS) or {}))
+
+    return _DEFAULT_POOL
+
+
+def configure_default_pool(**options):
+    # type: (**Any) -> ConnectionPool
+    """Replace the process-wide connection pool with the given options"""
+    global _DEFAULT_POOL  # noqa
+
+    with _DEFAULT_POOL_LOCK:
+        if _DEFAULT_POOL is not None:
+            _DEFAULT_POOL.clear()
+
+        _DEFAULT_POOL = ConnectionPool(**options)
+
+    return _DEFAULT_POOL
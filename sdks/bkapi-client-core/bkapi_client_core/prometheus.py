@@ -9,15 +9,17 @@
  specific language governing permissions and limitations under the License.
 """
 
-from functools import partial
-from typing import Any, Dict, List, Optional  # noqa
+import random
+from typing import Any, Callable, Dict, List, Optional, Tuple  # noqa
 
 from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram  # noqa
 from requests import Response  # noqa
 
 from bkapi_client_core import session
 from bkapi_client_core.base import Operation  # noqa
+from bkapi_client_core.batch import BatchResult  # noqa
 from bkapi_client_core.config import HookEvent
+from bkapi_client_core.streaming import StreamingResponse  # noqa
 from bkapi_client_core.utils import allow_fail
 
 default_bytes_buckets = [
@@ -63,7 +65,71 @@ default_duration_buckets = [
 ]
 
 
+def request_id_exemplar(response):
+    # type: (Response) -> Optional[Dict[str, str]]
+    """Use the request id of the apigateway as the exemplar of the duration"""
+    request_id = response.headers.get("X-Bkapi-Request-Id")
+    return {"request_id": request_id} if request_id else None
+
+
+class _OperationMetrics(object):
+    """The labelled children of the metrics for an operation, which are resolved only once"""
+
+    def __init__(
+        self,
+        collector,  # type: HookCollector
+        operation,  # type: str
+        method,  # type: str
+    ):
+        self.collector = collector
+        self.operation = operation
+        self.method = method
+        self.requests_duration_seconds = collector.metric_requests_duration_seconds.labels(
+            operation=operation,
+            method=method,
+        )
+        self.requests_body_bytes = collector.metric_requests_body_bytes.labels(operation=operation, method=method)
+        self.responses_body_bytes = collector.metric_responses_body_bytes.labels(operation=operation, method=method)
+        self._responses_total = {}  # type: Dict[Any, Any]
+        self._failures_total = {}  # type: Dict[str, Any]
+
+    def responses_total(self, status):
+        child = self._responses_total.get(status)
+        if child is None:
+            child = self._responses_total[status] = self.collector.metric_responses_total.labels(
+                operation=self.operation,
+                method=self.method,
+                status=status,
+            )
+
+        return child
+
+    def failures_total(self, error):
+        child = self._failures_total.get(error)
+        if child is None:
+            child = self._failures_total[error] = self.collector.metric_failures_total.labels(
+                operation=self.operation,
+                method=self.method,
+                error=error,
+            )
+
+        return child
+
+    def response_hook(self, response, **kwargs):
+        self.collector.observe_response(self, response)
+
+    def sampled_out_response_hook(self, response, **kwargs):
+        self.collector.observe_response(self, response, sampled=False)
+
+
 class HookCollector:
+    """
+    HookCollector collects the metrics of the requests by the session hooks.
+
+    The labelled children are cached by operation and method, so that the labels are resolved only once,
+    and the body sizes are taken from the headers, the bodies are never read by the collector.
+    """
+
     def __init__(
         self,
         registry,  # type: CollectorRegistry
@@ -71,7 +137,17 @@ class HookCollector:
         subsystem,  # type: str
         duration_buckets,  # type: List[float]
         bytes_buckets,  # type: List[float]
+        sample_rate=1.0,  # type: float
+        exemplar=None,  # type: Optional[Callable[[Response], Optional[Dict[str, str]]]]
     ):
+        """
+        :param sample_rate: The ratio of requests observed by the histograms, the counters always count all requests.
+        :param exemplar: A function returns the exemplar labels of the duration for a response, such as the request id.
+        """
+        self.sample_rate = sample_rate
+        self.exemplar = exemplar
+        self._operation_metrics = {}  # type: Dict[Tuple[str, str], _OperationMetrics]
+
         self.metric_requests_duration_seconds = Histogram(
             "bkapi_requests_duration_seconds",
             "Histogram of requests duration by operation, method",
@@ -120,42 +196,93 @@ class HookCollector:
             registry=registry,
         )
 
+        self.metric_batch_duration_seconds = Histogram(
+            "bkapi_batch_duration_seconds",
+            "Histogram of batch requests duration by operation, method",
+            ["operation", "method"],
+            namespace=namespace,
+            subsystem=subsystem,
+            registry=registry,
+            buckets=duration_buckets,
+        )
+
+        self.metric_batch_requests_total = Counter(
+            "bkapi_batch_requests_total",
+            "Count of requests in batches by operation, method, result",
+            ["operation", "method", "result"],
+            namespace=namespace,
+            subsystem=subsystem,
+            registry=registry,
+        )
+
+        self.metric_cache_requests_total = Counter(
+            "bkapi_cache_requests_total",
+            "Count of response cache lookups by operation, method, result",
+            ["operation", "method", "result"],
+            namespace=namespace,
+            subsystem=subsystem,
+            registry=registry,
+        )
+
+    def get_operation_metrics(
+        self,
+        operation,  # type: str
+        method,  # type: str
+    ):
+        # type: (...) -> _OperationMetrics
+        key = (operation, method)
+        metrics = self._operation_metrics.get(key)
+        if metrics is None:
+            metrics = self._operation_metrics[key] = _OperationMetrics(self, operation, method)
+
+        return metrics
+
     @allow_fail
-    def response_hook(
+    def observe_response(
         self,
+        metrics,  # type: _OperationMetrics
         response,  # type: Response
-        bkapi_operation,  # type: Operation
-        **kwargs,  # type: Any
+        sampled=True,  # type: bool
     ):
-        name = str(bkapi_operation)
-        method = response.request.method
+        metrics.responses_total(response.status_code).inc()
+        if not sampled:
+            return
 
-        self.metric_requests_duration_seconds.labels(
-            operation=name,
-            method=method,
-        ).observe(response.elapsed.total_seconds())
-
-        self.metric_responses_total.labels(
-            operation=name,
-            method=method,
-            status=response.status_code,
-        ).inc()
+        duration = response.elapsed.total_seconds()
+        exemplar = self.exemplar(response) if self.exemplar is not None else None
+        if exemplar:
+            metrics.requests_duration_seconds.observe(duration, exemplar)
+        else:
+            metrics.requests_duration_seconds.observe(duration)
 
-        request_content_length = response.request.headers.get("Content-Length")
-        if request_content_length and request_content_length.isdigit():
-            self.metric_requests_body_bytes.labels(
-                operation=name,
-                method=method,
-            ).observe(int(request_content_length))
+        request_size = _get_request_body_size(response.request)
+        if request_size:
+            metrics.requests_body_bytes.observe(request_size)
 
         # this method should finish as fast as possible,
         # so it's not a good idea to read the response body to calculate the size
-        response_content_length = response.headers.get("Content-Length")
-        if response_content_length and response_content_length.isdigit():
-            self.metric_responses_body_bytes.labels(
-                operation=name,
-                method=method,
-            ).observe(int(response_content_length))
+        response_size = _get_content_length(response.headers)
+        if response_size:
+            metrics.responses_body_bytes.observe(response_size)
+
+    @allow_fail
+    def response_hook(
+        self,
+        response,  # type: Response
+        bkapi_operation,  # type: Operation
+        **kwargs,  # type: Any
+    ):
+        metrics = self.get_operation_metrics(str(bkapi_operation), response.request.method)
+        self.observe_response(metrics, response)
+
+    @allow_fail
+    def responded_hook(
+        self,
+        response,  # type: Response
+        operation,  # type: Operation
+    ):
+        metrics = self.get_operation_metrics(str(operation), response.request.method)
+        self.observe_response(metrics, response, sampled=self._is_sampled())
 
     @allow_fail
     def request_hook(
@@ -163,14 +290,19 @@ class HookCollector:
         context,  # type: Dict[str, Any]
         operation,  # type: Operation
     ):
+        """
+        Add a response hook to the request context,
+        it is kept for compatibility, `responded_hook` is cheaper, which does not add hooks to every request.
+        """
+        # the method of the prepared request is upper case
+        metrics = self.get_operation_metrics(str(operation), operation.method.upper())
+        if self._is_sampled():
+            hook = metrics.response_hook
+        else:
+            hook = metrics.sampled_out_response_hook
+
         hooks = context.setdefault("hooks", {})
-        response_hooks = hooks.setdefault(HookEvent.RESPONSE, [])
-        response_hooks.append(
-            partial(
-                self.response_hook,
-                bkapi_operation=operation,
-            )
-        )
+        hooks.setdefault(HookEvent.RESPONSE, []).append(hook)
 
         return context
 
@@ -180,15 +312,102 @@ class HookCollector:
         error,  # type: Exception
         operation,  # type: Operation
     ):
-        self.metric_failures_total.labels(
+        metrics = self.get_operation_metrics(str(operation), operation.method)
+        metrics.failures_total(error.__class__.__name__).inc()
+
+    @allow_fail
+    def batch_hook(
+        self,
+        result,  # type: BatchResult
+        operation,  # type: Operation
+    ):
+        name = str(operation)
+
+        self.metric_batch_duration_seconds.labels(
+            operation=name,
+            method=operation.method,
+        ).observe(result.elapsed)
+
+        succeeded = result.succeeded
+        if succeeded:
+            self.metric_batch_requests_total.labels(
+                operation=name,
+                method=operation.method,
+                result="succeeded",
+            ).inc(succeeded)
+
+        failed = len(result) - succeeded
+        if failed:
+            self.metric_batch_requests_total.labels(
+                operation=name,
+                method=operation.method,
+                result="failed",
+            ).inc(failed)
+
+        return result
+
+    @allow_fail
+    def stream_hook(
+        self,
+        stream,  # type: StreamingResponse
+        operation,  # type: Operation
+    ):
+        # the size has been observed by the response hook if the Content-Length header is present,
+        # otherwise, observe the size of the body which has been read by the stream
+        if _get_content_length(stream.headers) is not None:
+            return stream
+
+        self.get_operation_metrics(str(operation), operation.method).responses_body_bytes.observe(stream.bytes_read)
+
+        return stream
+
+    @allow_fail
+    def cache_hook(
+        self,
+        result,  # type: str
+        operation,  # type: Operation
+    ):
+        self.metric_cache_requests_total.labels(
             operation=str(operation),
             method=operation.method,
-            error=error.__class__.__name__,
+            result=result,
         ).inc()
 
+        return result
+
+    def _is_sampled(self):
+        # type: () -> bool
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
     def enable_hooks(self):
-        session.register_global_hook(HookEvent.OPERATION_PREPARED, self.request_hook)
+        session.register_global_hook(HookEvent.OPERATION_RESPONDED, self.responded_hook)
         session.register_global_hook(HookEvent.OPERATION_ERROR, self.error_hook)
+        session.register_global_hook(HookEvent.OPERATION_BATCH_FINISHED, self.batch_hook)
+        session.register_global_hook(HookEvent.OPERATION_STREAM_CLOSED, self.stream_hook)
+        session.register_global_hook(HookEvent.OPERATION_CACHE_LOOKUP, self.cache_hook)
+
+
+def _get_content_length(headers):
+    # type: (Any) -> Optional[int]
+    content_length = headers.get("Content-Length")
+    if content_length and content_length.isdigit():
+        return int(content_length)
+
+    return None
+
+
+def _get_request_body_size(request):
+    # type: (Any) -> Optional[int]
+    content_length = _get_content_length(request.headers)
+    if content_length is not None:
+        return content_length
+
+    # the streaming bodies are not measured
+    body = request.body
+    if isinstance(body, (bytes, str)):
+        return len(body)
+
+    return None
 
 
 _GLOBAL_COLLECTOR = None  # type: Optional[HookCollector]
@@ -200,9 +419,15 @@ def enable(
     subsystem="",
     duration_buckets=default_duration_buckets,
     bytes_buckets=default_bytes_buckets,
+    sample_rate=1.0,
+    exemplar=None,
 ):
     """
     Enable bkapi prometheus collector
+
+    :param sample_rate: The ratio of requests observed by the histograms, the counters always count all requests.
+    :param exemplar: A function returns the exemplar labels of the duration for a response,
+        such as `request_id_exemplar`.
     """
     global _GLOBAL_COLLECTOR  # noqa
 
@@ -215,6 +440,8 @@ def enable(
         subsystem=subsystem,
         duration_buckets=duration_buckets,
         bytes_buckets=bytes_buckets,
+        sample_rate=sample_rate,
+        exemplar=exemplar,
     )
     _GLOBAL_COLLECTOR.enable_hooks()
 
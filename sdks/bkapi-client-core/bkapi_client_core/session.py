@@ -8,43 +8,91 @@
  * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
  * specific language governing permissions and limitations under the License.
 """
+import copy
 import string
-from typing import Any, Dict, List, Optional  # noqa
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple  # noqa
 
 from requests import Request  # noqa
 from requests import Session as RequestSession
+from requests.cookies import cookiejar_from_dict
 from requests.hooks import dispatch_hook
 from requests.models import RequestHooksMixin
-from requests.sessions import merge_setting
 
 from bkapi_client_core import __version__
+from bkapi_client_core.auth import BKApiAuthorization
 from bkapi_client_core.config import HookEvent
 from bkapi_client_core.exceptions import PathParamsMissing
+from bkapi_client_core.pool import ConnectionPool  # noqa
 
 
-class _UrlRender(string.Formatter):
-    """_UrlRender should format the url by path parameters."""
-
-    def __init__(self, url, common_path_params=None):
-        self.url = url
-        self.common_path_params = common_path_params
-
-    def render(self, path_params=None):
-        """Render the url with path_params."""
-        real_path_params = merge_setting(path_params, self.common_path_params)
-
-        return self.format(self.url, **real_path_params)
+class _UrlTemplate(object):
+    """_UrlTemplate is a compiled url template, the template is parsed only once."""
 
-    def get_field(self, field_name, args, kwargs):
-        """Get the path parameter."""
+    _formatter = string.Formatter()
 
-        # Why should I override `get_field` but not `get_value`?
-        # Because the `get_field` implementation allow to drill down the attributes by `.`.
-        # This feature is unnecessary and unsafe.
-
-        field_name = field_name.strip()
+    def __init__(self, url):
+        # type: (str) -> None
+        self.url = url
+        # [(literal_text, field_name, format_spec, conversion)], field_name is None for the trailing literal text
+        self._parts = []  # type: List[Tuple[str, Optional[str], str, Optional[str]]]
+
+        for literal_text, raw_field_name, format_spec, conversion in self._formatter.parse(url):
+            # Why not drill down the attributes by `.` like `str.format`?
+            # This feature is unnecessary and unsafe, so the whole field name is the parameter name.
+            field_name = raw_field_name.strip() if raw_field_name is not None else None
+            self._parts.append((literal_text, field_name, format_spec or "", conversion))
+
+        self.fields = frozenset(part[1] for part in self._parts if part[1] is not None)
+        # the rendered url of the template without fields, the escaped braces are unescaped
+        self._static_url = "".join(part[0] for part in self._parts) if not self.fields else None
+
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def compile(cls, url):
+        # type: (str) -> _UrlTemplate
+        """Returns the compiled template of the url, the result is cached"""
+        return cls(url)
+
+    def render(
+        self,
+        path_params=None,  # type: Optional[Dict[str, Any]]
+        common_path_params=None,  # type: Optional[Dict[str, Any]]
+    ):
+        # type: (...) -> str
+        """Render the url with path_params, which overrides the common_path_params."""
+        if self._static_url is not None:
+            return self._static_url
+
+        pieces = []
+        for literal_text, field_name, format_spec, conversion in self._parts:
+            pieces.append(literal_text)
+            if field_name is None:
+                continue
+
+            value = self._get_value(field_name, path_params, common_path_params)
+            if conversion:
+                value = self._formatter.convert_field(value, conversion)
+
+            pieces.append(format(value, format_spec))
+
+        return "".join(pieces)
+
+    def _get_value(self, field_name, path_params, common_path_params):
+        # The lookup is equivalent to formatting with `merge_setting(path_params, common_path_params)`,
+        # which drops the parameters set to None when both are given, but does not copy the dicts.
+        merged = path_params is not None and common_path_params is not None
+
+        if path_params is not None and field_name in path_params:
+            value = path_params[field_name]
+        elif common_path_params is not None and field_name in common_path_params:
+            value = common_path_params[field_name]
+        else:
+            value = None
+            merged = True
 
-        if field_name not in kwargs:
+        if value is None and merged:
             raise PathParamsMissing(
                 "url {url} path parameter is required: {field_name}".format(
                     field_name=field_name,
@@ -52,7 +100,20 @@ class _UrlRender(string.Formatter):
                 ),
             )
 
-        return kwargs[field_name], field_name
+        return value
+
+
+class _UrlRender(object):
+    """_UrlRender should format the url by path parameters."""
+
+    def __init__(self, url, common_path_params=None):
+        self.url = url
+        self.common_path_params = common_path_params
+        self._template = _UrlTemplate.compile(url)
+
+    def render(self, path_params=None):
+        """Render the url with path_params."""
+        return self._template.render(path_params, self.common_path_params)
 
 
 _SESSION_HOOKS = {}  # type: Dict[str, List[Any]]
@@ -90,6 +151,12 @@ class Session(RequestSession, RequestHooksMixin):
         super(Session, self).__init__()
         self.path_params = {}  # type: Dict[str, Any]
         self.timeout = None  # type: Optional[float]
+        # when the connection pool is set, the connections are shared with other sessions in the process
+        self.connection_pool = None  # type: Optional[ConnectionPool]
+        # the forked sessions share the adapters of the original session, they should not close them
+        self._owns_adapters = True
+        # the adapters mounted by requests, they are replaced by the connection pool when it is set
+        self._default_adapters = dict(self.adapters)
         self.set_user_agent(self.default_user_agent)
 
         for k, v in kwargs.items():
@@ -102,10 +169,53 @@ class Session(RequestSession, RequestHooksMixin):
         timeout=None,  # type: Optional[float]
         **kwargs,  # type: Any
     ):
-        render = _UrlRender(url, self.path_params)
-        rendered_url = render.render(path_params)
+        rendered_url = _UrlTemplate.compile(url).render(path_params, self.path_params)
         return self.request(url=rendered_url, timeout=timeout or self.timeout, **kwargs)
 
+    def fork(self):
+        """
+        Returns a lightweight session which shares the adapters, connection pool and settings of this session,
+        the headers, params, path_params, proxies, hooks, auth and the mounting of adapters are copied,
+        so that they can be changed independently, and the cookies are not shared.
+        """
+        session = self.__class__.__new__(self.__class__)
+        session.__dict__.update(self.__dict__)
+        session.headers = self.headers.copy()
+        session.params = dict(self.params)
+        session.proxies = dict(self.proxies)
+        session.adapters = OrderedDict(self.adapters)
+        session.path_params = dict(self.path_params)
+        session.hooks = {event: list(hooks) for event, hooks in self.hooks.items()}
+        session.cookies = cookiejar_from_dict({})
+        session._owns_adapters = False
+
+        if isinstance(self.auth, BKApiAuthorization):
+            session.auth = BKApiAuthorization(**self.auth.auth)
+        elif self.auth is not None:
+            session.auth = copy.copy(self.auth)
+
+        return session
+
+    def close(self):
+        if self._owns_adapters:
+            super(Session, self).close()
+
+    def get_adapter(
+        self,
+        url,  # type: str
+    ):
+        if self.connection_pool is None:
+            return super(Session, self).get_adapter(url)
+
+        # the adapters mounted by the user, such as the ones with retries or certificates, take precedence
+        for prefix, adapter in self.adapters.items():
+            if url.lower().startswith(prefix.lower()):
+                if adapter is not self._default_adapters.get(prefix):
+                    return super(Session, self).get_adapter(url)
+                break
+
+        return self.connection_pool.get_adapter(url)
+
     def set_user_agent(
         self,
         user_agent,  # type: str
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import codecs
+import json
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence  # noqa
+
+from requests import Response  # noqa
+from requests.exceptions import StreamConsumedError
+
+from bkapi_client_core.exceptions import JSONResponseError
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+
+
+def is_stream_data(data):
+    # type: (Any) -> bool
+    """Whether the request data should be sent as a streaming body, such as file-like objects and generators"""
+    if isinstance(data, (dict, list, tuple, str, bytes)):
+        return False
+
+    return hasattr(data, "read") or hasattr(data, "__next__")
+
+
+class _JSONItemsReader(object):
+    """
+    _JSONItemsReader decodes the items of a JSON array incrementally,
+    only the current item and the unconsumed chunk are kept in memory.
+    """
+
+    def __init__(
+        self,
+        chunks,  # type: Iterable[bytes]
+        encoding="utf-8",  # type: str
+    ):
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder(encoding)()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def iter_items(
+        self,
+        path=(),  # type: Sequence[str]
+    ):
+        # type: (...) -> Iterator[Any]
+        """
+        Yield the items of the array located by path,
+        e.g. the path of `{"data": {"info": [...]}}` is `("data", "info")`, null is treated as an empty array.
+        """
+        for key in path:
+            if not self._find_key(key):
+                return
+
+        if self._skip_null():
+            return
+
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield self._decode_value()
+
+            if self._expect(",]") == "]":
+                return
+
+    def _find_key(self, key):
+        # type: (str) -> bool
+        if self._skip_null():
+            return False
+
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return False
+
+        while True:
+            name = self._decode_value()
+            self._expect(":")
+            if name == key:
+                return True
+
+            # the values of the other keys are dropped
+            self._decode_value()
+            if self._expect(",}") == "}":
+                return False
+
+    def _skip_null(self):
+        # type: () -> bool
+        if self._peek() != "n":
+            return False
+
+        value = self._decode_value()
+        if value is not None:
+            self._raise_error("Expecting null")
+
+        return True
+
+    def _fill(self):
+        # drop the consumed text, then append the next chunk
+        if self._pos:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+
+        for chunk in self._chunks:
+            text = self._text_decoder.decode(chunk)
+            if text:
+                self._buffer += text
+                return
+
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._eof = True
+
+    def _peek(self):
+        # type: () -> str
+        """Skip the whitespaces, and return the next character, empty string means the end of the document"""
+        while True:
+            buffer = self._buffer
+            length = len(buffer)
+            pos = self._pos
+            while pos < length and buffer[pos] in _WHITESPACE:
+                pos += 1
+
+            self._pos = pos
+            if pos < length:
+                return buffer[pos]
+
+            if self._eof:
+                return ""
+
+            self._fill()
+
+    def _expect(self, chars):
+        # type: (str) -> str
+        char = self._peek()
+        if not char or char not in chars:
+            self._raise_error("Expecting one of %r" % chars)
+
+        self._pos += 1
+        return char
+
+    def _decode_value(self):
+        # type: () -> Any
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+
+                self._fill()
+                continue
+
+            # a value is always followed by a delimiter in a valid document,
+            # otherwise it may be truncated, such as the number `12` of `123`
+            if not self._eof and (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS):
+                self._fill()
+                continue
+
+            self._pos = end
+            return value
+
+    def _raise_error(self, message):
+        raise json.JSONDecodeError(message, self._buffer, self._pos)
+
+
+class StreamingResponse(object):
+    """
+    StreamingResponse reads the body of a response incrementally, the body is never buffered entirely.
+    The body can be consumed only once, and the connection is released after consumed or closed.
+    """
+
+    def __init__(
+        self,
+        response,  # type: Response
+        chunk_size=DEFAULT_CHUNK_SIZE,  # type: int
+        on_close=None,  # type: Optional[Callable[[StreamingResponse], Any]]
+    ):
+        self.response = response
+        self.chunk_size = chunk_size
+        # the size of the decoded body which has been read
+        self.bytes_read = 0
+        self._on_close = on_close
+        self._consumed = False
+        self._closed = False
+
+    @property
+    def status_code(self):
+        # type: () -> int
+        return self.response.status_code
+
+    @property
+    def headers(self):
+        return self.response.headers
+
+    @property
+    def closed(self):
+        # type: () -> bool
+        return self._closed
+
+    def iter_bytes(
+        self,
+        chunk_size=None,  # type: Optional[int]
+    ):
+        # type: (...) -> Iterator[bytes]
+        """Yield the chunks of the body"""
+        if self._consumed:
+            raise StreamConsumedError()
+
+        self._consumed = True
+        try:
+            for chunk in self.response.iter_content(chunk_size or self.chunk_size):
+                self.bytes_read += len(chunk)
+                yield chunk
+        finally:
+            self.close()
+
+    def iter_lines(
+        self,
+        chunk_size=None,  # type: Optional[int]
+    ):
+        # type: (...) -> Iterator[bytes]
+        """Yield the lines of the body, the line breaks are stripped"""
+        pending = bytearray()
+        for chunk in self.iter_bytes(chunk_size):
+            start = 0
+            while True:
+                index = chunk.find(b"\n", start)
+                if index < 0:
+                    pending += chunk[start:]
+                    break
+
+                pending += chunk[start:index]
+                yield bytes(pending.rstrip(b"\r"))
+                del pending[:]
+                start = index + 1
+
+        if pending:
+            yield bytes(pending.rstrip(b"\r"))
+
+    def iter_ndjson(
+        self,
+        chunk_size=None,  # type: Optional[int]
+    ):
+        # type: (...) -> Iterator[Any]
+        """Yield the objects of a newline delimited JSON body, the blank lines are skipped"""
+        for line in self.iter_lines(chunk_size):
+            if not line.strip():
+                continue
+
+            try:
+                yield json.loads(line)
+            except ValueError:
+                self._raise_json_error()
+
+    def iter_json_items(
+        self,
+        path=(),  # type: Sequence[str]
+        chunk_size=None,  # type: Optional[int]
+    ):
+        # type: (...) -> Iterator[Any]
+        """
+        Yield the items of a JSON array in the body incrementally.
+
+        :param path: The keys to locate the array, e.g. `("data", "info")` for `{"data": {"info": [...]}}`,
+            the array is the body itself by default.
+        """
+        reader = _JSONItemsReader(self.iter_bytes(chunk_size), self.response.encoding or "utf-8")
+        try:
+            for item in reader.iter_items(path):
+                yield item
+        except ValueError:
+            self._raise_json_error()
+
+    def close(self):
+        """Release the connection, it is safe to call multiple times"""
+        if self._closed:
+            return
+
+        self._closed = True
+        self.response.close()
+
+        if self._on_close is not None:
+            self._on_close(self)
+
+    def __iter__(self):
+        return self.iter_bytes()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _raise_json_error(self):
+        raise JSONResponseError("The response is not a valid JSON", response=self.response)
@@ -8,7 +8,6 @@
  * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
  * specific language governing permissions and limitations under the License.
 """
-import copy
 import json
 from functools import wraps
 from typing import Callable, Optional, Type, TypeVar  # noqa
@@ -35,22 +34,43 @@ class _SensitiveCleaner:
         self.sensitive_keys = sensitive_keys
 
     def clean(self, data):
-        data = copy.deepcopy(data)
-        self._clean(data)
-        return data
+        """
+        Returns the data with sensitive values masked, the data itself is not modified.
+        Only the containers on the paths to sensitive values are copied,
+        the rest parts are shared with the data, so do not modify the result.
+        """
+        return self._clean(data)
 
     def _clean(self, data):
         if isinstance(data, dict):
+            cleaned = None
             for key, value in data.items():
                 if isinstance(value, (dict, list)):
-                    self._clean(value)
-
+                    cleaned_value = self._clean(value)
                 elif key in self.sensitive_keys and value:
-                    data[key] = "***"
+                    cleaned_value = "***"
+                else:
+                    continue
+
+                if cleaned_value is not value:
+                    if cleaned is None:
+                        cleaned = data.copy()
+                    cleaned[key] = cleaned_value
+
+            return data if cleaned is None else cleaned
 
-        elif isinstance(data, list):
-            for item in data:
-                self._clean(item)
+        if isinstance(data, list):
+            cleaned = None
+            for index, item in enumerate(data):
+                cleaned_item = self._clean(item)
+                if cleaned_item is not item:
+                    if cleaned is None:
+                        cleaned = list(data)
+                    cleaned[index] = cleaned_item
+
+            return data if cleaned is None else cleaned
+
+        return data
 
 
 class _WrappedRequest:
@@ -66,10 +86,10 @@ class _WrappedRequest:
         return getattr(self._request, name)
 
     def _get_headers_without_sensitive(self, headers):
-        headers = copy.deepcopy(headers)
-
         authorization = headers.get(self.header_bkapi_authorization)
         if authorization:
+            # the header values are strings, a shallow copy is enough
+            headers = headers.copy()
             sensitive_cleaner = _SensitiveCleaner(
                 ["bk_app_secret", "app_secret", "bk_token", "bk_ticket", "access_token"]
             )
@@ -79,22 +99,42 @@ class _WrappedRequest:
 
 
 class CurlRequest:
+    """
+    CurlRequest renders the request as a curl command lazily,
+    it is cheap to pass as a logging argument, the command is rendered only when the record is emitted.
+    """
+
     def __init__(
         self,
         request,  # type: Optional[requests.PreparedRequest]
     ):
         self.request = request
+        self._curl = None  # type: Optional[str]
 
     def to_curl(self):
+        # type: () -> str
+        # the record may be formatted by multiple handlers, render only once
+        if self._curl is None:
+            self._curl = self._render()
+
+        return self._curl
+
+    def _render(self):
         # type: () -> str
         if self.request is None:
             return ""
 
+        if self.request.body is not None and not isinstance(self.request.body, (str, bytes)):
+            # the streaming body can be read only once, it should not be consumed by the logging
+            copied_request = self.request.copy()
+            copied_request.body = "<streaming body>"
+            return curlify.to_curl(_WrappedRequest(copied_request))
+
         try:
             # if request.body contains binary content, it may not be decoded
             return curlify.to_curl(_WrappedRequest(self.request))
         except UnicodeDecodeError:
-            copied_request = copy.deepcopy(self.request)
+            copied_request = self.request.copy()
             copied_request.body = ""
             return curlify.to_curl(_WrappedRequest(copied_request))
         except Exception:
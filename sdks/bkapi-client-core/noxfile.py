@@ -80,6 +80,7 @@ def tests(session):
         "Faker",
         "django",
         "prometheus-client",
+        "httpx",
     )
 
     for version in REQUESTS_VERSIONS:
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+from requests.exceptions import ConnectionError, ReadTimeout
+
+from bkapi_client_core.aio import AsyncAPIGatewayClient, AsyncBaseClient, AsyncESBClient, AsyncSession
+from bkapi_client_core.base import Operation, OperationGroup
+from bkapi_client_core.config import HookEvent
+from bkapi_client_core.exceptions import HTTPResponseError, PathParamsMissing
+from bkapi_client_core.property import bind_property
+from bkapi_client_core.session import deregister_global_hook, register_global_hook
+
+
+class Group(OperationGroup):
+    get_color = bind_property(Operation, name="get_color", method="GET", path="/colors/{color}/")
+    create_color = bind_property(Operation, name="create_color", method="POST", path="/colors/")
+
+
+class Client(AsyncBaseClient):
+    api = bind_property(Group, name="api")
+
+
+@pytest.fixture()
+def requests_history():
+    return []
+
+
+@pytest.fixture()
+def transport(requests_history):
+    def handler(request):
+        requests_history.append(request)
+        if request.url.path == "/colors/black/":
+            return httpx.Response(404, json={"result": False})
+
+        if request.url.path == "/colors/timeout/":
+            raise httpx.ReadTimeout("timeout", request=request)
+
+        if request.url.path == "/colors/refused/":
+            raise httpx.ConnectError("refused", request=request)
+
+        return httpx.Response(
+            200,
+            json={"path": request.url.path, "query": dict(request.url.params)},
+            headers={"X-Bkapi-Request-Id": "1234"},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture()
+def client(transport):
+    return Client(endpoint="http://example.com", session=AsyncSession(transport_options={"transport": transport}))
+
+
+class TestAsyncClient:
+    def test_call(self, client, requests_history):
+        result = asyncio.run(client.api.get_color({"x": 1}, path_params={"color": "red"}))
+
+        assert result == {"path": "/colors/red/", "query": {"x": "1"}}
+        assert requests_history[0].headers["User-Agent"] == client.session.default_user_agent
+
+    def test_request(self, client):
+        response = asyncio.run(client.api.create_color.request({"color": "green"}))
+
+        assert response.status_code == 200
+        assert response.headers["X-Bkapi-Request-Id"] == "1234"
+        assert json.loads(response.request.body) == {"color": "green"}
+
+    def test_concurrent(self, client, requests_history):
+        async def main():
+            async with client:
+                return await asyncio.gather(
+                    *[client.api.get_color(path_params={"color": color}) for color in ["red", "green", "blue"]]
+                )
+
+        results = asyncio.run(main())
+
+        assert [result["path"] for result in results] == ["/colors/red/", "/colors/green/", "/colors/blue/"]
+        assert len(requests_history) == 3
+
+    def test_authorization(self, client, requests_history):
+        client.update_bkapi_authorization(bk_app_code="test", bk_app_secret="secret")
+        asyncio.run(client.api.get_color(path_params={"color": "red"}))
+
+        assert json.loads(requests_history[0].headers["X-Bkapi-Authorization"]) == {
+            "bk_app_code": "test",
+            "bk_app_secret": "secret",
+        }
+
+    def test_hooks(self, mocker, client):
+        operation_prepared_hook = mocker.MagicMock(side_effect=lambda context, operation: context)
+        response_hook = mocker.MagicMock(side_effect=lambda response, **kwargs: response)
+        register_global_hook(HookEvent.OPERATION_PREPARED, operation_prepared_hook)
+        client.session.register_hook(HookEvent.RESPONSE, response_hook)
+
+        try:
+            asyncio.run(client.api.get_color(path_params={"color": "red"}))
+        finally:
+            deregister_global_hook(HookEvent.OPERATION_PREPARED, operation_prepared_hook)
+
+        operation_prepared_hook.assert_called_once_with(mocker.ANY, operation=client.api.get_color)
+        assert response_hook.call_args[0][0].status_code == 200
+
+    def test_stream(self, client):
+        async def main():
+            async with client:
+                return await client.api.get_color.stream(path_params={"color": "red"})
+
+        stream = asyncio.run(main())
+
+        assert b"".join(stream.iter_bytes(chunk_size=4)) == b'{"path":"/colors/red/","query":{}}'
+        assert stream.closed
+
+    def test_batch(self, mocker, client, requests_history):
+        batch_hook = mocker.MagicMock(return_value=None)
+        client.session.register_hook(HookEvent.OPERATION_BATCH_FINISHED, batch_hook)
+
+        result = asyncio.run(
+            client.api.get_color.batch(
+                [{"path_params": {"color": color}} for color in ["red", "black", "green"]],
+                max_workers=2,
+                rate_limit=100,
+            )
+        )
+
+        assert [item.ok for item in result] == [True, False, True]
+        assert result[2].result["path"] == "/colors/green/"
+        assert isinstance(result.errors[1], HTTPResponseError)
+        assert len(requests_history) == 3
+        batch_hook.assert_called_once_with(result, operation=client.api.get_color)
+
+    def test_http_error(self, client):
+        with pytest.raises(HTTPResponseError):
+            asyncio.run(client.api.get_color(path_params={"color": "black"}))
+
+    @pytest.mark.parametrize(
+        ("color", "exception_class"),
+        [
+            ("timeout", ReadTimeout),
+            ("refused", ConnectionError),
+        ],
+    )
+    def test_transport_error(self, mocker, client, color, exception_class):
+        error_hook = mocker.MagicMock()
+        client.session.register_hook(HookEvent.OPERATION_ERROR, error_hook)
+
+        with pytest.raises(exception_class):
+            asyncio.run(client.api.get_color(path_params={"color": color}))
+
+        assert isinstance(error_hook.call_args[0][0], exception_class)
+
+    def test_path_params_missing(self, client):
+        with pytest.raises(PathParamsMissing):
+            asyncio.run(client.api.get_color())
+
+
+    def test_fork_across_event_loops(self, client):
+        async def call():
+            forked = client.fork()
+            async with forked:
+                return await forked.api.get_color(path_params={"color": "red"})
+
+        for _ in range(2):
+            assert asyncio.run(call()) == {"path": "/colors/red/", "query": {}}
+
+        assert not client.session._transports
+
+
+class TestAsyncGatewayClients:
+    def test_apigateway_client(self, transport, requests_history):
+        class GatewayClient(AsyncAPIGatewayClient):
+            _gateway_name = "demo"
+            api = bind_property(Group, name="api")
+
+        client = GatewayClient(
+            endpoint="http://{gateway_name}.example.com",
+            session=AsyncSession(transport_options={"transport": transport}),
+        )
+        result = asyncio.run(client.api.create_color())
+
+        assert result["path"] == "/prod/colors/"
+        assert requests_history[0].url.host == "demo.example.com"
+
+    def test_esb_client(self, transport, requests_history):
+        client = AsyncESBClient(
+            endpoint="http://example.com",
+            session=AsyncSession(transport_options={"transport": transport}),
+            bk_api_ver="v2",
+        )
+        operation = Operation(name="test", manager=client, method="GET", path="/api/c/compapi{bk_api_ver}/test/")
+        asyncio.run(operation())
+
+        assert requests_history[0].url.path == "/api/c/compapi/v2/test/"
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import asyncio
+import io
+import ssl
+
+import httpx
+import pytest
+from requests.exceptions import ConnectionError, SSLError
+
+from bkapi_client_core.aio.session import AsyncSession
+
+
+class TestAsyncSession:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.requests_history = []
+
+        def handler(request):
+            self.requests_history.append(request)
+            return httpx.Response(
+                200,
+                json={"ok": True},
+                headers={"Content-Type": "application/json; charset=utf-8", "Set-Cookie": "bk_token=abc; Path=/"},
+            )
+
+        self.session = AsyncSession(transport_options={"transport": httpx.MockTransport(handler)})
+
+    def test_handle(self):
+        response = asyncio.run(
+            self.session.handle(
+                "http://example.com/{color}/",
+                method="GET",
+                path_params={"color": "red"},
+                params={"x": "1"},
+                headers={"X-Testing": "1"},
+            )
+        )
+
+        assert response.json() == {"ok": True}
+        assert response.encoding == "utf-8"
+        assert response.url == "http://example.com/red/?x=1"
+
+        request = self.requests_history[0]
+        assert request.headers["X-Testing"] == "1"
+        assert request.headers["User-Agent"] == self.session.default_user_agent
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            lambda: iter([b"red,", "green,", b"", b"blue"]),
+            lambda: io.BytesIO(b"red,green,blue"),
+        ],
+    )
+    def test_handle_stream_data(self, data):
+        response = asyncio.run(self.session.handle("http://example.com/", method="POST", data=data()))
+
+        assert response.json() == {"ok": True}
+        assert self.requests_history[0].content == b"red,green,blue"
+
+    def test_cookies(self):
+        asyncio.run(self.session.handle("http://example.com/", method="GET"))
+        assert self.session.cookies.get("bk_token") == "abc"
+
+    def test_transport_reused(self):
+        async def main():
+            await self.session.handle("http://example.com/", method="GET", verify=False)
+            await self.session.handle("http://example.com/", method="GET", verify=False)
+            await self.session.handle("http://example.com/", method="GET", verify=True)
+            return len(self.session._transports)
+
+        assert asyncio.run(main()) == 2
+
+    def test_reused_across_event_loops(self):
+        for _ in range(2):
+            response = asyncio.run(self.session.handle("http://example.com/", method="GET"))
+            assert response.json() == {"ok": True}
+
+        # the client of the closed event loop is dropped
+        assert len(self.session._transports) == 1
+
+    @pytest.mark.parametrize(
+        ("timeout", "expected"),
+        [
+            (None, httpx.Timeout(None)),
+            (3, httpx.Timeout(3)),
+            ((1, 5), httpx.Timeout(None, connect=1, read=5)),
+        ],
+    )
+    def test_to_httpx_timeout(self, timeout, expected):
+        assert self.session._to_httpx_timeout(timeout) == expected
+
+    def test_aclose(self):
+        async def main():
+            await self.session.handle("http://example.com/", method="GET")
+            transport = list(self.session._transports.values())[0]
+            await self.session.aclose()
+            return transport
+
+        transport = asyncio.run(main())
+        assert transport.is_closed
+        assert not self.session._transports
+
+    def test_to_request_exception(self):
+        err = httpx.ConnectError("connect failed")
+        err.__cause__ = ssl.SSLError("certificate verify failed")
+        assert isinstance(self.session._to_request_exception(err, None), SSLError)
+
+        err = httpx.ConnectError("SSL in the message, but refused")
+        exception = self.session._to_request_exception(err, None)
+        assert isinstance(exception, ConnectionError)
+        assert not isinstance(exception, SSLError)
@@ -58,6 +58,17 @@ class TestAPIGatewayClient:
         client = APIGatewayClient(endpoint=endpoint, stage=stage)
         assert client._get_endpoint() == expected
 
+    def test_get_endpoint_cached(self):
+        client = APIGatewayClient(endpoint="http://{api_name}.example.com", stage="test")
+        client._gateway_name = "demo"
+
+        endpoint = client._get_endpoint()
+        assert endpoint == "http://demo.example.com/test"
+        assert client._get_endpoint() is endpoint
+
+        client._stage = "prod"
+        assert client._get_endpoint() == "http://demo.example.com/prod"
+
     @pytest.mark.parametrize(
         ("stage", "mappings", "expected"),
         [
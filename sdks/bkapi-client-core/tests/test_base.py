@@ -157,3 +157,57 @@ class TestOperationGroup:
     def test_non_registered_operation(self):
         with pytest.raises(AttributeError):
             _ = self.group.test
+
+
+class TestOperationTable:
+    class Group(OperationGroup):
+        _operation_table = (
+            ("get_color", "GET", "/colors/{color}/"),
+            ("create_color", "POST", "/colors/"),
+        )
+
+    class SubGroup(Group):
+        _operation_table = (("delete_color", "DELETE", "/colors/{color}/"),)
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, mocker, faker):
+        self.manager = mocker.MagicMock()
+        self.group = self.SubGroup(name="api", manager=self.manager)
+
+    def test_lazy_operation(self):
+        assert "get_color" not in self.group.__dict__
+
+        operation = self.group.get_color
+        assert isinstance(operation, Operation)
+        assert operation.name == "get_color"
+        assert operation.method == "GET"
+        assert operation.path == "/colors/{color}/"
+        assert operation._manager is self.group
+        assert self.group.__dict__["get_color"] is operation
+        assert self.group.get_color is operation
+
+    def test_inherited(self):
+        assert self.group.delete_color.method == "DELETE"
+        assert self.group.create_color.method == "POST"
+
+        with pytest.raises(AttributeError):
+            _ = self.Group().delete_color
+
+    def test_not_declared(self):
+        with pytest.raises(AttributeError):
+            _ = self.group.update_color
+
+    def test_register_declared(self):
+        with pytest.raises(ValueError, match="already registered"):
+            self.group.register("get_color", Operation())
+
+    def test_dir(self):
+        assert {"get_color", "create_color", "delete_color"} <= set(dir(self.group))
+
+    def test_call(self):
+        client = self.manager.get_client.return_value
+
+        assert self.group.get_color(path_params={"color": "red"}) is client.parse_response.return_value
+        operation, context = client.handle_request.call_args[0]
+        assert operation is self.group.get_color
+        assert context["path_params"] == {"color": "red"}
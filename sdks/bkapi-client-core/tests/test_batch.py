@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import threading
+import time
+
+import pytest
+
+from bkapi_client_core import batch
+from bkapi_client_core.batch import BatchItemResult, BatchResult, RateLimiter, execute_batch
+
+
+class TestBatchResult:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.error = ValueError("testing")
+        self.result = BatchResult(
+            [BatchItemResult(0, result="a"), BatchItemResult(1, error=self.error), BatchItemResult(2, result="c")],
+            elapsed=1.0,
+        )
+
+    def test_summary(self):
+        assert len(self.result) == 3
+        assert self.result.succeeded == 2
+        assert self.result.failed == 1
+        assert self.result.results == ["a", None, "c"]
+        assert self.result.errors == {1: self.error}
+        assert [item.ok for item in self.result] == [True, False, True]
+        assert self.result[2].result == "c"
+
+    def test_raise_for_errors(self):
+        with pytest.raises(ValueError, match="testing"):
+            self.result.raise_for_errors()
+
+        BatchResult([BatchItemResult(0, result="a")], elapsed=0).raise_for_errors()
+
+
+class TestRateLimiter:
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            RateLimiter(0)
+
+    def test_reserve(self, mocker):
+        mocker.patch.object(batch.time, "monotonic", return_value=100.0)
+        limiter = RateLimiter(4)
+
+        assert [limiter.reserve() for _ in range(3)] == [0, 0.25, 0.5]
+
+
+class TestExecuteBatch:
+    def test_ordered(self):
+        def func(value):
+            time.sleep(0.01 * (5 - value))
+            return value * 2
+
+        result = execute_batch(func, list(range(5)), max_workers=5)
+        assert result.results == [0, 2, 4, 6, 8]
+        assert result.elapsed < 0.15
+
+    def test_errors(self):
+        def func(value):
+            if value % 2:
+                raise ValueError(value)
+            return value
+
+        result = execute_batch(func, list(range(4)))
+        assert result.results == [0, None, 2, None]
+        assert sorted(result.errors) == [1, 3]
+
+    def test_bounded_concurrency(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def func(value):
+            with lock:
+                running.append(value)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(value)
+
+        execute_batch(func, list(range(12)), max_workers=3)
+        assert max(peak) <= 3
+
+    def test_empty(self):
+        result = execute_batch(lambda x: x, [])
+        assert len(result) == 0
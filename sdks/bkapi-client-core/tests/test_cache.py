@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import threading
+import time
+
+import pytest
+from requests import Response
+
+from bkapi_client_core.base import Operation, OperationGroup
+from bkapi_client_core.cache import (
+    CacheEntry,
+    CacheResult,
+    DjangoCacheBackend,
+    LRUCacheBackend,
+    ResponseCache,
+)
+from bkapi_client_core.client import BaseClient
+from bkapi_client_core.config import HookEvent
+from bkapi_client_core.exceptions import HTTPResponseError
+from bkapi_client_core.property import bind_property
+
+
+def make_response(content=b'{"result": true}', status_code=200, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+class Group(OperationGroup):
+    get_user = bind_property(Operation, name="get_user", method="GET", path="/users/{username}/")
+    search_business = bind_property(Operation, name="search_business", method="POST", path="/search_business/")
+    create_user = bind_property(Operation, name="create_user", method="POST", path="/users/")
+
+
+class Client(BaseClient):
+    api = bind_property(Group, name="api")
+
+
+class TestCacheEntry:
+    def test_response(self):
+        entry = CacheEntry.from_response(make_response(headers={"X-Test": "1"}), ttl=10)
+        response = entry.to_response()
+
+        assert response.json() == {"result": True}
+        assert response.headers["x-test"] == "1"
+        assert entry.to_response() is not response
+
+    def test_fresh(self):
+        entry = CacheEntry({}, ttl=10, stale_ttl=5, created_at=100)
+
+        assert entry.is_fresh(109)
+        assert not entry.is_fresh(110)
+        assert entry.is_usable(114)
+        assert not entry.is_usable(115)
+
+
+class TestLRUCacheBackend:
+    def test_lru(self):
+        backend = LRUCacheBackend(maxsize=2)
+        backend.set("a", 1, 10)
+        backend.set("b", 2, 10)
+        assert backend.get("a") == 1
+
+        backend.set("c", 3, 10)
+        assert backend.get("b") is None
+        assert backend.get("a") == 1
+        assert len(backend) == 2
+
+        backend.delete("a")
+        assert backend.get("a") is None
+
+    def test_timeout(self, mocker):
+        mocker.patch("bkapi_client_core.cache.time.time", return_value=100)
+        backend = LRUCacheBackend()
+        backend.set("a", 1, 10)
+
+        mocker.patch("bkapi_client_core.cache.time.time", return_value=110)
+        assert backend.get("a") is None
+        assert len(backend) == 0
+
+
+class TestDjangoCacheBackend:
+    def test_backend(self):
+        backend = DjangoCacheBackend()
+        entry = CacheEntry.from_response(make_response(), ttl=10)
+
+        backend.set("bkapi:test", entry, 10)
+        assert backend.get("bkapi:test").to_response().json() == {"result": True}
+
+        backend.delete("bkapi:test")
+        assert backend.get("bkapi:test") is None
+
+
+class TestResponseCache:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.cache = ResponseCache(ttl=10, stale_ttl=5)
+        self.results = []
+
+    def test_get_ttl(self):
+        cache = ResponseCache(ttl=10, operations={"api.get_user": 30, "client.api.search_business": None})
+        client = Client("http://example.com")
+
+        assert cache.get_ttl(client.api.get_user) == 30
+        assert cache.get_ttl(client.api.search_business) == 10
+        assert cache.get_ttl(client.api.create_user) is None
+
+        cache = ResponseCache(operations=["get_user"])
+        assert cache.get_ttl(client.api.get_user) == 60
+
+    def test_make_key(self):
+        client = Client("http://example.com")
+        operation = client.api.get_user
+        context = {"url": "http://example.com/users/{username}/", "method": "GET", "path_params": {"username": "a"}}
+
+        key = self.cache.make_key(operation, context, client.session)
+        assert key.startswith("bkapi:response:client.api.get_user:")
+        assert self.cache.make_key(operation, dict(context), client.session) == key
+        assert self.cache.make_key(operation, dict(context, path_params={"username": "b"}), client.session) != key
+        assert self.cache.make_key(operation, dict(context, params={"x": 1}), client.session) != key
+
+        client.update_bkapi_authorization(bk_username="admin")
+        key = self.cache.make_key(operation, context, client.session)
+        assert key != self.cache.make_key(operation, dict(context, cookies={"bk_token": "a"}), client.session)
+
+        client.session.cookies.set("bk_token", "a")
+        assert self.cache.make_key(operation, context, client.session) != key
+
+    def test_fetch(self, mocker):
+        request = mocker.MagicMock(side_effect=lambda: make_response())
+        mock_time = mocker.patch("bkapi_client_core.cache.time.time", return_value=100)
+
+        assert self.cache.fetch("key", 10, request, self.results.append).json() == {"result": True}
+        assert self.cache.fetch("key", 10, request, self.results.append).json() == {"result": True}
+        assert request.call_count == 1
+
+        mock_time.return_value = 120
+        self.cache.fetch("key", 10, request, self.results.append)
+        assert request.call_count == 2
+
+        assert self.results == [CacheResult.MISS, CacheResult.HIT, CacheResult.EXPIRED]
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            None,
+            make_response(status_code=500),
+            make_response(headers={"X-Bkapi-Error-Code": "1640001"}),
+        ],
+    )
+    def test_fetch_not_cacheable(self, mocker, response):
+        request = mocker.MagicMock(return_value=response)
+
+        assert self.cache.fetch("key", 10, request) is response
+        assert self.cache.fetch("key", 10, request) is response
+        assert request.call_count == 2
+
+    def test_stale_while_revalidate(self, mocker):
+        contents = iter([b'{"version": 1}', b'{"version": 2}'])
+        refreshed = threading.Event()
+
+        def request():
+            response = make_response(next(contents))
+            refreshed.set()
+            return response
+
+        mock_time = mocker.patch("bkapi_client_core.cache.time.time", return_value=100)
+        assert self.cache.fetch("key", 10, request).json() == {"version": 1}
+
+        mock_time.return_value = 112
+        refreshed.clear()
+        assert self.cache.fetch("key", 10, request, self.results.append).json() == {"version": 1}
+        assert refreshed.wait(5)
+
+        for _ in range(100):
+            if not self.cache._inflight:
+                break
+            time.sleep(0.01)
+
+        assert self.cache.fetch("key", 10, request, self.results.append).json() == {"version": 2}
+        assert self.results == [CacheResult.STALE, CacheResult.HIT]
+
+    def test_coalescing(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def request():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return make_response()
+
+        results = []
+
+        def fetch():
+            results.append(self.cache.fetch("key", 10, request, self.results.append))
+
+        leader = threading.Thread(target=fetch)
+        leader.start()
+        assert started.wait(5)
+
+        followers = [threading.Thread(target=fetch) for _ in range(3)]
+        for thread in followers:
+            thread.start()
+
+        for _ in range(100):
+            if self.results.count(CacheResult.MISS) == 4:
+                break
+            time.sleep(0.01)
+
+        release.set()
+        for thread in [leader] + followers:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert len(results) == 4
+        assert self.results.count(CacheResult.COALESCED) == 3
+        # every waiter gets its own response
+        assert len({id(response) for response in results}) == 4
+        assert all(response.json() == results[0].json() for response in results)
+
+    def test_coalescing_error(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def request():
+            started.set()
+            release.wait(5)
+            raise ValueError("error")
+
+        errors = []
+
+        def fetch():
+            try:
+                self.cache.fetch("key", 10, request)
+            except ValueError as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=fetch) for _ in range(3)]
+        threads[0].start()
+        assert started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(errors) == 3
+        assert not self.cache._inflight
+
+
+class TestClientResponseCache:
+    @pytest.fixture(autouse=True)
+    def _setup(self, requests_mock):
+        self.client = Client("http://example.com")
+        self.cache = ResponseCache(operations=["api.get_user", "api.search_business"])
+        self.client.enable_response_cache(self.cache)
+
+        requests_mock.get("http://example.com/users/admin/", json={"username": "admin"})
+        requests_mock.get("http://example.com/users/guest/", status_code=404)
+        requests_mock.post("http://example.com/search_business/", json={"count": 1})
+        requests_mock.post("http://example.com/users/", json={"result": True})
+        self.requests_mock = requests_mock
+
+    def test_cached(self, mocker):
+        cache_hook = mocker.MagicMock(side_effect=lambda result, operation: result)
+        self.client.session.register_hook(HookEvent.OPERATION_CACHE_LOOKUP, cache_hook)
+
+        assert self.client.api.get_user(path_params={"username": "admin"}) == {"username": "admin"}
+        assert self.client.api.get_user(path_params={"username": "admin"}) == {"username": "admin"}
+        assert self.client.api.search_business({"bk_biz_id": 1}) == {"count": 1}
+        assert self.client.api.search_business({"bk_biz_id": 1}) == {"count": 1}
+        assert self.client.api.search_business({"bk_biz_id": 2}) == {"count": 1}
+        assert self.requests_mock.call_count == 3
+
+        assert [call[0][0] for call in cache_hook.call_args_list] == ["miss", "hit", "miss", "hit", "miss"]
+        cache_hook.assert_any_call("hit", operation=self.client.api.get_user)
+
+    def test_key_after_hooks(self):
+        tenants = iter(["tenant-a", "tenant-b", "tenant-a"])
+
+        def inject_tenant(context, operation):
+            context["headers"] = dict(context.get("headers") or {}, **{"X-Bk-Tenant-Id": next(tenants)})
+            return context
+
+        self.client.session.register_hook(HookEvent.OPERATION_PREPARED, inject_tenant)
+        for _ in range(3):
+            self.client.api.get_user(path_params={"username": "admin"})
+
+        assert self.requests_mock.call_count == 2
+
+    def test_not_cached(self):
+        self.client.api.create_user({"username": "admin"})
+        self.client.api.create_user({"username": "admin"})
+
+        for _ in range(2):
+            with pytest.raises(HTTPResponseError):
+                self.client.api.get_user(path_params={"username": "guest"})
+
+        with self.client.api.get_user.stream(path_params={"username": "admin"}) as stream:
+            assert b"".join(stream.iter_bytes()) == b'{"username": "admin"}'
+
+        assert self.requests_mock.call_count == 5
+
+    def test_disable(self):
+        self.client.api.get_user(path_params={"username": "admin"})
+        self.client.disable_response_cache()
+        self.client.api.get_user(path_params={"username": "admin"})
+
+        assert self.requests_mock.call_count == 2
@@ -8,6 +8,8 @@
  * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
  * specific language governing permissions and limitations under the License.
 """
+import io
+
 import pytest
 from requests.exceptions import RequestException
 
@@ -15,6 +17,7 @@ from bkapi_client_core.base import Operation, OperationGroup
 from bkapi_client_core.client import BaseClient, RequestContextBuilder, ResponseHeadersRepresenter
 from bkapi_client_core.config import HookEvent
 from bkapi_client_core.exceptions import APIGatewayResponseError, EndpointNotSetError, ResponseError
+from bkapi_client_core.pool import ConnectionPool
 from bkapi_client_core.property import bind_property
 from bkapi_client_core.session import Session
 
@@ -149,6 +152,14 @@ class TestRequestContextBuilder:
         assert context.get("params") == excepted_params
         assert context.get("json") == excepted_json
 
+    @pytest.mark.parametrize("method", ["GET", "POST", "PUT"])
+    def test_build_data_stream(self, method):
+        data = io.BytesIO(b"content")
+        context = {"params": {"y": 2}, "method": method}
+        self.builder.build_data(context, data)
+
+        assert context == {"params": {"y": 2}, "method": method, "data": data}
+
     @pytest.mark.parametrize(
         ("input", "output"),
         [
@@ -283,6 +294,24 @@ class TestBaseClient:
         assert client._reuse_session_connection is False
         mock_close.assert_called_once_with()
 
+    def test_connection_pool(self, mocker, faker, requests_mock):
+        url = faker.url()
+        requests_mock.get(url, json={"result": True})
+
+        client = BaseClient(url)
+        mock_close = mocker.patch.object(client, "close", return_value=None)
+        pool = ConnectionPool()
+
+        client.enable_connection_pool(pool)
+        assert client.session.connection_pool is pool
+
+        client.handle_request(url, {"method": "GET"})
+        mock_close.assert_not_called()
+
+        client.disable_connection_pool()
+        client.handle_request(url, {"method": "GET"})
+        mock_close.assert_called_once_with()
+
     @pytest.mark.parametrize(
         ("endpoint", "operation_path", "excepted_url"),
         [
@@ -314,6 +343,60 @@ class TestBaseClient:
         assert client.api.echo() == result
         assert str(client.api.echo) == "client.api.echo"
 
+    def test_batch(self, mocker, requests_mock):
+        class Group(OperationGroup):
+            echo = bind_property(Operation, method="GET", path="/echo/{color}/", name="echo")
+
+        class Client(BaseClient):
+            api = bind_property(Group, name="api")
+
+        requests_mock.get("http://example.com/echo/red/", json={"color": "red"})
+        requests_mock.get("http://example.com/echo/green/", json={"color": "green"})
+        requests_mock.get("http://example.com/echo/black/", status_code=500)
+
+        client = Client("http://example.com")
+        mock_close = mocker.patch.object(client, "close", return_value=None)
+        batch_hook = mocker.MagicMock(return_value=None)
+        client.session.register_hook(HookEvent.OPERATION_BATCH_FINISHED, batch_hook)
+
+        result = client.api.echo.batch(
+            [{"path_params": {"color": color}} for color in ["red", "black", "green"]],
+            max_workers=2,
+        )
+
+        assert result.results == [{"color": "red"}, None, {"color": "green"}]
+        assert isinstance(result.errors[1], ResponseError)
+        mock_close.assert_called_once_with()
+        batch_hook.assert_called_once_with(result, operation=client.api.echo)
+        # the batch does not change the state of the client, which may be used by other threads
+        assert "_reuse_session_connection" not in client.__dict__
+
+        responses = client.api.echo.batch([{"path_params": {"color": "red"}}], parse_response=False, rate_limit=10)
+        assert responses[0].result.status_code == 200
+
+    @pytest.mark.parametrize(
+        ("debug_enabled", "sample_rate", "random_value", "logged"),
+        [
+            (False, 1.0, 0, False),
+            (True, 1.0, 0.99, True),
+            (True, "0.1", 0.05, True),
+            (True, 0.1, 0.5, False),
+            (True, 0, 0, False),
+        ],
+    )
+    def test_handle_response_logging(self, mocker, debug_enabled, sample_rate, random_value, logged):
+        mock_logger = mocker.patch("bkapi_client_core.client.logger")
+        mock_logger.isEnabledFor.return_value = debug_enabled
+        mocker.patch("bkapi_client_core.client.random.random", return_value=random_value)
+        mock_curl_request = mocker.patch("bkapi_client_core.client.CurlRequest")
+        self.client.set_success_log_sample_rate(sample_rate)
+
+        response = mocker.MagicMock()
+        assert self.client._handle_response(mocker.MagicMock(), {}, response) is response
+
+        assert mock_logger.debug.called is logged
+        assert mock_curl_request.called is logged
+
     def test_handle(self, mocker, faker):
         session = Session()
         mock_handle = mocker.patch.object(session, "handle")
@@ -346,6 +429,18 @@ class TestBaseClient:
         client.handle_request(operation, context)
         session.handle.assert_called_once_with(url="http://example.com/hooked")
 
+    def test_handle_responded_hook(self, mocker):
+        session = Session()
+        mock_handle = mocker.patch.object(session, "handle")
+        hook = mocker.MagicMock(return_value=None)
+        session.register_hook(HookEvent.OPERATION_RESPONDED, hook)
+
+        client = BaseClient(endpoint="http://example.com", session=session)
+        operation = mocker.MagicMock()
+
+        assert client.handle_request(operation, {"path": "test"}) is mock_handle.return_value
+        hook.assert_called_once_with(mock_handle.return_value, operation=operation)
+
     def test_handle_error(self, mocker, faker):
         session = mocker.MagicMock()
         client = BaseClient(session=session, endpoint=faker.url())
@@ -499,3 +594,33 @@ class TestBaseClient:
                 mocker.MagicMock(),
                 response and mocker.MagicMock(**response),
             )
+
+    def test_fork(self, mocker, faker, requests_mock):
+        class Group(OperationGroup):
+            echo = bind_property(Operation, method="GET", path="/echo/", name="echo")
+
+        class Client(BaseClient):
+            api = bind_property(Group, name="api")
+
+        url = faker.url()
+        requests_mock.get(url.rstrip("/") + "/echo/", json={"result": True})
+
+        client = Client(endpoint=url, session=Session(connection_pool=ConnectionPool()))
+        client.update_bkapi_authorization(bk_app_code="test")
+        client.session.headers["X-Testing"] = "1"
+        assert client.api._get_client() is client
+
+        forked = client.fork()
+        forked.update_bkapi_authorization(bk_username="admin")
+        forked.session.headers["X-Testing"] = "2"
+
+        assert forked.api._get_client() is forked
+        assert forked.session.connection_pool is client.session.connection_pool
+        assert client.session.auth.auth == {"bk_app_code": "test"}
+        assert forked.session.auth.auth == {"bk_app_code": "test", "bk_username": "admin"}
+        assert client.session.headers["X-Testing"] == "1"
+        assert forked.api.echo() == {"result": True}
+
+        mock_close = mocker.patch("requests.adapters.HTTPAdapter.close")
+        forked.close()
+        mock_close.assert_not_called()
@@ -8,6 +8,8 @@
  * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
  * specific language governing permissions and limitations under the License.
 """
+import datetime
+
 import pytest
 
 from bkapi_client_core import django_helper
@@ -190,3 +192,125 @@ def test_get_client_by_username_with_verify(verify, core_settings, client_cls, d
         client.disable_ssl_verify.assert_not_called()
     else:
         client.disable_ssl_verify.assert_called_once_with()
+
+
+class TestClientFactory:
+    def test_get_client(self, mocker):
+        factory = django_helper.ClientFactory()
+        create = mocker.MagicMock()
+
+        client = factory.get_client("key", create)
+        assert client is create.return_value.fork.return_value
+        factory.get_client("key", create)
+        create.assert_called_once_with()
+
+        factory.clear()
+        factory.get_client("key", create)
+        assert create.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("reuse_client", "kwargs", "create_count"),
+    [
+        (False, {"endpoint": "http://example.com"}, 2),
+        (True, {"endpoint": "http://example.com"}, 1),
+        (True, {"endpoint": ["unhashable"]}, 2),
+    ],
+)
+def test_get_client_by_settings_reuse_client(mocker, core_settings, reuse_client, kwargs, create_count):
+    core_settings.set(SettingKeys.BK_API_CLIENT_REUSE_CLIENT, reuse_client)
+    mocker.patch.object(django_helper, "client_factory", django_helper.ClientFactory())
+    mock_create = mocker.patch.object(django_helper, "_create_client_by_settings")
+
+    for _ in range(2):
+        django_helper._get_client_by_settings(mocker.MagicMock, **kwargs)
+
+    assert mock_create.call_count == create_count
+
+
+class TestAccessTokenCache:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mocker):
+        self.cache = django_helper.AccessTokenCache()
+        self.mock_time = mocker.patch.object(django_helper.time, "time", return_value=1000)
+
+    @pytest.mark.parametrize(
+        ("expires_in", "cached_until"),
+        [
+            (None, 1300),
+            (3600, 1300),
+            (120, 1060),
+        ],
+    )
+    def test_get(self, mocker, expires_in, cached_until):
+        expires = None
+        if expires_in is not None:
+            expires = datetime.datetime.fromtimestamp(1000 + expires_in, tz=datetime.timezone.utc)
+        fetch = mocker.MagicMock(return_value=mocker.MagicMock(access_token="token", expires=expires))
+
+        assert self.cache.get("admin", 300, fetch) == "token"
+
+        self.mock_time.return_value = cached_until - 1
+        assert self.cache.get("admin", 300, fetch) == "token"
+        assert fetch.call_count == 1
+
+        self.mock_time.return_value = cached_until
+        assert self.cache.get("admin", 300, fetch) == "token"
+        assert fetch.call_count == 2
+
+    def test_get_expired_soon(self, mocker):
+        expires = datetime.datetime.fromtimestamp(1030, tz=datetime.timezone.utc)
+        fetch = mocker.MagicMock(return_value=mocker.MagicMock(access_token="token", expires=expires))
+
+        assert self.cache.get("admin", 300, fetch) == "token"
+        assert self.cache.get("admin", 300, fetch) == "token"
+        assert fetch.call_count == 2
+
+    def test_get_none(self, mocker):
+        fetch = mocker.MagicMock(return_value=None)
+
+        assert self.cache.get("admin", 300, fetch) is None
+        assert self.cache.get("admin", 300, fetch) is None
+        assert fetch.call_count == 2
+
+    def test_get_expired_evicted(self, mocker):
+        fetch = mocker.MagicMock(return_value=mocker.MagicMock(access_token="token", expires=None))
+        self.cache.get("admin", 300, fetch)
+
+        self.mock_time.return_value = 1300
+        fetch.return_value = None
+        assert self.cache.get("admin", 300, fetch) is None
+        assert "admin" not in self.cache._tokens
+
+    def test_get_lru(self, mocker):
+        cache = django_helper.AccessTokenCache(maxsize=2)
+        fetch = mocker.MagicMock(return_value=mocker.MagicMock(access_token="token", expires=None))
+
+        cache.get("admin", 300, fetch)
+        cache.get("alice", 300, fetch)
+        cache.get("admin", 300, fetch)
+        cache.get("bob", 300, fetch)
+
+        assert list(cache._tokens) == ["admin", "bob"]
+        assert fetch.call_count == 3
+
+    def test_delete(self, mocker):
+        fetch = mocker.MagicMock(return_value=mocker.MagicMock(access_token="token", expires=None))
+
+        self.cache.get("admin", 300, fetch)
+        self.cache.delete("admin")
+        self.cache.get("admin", 300, fetch)
+        assert fetch.call_count == 2
+
+
+def test_get_client_by_username_with_access_token_cache(mocker, core_settings, client_cls):
+    core_settings.set(SettingKeys.BK_API_CLIENT_ACCESS_TOKEN_CACHE_TTL, 300)
+    mocker.patch.object(django_helper, "access_token_cache", django_helper.AccessTokenCache())
+    bkoauth = mocker.patch.object(django_helper, "bkoauth")
+    bkoauth.get_access_token_by_user.return_value = mocker.MagicMock(access_token="token", expires=None)
+
+    for _ in range(2):
+        client = django_helper.get_client_by_username(client_cls, "admin")
+        client.update_bkapi_authorization.assert_called_with(access_token="token", bk_username="admin")
+
+    bkoauth.get_access_token_by_user.assert_called_once_with("admin")
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import pytest
+
+from bkapi_client_core import pool as pool_module
+from bkapi_client_core.pool import ConnectionPool, configure_default_pool, get_default_pool
+from bkapi_client_core.session import Session
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        body = b'{"result": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def local_server():
+    server = _ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    yield "http://127.0.0.1:%s" % server.server_port
+
+    server.shutdown()
+    server.server_close()
+
+
+class TestConnectionPool:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.pool = ConnectionPool()
+        yield
+        self.pool.clear()
+
+    @pytest.mark.parametrize(
+        ("url1", "url2", "same"),
+        [
+            ("http://example.com/a", "http://example.com/b", True),
+            ("http://example.com/a", "http://EXAMPLE.com:80/b", True),
+            ("https://example.com/a", "https://example.com:443/b", True),
+            ("http://example.com/a", "https://example.com/a", False),
+            ("http://example.com/a", "http://example.com:8080/a", False),
+            ("http://a.example.com/", "http://b.example.com/", False),
+        ],
+    )
+    def test_get_adapter(self, url1, url2, same):
+        assert (self.pool.get_adapter(url1) is self.pool.get_adapter(url2)) is same
+
+    def test_idle_eviction(self, mocker):
+        self.pool.idle_timeout = 10
+        mock_time = mocker.patch.object(pool_module.time, "time", return_value=100)
+
+        adapter = self.pool.get_adapter("http://example.com/")
+        mocker.patch.object(adapter, "close")
+
+        mock_time.return_value = 105
+        assert self.pool.get_adapter("http://example.com/") is adapter
+        assert self.pool.evict_idle() == 0
+
+        mock_time.return_value = 120
+        assert self.pool.evict_idle() == 1
+        adapter.close.assert_called_once_with()
+
+        assert self.pool.get_adapter("http://example.com/") is not adapter
+        assert self.pool.stats()["evictions"] == 1
+
+    def test_idle_eviction_on_miss(self, mocker):
+        self.pool.idle_timeout = 10
+        mock_time = mocker.patch.object(pool_module.time, "time", return_value=100)
+
+        adapter = self.pool.get_adapter("http://example.com/")
+        mocker.patch.object(adapter, "close")
+
+        mock_time.return_value = 120
+        self.pool.get_adapter("http://another.example.com/")
+        adapter.close.assert_called_once_with()
+        assert self.pool.stats()["evictions"] == 1
+
+    def test_after_fork(self, mocker):
+        adapter = self.pool.get_adapter("http://example.com/")
+        mocker.patch.object(adapter, "close")
+        mocker.patch.object(pool_module.os, "getpid", return_value=-1)
+
+        assert self.pool.get_adapter("http://example.com/") is not adapter
+        adapter.close.assert_not_called()
+
+    def test_connection_reused(self, local_server):
+        sessions = [Session(connection_pool=self.pool) for _ in range(3)]
+        for session in sessions:
+            assert session.handle(local_server + "/ping", method="GET").json() == {"result": True}
+            session.close()
+
+        stats = self.pool.stats()
+        assert stats["adapter_misses"] == 1
+        assert stats["adapter_hits"] == 2
+        assert stats["connection_misses"] == 1
+        assert stats["connection_hits"] == 2
+
+    def test_without_pool(self, local_server):
+        session = Session()
+        assert session.handle(local_server + "/ping", method="GET").json() == {"result": True}
+        assert session.connection_pool is None
+        assert self.pool.stats()["adapter_misses"] == 0
+
+
+def test_default_pool(mocker, core_settings):
+    mocker.patch.object(pool_module, "_DEFAULT_POOL", None)
+    core_settings.set("BK_API_CLIENT_CONNECTION_POOL_OPTIONS", {"pool_maxsize": 20})
+
+    pool = get_default_pool()
+    assert pool.pool_maxsize == 20
+    assert get_default_pool() is pool
+
+    new_pool = configure_default_pool(pool_maxsize=30, idle_timeout=60)
+    assert get_default_pool() is new_pool
+    assert new_pool.idle_timeout == 60
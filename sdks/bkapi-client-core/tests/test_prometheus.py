@@ -15,8 +15,10 @@ import requests
 from prometheus_client import CollectorRegistry
 from requests.exceptions import RequestException
 
+from bkapi_client_core.batch import BatchItemResult, BatchResult
 from bkapi_client_core.config import HookEvent
-from bkapi_client_core.prometheus import HookCollector, enable
+from bkapi_client_core.prometheus import HookCollector, enable, request_id_exemplar
+from bkapi_client_core.streaming import StreamingResponse
 
 
 @pytest.fixture(autouse=True)
@@ -38,9 +40,12 @@ def test_enable_collector(mocker, mock_registry, mock_register_global_hook):
     enable(registry=mock_registry)
     enable(registry=mock_registry)  # this is not work
 
-    assert mock_register_global_hook.call_count == 2
-    mock_register_global_hook.assert_any_call(HookEvent.OPERATION_PREPARED, mocker.ANY)
+    assert mock_register_global_hook.call_count == 5
+    mock_register_global_hook.assert_any_call(HookEvent.OPERATION_RESPONDED, mocker.ANY)
     mock_register_global_hook.assert_any_call(HookEvent.OPERATION_ERROR, mocker.ANY)
+    mock_register_global_hook.assert_any_call(HookEvent.OPERATION_BATCH_FINISHED, mocker.ANY)
+    mock_register_global_hook.assert_any_call(HookEvent.OPERATION_STREAM_CLOSED, mocker.ANY)
+    mock_register_global_hook.assert_any_call(HookEvent.OPERATION_CACHE_LOOKUP, mocker.ANY)
 
 
 class TestHookCollector:
@@ -72,6 +77,86 @@ class TestHookCollector:
         result = self.collector.request_hook(context, operation)
         assert len(result["hooks"][HookEvent.RESPONSE]) == 2
 
+    def test_request_hook_cache_children(self, mocker, faker, requests_mock, mock_operation, mock_registry):
+        mock_operation.method = "GET"
+        url = faker.url()
+        requests_mock.get(url, json={"result": True})
+        labels = mocker.spy(self.collector.metric_requests_duration_seconds, "labels")
+
+        for _ in range(3):
+            context = self.collector.request_hook({}, mock_operation)
+            requests.get(url, hooks=context["hooks"])
+
+        assert labels.call_count == 1
+        assert (
+            mock_registry.get_sample_value(
+                "bkapi_responses_total",
+                {"operation": str(mock_operation), "method": "GET", "status": "200"},
+            )
+            == 3
+        )
+
+    @pytest.mark.parametrize(
+        ("random_value", "observed"),
+        [
+            (0.05, 1),
+            (0.5, 0),
+        ],
+    )
+    def test_request_hook_sampling(self, mocker, faker, requests_mock, mock_registry, random_value, observed):
+        mocker.patch("bkapi_client_core.prometheus.random.random", return_value=random_value)
+        operation = mocker.MagicMock(method="GET")
+        collector = HookCollector(mock_registry, "test", "", [1, float("inf")], [1, float("inf")], sample_rate=0.1)
+        url = faker.url()
+        requests_mock.get(url, json={"result": True})
+
+        context = collector.request_hook({}, operation)
+        requests.get(url, hooks=context["hooks"])
+
+        labels = {"operation": str(operation), "method": "GET"}
+        assert mock_registry.get_sample_value("test_bkapi_responses_total", dict(labels, status="200")) == 1
+        assert mock_registry.get_sample_value("test_bkapi_requests_duration_seconds_count", labels) == observed
+
+    def test_exemplar(self, mocker, faker, requests_mock, mock_registry):
+        operation = mocker.MagicMock(method="GET")
+        collector = HookCollector(
+            mock_registry, "test", "", [1, float("inf")], [1, float("inf")], exemplar=request_id_exemplar
+        )
+        metrics = collector.get_operation_metrics(str(operation), "GET")
+        observe = mocker.spy(metrics.requests_duration_seconds, "observe")
+        url = faker.url()
+        requests_mock.get(url, json={"result": True}, headers={"X-Bkapi-Request-Id": "1234"})
+
+        collector.response_hook(requests.get(url), operation)
+
+        observe.assert_called_once_with(mocker.ANY, {"request_id": "1234"})
+
+    def test_responded_hook(self, mocker, faker, requests_mock, mock_registry):
+        operation = mocker.MagicMock(method="GET")
+        url = faker.url()
+        requests_mock.get(url, json={"result": True}, headers={"Content-Length": "16"})
+        labels = mocker.spy(self.collector.metric_responses_body_bytes, "labels")
+
+        for _ in range(2):
+            self.collector.responded_hook(requests.get(url), operation)
+
+        assert labels.call_count == 1
+        labels = {"operation": str(operation), "method": "GET"}
+        assert mock_registry.get_sample_value("bkapi_responses_total", dict(labels, status="200")) == 2
+        assert mock_registry.get_sample_value("bkapi_requests_duration_seconds_count", labels) == 2
+        assert mock_registry.get_sample_value("bkapi_responses_body_bytes_sum", labels) == 32
+
+    def test_request_body_size(self, faker, requests_mock, mock_operation, mock_registry):
+        url = faker.url()
+        requests_mock.post(url, json={"result": True})
+        response = requests.post(url, data=b"12345")
+        del response.request.headers["Content-Length"]
+
+        self.collector.response_hook(response, mock_operation)
+
+        labels = {"operation": str(mock_operation), "method": "POST"}
+        assert mock_registry.get_sample_value("bkapi_requests_body_bytes_sum", labels) == 5
+
     @pytest.mark.parametrize(
         ("request_size", "request_headers", "response_size", "response_headers"),
         [
@@ -163,3 +248,43 @@ class TestHookCollector:
             )
             == 1.0
         )
+
+    def test_batch_hook(self, mock_operation, mock_registry):
+        result = BatchResult(
+            [BatchItemResult(0, result=1), BatchItemResult(1, result=2), BatchItemResult(2, error=ValueError())],
+            elapsed=1.5,
+        )
+
+        self.collector.batch_hook(result, mock_operation)
+
+        labels = {"operation": str(mock_operation), "method": str(mock_operation.method)}
+        assert mock_registry.get_sample_value("bkapi_batch_duration_seconds_sum", labels) == 1.5
+        assert mock_registry.get_sample_value("bkapi_batch_requests_total", dict(labels, result="succeeded")) == 2
+        assert mock_registry.get_sample_value("bkapi_batch_requests_total", dict(labels, result="failed")) == 1
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({}, 5),
+            ({"Content-Length": "5"}, None),
+        ],
+    )
+    def test_stream_hook(self, faker, requests_mock, mock_operation, mock_registry, headers, expected):
+        url = faker.url()
+        requests_mock.get(url, content=b"hello", headers=headers)
+        stream = StreamingResponse(requests.get(url, stream=True))
+        list(stream.iter_bytes())
+
+        self.collector.stream_hook(stream, mock_operation)
+
+        labels = {"operation": str(mock_operation), "method": str(mock_operation.method)}
+        assert mock_registry.get_sample_value("bkapi_responses_body_bytes_sum", labels) == expected
+
+    def test_cache_hook(self, mock_operation, mock_registry):
+        assert self.collector.cache_hook("hit", mock_operation) == "hit"
+        self.collector.cache_hook("hit", mock_operation)
+        self.collector.cache_hook("miss", mock_operation)
+
+        labels = {"operation": str(mock_operation), "method": str(mock_operation.method)}
+        assert mock_registry.get_sample_value("bkapi_cache_requests_total", dict(labels, result="hit")) == 2
+        assert mock_registry.get_sample_value("bkapi_cache_requests_total", dict(labels, result="miss")) == 1
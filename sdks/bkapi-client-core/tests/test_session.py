@@ -9,10 +9,12 @@
  * specific language governing permissions and limitations under the License.
 """
 import pytest
+from requests.adapters import HTTPAdapter
 
 from bkapi_client_core.config import HookEvent
 from bkapi_client_core.exceptions import PathParamsMissing
-from bkapi_client_core.session import Session, deregister_global_hook, register_global_hook
+from bkapi_client_core.pool import ConnectionPool, PooledHTTPAdapter
+from bkapi_client_core.session import Session, _UrlRender, _UrlTemplate, deregister_global_hook, register_global_hook
 
 
 class TestSession:
@@ -78,6 +80,45 @@ class TestSession:
         session.dispatch_hook(event, 1, has_extra=True)
         hook.assert_called_once_with(1, has_extra=True)
 
+    def test_fork(self, mocker):
+        hook = mocker.MagicMock()
+        session = Session(headers={"X-Testing": "1"}, path_params={"color": "green"})
+        session.register_hook(HookEvent.RESPONSE, hook)
+        session.cookies.set("bk_token", "token")
+
+        forked = session.fork()
+        forked.headers["X-Testing"] = "2"
+        forked.path_params["color"] = "red"
+        forked.deregister_hook(HookEvent.RESPONSE, hook)
+
+        assert session.headers["X-Testing"] == "1"
+        assert session.path_params == {"color": "green"}
+        assert session.hooks[HookEvent.RESPONSE] == [hook]
+        assert forked.adapters == session.adapters
+        forked.mount("http://example.com/", mocker.MagicMock())
+        forked.proxies["http"] = "http://proxy.example.com"
+        assert "http://example.com/" not in session.adapters
+        assert session.proxies == {}
+        assert len(forked.cookies) == 0
+
+        mock_close = mocker.patch("requests.adapters.HTTPAdapter.close")
+        forked.close()
+        mock_close.assert_not_called()
+
+        session.close()
+        assert mock_close.called
+
+    def test_get_adapter_with_connection_pool(self):
+        custom = HTTPAdapter(max_retries=5)
+        self.session.mount("https://example.com/", custom)
+        self.session.connection_pool = ConnectionPool()
+
+        assert self.session.get_adapter("https://example.com/api/") is custom
+        assert isinstance(self.session.get_adapter("https://other.example.com/api/"), PooledHTTPAdapter)
+
+        self.session.mount("http://", custom)
+        assert self.session.get_adapter("http://other.example.com/api/") is custom
+
     def test_set_user_agent(self):
         self.session.set_user_agent("test")
         assert self.session.headers["User-Agent"] == "test"
@@ -115,3 +156,50 @@ class TestSession:
         assert response.request.headers["X-Testing"] == "1"
 
         assert deregister_global_hook(HookEvent.REQUEST, hook)
+
+
+class TestUrlTemplate:
+    def test_compile(self):
+        template = _UrlTemplate.compile("http://example.com/{ color }/{size}/")
+
+        assert _UrlTemplate.compile("http://example.com/{ color }/{size}/") is template
+        assert template.fields == frozenset(["color", "size"])
+
+    def test_compile_invalid(self):
+        with pytest.raises(ValueError):
+            _UrlTemplate.compile("http://example.com/{color/")
+
+    @pytest.mark.parametrize(
+        ("url", "path_params", "common_path_params", "expected"),
+        [
+            ("http://example.com/red/", None, None, "http://example.com/red/"),
+            ("http://example.com/{{red}}/", None, None, "http://example.com/{red}/"),
+            ("http://example.com/{ color }/", {"color": "red"}, None, "http://example.com/red/"),
+            ("http://example.com/{color}/", None, {"color": "red"}, "http://example.com/red/"),
+            ("http://example.com/{color}/", {"color": "red"}, {"color": "green"}, "http://example.com/red/"),
+            ("http://example.com/{color}/", {"color": None}, None, "http://example.com/None/"),
+            ("http://example.com/{id:03d}/", {"id": 7}, None, "http://example.com/007/"),
+            ("http://example.com/{color!r}/", {"color": "red"}, None, "http://example.com/'red'/"),
+        ],
+    )
+    def test_render(self, url, path_params, common_path_params, expected):
+        template = _UrlTemplate.compile(url)
+        assert template.render(path_params, common_path_params) == expected
+        assert _UrlRender(url, common_path_params).render(path_params) == expected
+
+    @pytest.mark.parametrize(
+        ("path_params", "common_path_params"),
+        [
+            (None, None),
+            ({}, {}),
+            ({"size": 1}, None),
+            ({"color": None}, {"color": None}),
+            ({"color": None}, {}),
+            ({"color": None}, {"color": "green"}),
+        ],
+    )
+    def test_render_missing(self, path_params, common_path_params):
+        template = _UrlTemplate.compile("http://example.com/{color}/")
+
+        with pytest.raises(PathParamsMissing, match="path parameter is required: color"):
+            template.render(path_params, common_path_params)
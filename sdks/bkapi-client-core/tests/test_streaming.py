@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import pytest
+import requests
+from requests.exceptions import StreamConsumedError
+
+from bkapi_client_core.base import Operation, OperationGroup
+from bkapi_client_core.client import BaseClient
+from bkapi_client_core.config import HookEvent
+from bkapi_client_core.exceptions import HTTPResponseError, JSONResponseError
+from bkapi_client_core.property import bind_property
+from bkapi_client_core.streaming import StreamingResponse, _JSONItemsReader, is_stream_data
+
+
+def _split(content, size):
+    return [content[i : i + size] for i in range(0, len(content), size)]
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ({"a": 1}, False),
+        ([1, 2], False),
+        ("text", False),
+        (b"bytes", False),
+        (io.BytesIO(b"file"), True),
+        ((i for i in range(3)), True),
+        (iter([b"a"]), True),
+    ],
+)
+def test_is_stream_data(data, expected):
+    assert is_stream_data(data) is expected
+
+
+class TestJSONItemsReader:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+    @pytest.mark.parametrize(
+        ("document", "path", "expected"),
+        [
+            ([], (), []),
+            ([1, 23, 456, -7.5e3], (), [1, 23, 456, -7.5e3]),
+            ([{"id": 1, "name": "a,b]"}, {"tags": ["x"]}], (), [{"id": 1, "name": "a,b]"}, {"tags": ["x"]}]),
+            ({"data": {"count": 2, "info": [{"id": 1}, {"id": 2}]}}, ("data", "info"), [{"id": 1}, {"id": 2}]),
+            ({"result": True, "message": "中文", "data": ["蓝鲸", "智云"]}, ("data",), ["蓝鲸", "智云"]),
+            ({"data": None}, ("data", "info"), []),
+            ({"data": {"info": None}}, ("data", "info"), []),
+            ({"data": {}}, ("data", "info"), []),
+            ({"other": [1]}, ("data",), []),
+        ],
+    )
+    def test_iter_items(self, document, path, expected, chunk_size):
+        content = json.dumps(document, ensure_ascii=False, indent=1).encode("utf-8")
+        reader = _JSONItemsReader(_split(content, chunk_size))
+
+        assert list(reader.iter_items(path)) == expected
+
+    @pytest.mark.parametrize(
+        ("content", "path"),
+        [
+            (b"", ()),
+            (b'{"a": 1}', ()),
+            (b"[1, 2", ()),
+            (b"[1 2]", ()),
+            (b'[{"a": 1]', ()),
+            (b"[1]", ("data",)),
+        ],
+    )
+    def test_invalid(self, content, path):
+        reader = _JSONItemsReader(_split(content, 2))
+
+        with pytest.raises(ValueError):
+            list(reader.iter_items(path))
+
+    def test_lazy(self):
+        consumed = []
+
+        def chunks():
+            for chunk in [b"[1, ", b"2, ", b"3]"]:
+                consumed.append(chunk)
+                yield chunk
+
+        items = _JSONItemsReader(chunks()).iter_items()
+
+        assert next(items) == 1
+        assert len(consumed) == 1
+
+
+class TestStreamingResponse:
+    @pytest.fixture()
+    def make_stream(self, faker, requests_mock):
+        def make_stream(content, on_close=None, **kwargs):
+            url = faker.url()
+            requests_mock.get(url, body=io.BytesIO(content), **kwargs)
+            return StreamingResponse(requests.get(url, stream=True), chunk_size=3, on_close=on_close)
+
+        return make_stream
+
+    def test_iter_bytes(self, mocker, make_stream):
+        on_close = mocker.MagicMock()
+        stream = make_stream(b"hello world", on_close=on_close)
+
+        assert list(stream) == [b"hel", b"lo ", b"wor", b"ld"]
+        assert stream.bytes_read == 11
+        assert stream.closed
+        on_close.assert_called_once_with(stream)
+
+        with pytest.raises(StreamConsumedError):
+            list(stream.iter_bytes())
+
+    def test_close(self, mocker, make_stream):
+        on_close = mocker.MagicMock()
+
+        with make_stream(b"hello world", on_close=on_close) as stream:
+            assert next(stream.iter_bytes()) == b"hel"
+
+        assert stream.bytes_read == 3
+        stream.close()
+        on_close.assert_called_once_with(stream)
+
+    def test_iter_lines(self, make_stream):
+        stream = make_stream(b"first\r\nsecond\n\nthird line\nlast")
+        assert list(stream.iter_lines()) == [b"first", b"second", b"", b"third line", b"last"]
+
+    def test_iter_ndjson(self, make_stream):
+        stream = make_stream(b'{"id": 1}\n\n{"id": 2}\n')
+        assert list(stream.iter_ndjson()) == [{"id": 1}, {"id": 2}]
+
+        stream = make_stream(b'{"id": 1}\n{"id": \n')
+        with pytest.raises(JSONResponseError):
+            list(stream.iter_ndjson())
+
+    def test_iter_json_items(self, make_stream):
+        stream = make_stream(b'{"data": {"info": [{"id": 1}, {"id": 2}]}}')
+        assert list(stream.iter_json_items(("data", "info"))) == [{"id": 1}, {"id": 2}]
+        assert stream.closed
+
+        stream = make_stream(b'{"data": {"info": [{"id": 1}, ')
+        with pytest.raises(JSONResponseError):
+            list(stream.iter_json_items(("data", "info")))
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _StreamingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        if self.path == "/error/":
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i in range(100):
+            line = ('{"id": %s}\n' % i).encode()
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_POST(self):  # noqa: N802
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = b""
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if not size:
+                    self.rfile.readline()
+                    break
+                body += self.rfile.read(size)
+                self.rfile.readline()
+        else:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+
+        content = json.dumps({"size": len(body), "chunked": self.headers.get("Transfer-Encoding") == "chunked"})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def local_server():
+    server = _ThreadingHTTPServer(("127.0.0.1", 0), _StreamingHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    yield "http://127.0.0.1:%s" % server.server_port
+
+    server.shutdown()
+    server.server_close()
+
+
+class Group(OperationGroup):
+    export = bind_property(Operation, name="export", method="GET", path="/export/")
+    error = bind_property(Operation, name="error", method="GET", path="/error/")
+    upload = bind_property(Operation, name="upload", method="POST", path="/upload/")
+
+
+class Client(BaseClient):
+    api = bind_property(Group, name="api")
+
+
+class TestClientStreaming:
+    def test_stream(self, mocker, local_server):
+        client = Client(local_server)
+        stream_hook = mocker.MagicMock(side_effect=lambda stream, operation: stream)
+        client.session.register_hook(HookEvent.OPERATION_STREAM_CLOSED, stream_hook)
+
+        with client.api.export.stream(chunk_size=16) as stream:
+            assert stream.status_code == 200
+            items = list(stream.iter_ndjson())
+
+        assert items == [{"id": i} for i in range(100)]
+        stream_hook.assert_called_once_with(stream, operation=client.api.export)
+        assert stream.bytes_read == sum(len('{"id": %s}\n' % i) for i in range(100))
+
+    def test_stream_error(self, local_server):
+        client = Client(local_server)
+
+        with pytest.raises(HTTPResponseError):
+            client.api.error.stream()
+
+    @pytest.mark.parametrize(
+        ("data", "chunked"),
+        [
+            (io.BytesIO(b"x" * 100000), False),
+            ((b"x" * 1000 for _ in range(100)), True),
+        ],
+    )
+    def test_upload(self, local_server, data, chunked):
+        client = Client(local_server)
+
+        assert client.api.upload(data) == {"size": 100000, "chunked": chunked}
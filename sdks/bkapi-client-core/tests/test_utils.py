@@ -79,6 +79,22 @@ class TestSensitiveCleaner:
         result = sensitive_cleaner.clean(data)
         assert result == expected
 
+    def test_clean_copy_on_write(self):
+        data = {
+            "auth": {"secret": "bar"},
+            "payload": {"items": [{"id": 1}, {"id": 2}]},
+        }
+
+        result = utils._SensitiveCleaner(["secret"]).clean(data)
+
+        assert data["auth"]["secret"] == "bar"
+        assert result["auth"]["secret"] == "***"
+        assert result["payload"] is data["payload"]
+
+    def test_clean_without_sensitive(self):
+        data = {"foo": [{"bar": "baz"}], "secret": ""}
+        assert utils._SensitiveCleaner(["secret"]).clean(data) is data
+
 
 class TestWrappedRequest:
     @pytest.mark.parametrize(
@@ -105,6 +121,30 @@ class TestWrappedRequest:
 
 
 class TestCurlRequest:
+    def test_render_once(self, mocker, fake_request):
+        mock_to_curl = mocker.patch.object(utils.curlify, "to_curl", return_value="curl")
+        curl_request = utils.CurlRequest(fake_request)
+
+        assert str(curl_request) == "curl"
+        assert curl_request.to_curl() == "curl"
+        mock_to_curl.assert_called_once()
+
+    def test_binary_body(self, fake_request):
+        fake_request.body = b"\xff\xfe"
+        result = utils.CurlRequest(fake_request).to_curl()
+
+        assert result.startswith("curl")
+        assert fake_request.body == b"\xff\xfe"
+
+    def test_streaming_body(self, fake_request):
+        body = (chunk for chunk in [b"a", b"b"])
+        fake_request.body = body
+        result = utils.CurlRequest(fake_request).to_curl()
+
+        assert result == "curl -X GET -d '<streaming body>' https://example.com/get"
+        assert fake_request.body is body
+        assert list(body) == [b"a", b"b"]
+
     def test_str(self, fake_request):
         result = utils.CurlRequest(fake_request).to_curl()
         assert result == "curl -X GET https://example.com/get"
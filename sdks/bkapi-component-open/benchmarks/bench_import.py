@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+ * TencentBlueKing is pleased to support the open source community by making 蓝鲸智云-蓝鲸 PaaS 平台(BlueKing-PaaS) available.
+ * Copyright (C) 2017-2021 THL A29 Limited, a Tencent company. All rights reserved.
+ * Licensed under the MIT License (the "License"); you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://opensource.org/licenses/MIT
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+"""
+"""
+Benchmark the import time and memory of bkapi_component.open.client.
+
+The operations are declared in tables and instantiated lazily, this script compares it with
+an equivalent client declared by `bind_property`, which is generated from the same tables.
+
+Usage: python benchmarks/bench_import.py [--rounds 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, resource, sys, time, tracemalloc
+# import the dependencies and the namespace package first, only the client module is measured
+import bkapi_client_core.esb
+import bkapi_component.open
+
+module_name = sys.argv[1]
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+tracemalloc.start()
+start = time.perf_counter()
+module = __import__(module_name, fromlist=["Client"])
+import_seconds = time.perf_counter() - start
+import_bytes = tracemalloc.get_traced_memory()[0]
+
+client = module.Client(endpoint="http://example.com")
+start = time.perf_counter()
+client.cc.search_business
+client.bk_login.get_user
+first_call_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+for group_name in ["bk_login", "cc", "cmsi", "gse", "itsm", "jobv3", "monitor_v3", "sops", "usermanage"]:
+    group = getattr(client, group_name)
+    for name, _, _ in type(group)._operation_table:
+        getattr(group, name)
+all_operations_seconds = time.perf_counter() - start
+all_operations_bytes = tracemalloc.get_traced_memory()[0]
+
+print(json.dumps({
+    "import_ms": import_seconds * 1000,
+    "import_kb": import_bytes / 1024,
+    "first_access_ms": first_call_seconds * 1000,
+    "all_operations_ms": all_operations_seconds * 1000,
+    "all_operations_kb": all_operations_bytes / 1024,
+    "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before,
+}))
+"""
+
+
+def generate_bind_property_module(path):
+    """Generate a client module with bind_property declarations from the operation tables"""
+    from bkapi_component.open import client as client_module
+
+    lines = ["from bkapi_client_core.esb import ESBClient, Operation, OperationGroup, bind_property", ""]
+    group_properties = []
+    for name, value in vars(client_module.Client).items():
+        if not hasattr(value, "_cls"):
+            continue
+
+        group_cls = value._cls
+        lines.append("class %s(OperationGroup):" % group_cls.__name__)
+        # keep the table, so that the probe can iterate the operations
+        lines.append("    _operation_table = %r" % (group_cls._operation_table,))
+        for operation_name, method, operation_path in group_cls._operation_table:
+            lines.append(
+                "    %s = bind_property(Operation, name=%r, method=%r, path=%r)"
+                % (operation_name, operation_name, method, operation_path)
+            )
+        lines.append("")
+        group_properties.append("    %s = bind_property(%s, name=%r)" % (name, group_cls.__name__, name))
+
+    lines.append("class Client(ESBClient):")
+    lines.extend(group_properties)
+
+    with open(path, "w") as fp:
+        fp.write("\n".join(lines) + "\n")
+
+
+def run(module_name, rounds, extra_path):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([extra_path, ROOT, env.get("PYTHONPATH", "")])
+    env["PYTHONDONTWRITEBYTECODE"] = ""
+
+    # warm up to compile the byte codes
+    subprocess.check_output([sys.executable, "-c", PROBE, module_name], env=env)
+
+    results = []
+    for _ in range(rounds):
+        output = subprocess.check_output([sys.executable, "-c", PROBE, module_name], env=env)
+        results.append(json.loads(output))
+
+    return {key: statistics.median(result[key] for result in results) for key in results[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        generate_bind_property_module(os.path.join(tmp_dir, "bind_property_client.py"))
+
+        rows = [
+            ("operation table", run("bkapi_component.open.client", args.rounds, tmp_dir)),
+            ("bind_property", run("bind_property_client", args.rounds, tmp_dir)),
+        ]
+
+    print(
+        "%-16s %10s %10s %16s %18s %18s %10s"
+        % ("declaration", "import ms", "import KB", "first access ms", "all operations ms", "all operations KB", "RSS KB")
+    )
+    for name, result in rows:
+        print(
+            "%-16s %10.2f %10.1f %16.3f %18.2f %18.1f %10d"
+            % (
+                name,
+                result["import_ms"],
+                result["import_kb"],
+                result["first_access_ms"],
+                result["all_operations_ms"],
+                result["all_operations_kb"],
+                result["rss_kb"],
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
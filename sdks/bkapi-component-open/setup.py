@@ -16,7 +16,7 @@ setup(
     description='',
     long_description=readme,
     name='bkapi-component-open',
-    version='2.1.0',
+    version='2.2.0',
     python_requires='>=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*, !=3.4.*, !=3.5.*',
     author='blueking',
     license='MIT',
@@ -25,6 +25,6 @@ setup(
     package_dir={'': '.'},
     package_data={},
     install_requires=[
-        'bkapi-client-core>=1.1.0,<2.0.0',
+        'bkapi-client-core>=1.3.0,<2.0.0',
     ],
 )
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# TencentBlueKing is pleased to support the open source community by making
+# 蓝鲸智云 - PaaS 平台 (BlueKing - PaaS System) available.
+# Copyright (C) 2017 THL A29 Limited, a Tencent company. All rights reserved.
+# Licensed under the MIT License (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+#     http://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# We undertake not to change the open source license (MIT license) applicable
+# to the current version of the project delivered to anyone in the future.
+"""
+Benchmark of the StreamChannel subscribers with many concurrent subscribers on one channel.
+
+It compares the polling loop of `StreamChannelSubscriber.get_events`, the blocking loop of
+`StreamChannelSubscriber.listen_events` (a thread per subscriber) and `AsyncStreamChannelSubscriber`
+(all subscribers in one event loop), reports the CPU used while the channel is idle, and the latency
+between publishing an event and receiving it.
+
+Usage: REDIS_URL=redis://localhost:6379/0 python benchmarks/bench_stream_subscriber.py [--subscribers 200]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+import uuid
+
+import redis
+import redis.asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blue_krill.redis_tools.messaging import (  # noqa: E402
+    AsyncStreamChannelSubscriber,
+    StreamChannel,
+    StreamChannelSubscriber,
+)
+
+
+def measure_idle_cpu(seconds):
+    """The percentage of a CPU used by this process in the given seconds"""
+    cpu, wall = time.process_time(), time.perf_counter()
+    time.sleep(seconds)
+    return (time.process_time() - cpu) / (time.perf_counter() - wall) * 100
+
+
+def publish_events(channel, count, interval):
+    for _ in range(count):
+        channel.publish_msg(time.perf_counter())
+        time.sleep(interval)
+    channel.close()
+
+
+def run_threads(redis_db, args, blocking):
+    channel_id = uuid.uuid4().hex
+    channel = StreamChannel(channel_id, redis_db)
+    channel.initialize()
+
+    latencies = []
+    ready = threading.Barrier(args.subscribers + 1)
+
+    def consume():
+        subscriber = StreamChannelSubscriber(channel_id, redis_db)
+        ready.wait()
+        events = subscriber.listen_events(timeout=1.0) if blocking else subscriber.get_events(wait=0.05)
+        for event in events:
+            latencies.append(time.perf_counter() - event["data"])
+        subscriber.close()
+
+    threads = [threading.Thread(target=consume) for _ in range(args.subscribers)]
+    for thread in threads:
+        thread.start()
+    ready.wait()
+
+    idle_cpu = measure_idle_cpu(args.idle_seconds)
+    publish_events(channel, args.events, args.interval)
+    for thread in threads:
+        thread.join()
+
+    channel.destroy()
+    return idle_cpu, latencies
+
+
+def run_asyncio(redis_db, args):
+    channel_id = uuid.uuid4().hex
+    channel = StreamChannel(channel_id, redis_db)
+    channel.initialize()
+
+    latencies = []
+
+    async def consume(subscriber):
+        async for event in subscriber.listen_events(timeout=1.0):
+            latencies.append(time.perf_counter() - event["data"])
+        await subscriber.close()
+
+    async def main():
+        async_redis_db = redis.asyncio.Redis.from_url(args.url)
+        subscribers = [AsyncStreamChannelSubscriber(channel_id, async_redis_db) for _ in range(args.subscribers)]
+        for subscriber in subscribers:
+            await subscriber.subscribe()
+
+        tasks = [asyncio.create_task(consume(subscriber)) for subscriber in subscribers]
+        idle_cpu = await asyncio.to_thread(measure_idle_cpu, args.idle_seconds)
+        await asyncio.to_thread(publish_events, channel, args.events, args.interval)
+        await asyncio.gather(*tasks)
+        await async_redis_db.aclose()
+        return idle_cpu
+
+    idle_cpu = asyncio.run(main())
+    channel.destroy()
+    return idle_cpu, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=os.environ.get("REDIS_URL", "redis://localhost:6379/0"))
+    parser.add_argument("--subscribers", type=int, default=200)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.05, help="seconds between the published events")
+    parser.add_argument("--idle-seconds", type=float, default=3)
+    args = parser.parse_args()
+
+    redis_db = redis.Redis.from_url(args.url)
+    print("subscribers: %s, events: %s" % (args.subscribers, args.events))
+    print("  %-28s %12s %16s %16s" % ("impl", "idle cpu %", "latency p50 ms", "latency p99 ms"))
+    for name, run in [
+        ("polling (get_events)", lambda: run_threads(redis_db, args, blocking=False)),
+        ("blocking (listen_events)", lambda: run_threads(redis_db, args, blocking=True)),
+        ("asyncio (listen_events)", lambda: run_asyncio(redis_db, args)),
+    ]:
+        idle_cpu, latencies = run()
+        quantiles = statistics.quantiles(latencies, n=100)
+        print("  %-28s %12.1f %16.2f %16.2f" % (name, idle_cpu, quantiles[49] * 1e3, quantiles[98] * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,4 +15,4 @@
 # We undertake not to change the open source license (MIT license) applicable
 # to the current version of the project delivered to anyone in the future.
 
-__version__ = "3.0.0"
+__version__ = "3.1.0"
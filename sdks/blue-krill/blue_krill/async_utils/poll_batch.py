@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+# TencentBlueKing is pleased to support the open source community by making
+# 蓝鲸智云 - PaaS 平台 (BlueKing - PaaS System) available.
+# Copyright (C) 2017 THL A29 Limited, a Tencent company. All rights reserved.
+# Licensed under the MIT License (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+#     http://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# We undertake not to change the open source license (MIT license) applicable
+# to the current version of the project delivered to anyone in the future.
+
+"""module for driving many polling tasks by one periodic driver, instead of a celery message for every polling
+
+Usage::
+
+    driver = BatchPollingDriver(RedisPollingStore(redis_db))
+
+
+    class DeployPoller(BatchPollingMixin, TaskPoller):
+        @classmethod
+        def get_polling_driver(cls):
+            return driver
+
+        def query(self) -> PollingResult: ...
+
+
+    # Run the driver periodically, such as by a celery beat task, or in a dedicated process by `run_forever`
+    @shared_task
+    def drive_pollers():
+        driver.run_once()
+"""
+
+import dataclasses
+import functools
+import heapq
+import json
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
+
+from blue_krill.async_utils.poll_task import (
+    CallbackHandler,
+    NullResultHandler,
+    PollingMetadata,
+    PollingResult,
+    PollTaskScheduler,
+    TaskPoller,
+)
+from blue_krill.encoding import force_text
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PollingEntry:
+    """A polling procedure stored in PollingStore
+
+    :param id: unique id of the entry
+    :param poller_name: name of poller class
+    :param handler_name: name of result handler
+    :param params: params for performing polling, must be Json compatible
+    :param metadata: metadata of the polling procedure
+    """
+
+    id: str
+    poller_name: str
+    handler_name: Optional[str]
+    params: Dict
+    metadata: PollingMetadata
+
+    def to_json(self) -> str:
+        return json.dumps(dataclasses.asdict(self))
+
+    @classmethod
+    def from_json(cls, value) -> "PollingEntry":
+        data = json.loads(value)
+        data["metadata"] = PollingMetadata(**data["metadata"])
+        return cls(**data)
+
+
+class PollingStore(ABC):
+    """Store of the polling entries, ordered by the time of their next polling"""
+
+    @abstractmethod
+    def add(self, entry: PollingEntry, next_poll_at: float):
+        """Add or update an entry, it will be polled after `next_poll_at`"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def claim_due(self, now: float, limit: int, lease_seconds: float) -> List[PollingEntry]:
+        """Claim at most `limit` entries which are due at `now`, the claimed entries will be due again after
+        `lease_seconds` unless they are updated or removed, so an entry is polled by only one driver at a time,
+        and the entries claimed by a crashed driver will be polled again.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def remove(self, entry_id: str):
+        """Remove an entry"""
+        raise NotImplementedError()
+
+
+class MemoryPollingStore(PollingStore):
+    """Store entries in memory, it is suitable for a single process and testing"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, PollingEntry] = {}
+        self._due: Dict[str, float] = {}
+
+    def add(self, entry: PollingEntry, next_poll_at: float):
+        with self._lock:
+            self._entries[entry.id] = entry
+            self._due[entry.id] = next_poll_at
+
+    def claim_due(self, now: float, limit: int, lease_seconds: float) -> List[PollingEntry]:
+        with self._lock:
+            due = [(ts, entry_id) for entry_id, ts in self._due.items() if ts <= now]
+            claimed = [entry_id for _, entry_id in heapq.nsmallest(limit, due)]
+            for entry_id in claimed:
+                self._due[entry_id] = now + lease_seconds
+            return [self._entries[entry_id] for entry_id in claimed]
+
+    def remove(self, entry_id: str):
+        with self._lock:
+            self._entries.pop(entry_id, None)
+            self._due.pop(entry_id, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Claim the due entries atomically, KEYS: [due, entries], ARGV: [now, limit, lease_until]
+CLAIM_DUE_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+if #ids == 0 then
+    return {}
+end
+for _, id in ipairs(ids) do
+    redis.call('ZADD', KEYS[1], ARGV[3], id)
+end
+return redis.call('HMGET', KEYS[2], unpack(ids))
+"""
+
+
+class RedisPollingStore(PollingStore):
+    """Store entries in redis, the ids are stored in a sorted set scored by the time of next polling, and the entries
+    are stored in a hash.
+    """
+
+    default_key_prefix = "p3::poll::"
+
+    def __init__(self, redis_db, key_prefix: Optional[str] = None):
+        self.redis_db = redis_db
+        key_prefix = key_prefix or self.default_key_prefix
+        self.due_key = "{}due".format(key_prefix)
+        self.entries_key = "{}entries".format(key_prefix)
+        self._claim_script = None
+
+    def add(self, entry: PollingEntry, next_poll_at: float):
+        pipe = self.redis_db.pipeline()
+        pipe.hset(self.entries_key, entry.id, entry.to_json())
+        pipe.zadd(self.due_key, {entry.id: next_poll_at})
+        pipe.execute()
+
+    def claim_due(self, now: float, limit: int, lease_seconds: float) -> List[PollingEntry]:
+        if self._claim_script is None:
+            self._claim_script = self.redis_db.register_script(CLAIM_DUE_SCRIPT)
+
+        values = self._claim_script(keys=[self.due_key, self.entries_key], args=[now, limit, now + lease_seconds])
+        # The entry may be removed by others after its id is read
+        return [PollingEntry.from_json(force_text(value)) for value in values if value is not None]
+
+    def remove(self, entry_id: str):
+        pipe = self.redis_db.pipeline()
+        pipe.zrem(self.due_key, entry_id)
+        pipe.hdel(self.entries_key, entry_id)
+        pipe.execute()
+
+    def __len__(self):
+        return self.redis_db.hlen(self.entries_key)
+
+
+class BatchPollingDriver:
+    """Drive the polling procedures stored in a PollingStore, every run picks up the due entries in batches, polls
+    them in a bounded thread pool and reschedules the unfinished ones. The timeout, retries and callbacks are handled
+    by PollTaskScheduler, the same as the celery task `check_status_until_finished`.
+
+    :param store: store of the polling entries
+    :param batch_size: max number of entries claimed at once
+    :param max_workers: max number of entries polled in parallel
+    :param lease_seconds: seconds before a claimed entry can be claimed again if it is not rescheduled,
+        it should be longer than the time of a polling
+    """
+
+    def __init__(self, store: PollingStore, batch_size: int = 100, max_workers: int = 10, lease_seconds: float = 300):
+        self.store = store
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.lease_seconds = lease_seconds
+
+    def submit(
+        self,
+        poller_cls: Type[TaskPoller],
+        params: Dict,
+        callback_handler_cls: Optional[Type[CallbackHandler]] = None,
+        delay: float = 0,
+    ) -> str:
+        """Start a new polling procedure, the id of the entry will be returned
+
+        :param params: params for starting polling, must be Json compatible
+        :param callback_handler_cls: type to handle poll result
+        :param delay: seconds before the first polling
+        """
+        handler_name = None
+        if callback_handler_cls is not None:
+            assert issubclass(callback_handler_cls, CallbackHandler)
+            handler_name = callback_handler_cls.__name__
+
+        now = time.time()
+        entry = PollingEntry(
+            id=uuid.uuid4().hex,
+            poller_name=poller_cls.__name__,
+            handler_name=handler_name,
+            params=params,
+            metadata=PollingMetadata(retries=0, query_started_at=now, queried_count=0),
+        )
+        self.store.add(entry, now + delay)
+        return entry.id
+
+    def run_once(self) -> int:
+        """Poll all the entries due at the beginning, the number of polled entries will be returned"""
+        # The entries rescheduled during this run will be polled by the next run
+        now = time.time()
+        count = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                entries = self.store.claim_due(now, self.batch_size, self.lease_seconds)
+                if not entries:
+                    break
+
+                list(executor.map(lambda poll: poll(), self._make_polls(entries)))
+                count += len(entries)
+                if len(entries) < self.batch_size:
+                    break
+        return count
+
+    def run_forever(self, interval: float = 1, stop_event: Optional[threading.Event] = None):
+        """Run the driver until stop_event is set
+
+        :param interval: seconds to wait when no entries are due
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            try:
+                polled = self.run_once()
+            except Exception:
+                logger.exception("Exception when driving the pollers")
+                polled = 0
+
+            if not polled:
+                stop_event.wait(interval)
+
+    def _make_polls(self, entries: List[PollingEntry]) -> List[Callable[[], None]]:
+        """Make the polling actions of the entries, the entries of a poller class which supports `batch_query` are
+        grouped, so they are checked by one query
+        """
+        polls: List[Callable[[], None]] = []
+        groups: Dict[str, List[PollingEntry]] = {}
+        for entry in entries:
+            try:
+                batch_query_size = TaskPoller.get_poller_cls(entry.poller_name).batch_query_size
+            except KeyError:
+                batch_query_size = 0
+
+            if batch_query_size > 1:
+                groups.setdefault(entry.poller_name, []).append(entry)
+            else:
+                polls.append(functools.partial(self.poll, entry))
+
+        for poller_name, group in groups.items():
+            size = TaskPoller.get_poller_cls(poller_name).batch_query_size
+            for start in range(0, len(group), size):
+                polls.append(functools.partial(self.poll_many, group[start : start + size]))
+        return polls
+
+    def poll(self, entry: PollingEntry):
+        """Poll an entry, then reschedule or remove it"""
+        try:
+            poller, handler_cls = self._make_poller(entry)
+        except Exception:
+            logger.exception("Exception when making poller, entry=%s", entry)
+            self.store.remove(entry.id)
+            return
+
+        self._run_scheduler(entry, poller, handler_cls)
+
+    def poll_many(self, entries: List[PollingEntry]):
+        """Poll the entries of the same poller class by one `batch_query` call, then reschedule or remove them"""
+        prepared = []
+        for entry in entries:
+            try:
+                prepared.append((entry, *self._make_poller(entry)))
+            except Exception:
+                logger.exception("Exception when making poller, entry=%s", entry)
+                self.store.remove(entry.id)
+
+        # The timed out pollers will not be queried
+        pollers = [poller for _, poller, _ in prepared if not poller.exceeded_timeout()]
+        results: Dict[int, Union[PollingResult, Exception]] = {}
+        if pollers:
+            poller_cls = type(pollers[0])
+            queried: List[Union[PollingResult, Exception]]
+            try:
+                queried = poller_cls.batch_query(pollers)
+            except Exception as e:
+                logger.exception("Exception when batch query status, poll_class=%s", poller_cls.__name__)
+                queried = [e] * len(pollers)
+
+            if len(queried) != len(pollers):
+                error = ValueError(f"batch_query returned {len(queried)} results for {len(pollers)} pollers")
+                logger.error("Invalid batch query results, poll_class=%s: %s", poller_cls.__name__, error)
+                queried = [error] * len(pollers)
+            results = {id(poller): result for poller, result in zip(pollers, queried)}
+
+        for entry, poller, handler_cls in prepared:
+            self._run_scheduler(entry, poller, handler_cls, results.get(id(poller)))
+
+    def _make_poller(self, entry: PollingEntry) -> Tuple[TaskPoller, Type[CallbackHandler]]:
+        poller = TaskPoller.get_poller_cls(entry.poller_name)(entry.params, entry.metadata)
+        if entry.handler_name is not None:
+            handler_cls = CallbackHandler.get_handler_cls(entry.handler_name)
+        else:
+            handler_cls = NullResultHandler
+        return poller, handler_cls
+
+    def _run_scheduler(
+        self,
+        entry: PollingEntry,
+        poller: TaskPoller,
+        handler_cls: Type[CallbackHandler],
+        queried_result: Union[PollingResult, Exception, None] = None,
+    ):
+        try:
+            next_metadata = PollTaskScheduler(poller, handler_cls).run(queried_result)
+        except Exception:
+            # The celery task would not be retried either, drop the entry rather than polling it forever
+            logger.exception("Exception when polling, entry=%s", entry)
+            self.store.remove(entry.id)
+            return
+
+        if next_metadata is None:
+            self.store.remove(entry.id)
+            return
+
+        countdown = poller.get_retry_delay()
+        logger.debug("Will retry query status for %s after %s seconds. metadata=%s", poller, countdown, next_metadata)
+        self.store.add(dataclasses.replace(entry, metadata=next_metadata), time.time() + countdown)
+
+
+class BatchPollingMixin:
+    """Mixin for TaskPoller, make the polling procedures driven by a BatchPollingDriver instead of celery tasks"""
+
+    @classmethod
+    def get_polling_driver(cls) -> BatchPollingDriver:
+        """Return the driver of the pollers, subclasses must override this method"""
+        raise NotImplementedError()
+
+    @classmethod
+    def start(cls, params: Dict, callback_handler_cls: Optional[Type] = None):
+        """Start a new polling procedure
+
+        :param params: params for starting polling, must be Json compatible
+        :param callback_handler_cls: type to handle poll result
+        """
+        cls.get_polling_driver().submit(cls, params, callback_handler_cls)  # type: ignore[arg-type]
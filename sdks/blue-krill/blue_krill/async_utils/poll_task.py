@@ -16,12 +16,16 @@
 # to the current version of the project delivered to anyone in the future.
 
 
+import bisect
 import logging
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional, Type
+from typing import Any, Deque, Dict, List, Optional, Type, Union
 
 from celery import shared_task
 
@@ -41,11 +45,14 @@ class PollingResult:
 
     :param status: status of current polling action, such as: DOING, DONE
     :param data: extra data of current polling
+    :param finished_at: unix timestamp of when the task finished, if the backend reports it, it is used for
+        measuring the latency of detecting the finish
     """
 
-    def __init__(self, status: PollingStatus, data: Optional[Any] = None):
+    def __init__(self, status: PollingStatus, data: Optional[Any] = None, finished_at: Optional[float] = None):
         self.status = status
         self.data = data
+        self.finished_at = finished_at
 
     def __str__(self):
         return f"stauts={self.status} data={self.data}"
@@ -71,6 +78,146 @@ class PollingMetadata:
     queried_count: int
     # data attribute of last polling action
     last_polling_data: Optional[Dict] = None
+    # unix timestamp of last polling action
+    last_polled_at: Optional[float] = None
+
+
+class PollerMetrics:
+    """Metrics of the pollers of a TaskPoller class in current process
+
+    - polls: count of the polling actions
+    - errors: count of the polling actions which raised exceptions
+    - wasted_polls: count of the polling actions which found the task still doing
+    - finished: count of the finished polling procedures
+    - durations: the recent durations of the finished polling procedures, from start to the finish detected
+    - detect_latencies: the recent latencies between the task finished and the finish detected, it is measured by
+      `PollingResult.finished_at` if given, otherwise by the time since last polling, which is the upper bound
+    """
+
+    max_samples = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.polls = 0
+        self.errors = 0
+        self.wasted_polls = 0
+        self.finished = 0
+        self.durations: Deque[float] = deque(maxlen=self.max_samples)
+        self.detect_latencies: Deque[float] = deque(maxlen=self.max_samples)
+
+    def record_error(self):
+        with self._lock:
+            self.polls += 1
+            self.errors += 1
+
+    def record_doing(self):
+        with self._lock:
+            self.polls += 1
+            self.wasted_polls += 1
+
+    def record_done(self, duration: float, detect_latency: Optional[float]):
+        with self._lock:
+            self.polls += 1
+            self.finished += 1
+            self.durations.append(duration)
+            if detect_latency is not None:
+                self.detect_latencies.append(max(detect_latency, 0))
+
+    def get_durations(self) -> List[float]:
+        """The recent durations in ascending order"""
+        with self._lock:
+            return sorted(self.durations)
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            latencies = sorted(self.detect_latencies)
+            return {
+                "polls": self.polls,
+                "errors": self.errors,
+                "wasted_polls": self.wasted_polls,
+                "finished": self.finished,
+                "avg_polls_per_finish": self.polls / self.finished if self.finished else None,
+                "median_detect_latency": latencies[len(latencies) // 2] if latencies else None,
+            }
+
+
+class PollingStrategy(ABC):
+    """Strategy of the delay before next polling, set it to `TaskPoller.polling_strategy`"""
+
+    @abstractmethod
+    def get_delay(self, poller: "TaskPoller") -> float:
+        """Get delay of next polling for the poller"""
+        raise NotImplementedError()
+
+
+class FixedDelayStrategy(PollingStrategy):
+    """Poll at a fixed interval"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def get_delay(self, poller: "TaskPoller") -> float:
+        return self.delay
+
+
+class ExponentialBackoffStrategy(PollingStrategy):
+    """Poll quickly at first, then less and less often, the delay is multiplied by `factor` every polling
+
+    :param initial_delay: delay of the first polling
+    :param max_delay: max delay
+    :param jitter: the delay will be randomly changed by this ratio, so the pollers started together spread out
+    """
+
+    def __init__(self, initial_delay: float = 2, factor: float = 2, max_delay: float = 300, jitter: float = 0.1):
+        self.initial_delay = initial_delay
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def get_delay(self, poller: "TaskPoller") -> float:
+        # queried_count of the metadata is the count before current polling
+        exponent = min(poller.metadata.queried_count, 64)
+        delay = min(self.initial_delay * self.factor**exponent, self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class AdaptiveStrategy(PollingStrategy):
+    """Poll around the durations observed from the finished pollers of the same class.
+
+    Given the time elapsed, the next polling is at the next `step` quantile of the observed durations which are
+    longer than it, so a fast task is polled often around its usual duration, and a long-running task is polled
+    less often as the observed durations spread out. When there are not enough samples, or the task has run longer
+    than all of them, `fallback` is used.
+
+    The durations are observed in current process, see `TaskPoller.get_metrics`.
+
+    :param step: ratio of the remaining observed durations skipped by each polling
+    """
+
+    def __init__(
+        self,
+        min_delay: float = 1,
+        max_delay: float = 300,
+        step: float = 0.1,
+        min_samples: int = 20,
+        fallback: Optional[PollingStrategy] = None,
+    ):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.step = step
+        self.min_samples = min_samples
+        self.fallback = fallback or ExponentialBackoffStrategy(max_delay=max_delay)
+
+    def get_delay(self, poller: "TaskPoller") -> float:
+        durations = poller.get_metrics().get_durations()
+        elapsed = time.time() - poller.metadata.query_started_at
+        index = bisect.bisect_right(durations, elapsed)
+        if len(durations) < self.min_samples or index >= len(durations):
+            return self.fallback.get_delay(poller)
+
+        remaining = len(durations) - index
+        target = durations[index + max(int(remaining * self.step), 1) - 1]
+        return min(max(target - elapsed, self.min_delay), self.max_delay)
 
 
 class TaskPoller(ABC):
@@ -81,10 +228,15 @@ class TaskPoller(ABC):
     """
 
     _registered_pollers: Dict[str, Type["TaskPoller"]] = {}
+    _metrics: PollerMetrics
 
     max_retries_on_error = 10
     overall_timeout_seconds = 3600 * 24 * 7
     default_retry_delay_seconds = 10
+    # Strategy of the delay before next polling, `default_retry_delay_seconds` is used if not set
+    polling_strategy: Optional[PollingStrategy] = None
+    # Max number of pollers checked by one `batch_query` call when driven by BatchPollingDriver, 0 to disable
+    batch_query_size = 0
 
     def __init__(self, params: Dict, metadata: PollingMetadata):
         self.params = params
@@ -96,6 +248,12 @@ class TaskPoller(ABC):
                 f"A TaskPoller subclass named '{cls.__name__}' is already registered. Poller names must be unique."
             )
         cls._registered_pollers[cls.__name__] = cls
+        cls._metrics = PollerMetrics()
+
+    @classmethod
+    def get_metrics(cls) -> PollerMetrics:
+        """Metrics of the pollers of this class in current process"""
+        return cls._metrics
 
     @classmethod
     def get_poller_cls(cls, name: str) -> Type["TaskPoller"]:
@@ -132,6 +290,7 @@ class TaskPoller(ABC):
             query_started_at=self.metadata.query_started_at,
             queried_count=self.metadata.queried_count + 1,
             last_polling_data=last_polling_data,
+            last_polled_at=time.time(),
         )
 
     @abstractmethod
@@ -139,8 +298,24 @@ class TaskPoller(ABC):
         """Start a polling action, subclasses must override this method"""
         raise NotImplementedError()
 
-    def get_retry_delay(self) -> int:
+    @classmethod
+    def batch_query(cls, pollers: List["TaskPoller"]) -> List[Union[PollingResult, Exception]]:
+        """Query many pollers of this class, subclasses may override this method to check them in one backend
+        call, and set `batch_query_size` to enable it. The results are in the order of pollers, an exception
+        can be used as the result of a failed poller.
+        """
+        results: List[Union[PollingResult, Exception]] = []
+        for poller in pollers:
+            try:
+                results.append(poller.query())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def get_retry_delay(self) -> float:
         """Get delay of next retry"""
+        if self.polling_strategy is not None:
+            return self.polling_strategy.get_delay(self)
         return self.default_retry_delay_seconds
 
     def exceeded_timeout(self) -> bool:
@@ -250,6 +425,7 @@ def check_status_until_finished(poller_name: str, handler_name: str, params: Dic
         query_started_at=req.get("query_started_at", time.time()),
         queried_count=req.get("queried_count", 0),
         last_polling_data=req.get("last_polling_data"),
+        last_polled_at=req.get("last_polled_at"),
     )
 
     # Make handler and poller by name
@@ -277,6 +453,7 @@ def check_status_until_finished(poller_name: str, handler_name: str, params: Dic
                 "queried_count": next_metadata.queried_count,
                 "query_started_at": next_metadata.query_started_at,
                 "last_polling_data": next_metadata.last_polling_data,
+                "last_polled_at": next_metadata.last_polled_at,
             }
         )
 
@@ -292,16 +469,22 @@ class PollTaskScheduler:
         self.poller = poller
         self.handler_cls = handler_cls
 
-    def run(self) -> Optional[PollingMetadata]:
-        """Start schedule process"""
+    def run(self, queried_result: Union[PollingResult, Exception, None] = None) -> Optional[PollingMetadata]:
+        """Start schedule process
+
+        :param queried_result: result queried in advance, such as by `TaskPoller.batch_query`, the poller will
+            be queried if not given
+        """
         if self.poller.exceeded_timeout():
             logger.info("exceeded total timeout, ts_query_started=%s", self.poller.metadata.query_started_at)
             self._callback_timeout()
             return None
 
+        metrics = self.poller.get_metrics()
         try:
-            polling_result = self._safe_query(self.poller)
+            polling_result = self._safe_query(self.poller, queried_result)
         except PollingQueryError as e:
+            metrics.record_error()
             if self.poller.exceeded_max_retries():
                 self._callback_exception(e)
                 return None
@@ -313,24 +496,44 @@ class PollTaskScheduler:
             return metadata
 
         if polling_result.status == PollingStatus.DONE:
+            self._record_done(polling_result)
             ret = CallbackResult(status=CallbackStatus.NORMAL, data=polling_result.data)
             self._callback(ret)
             return None
 
+        metrics.record_doing()
         metadata = self.poller.make_next_metadata(has_error=False, last_polling_data=polling_result.data)
         return metadata
 
+    def _record_done(self, polling_result: PollingResult):
+        now = time.time()
+        metadata = self.poller.metadata
+        if polling_result.finished_at is not None:
+            detect_latency: Optional[float] = now - polling_result.finished_at
+        elif metadata.last_polled_at is not None:
+            detect_latency = now - metadata.last_polled_at
+        else:
+            detect_latency = None
+        self.poller.get_metrics().record_done(now - metadata.query_started_at, detect_latency)
+
     @staticmethod
-    def _safe_query(poller: TaskPoller) -> PollingResult:
+    def _safe_query(poller: TaskPoller, queried_result: Union[PollingResult, Exception, None] = None) -> PollingResult:
         """call poller's query method with exception handling
 
         :raises: PollingQueryError
         """
-        try:
-            polling_result = poller.query()
-        except Exception as e:
-            logger.exception("Exception when query status, poll_class=%s", poller)
-            raise PollingQueryError(str(e))
+        if isinstance(queried_result, Exception):
+            logger.error("Exception when query status, poll_class=%s", poller, exc_info=queried_result)
+            raise PollingQueryError(str(queried_result))
+
+        if queried_result is not None:
+            polling_result = queried_result
+        else:
+            try:
+                polling_result = poller.query()
+            except Exception as e:
+                logger.exception("Exception when query status, poll_class=%s", poller)
+                raise PollingQueryError(str(e))
 
         logger.debug("Query status result, poll_class=%s, polling result: %s", poller, polling_result)
         return polling_result
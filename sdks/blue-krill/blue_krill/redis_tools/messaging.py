@@ -23,17 +23,37 @@ from blue_krill.encoding import force_text
 
 logger = logging.getLogger(__name__)
 
+# Publish events in one atomic round trip: allocate the ids, append the events to history and publish them to
+# the subscribers. ARGV holds the (event, data) pairs which are already JSON encoded, the payloads are built
+# in the same format as `json.dumps({"id": ..., "event": ..., "data": ...})`.
+PUBLISH_SCRIPT = """
+local count = #ARGV / 2
+local last_id = redis.call('INCRBY', KEYS[1], count)
+local payloads = {}
+for i = 1, count do
+    local payload = '{"id": ' .. string.format('%d', last_id - count + i) .. ', "event": ' .. ARGV[2 * i - 1]
+        .. ', "data": ' .. ARGV[2 * i] .. '}'
+    payloads[i] = payload
+    redis.call('PUBLISH', KEYS[3], payload)
+end
+redis.call('RPUSH', KEYS[2], unpack(payloads))
+return last_id
+"""
+
 
 class StreamChannel(object):
     """A simple stream channel implemention"""
 
     default_expires_seconds = 3600 * 24
+    # Max number of events published by one script call, the arguments of a Lua function call are limited
+    publish_batch_size = 500
 
     def __init__(self, channel_id, redis_db=None, expires_seconds=None):
         self.channel_id = channel_id
         self.keys = KeyManager(channel_id)
         self.redis_db = redis_db
         self.expires_seconds = expires_seconds or self.default_expires_seconds
+        self._publish_script = None
 
     def initialize(self):
         """Initialize channel"""
@@ -51,13 +71,47 @@ class StreamChannel(object):
         pipe.execute()
 
     def publish_msg(self, message):
-        self.publish("msg", data=message)
+        return self.publish("msg", data=message)
+
+    def publish_msgs(self, messages):
+        """Publish many messages in one round trip, such as a burst of log lines"""
+        return self.publish_many(("msg", message) for message in messages)
 
     def publish(self, event, data=""):
-        index = self.redis_db.incr(self.keys.counter)
-        payload = {"id": index, "event": event, "data": data}
-        self.redis_db.rpush(self.keys.history, json.dumps(payload))
-        self.redis_db.publish(self.keys.channel, json.dumps(payload))
+        """Publish an event, the id of the event will be returned"""
+        return self._get_publish_script()(keys=self._script_keys(), args=[json.dumps(event), json.dumps(data)])
+
+    def publish_many(self, events):
+        """Publish many events in one round trip, the events are published atomically in every batch
+
+        :param events: iterable of (event, data) pairs
+        :return: the ids of the events
+        """
+        args = []
+        for event, data in events:
+            args.extend([json.dumps(event), json.dumps(data)])
+        if not args:
+            return []
+
+        script = self._get_publish_script()
+        size = self.publish_batch_size * 2
+        pipe = self.redis_db.pipeline(transaction=False)
+        for start in range(0, len(args), size):
+            script(keys=self._script_keys(), args=args[start : start + size], client=pipe)
+
+        ids = []
+        for start, last_id in zip(range(0, len(args), size), pipe.execute()):
+            count = len(args[start : start + size]) // 2
+            ids.extend(range(last_id - count + 1, last_id + 1))
+        return ids
+
+    def _get_publish_script(self):
+        if self._publish_script is None:
+            self._publish_script = self.redis_db.register_script(PUBLISH_SCRIPT)
+        return self._publish_script
+
+    def _script_keys(self):
+        return [self.keys.counter, self.keys.history, self.keys.channel]
 
     def close(self):
         self.redis_db.set(self.keys.state, "closed", self.expires_seconds)
@@ -94,15 +148,7 @@ class StreamChannelSubscriber(object):
         self._channel_state = self.read_channel_state()
 
     def read_channel_state(self):
-        state = self.redis_db.get(self.keys.state)
-        state = force_text(state)
-        if state is None:
-            return "none"
-        elif state == "open":
-            return "open"
-        elif state == "closed":
-            return "closed"
-        return "unknown"
+        return parse_channel_state(self.redis_db.get(self.keys.state))
 
     def is_closed(self):
         return self.get_channel_state() == "closed"
@@ -123,6 +169,42 @@ class StreamChannelSubscriber(object):
             results.append(event)
         return results
 
+    def listen_events(self, last_event_id=0, timeout=1.0, ignore_special=True):
+        """Get all history events and follow new one, like `get_events`, but the new events are waited by
+        blocking reads instead of polling, so they are delivered as soon as they are published.
+
+        :param int last_event_id: Ignore every events whose id is lower than this
+        :param float timeout: Max seconds of every blocking read
+        """
+        for events in self.listen_event_batches(last_event_id, timeout=timeout, ignore_special=ignore_special):
+            yield from events
+
+    def listen_event_batches(self, last_event_id=0, timeout=1.0, max_batch_size=100, ignore_special=True):
+        """Like `listen_events`, but yields lists of events, the events published in a burst are delivered
+        together, which is cheaper for the consumers writing them to a stream response.
+
+        :param int max_batch_size: Max number of events in a batch
+        """
+        events = self.get_history_events(last_event_id=last_event_id, ignore_special=ignore_special)
+        for start in range(0, len(events), max_batch_size):
+            yield events[start : start + max_batch_size]
+
+        max_event_id = events[-1]["id"] if events else last_event_id
+        while not self.is_closed():
+            batch = []
+            event = self.get_event(timeout=timeout)
+            while event:
+                # Ignore event that already fetched from history events
+                if event["id"] > max_event_id and not (ignore_special and self.is_special_event(event)):
+                    batch.append(event)
+                if len(batch) >= max_batch_size:
+                    break
+                # Take the events which have been received without waiting
+                event = self.get_event()
+
+            if batch:
+                yield batch
+
     def get_events(self, last_event_id=0, wait=0.05, ignore_special=True):
         """Get all history events and follow new one.
 
@@ -150,15 +232,16 @@ class StreamChannelSubscriber(object):
                 continue
             yield event
 
-    def get_event(self, block=False):
+    def get_event(self, block=False, timeout=0.0):
         """Get event from subscribe
 
         :param block bool: if True, will use .listen method to do a sync read
+        :param timeout float: seconds to wait for the event when block is False
         """
         if block:
             _data = next(self.sub_pipe.listen())
         else:
-            _data = self.sub_pipe.get_message()
+            _data = self.sub_pipe.get_message(timeout=timeout)
         if not _data:
             return None
 
@@ -170,7 +253,7 @@ class StreamChannelSubscriber(object):
         return data
 
     def is_special_event(self, event):
-        return event["event"] in ("init", "close")
+        return is_special_event(event)
 
     def close(self):
         self.sub_pipe.close()
@@ -179,6 +262,304 @@ class StreamChannelSubscriber(object):
         return "StreamChannelSubscriber: {}".format(self.channel_id)
 
 
+class AsyncStreamChannelSubscriber(object):
+    """Subscriber for StreamChannel, works with the asyncio client of redis, such as `redis.asyncio.Redis`
+
+    Usage::
+
+        async with AsyncStreamChannelSubscriber(channel_id, redis_db) as subscriber:
+            async for event in subscriber.listen_events():
+                ...
+    """
+
+    def __init__(self, channel_id, redis_db=None):
+        self.channel_id = channel_id
+        self.keys = KeyManager(channel_id)
+        self.redis_db = redis_db
+
+        self.sub_pipe = self.redis_db.pubsub(ignore_subscribe_messages=True)
+        self._channel_state = "none"
+
+    async def subscribe(self):
+        """Subscribe the channel, it must be called before reading the events"""
+        await self.sub_pipe.subscribe(self.keys.channel)
+        await self.update_channel_state()
+
+    def get_channel_state(self):
+        return self._channel_state
+
+    async def update_channel_state(self):
+        self._channel_state = await self.read_channel_state()
+
+    async def read_channel_state(self):
+        return parse_channel_state(await self.redis_db.get(self.keys.state))
+
+    def is_closed(self):
+        return self.get_channel_state() == "closed"
+
+    async def get_history_events(self, last_event_id=0, ignore_special=True):
+        """Get history events
+
+        :param int last_event_id: If given, result will start from last_event_id
+        """
+        results = []
+        for item in await self.redis_db.lrange(self.keys.history, last_event_id, -1):
+            event = json.loads(item)
+            if is_special_event(event):
+                await self.update_channel_state()
+                if ignore_special:
+                    continue
+            results.append(event)
+        return results
+
+    async def listen_events(self, last_event_id=0, timeout=1.0, ignore_special=True):
+        """Get all history events and follow new one until the channel is closed
+
+        :param int last_event_id: Ignore every events whose id is lower than this
+        :param float timeout: Max seconds of every blocking read
+        """
+        async for events in self.listen_event_batches(last_event_id, timeout=timeout, ignore_special=ignore_special):
+            for event in events:
+                yield event
+
+    async def listen_event_batches(self, last_event_id=0, timeout=1.0, max_batch_size=100, ignore_special=True):
+        """Like `listen_events`, but yields lists of events, the events published in a burst are delivered together
+
+        :param int max_batch_size: Max number of events in a batch
+        """
+        events = await self.get_history_events(last_event_id=last_event_id, ignore_special=ignore_special)
+        for start in range(0, len(events), max_batch_size):
+            yield events[start : start + max_batch_size]
+
+        max_event_id = events[-1]["id"] if events else last_event_id
+        while not self.is_closed():
+            batch = []
+            event = await self.get_event(timeout=timeout)
+            while event:
+                if event["id"] > max_event_id and not (ignore_special and is_special_event(event)):
+                    batch.append(event)
+                if len(batch) >= max_batch_size:
+                    break
+                event = await self.get_event()
+
+            if batch:
+                yield batch
+
+    async def get_event(self, timeout=0.0):
+        """Get event from subscribe
+
+        :param timeout float: seconds to wait for the event, None to wait until an event is received
+        """
+        _data = await self.sub_pipe.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if not _data:
+            return None
+
+        data = json.loads(_data["data"])
+
+        # Update Channel status if event is special
+        if is_special_event(data):
+            await self.update_channel_state()
+        return data
+
+    async def close(self):
+        # `aclose` is added in redis 5.0.1
+        close = getattr(self.sub_pipe, "aclose", None) or self.sub_pipe.reset
+        await close()
+
+    async def __aenter__(self):
+        await self.subscribe()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __str__(self):
+        return "AsyncStreamChannelSubscriber: {}".format(self.channel_id)
+
+
+class RedisStreamChannel(object):
+    """A stream channel implementation based on Redis Streams, the events are stored in one stream which is trimmed
+    to about `max_len` events, so the memory of a long-running channel is bounded. The ids of the events are the ids
+    of the stream entries, such as "1700000000000-0", subscribers can resume from the last id they received.
+    """
+
+    default_expires_seconds = 3600 * 24
+    default_max_len = 10000
+
+    def __init__(self, channel_id, redis_db=None, expires_seconds=None, max_len=None, approximate_trim=True):
+        self.channel_id = channel_id
+        self.keys = KeyManager(channel_id)
+        self.redis_db = redis_db
+        self.expires_seconds = expires_seconds or self.default_expires_seconds
+        self.max_len = max_len or self.default_max_len
+        # Trimming approximately is much more efficient, the stream may be a little longer than max_len
+        self.approximate_trim = approximate_trim
+
+    def initialize(self):
+        """Initialize channel"""
+        if self.redis_db.exists(self.keys.stream):
+            return
+
+        # Always update state first
+        self.redis_db.set(self.keys.state, "open")
+        self.publish("init")
+
+        # Set expires
+        pipe = self.redis_db.pipeline()
+        for key in self.keys.stream_entities():
+            pipe.expire(key, self.expires_seconds)
+        pipe.execute()
+
+    def publish_msg(self, message):
+        return self.publish("msg", data=message)
+
+    def publish_msgs(self, messages):
+        """Publish many messages in one round trip, such as a burst of log lines"""
+        return self.publish_many(("msg", message) for message in messages)
+
+    def publish(self, event, data=""):
+        """Publish an event, the id of the event will be returned"""
+        return force_text(self._add(self.redis_db, event, data))
+
+    def publish_many(self, events):
+        """Publish many events in one round trip
+
+        :param events: iterable of (event, data) pairs
+        :return: the ids of the events
+        """
+        pipe = self.redis_db.pipeline(transaction=False)
+        for event, data in events:
+            self._add(pipe, event, data)
+        return [force_text(event_id) for event_id in pipe.execute()]
+
+    def _add(self, client, event, data):
+        return client.xadd(
+            self.keys.stream,
+            {"event": event, "data": json.dumps(data)},
+            maxlen=self.max_len,
+            approximate=self.approximate_trim,
+        )
+
+    def close(self):
+        self.redis_db.set(self.keys.state, "closed", self.expires_seconds)
+        self.publish("close")
+
+    def destroy(self):
+        """Destory this channel, every history events will be deleted!"""
+        self.redis_db.delete(*self.keys.stream_entities())
+
+    def __str__(self):
+        return "RedisStreamChannel: {}".format(self.channel_id)
+
+
+class RedisStreamChannelSubscriber(object):
+    """Subscriber for RedisStreamChannel, the history and new events are read from the stream by their ids, so a
+    reconnecting client only reads the events after the last id it received.
+    """
+
+    def __init__(self, channel_id, redis_db=None):
+        self.channel_id = channel_id
+        self.keys = KeyManager(channel_id)
+        self.redis_db = redis_db
+
+        self.update_channel_state()
+
+    def get_channel_state(self):
+        return self._channel_state
+
+    def update_channel_state(self):
+        self._channel_state = self.read_channel_state()
+
+    def read_channel_state(self):
+        return parse_channel_state(self.redis_db.get(self.keys.state))
+
+    def is_closed(self):
+        return self.get_channel_state() == "closed"
+
+    def get_history_events(self, last_event_id="0", count=None, ignore_special=True):
+        """Get a page of history events
+
+        :param str last_event_id: If given, result will start after the event
+        :param int count: Max number of events to read, all the events will be read if not given
+        :return: the events, and the id of the last event read which can be used to read the next page
+        """
+        entries = self._read(last_event_id, count)
+        return self._parse_entries(entries, ignore_special), self._get_last_id(entries, last_event_id)
+
+    def listen_events(self, last_event_id="0", timeout=1.0, ignore_special=True):
+        """Get all events after last_event_id and follow new one until the channel is closed
+
+        :param str last_event_id: Ignore the events before this one, and itself
+        :param float timeout: Max seconds of every blocking read
+        """
+        for events in self.listen_event_batches(last_event_id, timeout=timeout, ignore_special=ignore_special):
+            yield from events
+
+    def listen_event_batches(self, last_event_id="0", timeout=1.0, max_batch_size=100, ignore_special=True):
+        """Like `listen_events`, but yields lists of events
+
+        :param int max_batch_size: Max number of events in a batch
+        """
+        block = None
+        while True:
+            entries = self._read(last_event_id, max_batch_size, block)
+            last_event_id = self._get_last_id(entries, last_event_id)
+            events = self._parse_entries(entries, ignore_special)
+            if events:
+                yield events
+
+            if len(entries) < max_batch_size:
+                if self.is_closed():
+                    return
+                # All the history events have been read, wait for the new ones
+                block = max(int(timeout * 1000), 1)
+
+    def _read(self, last_event_id, count, block=None):
+        result = self.redis_db.xread({self.keys.stream: str(last_event_id)}, count=count, block=block)
+        if not result:
+            return []
+        # [[stream, [(id, fields), ...]]]
+        return result[0][1]
+
+    def _get_last_id(self, entries, default):
+        return force_text(entries[-1][0]) if entries else str(default)
+
+    def _parse_entries(self, entries, ignore_special):
+        results = []
+        for entry_id, raw_fields in entries:
+            fields = {force_text(key): force_text(value) for key, value in raw_fields.items()}
+            event = {"id": force_text(entry_id), "event": fields["event"], "data": json.loads(fields["data"])}
+            # Update Channel status if event is special
+            if is_special_event(event):
+                self.update_channel_state()
+                if ignore_special:
+                    continue
+            results.append(event)
+        return results
+
+    def close(self):
+        """Nothing to release, the events are read by the commands of the client"""
+
+    def __str__(self):
+        return "RedisStreamChannelSubscriber: {}".format(self.channel_id)
+
+
+def parse_channel_state(state):
+    """Parse the state stored in redis"""
+    state = force_text(state)
+    if state is None:
+        return "none"
+    elif state == "open":
+        return "open"
+    elif state == "closed":
+        return "closed"
+    return "unknown"
+
+
+def is_special_event(event):
+    return event["event"] in ("init", "close")
+
+
 class KeyManager(object):
     """Redis key manager for channel"""
 
@@ -190,6 +571,11 @@ class KeyManager(object):
         self.counter = "{}evtch::{}::cnt".format(prefix, channel_id)
         self.history = "{}evtch::{}::his".format(prefix, channel_id)
         self.channel = "{}evtch::{}::cha".format(prefix, channel_id)
+        self.stream = "{}evtch::{}::stm".format(prefix, channel_id)
 
     def entities(self):
         return [self.state, self.counter, self.history]
+
+    def stream_entities(self):
+        """Keys used by RedisStreamChannel"""
+        return [self.state, self.stream]
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# TencentBlueKing is pleased to support the open source community by making
+# 蓝鲸智云 - PaaS 平台 (BlueKing - PaaS System) available.
+# Copyright (C) 2017 THL A29 Limited, a Tencent company. All rights reserved.
+# Licensed under the MIT License (the "License"); you may not use this file except
+# in compliance with the License. You may obtain a copy of the License at
+#
+#     http://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# We undertake not to change the open source license (MIT license) applicable
+# to the current version of the project delivered to anyone in the future.
+
+import os
+import time
+import uuid
+
+import pytest
+
+from blue_krill.async_utils.poll_batch import (
+    BatchPollingDriver,
+    BatchPollingMixin,
+    MemoryPollingStore,
+    PollingEntry,
+    RedisPollingStore,
+)
+from blue_krill.async_utils.poll_task import (
+    CallbackHandler,
+    CallbackStatus,
+    PollingMetadata,
+    PollingResult,
+    TaskPoller,
+)
+
+_driver = BatchPollingDriver(MemoryPollingStore(), batch_size=2, max_workers=2)
+
+
+class BatchCounterPoller(BatchPollingMixin, TaskPoller):
+    """Finish after being queried `params["times"]` times"""
+
+    default_retry_delay_seconds = 0
+
+    @classmethod
+    def get_polling_driver(cls):
+        return _driver
+
+    def query(self) -> PollingResult:
+        if self.metadata.queried_count + 1 >= self.params["times"]:
+            return PollingResult.done(data={"queried_count": self.metadata.queried_count + 1})
+        return PollingResult.doing(data={"queried_count": self.metadata.queried_count + 1})
+
+
+class BatchErrorPoller(BatchPollingMixin, TaskPoller):
+    default_retry_delay_seconds = 0
+    max_retries_on_error = 1
+
+    @classmethod
+    def get_polling_driver(cls):
+        return _driver
+
+    def query(self) -> PollingResult:  # type: ignore
+        _ = 1 / 0
+
+
+class BatchCoalescedPoller(BatchPollingMixin, TaskPoller):
+    """Check many pollers in one call, the ones with params["fail"] fail"""
+
+    default_retry_delay_seconds = 0
+    batch_query_size = 3
+    batch_sizes: list = []
+
+    @classmethod
+    def get_polling_driver(cls):
+        return _driver
+
+    @classmethod
+    def batch_query(cls, pollers):
+        cls.batch_sizes.append(len(pollers))
+        return [
+            ValueError("failed") if poller.params.get("fail") else PollingResult.done(data=poller.params)
+            for poller in pollers
+        ]
+
+    def query(self) -> PollingResult:
+        raise NotImplementedError
+
+
+class BatchRecordHandler(CallbackHandler):
+    results: list = []
+
+    def handle(self, result, poller):
+        BatchRecordHandler.results.append((poller.params, result))
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    _driver.store = MemoryPollingStore()
+    BatchRecordHandler.results = []
+    BatchCoalescedPoller.batch_sizes = []
+
+
+class TestMemoryPollingStore:
+    def test_claim_due(self):
+        store = MemoryPollingStore()
+        for i in range(3):
+            entry = PollingEntry(str(i), "poller", None, {}, PollingMetadata(0, 0, 0))
+            store.add(entry, 100 - i)
+
+        assert [entry.id for entry in store.claim_due(now=99, limit=10, lease_seconds=10)] == ["2", "1"]
+        # Claimed entries are leased
+        assert store.claim_due(now=100, limit=10, lease_seconds=10)[0].id == "0"
+        assert store.claim_due(now=105, limit=10, lease_seconds=10) == []
+        assert {entry.id for entry in store.claim_due(now=109, limit=10, lease_seconds=10)} == {"1", "2"}
+
+        store.remove("1")
+        assert len(store) == 2
+
+
+class TestBatchPollingDriver:
+    def test_finished(self):
+        for times in [1, 2, 3]:
+            BatchCounterPoller.start({"times": times}, BatchRecordHandler)
+
+        rounds = 0
+        while len(_driver.store):
+            _driver.run_once()
+            rounds += 1
+
+        assert rounds == 3
+        results = sorted(BatchRecordHandler.results, key=lambda item: item[0]["times"])
+        assert [result.status for _, result in results] == [CallbackStatus.NORMAL] * 3
+        assert [result.data["queried_count"] for _, result in results] == [1, 2, 3]
+
+    def test_polled_in_batches(self):
+        for _ in range(5):
+            BatchCounterPoller.start({"times": 2})
+
+        assert _driver.run_once() == 5
+        assert len(_driver.store) == 5
+
+    def test_retry_delay(self, monkeypatch):
+        monkeypatch.setattr(BatchCounterPoller, "default_retry_delay_seconds", 60)
+        BatchCounterPoller.start({"times": 2})
+
+        assert _driver.run_once() == 1
+        assert _driver.run_once() == 0
+
+    def test_max_retries(self):
+        BatchErrorPoller.start({}, BatchRecordHandler)
+
+        _driver.run_once()
+        assert BatchRecordHandler.results == []
+        _driver.run_once()
+
+        assert len(_driver.store) == 0
+        _, result = BatchRecordHandler.results[0]
+        assert result.status == CallbackStatus.EXCEPTION
+
+    def test_timeout(self, monkeypatch):
+        monkeypatch.setattr(BatchCounterPoller, "overall_timeout_seconds", -1)
+        BatchCounterPoller.start({"times": 2}, BatchRecordHandler)
+
+        _driver.run_once()
+
+        assert len(_driver.store) == 0
+        _, result = BatchRecordHandler.results[0]
+        assert result.status == CallbackStatus.TIMEOUT
+
+    def test_batch_query(self, monkeypatch):
+        monkeypatch.setattr(_driver, "batch_size", 100)
+        for i in range(7):
+            BatchCoalescedPoller.start({"i": i, "fail": i == 0}, BatchRecordHandler)
+        BatchCounterPoller.start({"times": 1}, BatchRecordHandler)
+
+        assert _driver.run_once() == 8
+
+        assert BatchCoalescedPoller.batch_sizes == [3, 3, 1]
+        assert len(BatchRecordHandler.results) == 7
+        # The failed one will be retried
+        assert len(_driver.store) == 1
+
+
+class TestRedisPollingStore:
+    @pytest.fixture
+    def store(self):
+        if not os.environ.get("REDIS_URL"):
+            raise pytest.skip("MISSING REDIS_URL")
+
+        import redis
+
+        redis_db = redis.Redis.from_url(os.environ["REDIS_URL"])
+        store = RedisPollingStore(redis_db, key_prefix="test::poll::{}::".format(uuid.uuid4().hex))
+        yield store
+        redis_db.delete(store.due_key, store.entries_key)
+
+    def test_claim_due(self, store):
+        now = time.time()
+        for i in range(3):
+            entry = PollingEntry(str(i), "poller", "handler", {"i": i}, PollingMetadata(0, now, 0))
+            store.add(entry, now - i)
+
+        entries = store.claim_due(now=now, limit=2, lease_seconds=10)
+        assert [entry.id for entry in entries] == ["2", "1"]
+        assert entries[0].params == {"i": 2}
+        assert entries[0].metadata == PollingMetadata(0, now, 0)
+
+        assert [entry.id for entry in store.claim_due(now=now, limit=2, lease_seconds=10)] == ["0"]
+        assert store.claim_due(now=now + 5, limit=2, lease_seconds=10) == []
+
+        store.remove("0")
+        assert len(store) == 2
@@ -21,9 +21,13 @@ from unittest import mock
 import pytest
 
 from blue_krill.async_utils.poll_task import (
+    AdaptiveStrategy,
     CallbackHandler,
     CallbackStatus,
+    ExponentialBackoffStrategy,
+    FixedDelayStrategy,
     NullResultHandler,
+    PollerMetrics,
     PollingMetadata,
     PollingResult,
     PollTaskScheduler,
@@ -196,3 +200,86 @@ class TestTaskPoller:
 
         DonePoller.start({}, NullResultHandler)
         assert not BasePoller.get_async_task().subtask().apply_async.called
+
+
+class StrategyPoller(BasePoller):
+    def query(self) -> PollingResult:
+        return PollingResult.doing()
+
+
+def _make_poller(queried_count=0, elapsed=0.0):
+    metadata = PollingMetadata(retries=0, query_started_at=time.time() - elapsed, queried_count=queried_count)
+    return StrategyPoller({}, metadata)
+
+
+class TestPollingStrategy:
+    def test_default(self):
+        assert _make_poller().get_retry_delay() == TaskPoller.default_retry_delay_seconds
+
+    def test_fixed(self, monkeypatch):
+        monkeypatch.setattr(StrategyPoller, "polling_strategy", FixedDelayStrategy(3))
+        assert _make_poller().get_retry_delay() == 3
+
+    def test_exponential_backoff(self):
+        strategy = ExponentialBackoffStrategy(initial_delay=1, factor=2, max_delay=10, jitter=0)
+
+        assert [strategy.get_delay(_make_poller(queried_count=i)) for i in range(6)] == [1, 2, 4, 8, 10, 10]
+        assert strategy.get_delay(_make_poller(queried_count=10000)) == 10
+
+    def test_exponential_backoff_jitter(self):
+        strategy = ExponentialBackoffStrategy(initial_delay=10, jitter=0.1)
+
+        delays = [strategy.get_delay(_make_poller()) for _ in range(100)]
+        assert all(9 <= delay <= 11 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_adaptive(self, monkeypatch):
+        metrics = PollerMetrics()
+        for duration in range(1, 101):
+            metrics.record_done(float(duration), None)
+        monkeypatch.setattr(StrategyPoller, "_metrics", metrics)
+        strategy = AdaptiveStrategy(min_delay=1, max_delay=300, step=0.1, fallback=FixedDelayStrategy(123))
+
+        # Aim at the next 10% of the observed durations
+        assert strategy.get_delay(_make_poller(elapsed=0)) == pytest.approx(10, abs=0.1)
+        assert strategy.get_delay(_make_poller(elapsed=50.5)) == pytest.approx(4.5, abs=0.1)
+        assert strategy.get_delay(_make_poller(elapsed=99.5)) == 1
+        # Longer than all the observed durations
+        assert strategy.get_delay(_make_poller(elapsed=200)) == 123
+
+    def test_adaptive_not_enough_samples(self, monkeypatch):
+        monkeypatch.setattr(StrategyPoller, "_metrics", PollerMetrics())
+        strategy = AdaptiveStrategy(fallback=FixedDelayStrategy(123))
+
+        assert strategy.get_delay(_make_poller()) == 123
+
+
+class TestPollerMetrics:
+    def test_scheduler_records(self, monkeypatch):
+        monkeypatch.setattr(StrategyPoller, "_metrics", PollerMetrics())
+        started_at = time.time() - 30
+        metadata = PollingMetadata(retries=0, query_started_at=started_at, queried_count=0)
+
+        next_metadata = PollTaskScheduler(StrategyPoller({}, metadata), NullResultHandler).run()
+        assert next_metadata
+        assert next_metadata.last_polled_at
+
+        scheduler = PollTaskScheduler(StrategyPoller({}, metadata), NullResultHandler)
+        scheduler.run(ValueError("failed"))
+        scheduler.run(PollingResult.done(finished_at=time.time() - 5))
+
+        metrics = StrategyPoller.get_metrics()
+        assert (metrics.polls, metrics.errors, metrics.wasted_polls, metrics.finished) == (3, 1, 1, 1)
+        assert metrics.get_durations()[0] == pytest.approx(30, abs=1)
+        assert metrics.to_dict()["median_detect_latency"] == pytest.approx(5, abs=1)
+        assert metrics.to_dict()["avg_polls_per_finish"] == 3
+
+    def test_detect_latency_by_last_polling(self, monkeypatch):
+        monkeypatch.setattr(StrategyPoller, "_metrics", PollerMetrics())
+        metadata = PollingMetadata(
+            retries=0, query_started_at=time.time() - 30, queried_count=3, last_polled_at=time.time() - 10
+        )
+
+        PollTaskScheduler(StrategyPoller({}, metadata), NullResultHandler).run(PollingResult.done())
+
+        assert list(StrategyPoller.get_metrics().detect_latencies) == [pytest.approx(10, abs=1)]
@@ -15,6 +15,8 @@
 # We undertake not to change the open source license (MIT license) applicable
 # to the current version of the project delivered to anyone in the future.
 
+import asyncio
+import json
 import os
 import random
 import time
@@ -23,7 +25,13 @@ import uuid
 import pytest
 import redis
 
-from blue_krill.redis_tools.messaging import StreamChannel, StreamChannelSubscriber
+from blue_krill.redis_tools.messaging import (
+    AsyncStreamChannelSubscriber,
+    RedisStreamChannel,
+    RedisStreamChannelSubscriber,
+    StreamChannel,
+    StreamChannelSubscriber,
+)
 from blue_krill.redis_tools.sentinel import SentinelBackend
 from tests.utils import generate_random_string
 
@@ -95,6 +103,46 @@ class TestMessageChannel:
         assert len(subscriber.get_history_events(last_event_id=7)) == 4
         channel.destroy()
 
+    def test_publish(self):
+        channel = StreamChannel(self.channel_id, self.redis_db)
+        channel.initialize()
+
+        assert channel.publish_msg(message="你好") == 2
+        assert channel.publish("custom", data={"line": 1}) == 3
+
+        history = self.redis_db.lrange(channel.keys.history, 0, -1)
+        assert history[1:] == [
+            json.dumps({"id": 2, "event": "msg", "data": "你好"}).encode(),
+            json.dumps({"id": 3, "event": "custom", "data": {"line": 1}}).encode(),
+        ]
+        channel.destroy()
+
+    def test_publish_many(self):
+        channel = StreamChannel(self.channel_id, self.redis_db)
+        channel.publish_batch_size = 3
+        subscriber = StreamChannelSubscriber(self.channel_id, self.redis_db)
+        channel.initialize()
+
+        ids = channel.publish_msgs("line %s" % i for i in range(10))
+
+        assert ids == list(range(2, 12))
+        assert channel.publish_many([]) == []
+        events = subscriber.get_history_events(last_event_id=3)
+        assert [event["id"] for event in events] == list(range(4, 12))
+        assert [event["data"] for event in events] == ["line %s" % i for i in range(2, 10)]
+
+        received = []
+        deadline = time.time() + 1
+        while len(received) < len(ids) + 1 and time.time() < deadline:
+            event = subscriber.get_event()
+            if event is None:
+                time.sleep(0.01)
+                continue
+            received.append(event)
+        assert [event["id"] for event in received if event["event"] == "msg"] == ids
+        subscriber.close()
+        channel.destroy()
+
     def test_consumer_concurrent(self):
         import threading
 
@@ -190,6 +238,148 @@ class TestMessageChannel:
         for t in [t1, t2]:
             t.join()
 
+    def test_listen_events(self):
+        import threading
+
+        batch = 4
+        received = []
+
+        def consumer():
+            subscriber = StreamChannelSubscriber(self.channel_id, self.redis_db)
+            received.extend(subscriber.listen_events(timeout=0.1))
+            subscriber.close()
+
+        t1 = threading.Thread(target=self.producer, args=(batch, 0.1))
+        t2 = threading.Thread(target=consumer)
+        t2.start()
+        time.sleep(0.2)
+        t1.start()
+        for t in [t1, t2]:
+            t.join()
+
+        assert [event["data"] for event in received] == ["Hello, I am %s." % (i + 1) for i in range(batch)]
+
+    def test_listen_event_batches(self):
+        channel = StreamChannel(self.channel_id, self.redis_db)
+        channel.initialize()
+        channel.publish_msgs(["history 1", "history 2", "history 3"])
+        subscriber = StreamChannelSubscriber(self.channel_id, self.redis_db)
+
+        batches = subscriber.listen_event_batches(last_event_id=2, timeout=0.1, max_batch_size=2)
+        assert [event["data"] for event in next(batches)] == ["history 2", "history 3"]
+
+        channel.publish_msgs(["burst %s" % i for i in range(5)])
+        channel.close()
+        rest = list(batches)
+
+        assert [event["data"] for batch in rest for event in batch] == ["burst %s" % i for i in range(5)]
+        assert all(0 < len(batch) <= 2 for batch in rest)
+        subscriber.close()
+        channel.destroy()
+
+
+class TestAsyncStreamChannelSubscriber:
+    @pytest.fixture(autouse=True)
+    def setUp(self, redis_db, channel_id):
+        self.redis_db = redis_db
+        self.channel_id = channel_id
+
+    def test_listen_events(self):
+        import redis.asyncio
+
+        channel = StreamChannel(self.channel_id, self.redis_db)
+        channel.initialize()
+        channel.publish_msg("history")
+
+        async def consume():
+            async_redis_db = redis.asyncio.Redis.from_url(os.environ["REDIS_URL"])
+            async with AsyncStreamChannelSubscriber(self.channel_id, async_redis_db) as subscriber:
+                events = []
+                async for event in subscriber.listen_events(timeout=0.1):
+                    events.append(event)
+                    if len(events) == 1:
+                        # publish the followings after the history events are read
+                        channel.publish_msgs(["new 1", "new 2"])
+                        channel.close()
+            await async_redis_db.aclose()
+            return events
+
+        events = asyncio.run(consume())
+
+        assert [event["data"] for event in events] == ["history", "new 1", "new 2"]
+        channel.destroy()
+
+
+class TestRedisStreamChannel:
+    @pytest.fixture(autouse=True)
+    def setUp(self, redis_db, channel_id):
+        self.redis_db = redis_db
+        self.channel_id = channel_id
+
+    @pytest.fixture
+    def channel(self):
+        channel = RedisStreamChannel(self.channel_id, self.redis_db)
+        channel.initialize()
+        yield channel
+        channel.destroy()
+
+    def test_history_pages(self, channel):
+        ids = channel.publish_msgs("line %s" % i for i in range(5))
+        subscriber = RedisStreamChannelSubscriber(self.channel_id, self.redis_db)
+
+        events, last_id = subscriber.get_history_events(count=3)
+        assert [event["data"] for event in events] == ["line 0", "line 1"]
+        assert last_id == ids[1]
+
+        events, last_id = subscriber.get_history_events(last_event_id=last_id, count=3)
+        assert [event["id"] for event in events] == ids[2:]
+
+        events, next_id = subscriber.get_history_events(last_event_id=last_id)
+        assert events == []
+        assert next_id == last_id
+
+    def test_resume(self, channel):
+        ids = channel.publish_msgs(["a", "b", "c"])
+        channel.publish("custom", data={"line": 1})
+        channel.close()
+
+        subscriber = RedisStreamChannelSubscriber(self.channel_id, self.redis_db)
+        events = list(subscriber.listen_events(last_event_id=ids[1], timeout=0.1))
+
+        assert [(event["event"], event["data"]) for event in events] == [("msg", "c"), ("custom", {"line": 1})]
+        assert subscriber.is_closed()
+
+    def test_max_len(self):
+        channel = RedisStreamChannel(self.channel_id, self.redis_db, max_len=5, approximate_trim=False)
+        channel.initialize()
+        channel.publish_msgs("line %s" % i for i in range(20))
+
+        subscriber = RedisStreamChannelSubscriber(self.channel_id, self.redis_db)
+        events, _ = subscriber.get_history_events()
+
+        assert self.redis_db.xlen(channel.keys.stream) == 5
+        assert [event["data"] for event in events] == ["line %s" % i for i in range(15, 20)]
+        channel.destroy()
+
+    def test_listen_event_batches(self, channel):
+        import threading
+
+        batches = []
+
+        def consumer():
+            subscriber = RedisStreamChannelSubscriber(self.channel_id, self.redis_db)
+            batches.extend(subscriber.listen_event_batches(timeout=0.1, max_batch_size=2))
+
+        t = threading.Thread(target=consumer)
+        t.start()
+        time.sleep(0.3)
+        channel.publish_msgs(["burst %s" % i for i in range(5)])
+        channel.close()
+        t.join()
+
+        assert [event["data"] for batch in batches for event in batch] == ["burst %s" % i for i in range(5)]
+        assert all(0 < len(batch) <= 2 for batch in batches)
+
 
 class TestSentinel:
     @pytest.fixture